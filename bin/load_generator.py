@@ -0,0 +1,577 @@
+#!/usr/bin/env python
+"""
+Load generator of many concurrent telnet sessions, measuring a telnetlib3 server.
+
+Usage::
+
+    $ python bin/load_generator.py --sessions 1000 --duration 30
+    $ python bin/load_generator.py --sessions 5000 --mix negotiate=1,mud=4,mccp=1,idle=4 \\
+        --save-baseline baseline.json
+    $ python bin/load_generator.py --sessions 5000 --mix negotiate=1,mud=4,mccp=1,idle=4 \\
+        --compare baseline.json
+
+A telnetlib3 server is started in a child process on localhost, unless
+``--connect HOST:PORT`` is given.  Each session is connected by
+:func:`telnetlib3.open_connection` and names its kind to the server on its
+first line:
+
+- ``negotiate``: connects again every tick, measuring negotiation.
+- ``mud``: receives a line and GMCP ``Char.Vitals`` every tick, and sends a
+  command.
+- ``mccp``: accepts MCCP2 compression and receives 4 KiB of text every tick.
+- ``idle``: connects and sends nothing more.
+- ``pty``: sends a line every tick to ``cat`` in a PTY of the server.
+
+All sessions are connected before traffic begins, at most
+``--connect-concurrency`` at a time.  Reported are connects per second of
+this ramp, p50 and p99 seconds from connect to completed negotiation, and
+of the server child, its resident memory per session after the ramp, CPU
+seconds per megabyte transferred after it, and ratio of MCCP compression.  Exit status is 1 when
+``--compare`` finds a regression greater than ``--tolerance``.
+
+Beyond about 500 sessions, raise the limit of open files (``ulimit -n``),
+which is raised to its hard limit when permitted.
+"""
+
+from __future__ import annotations
+
+# std imports
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import contextlib
+from typing import Any, Dict, List, Tuple, Optional
+
+# local
+import telnetlib3
+from telnetlib3.telopt import GMCP, WILL
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+#: Kinds of sessions, in the order of their description.
+SESSION_KINDS = ("negotiate", "mud", "mccp", "idle", "pty")
+
+#: Default weights of session kinds.
+DEFAULT_MIX = "negotiate=1,mud=3,mccp=1,idle=5"
+
+#: Reported values compared with baselines, and whether greater is better.
+BASELINE_KEYS = {
+    "connects_per_sec": True,
+    "negotiation_p50_ms": False,
+    "negotiation_p99_ms": False,
+    "rss_per_session_kib": False,
+    "server_cpu_per_mb": False,
+    "client_cpu_per_mb": False,
+}
+
+#: Text sent to ``mccp`` sessions each tick, compressible as a MUD's is.
+MCCP_BLOCK = ("The Prancing Pony is warm and crowded.  A fire crackles in the hearth.\r\n" * 58)[
+    :4096
+]
+
+
+def parse_mix(text: str, sessions: int) -> Dict[str, int]:
+    """
+    Return the number of sessions of each kind for weights *text*, such as ``"mud=3,idle=1"``.
+
+    Counts are proportional to the weights, the largest remainders rounded up.
+    """
+    weights: Dict[str, float] = {}
+    for item in filter(None, text.split(",")):
+        kind, _, weight = item.partition("=")
+        kind = kind.strip()
+        if kind not in SESSION_KINDS:
+            raise ValueError(f"unknown session kind {kind!r}, expected one of {SESSION_KINDS}")
+        weights[kind] = float(weight or 1)
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError(f"mix {text!r} has no sessions")
+    exact = {kind: sessions * weight / total for kind, weight in weights.items()}
+    counts = {kind: int(value) for kind, value in exact.items()}
+    by_remainder = sorted(exact, key=lambda kind: exact[kind] - counts[kind], reverse=True)
+    for kind in by_remainder[: sessions - sum(counts.values())]:
+        counts[kind] += 1
+    return counts
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Return the nearest-rank *pct* percentile of *values*, ``None`` when empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(-(-pct * len(ordered) // 100)))
+    return ordered[rank - 1]
+
+
+def process_sample() -> Dict[str, float]:
+    """Return the resident memory in KiB and CPU seconds of this process."""
+    times = os.times()
+    return {"rss_kib": _rss_kib(), "cpu_secs": times.user + times.system}
+
+
+def _rss_kib() -> float:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fin:
+            resident = int(fin.read().split()[1])
+        return resident * os.sysconf("SC_PAGE_SIZE") / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return 0.0
+    # peak rather than current, in bytes on macOS and KiB elsewhere.
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 1024 if sys.platform == "darwin" else float(maxrss)
+
+
+def raise_open_files_limit() -> None:
+    """Raise the soft limit of open files to the hard limit, where permitted."""
+    if resource is None:
+        return
+    with contextlib.suppress(ValueError, OSError):
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != hard:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+# -- server child process --
+
+
+async def _server_shell(
+    reader: Any, writer: Any, tick: float, pty_shell: Optional[Any] = None
+) -> None:
+    """Serve the session of the kind named by the first line of the client."""
+    kind = (await reader.readline()).strip()
+    if kind == "mud":
+        writer.iac(WILL, GMCP)
+        ticker = asyncio.ensure_future(_mud_ticker(writer, tick))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(f"You {line.strip()} around the tavern.\r\n> ")
+        finally:
+            ticker.cancel()
+    elif kind == "mccp":
+        while not writer.is_closing():
+            writer.write(MCCP_BLOCK)
+            await writer.drain()
+            await asyncio.sleep(tick)
+    elif kind == "pty" and pty_shell is not None:
+        await pty_shell(reader, writer)
+        return
+    else:
+        # negotiate, idle: wait for the client to disconnect
+        while await reader.read(4096):
+            pass
+    writer.close()
+
+
+async def _mud_ticker(writer: Any, tick: float) -> None:
+    hp = 100
+    while not writer.is_closing():
+        hp = hp - 1 if hp > 1 else 100
+        writer.send_gmcp("Char.Vitals", {"hp": hp, "maxhp": 100, "mp": 50, "maxmp": 50})
+        writer.write(f"\r\nA rat scurries past.  (HP: {hp}/100)\r\n> ")
+        await writer.drain()
+        await asyncio.sleep(tick)
+
+
+async def serve(host: str, port: int, tick: float) -> None:
+    """
+    Serve load generator sessions, controlled by lines of stdin.
+
+    Writes a JSON line of the port listened on, then answers each line of
+    stdin with a JSON line of :func:`process_sample` and the bytes and
+    sessions counted by the server, until end of file.
+    """
+    pty_shell = None
+    if telnetlib3.PTY_SUPPORT:
+        from telnetlib3.server_pty_shell import make_pty_shell
+
+        pty_shell = make_pty_shell("cat")
+
+    async def shell(reader: Any, writer: Any) -> None:
+        await _server_shell(reader, writer, tick, pty_shell)
+
+    metrics = telnetlib3.Metrics()
+    server = await telnetlib3.create_server(
+        host, port, shell=shell, connect_maxwait=2.0, timeout=0, compression=True, metrics=metrics
+    )
+    print(json.dumps({"port": server.sockets[0].getsockname()[1]}), flush=True)
+    loop = asyncio.get_running_loop()
+    while await loop.run_in_executor(None, sys.stdin.readline):
+        sample = process_sample()
+        sample["bytes"] = metrics.bytes_received + metrics.bytes_sent
+        sample["sessions"] = metrics.connections_active
+        sample["mccp_ratio"] = metrics.mccp_ratio
+        print(json.dumps(sample), flush=True)
+    server.close()
+    await server.wait_closed()
+
+
+class ServerProcess:
+    """A :func:`serve` child process, sampled by :meth:`sample`."""
+
+    def __init__(self, proc: asyncio.subprocess.Process, port: int) -> None:
+        """Class initializer."""
+        self.proc = proc
+        self.port = port
+
+    @classmethod
+    async def start(cls, tick: float) -> "ServerProcess":
+        """Start the server child process, and return once it listens."""
+        env = dict(os.environ)
+        # the child imports the telnetlib3 imported by this process.
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(telnetlib3.__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, (package_dir, env.get("PYTHONPATH"))))
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            os.path.abspath(__file__),
+            "--serve",
+            "--tick",
+            str(tick),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        assert proc.stdout is not None
+        line = await asyncio.wait_for(proc.stdout.readline(), 30)
+        if not line:
+            raise RuntimeError("load generator server exited")
+        return cls(proc, json.loads(line)["port"])
+
+    async def sample(self) -> Dict[str, float]:
+        """Return a sample of the resources and counts of the server."""
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        self.proc.stdin.write(b"sample\n")
+        await self.proc.stdin.drain()
+        result: Dict[str, float] = json.loads(await self.proc.stdout.readline())
+        return result
+
+    async def stop(self) -> None:
+        """Stop the server child process."""
+        assert self.proc.stdin is not None
+        self.proc.stdin.close()
+        try:
+            await asyncio.wait_for(self.proc.wait(), 10)
+        except asyncio.TimeoutError:
+            self.proc.kill()
+            await self.proc.wait()
+
+
+# -- client sessions --
+
+
+class LoadClient(telnetlib3.TelnetClient):
+    """Client accepting GMCP, as MUD clients do."""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Accept GMCP offered by the server."""
+        super().connection_made(transport)
+        assert self.writer is not None
+        self.writer.passive_do = {GMCP}
+
+
+class LoadGenerator:
+    """
+    Sessions of a mix of kinds, connected to one server.
+
+    :param host: Server address.
+    :param port: Server port.
+    :param counts: Number of sessions of each kind, see :func:`parse_mix`.
+    :param tick: Seconds between traffic of each session.
+    :param connect_concurrency: Most sessions connecting at once.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        counts: Dict[str, int],
+        tick: float = 1.0,
+        connect_concurrency: int = 100,
+    ) -> None:
+        """Class initializer."""
+        self.host = host
+        self.port = port
+        self.counts = counts
+        self.tick = tick
+        self.metrics = telnetlib3.Metrics()
+        #: Seconds from connect to negotiation of each connect.
+        self.latencies: List[float] = []
+        self.connects = 0
+        self.errors = 0
+        self._connecting = asyncio.Semaphore(connect_concurrency)
+        self._tasks: List[asyncio.Future[None]] = []
+        self._ramped = 0
+        self._all_ramped = asyncio.Event()
+        self._stop = asyncio.Event()
+
+    async def connect(self, kind: str) -> Tuple[Any, Any]:
+        """Connect a session of *kind*, recording its negotiation latency."""
+        async with self._connecting:
+            stime = time.perf_counter()
+            try:
+                reader, writer = await telnetlib3.open_connection(
+                    self.host,
+                    self.port,
+                    client_factory=LoadClient,
+                    # the server offers MCCP2 to every session
+                    compression=kind == "mccp",
+                    connect_minwait=0,
+                    connect_maxwait=2.0,
+                    connect_timeout=30,
+                    metrics=self.metrics,
+                )
+            except (OSError, ConnectionError):
+                self.errors += 1
+                raise
+            self.latencies.append(time.perf_counter() - stime)
+            self.connects += 1
+        writer.write(kind + "\r\n")
+        return reader, writer
+
+    def _mark_ramped(self) -> None:
+        self._ramped += 1
+        if self._ramped == sum(self.counts.values()):
+            self._all_ramped.set()
+
+    async def session(self, kind: str) -> None:
+        """Run one session of *kind* until :meth:`stop`."""
+        try:
+            reader, writer = await self.connect(kind)
+        except (OSError, ConnectionError):
+            self._mark_ramped()
+            return
+        self._mark_ramped()
+        await self._all_ramped.wait()
+        drain = asyncio.ensure_future(_read_all(reader))
+        try:
+            while not self._stop.is_set() and not drain.done():
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stop.wait(), self.tick)
+                if self._stop.is_set() or writer.is_closing():
+                    break
+                if kind == "negotiate":
+                    writer.close()
+                    drain.cancel()
+                    try:
+                        reader, writer = await self.connect(kind)
+                    except (OSError, ConnectionError):
+                        return
+                    drain = asyncio.ensure_future(_read_all(reader))
+                elif kind in ("mud", "pty"):
+                    writer.write("look\r\n")
+        finally:
+            drain.cancel()
+            writer.close()
+
+    async def ramp(self) -> float:
+        """Start every session, and return seconds until all are connected."""
+        stime = time.perf_counter()
+        self._tasks = [
+            asyncio.ensure_future(self.session(kind))
+            for kind, count in self.counts.items()
+            for _ in range(count)
+        ]
+        if self._tasks:
+            await self._all_ramped.wait()
+        return time.perf_counter() - stime
+
+    async def stop(self) -> None:
+        """Stop every session, and wait for them to close."""
+        self._stop.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.sleep(0.1)
+
+
+async def _read_all(reader: Any) -> None:
+    while await reader.read(65536):
+        pass
+
+
+async def run(
+    sessions: int,
+    mix: str = DEFAULT_MIX,
+    duration: float = 10.0,
+    tick: float = 1.0,
+    connect: Optional[str] = None,
+    connect_concurrency: int = 100,
+) -> Dict[str, Any]:
+    """
+    Run the load of *sessions* of *mix* for *duration* seconds, and return a report.
+
+    :param connect: ``HOST:PORT`` of a server, otherwise a server is
+        started in a child process and its resources are reported.
+    """
+    counts = parse_mix(mix, sessions)
+    server: Optional[ServerProcess] = None
+    if connect:
+        host, _, port = connect.rpartition(":")
+        host, port_num = host or "localhost", int(port)
+    else:
+        server = await ServerProcess.start(tick)
+        host, port_num = "127.0.0.1", server.port
+
+    generator = LoadGenerator(host, port_num, counts, tick, connect_concurrency)
+    report: Dict[str, Any] = {"sessions": sessions, "mix": counts, "duration": duration}
+    try:
+        server_start = await server.sample() if server else None
+        ramp_secs = await generator.ramp()
+        ramp_connects = generator.connects
+        server_ramped = await server.sample() if server else None
+        client_ramped = process_sample()
+        client_bytes = generator.metrics.bytes_received + generator.metrics.bytes_sent
+        await asyncio.sleep(duration)
+        server_end = await server.sample() if server else None
+        client_end = process_sample()
+        client_mb = (
+            generator.metrics.bytes_received + generator.metrics.bytes_sent - client_bytes
+        ) / 2**20
+        await generator.stop()
+    finally:
+        if server is not None:
+            await server.stop()
+
+    report["connects"] = generator.connects
+    report["connect_errors"] = generator.errors
+    report["connects_per_sec"] = ramp_connects / ramp_secs if ramp_secs else None
+    for pct in (50, 99):
+        value = percentile(generator.latencies, pct)
+        report[f"negotiation_p{pct}_ms"] = None if value is None else value * 1000
+    report["mb_transferred"] = client_mb
+    report["client_cpu_per_mb"] = (
+        (client_end["cpu_secs"] - client_ramped["cpu_secs"]) / client_mb if client_mb else None
+    )
+    report["rss_per_session_kib"] = report["server_cpu_per_mb"] = None
+    report["mccp_ratio"] = None
+    if server_start and server_ramped and server_end:
+        report["mccp_ratio"] = server_end["mccp_ratio"]
+        if server_ramped["sessions"]:
+            report["rss_per_session_kib"] = (
+                server_ramped["rss_kib"] - server_start["rss_kib"]
+            ) / server_ramped["sessions"]
+        server_mb = (server_end["bytes"] - server_ramped["bytes"]) / 2**20
+        if server_mb:
+            report["server_cpu_per_mb"] = (
+                server_end["cpu_secs"] - server_ramped["cpu_secs"]
+            ) / server_mb
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Return *report* of :func:`run` as text."""
+    mix = " ".join(f"{kind}={count}" for kind, count in report["mix"].items())
+    rows = [
+        ("sessions", f"{report['sessions']} ({mix})"),
+        ("connects", f"{report['connects']} (errors {report['connect_errors']})"),
+        ("connects/sec", _format(report["connects_per_sec"], "{:.1f}")),
+        ("negotiation p50", _format(report["negotiation_p50_ms"], "{:.1f} ms")),
+        ("negotiation p99", _format(report["negotiation_p99_ms"], "{:.1f} ms")),
+        ("transferred", _format(report["mb_transferred"], "{:.2f} MB")),
+        ("mccp ratio", _format(report["mccp_ratio"], "{:.3f}")),
+        ("rss/session", _format(report["rss_per_session_kib"], "{:.1f} KiB")),
+        ("server cpu/MB", _format(report["server_cpu_per_mb"], "{:.3f} s")),
+        ("client cpu/MB", _format(report["client_cpu_per_mb"], "{:.3f} s")),
+    ]
+    return "\n".join(f"{name:<18}{value}" for name, value in rows)
+
+
+def _format(value: Optional[float], fmt: str) -> str:
+    return "-" if value is None else fmt.format(value)
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.10
+) -> Tuple[str, bool]:
+    """
+    Compare *report* with *baseline*, returning text and whether any value regressed.
+
+    A value regresses when worse than its baseline by more than *tolerance*,
+    a fraction of the baseline.
+    """
+    lines = []
+    regressed = False
+    for key, greater_is_better in BASELINE_KEYS.items():
+        old, new = baseline.get(key), report.get(key)
+        if old is None or new is None:
+            continue
+        change = (new - old) / old if old else 0.0
+        worse = -change if greater_is_better else change
+        flag = ""
+        if worse > tolerance:
+            flag, regressed = "  REGRESSION", True
+        lines.append(f"{key:<22}{old:12.3f} -> {new:12.3f} ({change:+.1%}){flag}")
+    return "\n".join(lines), regressed
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of the load generator."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0].strip(),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--sessions", type=int, default=100, help="concurrent sessions")
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"weights of session kinds, of {', '.join(SESSION_KINDS)}",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="seconds of traffic after all connect"
+    )
+    parser.add_argument("--tick", type=float, default=1.0, help="seconds between traffic")
+    parser.add_argument(
+        "--connect-concurrency", type=int, default=100, help="most sessions connecting at once"
+    )
+    parser.add_argument(
+        "--connect", metavar="HOST:PORT", help="load this server rather than a child process"
+    )
+    parser.add_argument("--json", action="store_true", help="write the report as JSON")
+    parser.add_argument("--save-baseline", metavar="PATH", help="save the report as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the report with a baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.10, help="fraction of a baseline that regresses"
+    )
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point, returning the exit status."""
+    args = get_argument_parser().parse_args(argv)
+    raise_open_files_limit()
+    if args.serve:
+        asyncio.run(serve("127.0.0.1", 0, args.tick))
+        return 0
+    report = asyncio.run(
+        run(
+            args.sessions,
+            args.mix,
+            args.duration,
+            args.tick,
+            args.connect,
+            args.connect_concurrency,
+        )
+    )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as fout:
+            json.dump(report, fout, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fin:
+            text, regressed = compare(report, json.load(fin), args.tolerance)
+        print(text)
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
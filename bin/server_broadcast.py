@@ -8,6 +8,10 @@ specific negotiation states.
 
 Run this server, then connect multiple telnet clients. Messages typed
 in one client will be broadcast to all others.
+
+Broadcasts are written without waiting on drain(), so that one client that
+does not read cannot delay the others.  Its output is instead limited by a
+WriteLimit, which drops the oldest messages held for it beyond 64 KiB.
 """
 
 # std imports
@@ -47,7 +51,9 @@ async def handle_client(server, client, client_id):
 
 async def main():
     """Start server and handle client connections."""
-    server = await telnetlib3.create_server(host="127.0.0.1", port=6023)
+    server = await telnetlib3.create_server(
+        host="127.0.0.1", port=6023, write_limit=telnetlib3.WriteLimit(policy="drop")
+    )
     print("Broadcast server running on localhost:6023")
     print("Connect multiple clients with: telnet localhost 6023")
 
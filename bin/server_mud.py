@@ -222,10 +222,10 @@ def resolve_target(writer: Any, prefix: str, candidates: list[Any], err: str) ->
 
 
 def send_vitals(writer: Any, player: Player) -> None:
-    """Push Char.Vitals GMCP and MSDP reported variables."""
+    """Push Char.Vitals GMCP and MSDP reported variables, when changed."""
     wn = player.weapon.name if player.weapon else "Fists"
     st = "dodging" if player.is_dodging else "ready"
-    writer.send_gmcp(
+    writer.mud_state.set(
         "Char.Vitals",
         {
             "hp": player.health,
@@ -240,13 +240,13 @@ def send_vitals(writer: Any, player: Player) -> None:
 
 
 def send_room_gmcp(writer: Any, player: Player) -> None:
-    """Push Room.Info GMCP."""
+    """Push Room.Info GMCP, when changed."""
     room = ROOMS[player.room]
     people = [
         {"name": p.name, "hp": p.health, "maxhp": p.max_health}
         for p in players_in_room(player.room, exclude=player)
     ]
-    writer.send_gmcp(
+    writer.mud_state.set(
         "Room.Info",
         {
             "num": ROOM_IDS[player.room],
@@ -312,7 +312,7 @@ def get_msdp_var(player: Player, var: str) -> dict[str, Any] | None:
 
 
 def push_msdp_reported(writer: Any, player: Player) -> None:
-    """Push all MSDP variables in *player*'s report set."""
+    """Push MSDP variables in *player*'s report set that have changed."""
     if not player.msdp_reported:
         return
     merged: dict[str, Any] = {}
@@ -321,7 +321,7 @@ def push_msdp_reported(writer: Any, player: Player) -> None:
         if val is not None:
             merged.update(val)
     if merged:
-        writer.send_msdp(merged)
+        writer.mud_state.set_msdp(merged)
 
 
 def on_msdp(writer: Any, variables: dict[str, Any]) -> None:
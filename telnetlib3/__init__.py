@@ -1,93 +1,180 @@
-"""telnetlib3: an asyncio Telnet Protocol implemented in python."""
+"""
+telnetlib3: an asyncio Telnet Protocol implemented in python.
+
+Submodules are imported on first use of a name they export, so that a
+program using only :mod:`telnetlib3.sync`, or only the client, does not pay
+to import the server, fingerprinting, and PTY modules.
+"""
 
 # std imports
 import sys
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# local
+from . import encodings  # noqa: F401 - registers custom codecs (petscii, atarist)
 
 # flake8: noqa: F405
 # fmt: off
 # isort: off
-# Import order matters: server_shell symbols must be exported before server
-# import due to function_lookup("telnetlib3.telnet_server_shell") at server.py load time
-from . import server_base
-from . import server_shell
-from .server_shell import *  # noqa - Must export before server import
-from . import server
-from . import stream_writer
-from . import stream_reader
-from . import client_base
-from . import client_shell
-from . import client
-from . import telopt
-from . import mud
-from . import slc
-from . import telnetlib
-from . import guard_shells
-from . import fingerprinting
-from . import server_fingerprinting
-if sys.platform != "win32":
-    from . import fingerprinting_display  # noqa: F401
-from . import encodings  # noqa: F401 - registers custom codecs (petscii, atarist)
-from . import sync
-from ._session_context import TelnetSessionContext  # noqa: F401
-from .server_base import *  # noqa
-from .server import *  # noqa
-from .stream_writer import *  # noqa
-from .stream_reader import *  # noqa
-from .client_base import *  # noqa
-from .client_shell import *  # noqa
-from .client import *  # noqa
-from .telopt import *  # noqa
-from .mud import *  # noqa
-from .slc import *  # noqa
-from .telnetlib import *  # noqa
-from .guard_shells import *  # noqa
-from .fingerprinting import *  # noqa
-from .server_fingerprinting import *  # noqa
-if sys.platform != "win32":
-    from .fingerprinting_display import *  # noqa
-from .sync import *  # noqa
-try:
+if TYPE_CHECKING:  # pragma: no cover
+    from . import server_base
+    from . import server_shell
+    from . import server
+    from . import stream_writer
+    from . import stream_reader
+    from . import client_base
+    from . import client_shell
+    from . import client
+    from . import telopt
+    from . import mud
+    from . import slc
+    from . import telnetlib
+    from . import guard_shells
+    from . import fingerprinting
+    from . import server_fingerprinting
+    from . import sync
     from . import server_pty_shell
+    from . import metrics
+    from ._session_context import TelnetSessionContext  # noqa: F401
+    from ._base import BufferedTelnetProtocol  # noqa: F401
+    from .server_shell import *  # noqa
+    from .server_base import *  # noqa
+    from .server import *  # noqa
+    from .stream_writer import *  # noqa
+    from .stream_reader import *  # noqa
+    from .client_base import *  # noqa
+    from .client_shell import *  # noqa
+    from .client import *  # noqa
+    from .telopt import *  # noqa
+    from .mud import *  # noqa
+    from .slc import *  # noqa
+    from .telnetlib import *  # noqa
+    from .guard_shells import *  # noqa
+    from .fingerprinting import *  # noqa
+    from .server_fingerprinting import *  # noqa
+    from .sync import *  # noqa
     from .server_pty_shell import *  # noqa
-    PTY_SUPPORT = True
-except ImportError:
-    server_pty_shell = None  # type: ignore[assignment]
-    PTY_SUPPORT = False
-from .accessories import get_version as _get_version
+    from .metrics import *  # noqa
+    PTY_SUPPORT: bool
+    __all__: Tuple[str, ...]
 # isort: on
 # fmt: on
 
-__all__ = tuple(
-    dict.fromkeys(
-        # server,
-        server_base.__all__
-        + server.__all__
-        + server_shell.__all__
-        + guard_shells.__all__
-        + fingerprinting.__all__
-        + server_fingerprinting.__all__
-        + (server_pty_shell.__all__ if PTY_SUPPORT else ())
-        # client,
-        + client_base.__all__
-        + client.__all__
-        + client_shell.__all__
-        # telnet protocol stream / decoders,
-        + stream_writer.__all__
-        + stream_reader.__all__
-        # blocking i/o wrapper
-        + sync.__all__
-        # protocol bits, bytes, and names
-        + telopt.__all__
-        + mud.__all__
-        + slc.__all__
-        # python's legacy stdlib api
-        + telnetlib.__all__
-    )
-)  # noqa - deduplicate, preserving order
+#: Names exported by each submodule, its ``__all__``, in the order of
+#: :data:`__all__`.  Where two submodules export the same name, the latter is
+#: used.
+_EXPORTS: Dict[str, str] = {
+    "server_base": "BaseServer EARLY_SHELL_OPTIONS",
+    "server": (
+        "TelnetServer LinemodeServer BufferedTelnetServer NegotiationProfile "
+        "NegotiationProfileCache AdmissionControl TLSHandshakeStats Server create_server run_server "
+        "parse_server_args"
+    ),
+    "server_shell": (
+        "telnet_server_shell AnsiFilteringReader readline_async readline get_linemode get_slcdata "
+        "do_toggle do_latency"
+    ),
+    "guard_shells": "robot_check robot_shell busy_shell ConnectionCounter",
+    "fingerprinting": (
+        "ENVIRON_EXTENDED FingerprintingServer FingerprintingTelnetServer ProbeResult "
+        "fingerprint_server_main fingerprinting_server_shell fingerprinting_post_script "
+        "get_client_fingerprint probe_client_capabilities probe_client_loop_detection"
+    ),
+    "server_fingerprinting": "fingerprinting_client_shell probe_server_capabilities",
+    "server_pty_shell": "make_pty_shell pty_shell PTYSpawnError",
+    "client_base": "BaseClient",
+    "client": "TelnetClient TelnetTerminalClient BufferedTelnetClient open_connection",
+    "client_shell": "InputFilter TelnetTerminalShell TypescriptWriter telnet_client_shell",
+    "stream_writer": "TelnetWriter TelnetWriterUnicode ProtocolTrace WriteLimit WriteBuffer",
+    "stream_reader": "TelnetReader TelnetReaderUnicode",
+    "sync": "TelnetConnection BlockingTelnetServer ServerConnection",
+    "metrics": "Metrics Histogram SessionLatency start_metrics_server",
+    "telopt": (
+        "AARDWOLF ABORT ACCEPTED AO ATCP AUTHENTICATION AYT BINARY BM BRK CHARSET CMD_EOR "
+        "COM_PORT_OPTION DET DM DO DONT EC ECHO EL ENCRYPT EOF EOR ESC EXOPL FORWARD_X GA GMCP IAC "
+        "INFO IP IS KERMIT LFLOW LFLOW_OFF LFLOW_ON LFLOW_RESTART_ANY LFLOW_RESTART_XON LINEMODE "
+        "LOGOUT MCCP2_COMPRESS MCCP3_COMPRESS MCCP_COMPRESS MSDP MSDP_ARRAY_CLOSE MSDP_ARRAY_OPEN "
+        "MSDP_TABLE_CLOSE MSDP_TABLE_OPEN MSDP_VAL MSDP_VAR MSP MSSP MSSP_VAL MSSP_VAR MXP NAMS "
+        "NAOCRD NAOFFD NAOHTD NAOHTS NAOL NAOLFD NAOP NAOVTD NAOVTS NAWS NEW_ENVIRON NOP "
+        "PRAGMA_HEARTBEAT PRAGMA_LOGON RCP RCTE REJECTED REQUEST RSP SB SE SEND SEND_URL SGA "
+        "SNDLOC SSPI_LOGON STATUS SUPDUP SUPDUPOUTPUT TELOPT_92 SUPPRESS_LOCAL_ECHO SUSP TLS TM "
+        "TN3270E TSPEED TTABLE_ACK TTABLE_IS TTABLE_NAK TTABLE_REJECTED TTYLOC TTYPE USERVAR VALUE "
+        "VAR VT3270REGIME WILL WONT X3PAD XASCII XAUTH XDISPLOC ZMP theNULL name_command "
+        "name_commands name_option option_from_name"
+    ),
+    "mud": (
+        "gmcp_encode gmcp_decode GmcpMessage set_json_backend msdp_encode msdp_decode MsdpEncoder "
+        "mssp_encode mssp_decode MsdpParser MudState JsonEncodeCache zmp_decode atcp_decode "
+        "aardwolf_decode"
+    ),
+    "slc": (
+        "BSD_SLC_TAB Forwardmask generate_forwardmask generate_slctab Linemode LMODE_FORWARDMASK "
+        "LMODE_MODE LMODE_MODE_EDIT LMODE_MODE_REMOTE LMODE_SLC name_slc_command NSLC SLC "
+        "SLC_ABORT SLC_ACK SLC_AO SLC_AYT SLC_CANTCHANGE SLC_DEFAULT SLC_EC SLC_EL SLC_EOF SLC_EW "
+        "SLC_IP SLC_LNEXT SLC_nosupport SLC_NOSUPPORT SLCTable SLC_RP SLC_SUSP SLC_SYNCH "
+        "SLC_VARIABLE SLC_XON snoop theNULL"
+    ),
+    "telnetlib": (
+        "AO AUTHENTICATION AYT BINARY BM BRK CHARSET COM_PORT_OPTION DET DM DO DONT EC ECHO EL "
+        "ENCRYPT EOR EXOPL FORWARD_X GA IAC IP KERMIT LFLOW LINEMODE LOGOUT NAMS NAOCRD NAOFFD "
+        "NAOHTD NAOHTS NAOL NAOLFD NAOP NAOVTD NAOVTS NAWS NEW_ENVIRON NOOPT NOP OLD_ENVIRON "
+        "OUTMRK PRAGMA_HEARTBEAT PRAGMA_LOGON RCP RCTE RSP SB SE SEND_URL SGA SNDLOC SSPI_LOGON "
+        "STATUS SUPDUP SUPDUPOUTPUT SUPPRESS_LOCAL_ECHO TELNET_PORT TLS TM TN3270E TSPEED TTYLOC "
+        "TTYPE TUID Telnet VT3270REGIME WILL WONT X3PAD XASCII XAUTH XDISPLOC _TelnetSelector "
+        "theNULL"
+    ),
+}
+
+#: Submodule of each exported name.
+_EXPORTED_BY: Dict[str, str] = {
+    name: module for module, names in _EXPORTS.items() for name in names.split()
+}
+_EXPORTED_BY["TelnetSessionContext"] = "_session_context"
+_EXPORTED_BY["BufferedTelnetProtocol"] = "_base"
+
+#: Submodules available as attributes of the package.
+_SUBMODULES = frozenset((*_EXPORTS, "accessories", "encodings", "fingerprinting_display"))
 
 __author__ = "Jeff Quast"
 __url__ = "https://github.com/jquast/telnetlib3/"
 __copyright__ = "Copyright 2013"
 __credits__ = ["Jim Storch", "Wijnand Modderman-Lenstra"]
 __license__ = "ISC"
-__version__ = _get_version()
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule of *name* on first use, and keep its value."""
+    value: Any
+    if name in _EXPORTED_BY:
+        value = getattr(importlib.import_module(f".{_EXPORTED_BY[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name == "PTY_SUPPORT":
+        try:
+            importlib.import_module(".server_pty_shell", __name__)
+            value = True
+        except ImportError:
+            value = False
+    elif name == "__all__":
+        # names of server_pty_shell only when supported, which requires its import.
+        value = tuple(
+            dict.fromkeys(
+                name
+                for module, names in _EXPORTS.items()
+                if module != "server_pty_shell" or getattr(sys.modules[__name__], "PTY_SUPPORT")
+                for name in names.split()
+            )
+        )  # deduplicate, preserving order
+    elif name == "__version__":
+        value = importlib.import_module(".accessories", __name__).get_version()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Return module attributes, including those not yet imported."""
+    dunders = (name for name in globals() if name.startswith("__"))
+    return sorted({*dunders, *_EXPORTED_BY, *_SUBMODULES, "PTY_SUPPORT", "__all__", "__version__"})
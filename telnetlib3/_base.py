@@ -5,14 +5,25 @@ from __future__ import annotations
 # std imports
 import sys
 import types
+import asyncio
 import logging
 import datetime
 import traceback
-from typing import Any, Type, Callable, Optional
+import collections
+from typing import TYPE_CHECKING, Any, Type, Deque, Union, Callable, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import Metrics
 
 # Pre-allocated single-byte cache to avoid per-byte bytes() allocations
 _ONE_BYTE = [bytes([i]) for i in range(256)]
 
+#: Most bytes of queued chunks joined for one pass of :func:`_process_data_chunk`.
+_RX_COALESCE = 64 * 1024
+
+#: Bytes of queued data processed before yielding to the event loop.
+_RX_YIELD = 128 * 1024
+
 
 def _log_exception(
     log_fn: Callable[..., Any],
@@ -29,43 +40,53 @@ def _log_exception(
 
 
 def _process_data_chunk(
-    data: bytes,
+    data: Union[bytes, memoryview],
     writer: Any,
     reader: Any,
     slc_special: frozenset[int] | None,
     log_fn: Callable[..., Any],
+    buffer: Optional[bytearray] = None,
 ) -> bool:
     """
     Scan *data* for IAC and SLC bytes, feed regular bytes to *reader*.
 
-    :param data: Raw bytes received from the transport.
+    :param data: Raw bytes received from the transport, or a memoryview of
+        them.
     :param writer: TelnetWriter instance for IAC interpretation.
     :param reader: TelnetReader instance for in-band data.
     :param slc_special: Frozenset of special byte values (IAC + SLC triggers),
         or ``None`` when only IAC (255) is special.
     :param log_fn: Callable for logging exceptions (e.g. ``logger.warning``).
+    :param buffer: Receive buffer of which memoryview *data* views the first
+        ``len(data)`` bytes, see :class:`BufferedTelnetProtocol`.  IAC is
+        searched for in it, in place.  Any other memoryview is copied to be
+        searched.
     :returns: ``True`` if any IAC/SB command was observed.
 
     When MCCP2 is activated mid-chunk, the remaining compressed bytes are
     stored in ``writer._compressed_remainder`` for the caller to consume.
+
+    Regular bytes of a memoryview are fed to *reader* as views of it, copied
+    only by the reader.
     """
     cmd_received = False
     n = len(data)
     i = 0
     out_start = 0
     feeding_oob = bool(writer.is_oob)
+    scan: Union[bytes, bytearray] = data if isinstance(data, bytes) else buffer or data.tobytes()
 
     while i < n:
         if not feeding_oob:
             if slc_special is None:
-                next_iac = data.find(255, i)
+                next_iac = scan.find(255, i, n)
                 if next_iac == -1:
                     if n > out_start:
                         reader.feed_data(data[out_start:])
                     return cmd_received
                 i = next_iac
             else:
-                while i < n and data[i] not in slc_special:
+                while i < n and scan[i] not in slc_special:
                     i += 1
             if i > out_start:
                 reader.feed_data(data[out_start:i])
@@ -73,7 +94,7 @@ def _process_data_chunk(
                 break
 
         try:
-            recv_inband = writer.feed_byte(_ONE_BYTE[data[i]])
+            recv_inband = writer.feed_byte(_ONE_BYTE[scan[i]])
         except ValueError as exc:
             logging.getLogger(__name__).debug("Invalid telnet byte: %s", exc)
         except BaseException:
@@ -90,7 +111,7 @@ def _process_data_chunk(
         if writer._mccp2_activated:
             writer._mccp2_activated = False
             writer.mccp2_active = True
-            writer._compressed_remainder = data[i:] if i < n else b""
+            writer._compressed_remainder = bytes(data[i:]) if i < n else b""
             return True
 
     return cmd_received
@@ -103,6 +124,119 @@ class TelnetProtocolBase:
     _last_received: Optional[datetime.datetime] = None
     _transport: Any = None
     _extra: dict[str, Any]
+    _closing: bool
+    _waiter_connected: asyncio.Future[None]
+    metrics: Optional[Metrics]
+    _process_chunk: Callable[[Union[bytes, memoryview]], bool]
+    _check_negotiation_timer: Callable[[], None]
+
+    #: Number of bytes of received data queued for processing beyond which
+    #: reading from the transport is paused.
+    read_high = 512 * 1024
+    #: Number of bytes of received data queued at or below which reading is resumed.
+    read_low = 256 * 1024
+
+    # Receive queue, created only once data arrives faster than it is processed.
+    _rx_queue: Optional[Deque[bytes]] = None
+    _rx_queued = 0
+    _rx_task: Optional[asyncio.Task[None]] = None
+    _reading_paused = False
+
+    def _rx_buffer_of(self, data: Union[bytes, memoryview]) -> Optional[bytearray]:
+        """Return the receive buffer of which *data* views the first bytes, if known."""
+        return None
+
+    def _receive(self, data: Union[bytes, memoryview]) -> None:
+        """
+        Process *data* received by the transport.
+
+        Data is processed at once when nothing is queued.  Otherwise, or when
+        larger than is processed without yielding to the event loop, it is
+        queued for :meth:`_process_rx`, which joins small chunks queued
+        together, such as those of a peer sending one byte per packet, for
+        fewer passes of IAC interpretation.  Reading is paused while more than
+        :attr:`read_high` bytes are queued.  A memoryview, of a buffer reused
+        for the next read, is copied when queued.
+        """
+        if self._rx_task is None and len(data) <= _RX_YIELD:
+            if self._process_chunk(data) and not self._waiter_connected.done():
+                self._check_negotiation_timer()
+            return
+
+        queue = self._rx_queue
+        if queue is None:
+            queue = self._rx_queue = collections.deque()
+        queue.append(bytes(data))
+        self._rx_queued += len(data)
+        if self._rx_task is None:
+            self._rx_task = asyncio.get_event_loop().create_task(self._process_rx())
+
+        if not self._reading_paused and self._rx_queued >= self.read_high:
+            if self._transport is not None:
+                try:
+                    self._transport.pause_reading()
+                    self._reading_paused = True
+                    if self.metrics is not None:
+                        self.metrics.read_paused += 1
+                except Exception:
+                    # Some transports may not support pause_reading; ignore.
+                    pass
+
+    async def _process_rx(self) -> None:
+        """Process queued data, yielding to the event loop and resuming reading as it drains."""
+        processed = 0
+        any_cmd = False
+        queue = self._rx_queue
+        try:
+            while queue:
+                # Stop processing if connection was closed (feed_eof already called)
+                if self._closing:
+                    queue.clear()
+                    self._rx_queued = 0
+                    break
+
+                data = queue.popleft()
+                if queue and len(data) + len(queue[0]) <= _RX_COALESCE:
+                    parts = [data]
+                    size = len(data)
+                    while queue and size + len(queue[0]) <= _RX_COALESCE:
+                        size += len(queue[0])
+                        parts.append(queue.popleft())
+                    data = b"".join(parts)
+                self._rx_queued -= len(data)
+
+                any_cmd = self._process_chunk(data) or any_cmd
+                processed += len(data)
+
+                # Resume reading when we've drained below low watermark
+                if self._reading_paused and self._rx_queued <= self.read_low:
+                    if self._transport is not None:
+                        try:
+                            self._transport.resume_reading()
+                            self._reading_paused = False
+                            if self.metrics is not None:
+                                self.metrics.read_resumed += 1
+                        except Exception:
+                            pass
+
+                # Yield periodically to keep loop responsive without excessive context switching
+                if processed >= _RX_YIELD:
+                    await asyncio.sleep(0)
+                    processed = 0
+        finally:
+            self._rx_task = None
+            # Aggressively re-check negotiation if any command was seen and not yet connected
+            if any_cmd and not self._waiter_connected.done():
+                self._check_negotiation_timer()
+
+    def _discard_rx(self) -> None:
+        """Discard queued data and cancel its processing, as the connection is lost."""
+        if self._rx_queue is not None:
+            self._rx_queue.clear()
+        self._rx_queued = 0
+        if self._rx_task is not None and not self._rx_task.done():
+            self._rx_task.cancel()
+        self._rx_task = None
 
     @property
     def duration(self) -> float:
@@ -137,3 +271,64 @@ class TelnetProtocolBase:
             logger.debug("TLS handshake: %s cipher=%s", version, cipher_info[0])
         else:
             logger.debug("TLS handshake: %s", version)
+
+
+class BufferedTelnetProtocol(asyncio.BufferedProtocol):
+    """
+    Mixin receiving into a buffer reused for the life of the connection.
+
+    Combined with a server or client protocol, the transport receives by
+    ``recv_into()`` a :class:`bytearray` of :attr:`read_size` bytes, rather
+    than allocating :class:`bytes` for each read.  IAC is interpreted over a
+    :class:`memoryview` of it, and in-band data is copied once, into the
+    reader buffer::
+
+        from telnetlib3 import BufferedTelnetProtocol, TelnetTerminalClient
+
+        class MyClient(BufferedTelnetProtocol, TelnetTerminalClient):
+            pass
+
+        reader, writer = await open_connection(client_factory=MyClient, ...)
+
+    The memoryview is given to ``data_received()`` of the protocol, valid
+    only until it returns.
+    """
+
+    #: Size of the receive buffer, the most bytes received by each read, held
+    #: by each connection that has received data.
+    read_size = 16 * 1024
+
+    _rx_bytearray: Optional[bytearray] = None
+    _rx_buffer: Optional[memoryview] = None
+    _rx_view: Optional[memoryview] = None
+    data_received: Callable[[Union[bytes, memoryview]], None]
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the receive buffer, allocated by the first read."""
+        if self._rx_buffer is None:
+            self._rx_bytearray = bytearray(self.read_size)
+            self._rx_buffer = memoryview(self._rx_bytearray)
+        return self._rx_buffer
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Process *nbytes* received into the buffer."""
+        assert self._rx_buffer is not None
+        view = self._rx_view = self._rx_buffer[:nbytes]
+        try:
+            self.data_received(view)
+        finally:
+            self._rx_view = None
+
+    def _rx_buffer_of(self, data: Union[bytes, memoryview]) -> Optional[bytearray]:
+        """Return the receive buffer when *data* is the view given by :meth:`buffer_updated`."""
+        return self._rx_bytearray if data is self._rx_view else None
+
+    def eof_received(self) -> None:
+        """Called when the other end calls write_eof() or equivalent."""
+        # that of the protocol, rather than asyncio.BufferedProtocol, next in order.
+        super(asyncio.BufferedProtocol, self).eof_received()  # type: ignore[misc]
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Release the receive buffer once the connection is lost or closed."""
+        super().connection_lost(exc)
+        self._rx_buffer = self._rx_bytearray = None
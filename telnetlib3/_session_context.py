@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 # std imports
-from typing import IO, Any, Callable, Optional, Awaitable
+from typing import IO, TYPE_CHECKING, Any, List, Union, Callable, Optional, Awaitable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client_shell import TypescriptWriter
 
 __all__ = ("TelnetSessionContext",)
 
@@ -31,10 +34,28 @@ class TelnetSessionContext:
     :param autoreply_wait_fn: Async callable installed by the shell to gate autoreply
         sends on GA/EOR prompt signals; set automatically during shell startup.
     :param typescript_file: When set, all server output is appended to this file
-        (like the POSIX ``typescript`` command).
+        (like the POSIX ``typescript`` command).  A plain file is flushed after each
+        write, a :class:`~telnetlib3.client_shell.TypescriptWriter` buffers writes.
+    :param output_filters: Callables receiving and returning server output text, applied
+        in order after line endings are translated, before display.
     :param gmcp_data: Initial GMCP module data mapping; defaults to an empty dict.
     """
 
+    __slots__ = (
+        "raw_mode",
+        "ascii_eol",
+        "input_filter",
+        "autoreply_engine",
+        "autoreply_wait_fn",
+        "typescript_file",
+        "gmcp_data",
+        "output_filters",
+        # attributes of subclasses and applications are stored in a
+        # dictionary created on demand.
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         raw_mode: Optional[bool] = None,
@@ -42,8 +63,9 @@ class TelnetSessionContext:
         input_filter: Optional[Any] = None,
         autoreply_engine: Optional[Any] = None,
         autoreply_wait_fn: Optional[Callable[..., Awaitable[None]]] = None,
-        typescript_file: Optional[IO[str]] = None,
+        typescript_file: Optional[Union[IO[str], TypescriptWriter]] = None,
         gmcp_data: Optional[dict[str, Any]] = None,
+        output_filters: Optional[List[Callable[[str], str]]] = None,
     ) -> None:
         """Initialize session context with default attribute values."""
         self.raw_mode = raw_mode
@@ -53,3 +75,6 @@ class TelnetSessionContext:
         self.autoreply_wait_fn = autoreply_wait_fn
         self.typescript_file = typescript_file
         self.gmcp_data: dict[str, Any] = gmcp_data if gmcp_data is not None else {}
+        self.output_filters: List[Callable[[str], str]] = (
+            output_filters if output_filters is not None else []
+        )
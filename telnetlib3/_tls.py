@@ -0,0 +1,335 @@
+"""TLS handshakes performed in a thread pool, off the event loop thread."""
+
+from __future__ import annotations
+
+# std imports
+import ssl
+import time
+import asyncio
+import logging
+import concurrent.futures
+from typing import TYPE_CHECKING, Any, Tuple, Callable, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .server import TLSHandshakeStats
+
+__all__ = ("TLSTransport", "TLSHandshakeProtocol")
+
+logger = logging.getLogger("telnetlib3.server")
+
+#: Seconds allowed to complete a TLS handshake, as :mod:`asyncio` allows.
+HANDSHAKE_TIMEOUT = 60.0
+
+#: Size of plaintext read from a TLS connection at once.
+_READ_SIZE = 65536
+
+
+class TLSTransport(asyncio.Transport):
+    """
+    Transport of plaintext over a TLS connection established by :class:`TLSHandshakeProtocol`.
+
+    Data is encrypted and decrypted by an :class:`ssl.SSLObject` on the event
+    loop thread, and exchanged through the plain transport of the connection.
+    Extra info ``ssl_object``, ``sslcontext``, ``peercert``, ``cipher``, and
+    ``compression`` are given as by :meth:`asyncio.loop.start_tls`, other
+    names are answered by the plain transport.
+    """
+
+    def __init__(
+        self,
+        transport: asyncio.Transport,
+        sslobj: ssl.SSLObject,
+        incoming: ssl.MemoryBIO,
+        outgoing: ssl.MemoryBIO,
+    ) -> None:
+        """Class initializer."""
+        super().__init__()
+        self._ssl_extra = {
+            "ssl_object": sslobj,
+            "sslcontext": sslobj.context,
+            "peercert": sslobj.getpeercert(),
+            "cipher": sslobj.cipher(),
+            "compression": sslobj.compression(),
+        }
+        self._transport = transport
+        self._sslobj = sslobj
+        self._incoming = incoming
+        self._outgoing = outgoing
+        self._protocol: Optional[asyncio.BaseProtocol] = None
+        self._closing = False
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        """Return TLS or plain transport information *name*."""
+        if name in self._ssl_extra:
+            return self._ssl_extra[name]
+        return self._transport.get_extra_info(name, default)
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        """Set the protocol receiving plaintext."""
+        self._protocol = protocol
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        """Return the protocol receiving plaintext."""
+        assert self._protocol is not None
+        return self._protocol
+
+    def is_closing(self) -> bool:
+        """Return whether the transport is closing or closed."""
+        return self._closing or self._transport.is_closing()
+
+    def is_reading(self) -> bool:
+        """Return whether the transport is receiving."""
+        return self._transport.is_reading()
+
+    def pause_reading(self) -> None:
+        """Pause receiving."""
+        self._transport.pause_reading()
+
+    def resume_reading(self) -> None:
+        """Resume receiving."""
+        self._transport.resume_reading()
+
+    def set_write_buffer_limits(
+        self, high: Optional[int] = None, low: Optional[int] = None
+    ) -> None:
+        """Set flow control limits of the plain transport."""
+        self._transport.set_write_buffer_limits(high, low)
+
+    def get_write_buffer_limits(self) -> Tuple[int, int]:
+        """Return flow control limits of the plain transport."""
+        return self._transport.get_write_buffer_limits()
+
+    def get_write_buffer_size(self) -> int:
+        """Return the number of encrypted bytes buffered for sending."""
+        return self._transport.get_write_buffer_size()
+
+    def write(self, data: Any) -> None:
+        """Encrypt and send *data*."""
+        if self._closing:
+            return
+        view = memoryview(data)
+        while view:
+            count = self._sslobj.write(view)
+            view = view[count:]
+        self._flush()
+
+    def can_write_eof(self) -> bool:
+        """Return ``False``, TLS connections cannot be half-closed."""
+        return False
+
+    def write_eof(self) -> None:
+        """Raise :exc:`NotImplementedError`, TLS connections cannot be half-closed."""
+        raise NotImplementedError("TLS connections cannot be half-closed")
+
+    def close(self) -> None:
+        """Send TLS close_notify and close the connection once buffered data is sent."""
+        if self._closing:
+            return
+        self._closing = True
+        try:
+            self._sslobj.unwrap()
+        except ssl.SSLError:
+            # the reply of the peer to close_notify is not awaited.
+            pass
+        self._flush()
+        self._transport.close()
+
+    def abort(self) -> None:
+        """Close the connection immediately, discarding buffered data."""
+        self._closing = True
+        self._transport.abort()
+
+    def _flush(self) -> None:
+        """Send any encrypted data pending in the outgoing BIO."""
+        data = self._outgoing.read()
+        if data:
+            self._transport.write(data)
+
+    def _data_received(self, data: bytes) -> None:
+        """Decrypt *data* received by the plain transport and deliver it to the protocol."""
+        if data:
+            self._incoming.write(data)
+        while not self._transport.is_closing():
+            try:
+                chunk = self._sslobj.read(_READ_SIZE)
+            except ssl.SSLWantReadError:
+                break
+            except ssl.SSLZeroReturnError:
+                # close_notify received
+                self._eof_received()
+                break
+            except ssl.SSLError as exc:
+                logger.debug("TLS error from %s: %s", self.get_extra_info("peername"), exc)
+                self.abort()
+                break
+            assert self._protocol is not None
+            self._protocol.data_received(chunk)  # type: ignore[attr-defined]
+        # replies to key updates
+        self._flush()
+
+    def _eof_received(self) -> bool:
+        """Deliver end of stream to the protocol, closing unless it keeps the connection open."""
+        assert self._protocol is not None
+        keep_open = bool(self._protocol.eof_received())  # type: ignore[attr-defined]
+        if not keep_open:
+            self.close()
+        return keep_open
+
+
+class TLSHandshakeProtocol(asyncio.Protocol):
+    """
+    Protocol that completes a server TLS handshake in a thread pool, then hands off.
+
+    Each step of the handshake is run by :meth:`ssl.SSLObject.do_handshake` in
+    *executor*, where OpenSSL releases the GIL for its cryptography, so that
+    many handshakes after a storm of reconnects do not occupy the event loop
+    thread.  Handshake messages are exchanged by the event loop.  Once
+    complete, a protocol of *real_factory* is connected to a
+    :class:`TLSTransport`, and this protocol remains the protocol of the plain
+    transport, passing data through it.
+
+    :param ssl_context: Server :class:`ssl.SSLContext` of the connection.
+    :param executor: Executor that performs handshake steps.
+    :param real_factory: Factory of the protocol of the TLS connection.
+    :param stats: Statistics recording the outcome of the handshake.
+    :param timeout: Seconds to complete the handshake, the connection is
+        aborted when exceeded.
+    """
+
+    def __init__(
+        self,
+        ssl_context: ssl.SSLContext,
+        executor: concurrent.futures.Executor,
+        real_factory: Callable[[], asyncio.Protocol],
+        stats: Optional["TLSHandshakeStats"] = None,
+        timeout: float = HANDSHAKE_TIMEOUT,
+    ) -> None:
+        """Class initializer."""
+        self._ssl_context = ssl_context
+        self._executor = executor
+        self._real_factory = real_factory
+        self._stats = stats
+        self._timeout = timeout
+        self._transport: Optional[asyncio.Transport] = None
+        self._tls_transport: Optional[TLSTransport] = None
+        self._incoming = ssl.MemoryBIO()
+        self._outgoing = ssl.MemoryBIO()
+        self._sslobj = ssl_context.wrap_bio(self._incoming, self._outgoing, server_side=True)
+        # Data received while a handshake step runs in the executor, where
+        # the incoming BIO must not be written.
+        self._pending = bytearray()
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._exc: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Begin the handshake."""
+        self._transport = transport  # type: ignore[assignment]
+        self._task = asyncio.ensure_future(self._handshake())
+
+    def data_received(self, data: bytes) -> None:
+        """Receive handshake messages, or TLS records of an established connection."""
+        if self._tls_transport is not None:
+            self._tls_transport._data_received(data)
+            return
+        self._pending += data
+        self._wake()
+
+    def eof_received(self) -> Optional[bool]:
+        """End of stream without TLS close_notify."""
+        if self._tls_transport is not None:
+            return self._tls_transport._eof_received()
+        self._wake(ConnectionResetError("connection closed during TLS handshake"))
+        return False
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Connection closed, before or after handshake."""
+        if self._tls_transport is not None:
+            self._tls_transport.get_protocol().connection_lost(exc)
+            return
+        self._wake(exc or ConnectionResetError("connection closed during TLS handshake"))
+
+    def pause_writing(self) -> None:
+        """Pause writing of the protocol of the TLS connection."""
+        if self._tls_transport is not None:
+            self._tls_transport.get_protocol().pause_writing()
+
+    def resume_writing(self) -> None:
+        """Resume writing of the protocol of the TLS connection."""
+        if self._tls_transport is not None:
+            self._tls_transport.get_protocol().resume_writing()
+
+    def _wake(self, exc: Optional[BaseException] = None) -> None:
+        if exc is not None:
+            self._exc = exc
+        if self._waiter is not None and not self._waiter.done():
+            if exc is None:
+                self._waiter.set_result(None)
+            else:
+                self._waiter.set_exception(exc)
+
+    async def _handshake(self) -> None:
+        assert self._transport is not None
+        stime = time.monotonic()
+        try:
+            await asyncio.wait_for(self._do_handshake(), self._timeout)
+        except (ssl.SSLError, OSError, RuntimeError, asyncio.TimeoutError) as exc:
+            # RuntimeError when the executor is shut down by Server.close()
+            logger.debug("TLS handshake failed: %s", exc)
+            if self._stats is not None:
+                self._stats.record_failure()
+            self._transport.abort()
+            return
+        elapsed = time.monotonic() - stime
+        if self._stats is not None:
+            self._stats.record(elapsed, self._sslobj.session_reused)
+        logger.debug(
+            "TLS handshake with %s in %.1fms",
+            self._transport.get_extra_info("peername"),
+            elapsed * 1000,
+        )
+        if self._exc is not None or self._transport.is_closing():
+            # the connection was lost while the last step ran in the executor,
+            # a protocol connected now would never receive connection_lost().
+            logger.debug("TLS connection closed before hand-off: %s", self._exc)
+            self._transport.abort()
+            return
+        self._tls_transport = TLSTransport(
+            self._transport, self._sslobj, self._incoming, self._outgoing
+        )
+        protocol = self._real_factory()
+        self._tls_transport.set_protocol(protocol)
+        protocol.connection_made(self._tls_transport)
+        # application data that followed the handshake
+        pending, self._pending = bytes(self._pending), bytearray()
+        self._tls_transport._data_received(pending)
+
+    async def _do_handshake(self) -> None:
+        assert self._transport is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._pending:
+                self._incoming.write(self._pending)
+                self._pending.clear()
+            try:
+                await loop.run_in_executor(self._executor, self._sslobj.do_handshake)
+            except ssl.SSLWantReadError:
+                self._send_outgoing()
+                if self._exc is not None:
+                    raise self._exc
+                if not self._pending:
+                    self._waiter = loop.create_future()
+                    try:
+                        await self._waiter
+                    finally:
+                        self._waiter = None
+                continue
+            break
+        # Finished, and session tickets of TLS 1.3
+        self._send_outgoing()
+
+    def _send_outgoing(self) -> None:
+        assert self._transport is not None
+        data = self._outgoing.read()
+        if data:
+            self._transport.write(data)
@@ -12,15 +12,19 @@ import struct
 import asyncio
 import argparse
 import functools
-from typing import Any, Dict, List, Tuple, Union, Callable, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Callable, Optional, Sequence
 
 # local
 from telnetlib3 import accessories, client_base
+from telnetlib3._base import BufferedTelnetProtocol
 from telnetlib3._types import ShellCallback
 from telnetlib3.stream_reader import TelnetReader, TelnetReaderUnicode
-from telnetlib3.stream_writer import TelnetWriter, TelnetWriterUnicode
+from telnetlib3.stream_writer import WriteLimit, TelnetWriter, TelnetWriterUnicode
 
-__all__ = ("TelnetClient", "TelnetTerminalClient", "open_connection")
+if TYPE_CHECKING:  # pragma: no cover
+    from telnetlib3.metrics import Metrics
+
+__all__ = ("TelnetClient", "TelnetTerminalClient", "BufferedTelnetClient", "open_connection")
 
 #: Default GMCP modules requested via ``Core.Supports.Set``.
 #: Sub-modules are listed explicitly because not all servers treat
@@ -489,6 +493,16 @@ class TelnetTerminalClient(TelnetClient):
                 return (int(os.environ.get("LINES", 25)), int(os.environ.get("COLUMNS", 80)))
 
 
+class BufferedTelnetClient(BufferedTelnetProtocol, TelnetClient):
+    """
+    :class:`TelnetClient` receiving into a buffer reused for the connection.
+
+    An :class:`asyncio.BufferedProtocol`, given a :class:`memoryview` of
+    received data by ``data_received()``, valid only until it returns.  Other
+    protocols may be combined with its mixin, ``telnetlib3.BufferedTelnetProtocol``.
+    """
+
+
 async def open_connection(
     host: Optional[str] = None,
     port: int = 23,
@@ -516,6 +530,11 @@ async def open_connection(
     send_environ: Optional[Sequence[str]] = None,
     ssl: Union[bool, ssl_module.SSLContext, None] = None,
     server_hostname: Optional[str] = None,
+    protocol_trace: int = 0,
+    metrics: Optional[Metrics] = None,
+    write_limit: Optional[WriteLimit] = None,
+    read_high: Optional[int] = None,
+    read_low: Optional[int] = None,
 ) -> Tuple[Union[TelnetReader, TelnetReaderUnicode], Union[TelnetWriter, TelnetWriterUnicode]]:
     """
     Connect to a TCP Telnet server as a Telnet client.
@@ -585,16 +604,36 @@ async def open_connection(
         uses plain TCP.
     :param server_hostname: Hostname for TLS certificate verification.  When
         ``ssl`` is truthy and *server_hostname* is ``None``, defaults to *host*.
+    :param protocol_trace: Number of telnet commands received and sent that
+        are kept by :attr:`~.TelnetWriter.trace`, a :class:`~.ProtocolTrace`.
+        ``0`` (default) does not record them.
+    :param metrics: A :class:`~telnetlib3.metrics.Metrics` updated by the
+        connection.  ``None`` (default) counts nothing.
+    :param write_limit: A :class:`~.WriteLimit` of output buffered for the
+        server, and the policy applied beyond it.  ``None`` (default) uses the
+        limits of the transport.
+    :param read_high: Number of bytes received and queued for processing
+        beyond which reading from the server is paused.  ``None`` (default)
+        uses :attr:`~.BaseClient.read_high`, 512 KiB.
+    :param read_low: Number of bytes queued at or below which reading is
+        resumed.  ``None`` (default) uses :attr:`~.BaseClient.read_low`,
+        256 KiB.
+    :raises ValueError: When *read_low* is greater than *read_high*.
     :return: The reader is a :class:`~.TelnetReader` instance, the writer is a
         :class:`~.TelnetWriter` instance.
     """
+    high = client_base.BaseClient.read_high if read_high is None else read_high
+    low = client_base.BaseClient.read_low if read_low is None else read_low
+    if not 0 <= low <= high:
+        raise ValueError(f"read_low={low} must be between 0 and read_high={high}")
+
     if client_factory is None:
         client_factory = TelnetClient
         if sys.stdin.isatty():
             client_factory = TelnetTerminalClient
 
     def connection_factory() -> client_base.BaseClient:
-        return client_factory(
+        client = client_factory(
             encoding=encoding,
             encoding_errors=encoding_errors,
             force_binary=force_binary,
@@ -612,6 +651,17 @@ async def open_connection(
             limit=limit,
             send_environ=send_environ,
         )
+        if protocol_trace:
+            client.protocol_trace = protocol_trace
+        if metrics is not None:
+            client.metrics = metrics
+        if write_limit is not None:
+            client.write_limit = write_limit
+        if read_high is not None:
+            client.read_high = read_high
+        if read_low is not None:
+            client.read_low = read_low
+        return client
 
     # Resolve TLS context
     ssl_context: Union[ssl_module.SSLContext, None] = None
@@ -739,12 +789,16 @@ async def run_client() -> None:
             reader: Union[TelnetReader, TelnetReaderUnicode],
             writer_arg: Union[TelnetWriter, TelnetWriterUnicode],
         ) -> None:
+            from .client_shell import TypescriptWriter
+
             ctx = writer_arg.ctx
             assert typescript_path is not None
-            ts_file = open(  # noqa: SIM115
-                typescript_path,
-                "w" if args.get("typescript_mode") == "rewrite" else "a",
-                encoding="utf-8",
+            ts_file = TypescriptWriter(
+                open(  # noqa: SIM115
+                    typescript_path,
+                    "w" if args.get("typescript_mode") == "rewrite" else "a",
+                    encoding="utf-8",
+                )
             )
             ctx.typescript_file = ts_file
             try:
@@ -8,8 +8,7 @@ import asyncio
 import logging
 import weakref
 import datetime
-import collections
-from typing import Any, Union, Optional, cast
+from typing import TYPE_CHECKING, Any, Union, Optional, cast
 
 # local
 from ._base import TelnetProtocolBase, _log_exception, _process_data_chunk
@@ -17,7 +16,10 @@ from ._types import ShellCallback
 from .telopt import DO, WILL, theNULL, name_commands
 from .accessories import TRACE, hexdump
 from .stream_reader import TelnetReader, TelnetReaderUnicode
-from .stream_writer import TelnetWriter, TelnetWriterUnicode
+from .stream_writer import WriteLimit, TelnetWriter, ProtocolTrace, TelnetWriterUnicode
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import Metrics
 
 __all__ = ("BaseClient",)
 
@@ -33,6 +35,19 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
     _writer_factory_encoding = TelnetWriterUnicode
     _check_later: Optional[asyncio.Handle] = None
 
+    #: Number of telnet commands kept by :attr:`TelnetWriter.trace
+    #: <telnetlib3.stream_writer.TelnetWriter.trace>` of each connection, ``0``
+    #: (default) does not record them.
+    protocol_trace = 0
+
+    #: A :class:`~telnetlib3.metrics.Metrics` updated by each connection, or
+    #: ``None`` (default) when not counted.
+    metrics: Optional[Metrics] = None
+
+    #: A :class:`~telnetlib3.stream_writer.WriteLimit` applied to the writer of
+    #: each connection, or ``None`` (default) for the limits of the transport.
+    write_limit: Optional[WriteLimit] = None
+
     def __init__(
         self,
         shell: Optional[ShellCallback] = None,
@@ -74,15 +89,6 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         self._mccp3_compressor: Optional[zlib._Compress] = None
         self._mccp3_orig_write: Any = None
 
-        # High-throughput receive pipeline
-        self._rx_queue: collections.deque[bytes] = collections.deque()
-        self._rx_bytes = 0
-        self._rx_task: Optional[asyncio.Task[Any]] = None
-        self._reading_paused = False
-        # Apply backpressure to transport when our queue grows too large
-        self._read_high = 512 * 1024  # pause_reading() above this many buffered bytes
-        self._read_low = 256 * 1024  # resume_reading() below this many buffered bytes
-
     # Base protocol methods
 
     def eof_received(self) -> None:
@@ -100,6 +106,8 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         if self._closing:
             return
         self._closing = True
+        if self.metrics is not None:
+            self.metrics.connections_closed += 1
 
         # Clean up MCCP compressors/decompressors
         self._mccp2_decompressor = None
@@ -109,11 +117,7 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
 
         # Drain any pending rx data before signalling EOF to prevent
         # _process_rx from calling feed_data() after feed_eof().
-        self._rx_queue.clear()
-        self._rx_bytes = 0
-        if self._rx_task is not None and not self._rx_task.done():
-            self._rx_task.cancel()
-            self._rx_task = None
+        self._discard_rx()
 
         # inform yielding readers about closed connection
         if exc is None:
@@ -184,6 +188,13 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         self.writer = writer_factory(
             transport=_transport, protocol=self, reader=self.reader, client=True, **writer_kwds
         )
+        if self.protocol_trace:
+            self.writer.trace = ProtocolTrace(self.protocol_trace)
+        if self.metrics is not None:
+            self.metrics.connections_opened += 1
+            self.writer.metrics = self.reader.metrics = self.metrics
+        if self.write_limit is not None:
+            self.writer.set_write_limit(self.write_limit)
 
         self.log.info("Connected to %s", self)
         self._log_tls_info(self.log)
@@ -196,6 +207,8 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         # Don't start shell if the connection was cancelled or errored
         if future.cancelled() or future.exception() is not None:
             return
+        if self.metrics is not None:
+            self.metrics.shell_start_seconds.observe(self.duration)
         if self.shell is not None:
             assert self.reader is not None and self.writer is not None
             coro = self.shell(self.reader, self.writer)
@@ -223,8 +236,8 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         """
         Process bytes received by transport.
 
-        Buffer incoming data and schedule async processing to keep the event loop responsive. Apply
-        read-side backpressure using transport.pause_reading()/resume_reading().
+        Data is processed at once, or queued for async processing while earlier data is pending,
+        applying read-side backpressure using transport.pause_reading()/resume_reading().
         """
         if self.log.isEnabledFor(TRACE):
             self.log.log(TRACE, "recv %d bytes\n%s", len(data), hexdump(data, prefix="<<  "))
@@ -233,24 +246,9 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         # Detect SyncTERM font switching sequences and auto-switch encoding.
         self._detect_syncterm_font(data)
 
-        # Enqueue and account for buffered size
-        self._rx_queue.append(data)
-        self._rx_bytes += len(data)
-
-        # Start processor task if not running
-        if self._rx_task is None or self._rx_task.done():
-            loop = asyncio.get_event_loop()
-            self._rx_task = loop.create_task(self._process_rx())
-
-        # Pause reading if buffered bytes exceed high watermark
-        if not self._reading_paused and self._rx_bytes >= self._read_high:
-            if self._transport is not None:
-                try:
-                    self._transport.pause_reading()
-                    self._reading_paused = True
-                except Exception:
-                    # Some transports may not support pause_reading; ignore.
-                    pass
+        if self.metrics is not None:
+            self.metrics.bytes_received += len(data)
+        self._receive(data)
 
     def _detect_syncterm_font(self, data: bytes) -> None:
         """
@@ -275,6 +273,20 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
                 self.writer.environ_encoding = encoding
             self.force_binary = True
 
+    def pause_writing(self) -> None:
+        """Pause writing when the transport buffer exceeds its high-water mark."""
+        super().pause_writing()
+        if self.metrics is not None:
+            self.metrics.write_paused += 1
+        if self.writer is not None:
+            self.writer._pause_writing()
+
+    def resume_writing(self) -> None:
+        """Resume writing when the transport buffer drains to its low-water mark."""
+        super().resume_writing()
+        if self.writer is not None:
+            self.writer._resume_writing()
+
     # public properties
 
     def begin_negotiation(self) -> None:
@@ -354,7 +366,7 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
 
     # private methods
 
-    def _process_chunk(self, data: bytes) -> bool:
+    def _process_chunk(self, data: Union[bytes, memoryview]) -> bool:
         """Process a chunk of received bytes; return True if any IAC/SB cmd observed."""
         self._last_received = datetime.datetime.now()
 
@@ -387,7 +399,7 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
 
         return self._process_chunk_inner(data)
 
-    def _process_chunk_inner(self, data: bytes) -> bool:
+    def _process_chunk_inner(self, data: Union[bytes, memoryview]) -> bool:
         """Inner chunk processing with IAC interpretation and mid-chunk MCCP2 detection."""
         try:
             mode = self.writer.mode
@@ -402,7 +414,7 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
             slc_special = None
 
         cmd_received = _process_data_chunk(
-            data, self.writer, self.reader, slc_special, self.log.warning
+            data, self.writer, self.reader, slc_special, self.log.warning, self._rx_buffer_of(data)
         )
 
         if self.writer._compressed_remainder is not None:
@@ -418,44 +430,6 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
 
         return cmd_received
 
-    async def _process_rx(self) -> None:
-        """Async processor for receive queue that yields control and applies backpressure."""
-        processed = 0
-        any_cmd = False
-        try:
-            while self._rx_queue:
-                # Stop processing if connection was closed (feed_eof already called)
-                if self._closing:
-                    self._rx_queue.clear()
-                    self._rx_bytes = 0
-                    break
-
-                chunk = self._rx_queue.popleft()
-                self._rx_bytes -= len(chunk)
-
-                cmd = self._process_chunk(chunk)
-                any_cmd = any_cmd or cmd
-                processed += len(chunk)
-
-                # Resume reading when we've drained below low watermark
-                if self._reading_paused and self._rx_bytes <= self._read_low:
-                    if self._transport is not None:
-                        try:
-                            self._transport.resume_reading()
-                            self._reading_paused = False
-                        except Exception:
-                            pass
-
-                # Yield periodically to keep loop responsive without excessive context switching
-                if processed >= 128 * 1024:
-                    await asyncio.sleep(0)
-                    processed = 0
-        finally:
-            self._rx_task = None
-            # Aggressively re-check negotiation if any command was seen and not yet connected
-            if any_cmd and not self._waiter_connected.done():
-                self._check_negotiation_timer()
-
     def _mccp2_start(self) -> None:
         """Start MCCP2 decompression of server→client data."""
         self._mccp2_decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 32)
@@ -481,6 +455,9 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
             if self._mccp3_compressor is not None:
                 compressed = self._mccp3_compressor.compress(data)
                 compressed += self._mccp3_compressor.flush(zlib.Z_SYNC_FLUSH)
+                if self.metrics is not None:
+                    self.metrics.mccp_bytes_in += len(data)
+                    self.metrics.mccp_bytes_out += len(compressed)
                 orig_write(compressed)
             else:
                 orig_write(data)
@@ -501,6 +478,10 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         self.log.debug("MCCP3 compression ended (client→server)")
 
     def _check_negotiation_timer(self) -> None:
+        # data may be processed as it is received, before begin_negotiation()
+        # schedules the first check.
+        if self._check_later is None:
+            return
         self._check_later.cancel()
         self._tasks.remove(self._check_later)
 
@@ -509,7 +490,7 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
 
         if self.check_negotiation(final=final):
             self.log.debug("negotiation complete after %1.2fs.", self.duration)
-            self._waiter_connected.set_result(None)
+            self._negotiation_done()
         elif final:
             self.log.debug("negotiation failed after %1.2fs.", self.duration)
             _failed = [
@@ -518,7 +499,7 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
                 if pending
             ]
             self.log.debug("failed-reply: %r", ", ".join(_failed))
-            self._waiter_connected.set_result(None)
+            self._negotiation_done()
         else:
             # keep re-queuing until complete.  Aggressively re-queue until
             # connect_minwait, or connect_maxwait, whichever occurs next
@@ -531,4 +512,9 @@ class BaseClient(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
             )
             self._tasks.append(self._check_later)
 
+    def _negotiation_done(self) -> None:
+        if self.metrics is not None:
+            self.metrics.negotiation_seconds.observe(self.duration)
+        self._waiter_connected.set_result(None)
+
     _log_exception = staticmethod(_log_exception)
@@ -2,13 +2,28 @@
 
 # std imports
 import os
+import re
 import sys
+import codecs
 import asyncio
 import logging
 import threading
 import collections
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Tuple, Union, Generic, TypeVar, Callable, Optional, Protocol
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Tuple,
+    Union,
+    Generic,
+    Mapping,
+    Pattern,
+    TypeVar,
+    Callable,
+    Optional,
+    Protocol,
+)
 from dataclasses import dataclass
 
 # local
@@ -24,7 +39,7 @@ from .accessories import TRACE  # noqa: E402
 from .stream_reader import TelnetReader, TelnetReaderUnicode  # noqa: E402
 from .stream_writer import TelnetWriter, TelnetWriterUnicode  # noqa: E402
 
-__all__ = ("InputFilter", "TelnetTerminalShell", "telnet_client_shell")
+__all__ = ("InputFilter", "TelnetTerminalShell", "TypescriptWriter", "telnet_client_shell")
 
 # ATASCII graphics characters that map to byte 0x0D and 0x0A respectively.
 # When --ascii-eol is active, these are replaced with \r and \n before
@@ -119,14 +134,24 @@ class InputFilter:
         """Initialize input filter with sequence and byte translation tables."""
         self._map_singlebyte = byte_xlat
         self.esc_delay = esc_delay
-        # Sort sequences longest-first so \x1b[3~ matches before \x1b[3
-        self._seq_sorted: Tuple[Tuple[bytes, bytes], ...] = tuple(
-            sorted(seq_xlat.items(), key=lambda kv: len(kv[0]), reverse=True)
+        # Table for bytes.translate() of single bytes
+        self._table = bytes(byte_xlat.get(b, b) for b in range(256))
+        self._seq_xlat = dict(seq_xlat)
+        # Alternation of sequences, longest-first so \x1b[3~ matches before \x1b[3
+        seq_sorted = sorted(seq_xlat, key=len, reverse=True)
+        self._seq_pattern: Optional[Pattern[bytes]] = (
+            re.compile(b"|".join(re.escape(seq) for seq in seq_sorted)) if seq_sorted else None
+        )
+        # First bytes of all sequences; runs without them are translated in bulk
+        leads = bytes(sorted({seq[0] for seq in seq_xlat}))
+        self._lead_pattern: Optional[Pattern[bytes]] = (
+            re.compile(b"[" + re.escape(leads) + b"]") if leads else None
         )
         # Prefix set for partial-match buffering (blessed's get_leading_prefixes)
         self._mbs_prefixes: frozenset[bytes] = frozenset(
             seq[:i] for seq in seq_xlat for i in range(1, len(seq))
         )
+        self._max_seq_len = max((len(seq) for seq in seq_xlat), default=0)
         self._buf = b""
 
     @property
@@ -143,12 +168,9 @@ class InputFilter:
 
         :returns: Translated bytes from the buffer (may be empty).
         """
-        result = bytearray()
-        while self._buf:
-            b = self._buf[0]
-            self._buf = self._buf[1:]
-            result.append(self._map_singlebyte.get(b, b))
-        return bytes(result)
+        result = self._buf.translate(self._table)
+        self._buf = b""
+        return result
 
     def feed(self, data: bytes) -> bytes:
         """
@@ -161,26 +183,34 @@ class InputFilter:
         :param data: Raw bytes from terminal stdin.
         :returns: Translated bytes ready to send to the remote BBS.
         """
-        self._buf += data
+        buf = self._buf + data
+        if self._lead_pattern is None or self._seq_pattern is None:
+            self._buf = b""
+            return buf.translate(self._table)
+        end = len(buf)
+        pos = 0
         result = bytearray()
-        while self._buf:
+        while pos < end:
+            # Translate the run up to the next byte that may begin a sequence
+            lead = self._lead_pattern.search(buf, pos)
+            run_end = lead.start() if lead is not None else end
+            if run_end > pos:
+                result += buf[pos:run_end].translate(self._table)
+                pos = run_end
+                continue
             # Try multi-byte sequence match at current position
-            matched = False
-            for seq, repl in self._seq_sorted:
-                if self._buf[: len(seq)] == seq:
-                    result.extend(repl)
-                    self._buf = self._buf[len(seq) :]
-                    matched = True
-                    break
-            if matched:
+            match = self._seq_pattern.match(buf, pos)
+            if match is not None:
+                result += self._seq_xlat[match.group()]
+                pos = match.end()
                 continue
-            # Check if buffer is a prefix of any known sequence -- wait for more
-            if self._buf in self._mbs_prefixes:
+            # Check if remainder is a prefix of any known sequence -- wait for more
+            if end - pos < self._max_seq_len and buf[pos:] in self._mbs_prefixes:
                 break
             # No sequence match, emit single byte with translation
-            b = self._buf[0]
-            self._buf = self._buf[1:]
-            result.append(self._map_singlebyte.get(b, b))
+            result.append(self._table[buf[pos]])
+            pos += 1
+        self._buf = buf[pos:]
         return bytes(result)
 
 
@@ -289,7 +319,7 @@ class LinemodeBuffer:
 
     def __init__(
         self,
-        slctab: Dict[bytes, slc_module.SLC],
+        slctab: Mapping[bytes, slc_module.SLC],
         forwardmask: Optional[slc_module.Forwardmask] = None,
         trapsig: bool = False,
     ) -> None:
@@ -365,10 +395,13 @@ def _transform_output(
     out: str, writer: Union[TelnetWriter, TelnetWriterUnicode], in_raw_mode: bool
 ) -> str:
     r"""
-    Apply ASCII EOL substitution and CRLF normalization.
+    Apply ASCII EOL substitution, CRLF normalization, and output filters.
+
+    Output already in the form required, such as ``\r\n`` line endings in raw mode, is returned
+    without copying.
 
     :param out: Server output text to transform.
-    :param writer: Telnet writer (``ctx`` provides ascii_eol).
+    :param writer: Telnet writer (``ctx`` provides ascii_eol and output_filters).
     :param in_raw_mode: When ``True``, normalize line endings to ``\r\n``.
     :returns: Transformed output string.
     """
@@ -376,14 +409,122 @@ def _transform_output(
     if ctx.ascii_eol:
         out = out.replace(_ATASCII_CR_CHAR, "\r").replace(_ATASCII_LF_CHAR, "\n")
     if in_raw_mode:
-        out = out.replace("\r\n", "\n").replace("\n", "\r\n")
+        # Only when some LF is not already preceded by CR
+        if "\n" in out and out.count("\n") != out.count("\r\n"):
+            out = out.replace("\r\n", "\n").replace("\n", "\r\n")
     else:
         # Cooked mode: PTY ONLCR converts \n -> \r\n, so strip \r before \n
         # to avoid doubling (\r\n -> \r\r\n).
         out = out.replace("\r\n", "\n")
+    for output_filter in ctx.output_filters:
+        out = output_filter(out)
     return out
 
 
+def _transform_output_bytes(out: bytes, in_raw_mode: bool) -> bytes:
+    r"""
+    Apply CRLF normalization to server output displayed without decoding.
+
+    Bytes counterpart of :func:`_transform_output`, see :func:`_output_passthrough`.
+
+    :param out: Server output, encoded as UTF-8.
+    :param in_raw_mode: When ``True``, normalize line endings to ``\r\n``.
+    :returns: Transformed output bytes.
+    """
+    if in_raw_mode:
+        if b"\n" in out and out.count(b"\n") != out.count(b"\r\n"):
+            out = out.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+        return out
+    return out.replace(b"\r\n", b"\n")
+
+
+def _output_passthrough(
+    reader: Union[TelnetReader, TelnetReaderUnicode],
+    writer: Union[TelnetWriter, TelnetWriterUnicode],
+) -> bool:
+    """
+    Return whether server output may be displayed as received, without decoding.
+
+    Local output is always encoded as UTF-8, so output received in UTF-8 is displayed as-is, unless
+    ascii_eol or output_filters of the session context require text.
+    """
+    ctx: TelnetSessionContext = writer.ctx
+    if not isinstance(reader, TelnetReaderUnicode) or ctx.ascii_eol or ctx.output_filters:
+        return False
+    try:
+        return codecs.lookup(reader.fn_encoding(incoming=True)).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _make_output_task(
+    reader: Union[TelnetReader, TelnetReaderUnicode],
+    writer: Union[TelnetWriter, TelnetWriterUnicode],
+) -> "asyncio.Task[Any]":
+    """Return task reading server output, as bytes when :func:`_output_passthrough`."""
+    if _output_passthrough(reader, writer):
+        assert isinstance(reader, TelnetReaderUnicode)
+        return asyncio.ensure_future(reader.read_raw(2**24))
+    return accessories.make_reader_task(reader, size=2**24)
+
+
+class TypescriptWriter:
+    """
+    Buffered recorder of server output to a typescript file.
+
+    Rather than writing and flushing the file for each receipt of server output, text is held until
+    ``flush_size`` characters are buffered, or until ``flush_interval`` seconds have passed since
+    the first of them.  Given as :attr:`TelnetSessionContext.typescript_file
+    <telnetlib3._session_context.TelnetSessionContext.typescript_file>` by the ``--typescript``
+    option of ``telnetlib3-client``.
+
+    :param file: Text file to record to.
+    :param flush_interval: Seconds that buffered text may be held before it is written.
+    :param flush_size: Number of buffered characters that are written at once.
+    """
+
+    def __init__(self, file: IO[str], flush_interval: float = 1.0, flush_size: int = 2**16) -> None:
+        """Initialize typescript recorder of ``file``."""
+        self.file = file
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._buf: list[str] = []
+        self._size = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def write(self, text: str) -> None:
+        """Buffer ``text``, writing to file when ``flush_size`` characters are held."""
+        if not text:
+            return
+        self._buf.append(text)
+        self._size += len(text)
+        if self._size >= self.flush_size:
+            self.flush()
+        elif self._timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.flush()
+            else:
+                self._timer = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Write all buffered text and flush file."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buf:
+            self.file.write("".join(self._buf))
+            self._buf.clear()
+            self._size = 0
+        self.file.flush()
+
+    def close(self) -> None:
+        """Write all buffered text and close file."""
+        self.flush()
+        self.file.close()
+
+
 def _send_stdin(
     inp: bytes,
     telnet_writer: Union[TelnetWriter, TelnetWriterUnicode],
@@ -482,8 +623,10 @@ async def _raw_event_loop(
 ) -> None:
     """Standard byte-at-a-time event loop (mutates *state* in-place)."""
     stdin_task = accessories.make_reader_task(stdin)
-    telnet_task = accessories.make_reader_task(telnet_reader, size=2**24)
+    telnet_task = _make_output_task(telnet_reader, telnet_writer)
     esc_timer_task: Optional[asyncio.Task[None]] = None
+    # Decoder of output received as bytes, for autoreply engine and typescript
+    text_decoder: Optional[codecs.IncrementalDecoder] = None
     wait_for: set[asyncio.Task[Any]] = {stdin_task, telnet_task}
 
     while wait_for:
@@ -560,10 +703,20 @@ async def _raw_event_loop(
                 continue
             raw_mode = _get_raw_mode(telnet_writer)
             in_raw = raw_mode is True or (raw_mode is None and state.switched_to_raw)
-            out = _transform_output(out, telnet_writer, in_raw)
             ar_engine = _ensure_autoreply_engine(telnet_writer)
+            _ts_file = telnet_writer.ctx.typescript_file
+            if isinstance(out, bytes):
+                out_bytes = _transform_output_bytes(out, in_raw)
+                out_text = ""
+                if ar_engine is not None or _ts_file is not None:
+                    if text_decoder is None:
+                        text_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                    out_text = text_decoder.decode(out_bytes)
+            else:
+                out_text = _transform_output(out, telnet_writer, in_raw)
+                out_bytes = b""
             if ar_engine is not None:
-                ar_engine.feed(out)
+                ar_engine.feed(out_text)
             if raw_mode is None or (raw_mode is True and state.switched_to_raw):
                 mode_result = tty_shell.check_auto_mode(state.switched_to_raw, state.last_will_echo)
                 if mode_result is not None:
@@ -575,16 +728,17 @@ async def _raw_event_loop(
                     # now has ONLCR disabled.  Re-normalize so bare \n
                     # becomes \r\n for correct display.
                     if state.switched_to_raw and not in_raw:
-                        out = out.replace("\n", "\r\n")
+                        out_text = out_text.replace("\n", "\r\n")
+                        out_bytes = out_bytes.replace(b"\n", b"\r\n")
                 if raw_mode is None and want_repl():
                     state.reactivate_repl = True
-            stdout.write(out.encode())
+            stdout.write(out_bytes or out_text.encode())
             if hasattr(stdout, 'drain'):
                 await stdout.drain()
-            _ts_file = telnet_writer.ctx.typescript_file
             if _ts_file is not None:
-                _ts_file.write(out)
-                _ts_file.flush()
+                _ts_file.write(out_text)
+                if not isinstance(_ts_file, TypescriptWriter):
+                    _ts_file.flush()
             if state.reactivate_repl:
                 telnet_writer.log.debug("mode returned to local, reactivating REPL")
                 if stdin_task in wait_for:
@@ -592,7 +746,7 @@ async def _raw_event_loop(
                     wait_for.discard(stdin_task)
                 state.switched_to_raw = False
                 break
-            telnet_task = accessories.make_reader_task(telnet_reader, size=2**24)
+            telnet_task = _make_output_task(telnet_reader, telnet_writer)
             wait_for.add(telnet_task)
 
 
@@ -24,18 +24,50 @@ Decoding algorithm:
 - When a lead byte is followed by any other byte (e.g. ESC), the lone lead
   byte is decoded via CP437 and the following byte is re-processed.
 - Bytes below 0xA1 are decoded via latin-1 (identical to ASCII for 0x00-0x7F).
+
+Runs of ASCII and Big5 are decoded by Python's ``big5`` codec, which reports
+each byte that does not begin a defined pair to the ``big5bbs`` error handler,
+providing its latin-1 or CP437 character.  Encoding is likewise Big5 with the
+``big5bbs`` handler providing CP437 for characters without a Big5 encoding.
 """
 
 # std imports
 import codecs
 from typing import Tuple, Union
 
+#: Name of the error handler, registered with :func:`codecs.register_error`.
+_ERROR_HANDLER = "big5bbs"
 
-class Codec(codecs.Codec):
-    """Big5-BBS stateless codec (decodes entire buffer at once with final=True)."""
 
-    def encode(self, input: str, errors: str = "strict") -> Tuple[bytes, int]:
-        """Encode string to bytes, preferring Big5 with CP437 fallback per character."""
+def _error_handler(exc: UnicodeError) -> Tuple[Union[str, bytes], int]:
+    """
+    Error handler of the ``big5`` codec, providing half-width characters.
+
+    Decoding, a byte that does not begin a defined Big5 pair is decoded alone, by CP437 for Big5
+    lead bytes (0xA1-0xFE), otherwise by latin-1.  Encoding, characters without a Big5 encoding
+    are encoded by CP437, and the original exception is raised for those without either.
+    """
+    if isinstance(exc, UnicodeDecodeError):
+        byte_val = exc.object[exc.start]
+        char = _CP437_DECODING_TABLE[byte_val] if 0xA1 <= byte_val <= 0xFE else chr(byte_val)
+        return char, exc.start + 1
+    if isinstance(exc, UnicodeEncodeError):
+        try:
+            return (
+                bytes(_CP437_ENCODING_TABLE[ord(char)] for char in exc.object[exc.start : exc.end]),
+                exc.end,
+            )
+        except KeyError:
+            raise exc from None
+    raise exc
+
+
+def _encode(input: str, errors: str) -> bytes:
+    """Encode string to bytes, preferring Big5 with CP437 fallback."""
+    try:
+        return input.encode("big5", _ERROR_HANDLER)
+    except UnicodeEncodeError:
+        # characters in neither Big5 nor CP437 are handled by *errors*
         result = []
         for char in input:
             try:
@@ -43,12 +75,19 @@ class Codec(codecs.Codec):
             except UnicodeEncodeError:
                 encoded, _ = codecs.charmap_encode(char, errors, _CP437_ENCODING_TABLE)
                 result.append(encoded)
-        return b"".join(result), len(input)
+        return b"".join(result)
+
+
+class Codec(codecs.Codec):
+    """Big5-BBS stateless codec (decodes entire buffer at once with final=True)."""
+
+    def encode(self, input: str, errors: str = "strict") -> Tuple[bytes, int]:
+        """Encode string to bytes, preferring Big5 with CP437 fallback per character."""
+        return _encode(input, errors), len(input)
 
     def decode(self, input: bytes, errors: str = "strict") -> Tuple[str, int]:
         """Decode bytes using Big5/CP437 hybrid algorithm."""
-        dec = IncrementalDecoder(errors)
-        return dec.decode(input, final=True), len(input)
+        return bytes(input).decode("big5", _ERROR_HANDLER), len(input)
 
 
 class IncrementalEncoder(codecs.IncrementalEncoder):
@@ -56,14 +95,7 @@ class IncrementalEncoder(codecs.IncrementalEncoder):
 
     def encode(self, input: str, final: bool = False) -> bytes:
         """Encode input string incrementally."""
-        result = []
-        for char in input:
-            try:
-                result.append(char.encode("big5"))
-            except UnicodeEncodeError:
-                encoded, _ = codecs.charmap_encode(char, self.errors, _CP437_ENCODING_TABLE)
-                result.append(encoded)
-        return b"".join(result)
+        return _encode(input, self.errors)
 
     def reset(self) -> None:
         """Reset encoder state (stateless; no-op)."""
@@ -80,59 +112,31 @@ class IncrementalDecoder(codecs.IncrementalDecoder):
     """
     Big5-BBS incremental decoder with one-byte lookahead.
 
-    Holds at most one pending Big5 lead byte between calls.
+    Holds at most one pending byte between calls, a possible Big5 lead byte.
     """
 
     def __init__(self, errors: str = "strict") -> None:
         """Initialize decoder with empty pending buffer."""
         super().__init__(errors)
-        self._buf: bytes = b""
+        self._decoder = codecs.getincrementaldecoder("big5")(_ERROR_HANDLER)
 
     def decode(self, input: bytes, final: bool = False) -> str:  # type: ignore[override]
         """Decode input bytes using Big5/CP437 hybrid algorithm."""
-        data = self._buf + input
-        self._buf = b""
-        result = []
-        i = 0
-        while i < len(data):
-            b = data[i]
-            if 0xA1 <= b <= 0xFE:
-                if i + 1 < len(data):
-                    b2 = data[i + 1]
-                    if (0x40 <= b2 <= 0x7E) or (0xA1 <= b2 <= 0xFE):
-                        try:
-                            result.append(bytes([b, b2]).decode("big5", errors="strict"))
-                            i += 2
-                        except UnicodeDecodeError:
-                            # Structurally valid but undefined in Big5, treat
-                            # the lone lead byte as a CP437 half-width character.
-                            result.append(bytes([b]).decode("cp437"))
-                            i += 1
-                    else:
-                        result.append(bytes([b]).decode("cp437"))
-                        i += 1
-                elif not final:
-                    self._buf = bytes([b])
-                    break
-                else:
-                    result.append(bytes([b]).decode("cp437"))
-                    i += 1
-            else:
-                result.append(bytes([b]).decode("latin-1"))
-                i += 1
-        return "".join(result)
+        result: str = self._decoder.decode(input, final)
+        return result
 
     def reset(self) -> None:
         """Reset decoder state."""
-        self._buf = b""
+        self._decoder.reset()
 
     def getstate(self) -> Tuple[bytes, int]:
         """Return decoder state as (buffer, flags) tuple."""
-        return (self._buf, 0)
+        state: Tuple[bytes, int] = self._decoder.getstate()
+        return state
 
     def setstate(self, state: Tuple[bytes, int]) -> None:
         """Restore decoder state from (buffer, flags) tuple."""
-        self._buf = state[0]
+        self._decoder.setstate(state)
 
 
 class StreamWriter(Codec, codecs.StreamWriter):
@@ -171,3 +175,6 @@ def _build_cp437_encoding_table() -> dict[int, int]:
 
 
 _CP437_ENCODING_TABLE = _build_cp437_encoding_table()
+_CP437_DECODING_TABLE = bytes(range(256)).decode("cp437")
+
+codecs.register_error(_ERROR_HANDLER, _error_handler)
@@ -110,14 +110,23 @@ async def _read_line_inner(reader: Union[TelnetReader, TelnetReaderUnicode], max
     """Inner loop for _read_line, separated for wait_for compatibility."""
     buf = ""
     while len(buf) < max_len:
-        char = await reader.read(1)
-        if not char:
+        if isinstance(reader, TelnetReader):
+            # The limit is given in bytes, never fewer than the characters they decode to,
+            # and the decoder of a unicode reader holds the bytes of a partial character,
+            # so that no character is split.
+            data = await reader.read_available(max_len - len(buf), stop=b"\r\n")
+            if not data and not reader.at_eof():
+                # only part of a multibyte character was received
+                continue
+        else:
+            data = await reader.read(1)
+        if not data:
             break
-        if isinstance(char, bytes):
-            char = char.decode("latin-1")
-        if char in ("\r", "\n"):
+        text = data.decode("latin-1") if isinstance(data, bytes) else data
+        if text[-1] in ("\r", "\n"):
+            buf += text[:-1]
             break
-        buf += char
+        buf += text
     return buf
 
 
@@ -150,7 +159,13 @@ async def _read_cpr_response(
     buf = b""
     while True:
         try:
-            data = await reader.read(1)
+            if isinstance(reader, TelnetReader):
+                data = await reader.read_available(stop=b"R")
+                if not data and not reader.at_eof():
+                    # only part of a multibyte character was received
+                    continue
+            else:
+                data = await reader.read(1)
         except UnicodeDecodeError:
             return None
         if not data:
@@ -0,0 +1,469 @@
+"""
+Counters and histograms of telnet connections, exposed in the Prometheus text format.
+
+A :class:`Metrics` is given to :func:`~telnetlib3.server.create_server` or
+:func:`~telnetlib3.client.open_connection` by argument ``metrics``, and is
+updated by each of their connections.  Values are read by :meth:`Metrics.collect`,
+or scraped from the HTTP endpoint of :func:`start_metrics_server`::
+
+    metrics = telnetlib3.Metrics()
+    server = await telnetlib3.create_server(port=6023, metrics=metrics)
+    await telnetlib3.start_metrics_server(metrics, port=9464)
+
+Counters are plain attributes of integers, incremented by connections with no
+more than an addition.
+"""
+
+from __future__ import annotations
+
+# std imports
+import time
+import bisect
+import asyncio
+import logging
+import collections
+from typing import Dict, List, Deque, Tuple, Union, Callable, Iterable, Optional, Sequence
+
+# local
+from .telopt import name_command
+
+__all__ = ("Metrics", "Histogram", "SessionLatency", "start_metrics_server")
+
+logger = logging.getLogger("telnetlib3.metrics")
+
+#: Upper bounds of the buckets of histograms of durations, in seconds.
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+#: Upper bounds of the buckets of histograms of :class:`SessionLatency`, in seconds.
+LATENCY_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+#: A sample of a metric family, its name suffix, labels, and value.
+Sample = Tuple[str, Dict[str, str], float]
+
+#: A metric family, its name, type, help text, and samples.
+Family = Tuple[str, str, str, List[Sample]]
+
+
+class Histogram:
+    """
+    Distribution of observed values in fixed buckets.
+
+    :param buckets: Ascending upper bounds of buckets, a bucket of values
+        greater than the last is implied.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DURATION_BUCKETS) -> None:
+        """Class initializer."""
+        #: Upper bounds of buckets.
+        self.buckets = tuple(buckets)
+        #: Number of values observed in each bucket, not cumulative, the last
+        #: counts values greater than every bound.
+        self.counts = [0] * (len(self.buckets) + 1)
+        #: Sum of observed values.
+        self.sum = 0.0
+        #: Number of observed values.
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Observe *value*."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self) -> List[Sample]:
+        """Return samples of the histogram, with cumulative buckets."""
+        result: List[Sample] = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            result.append(("_bucket", {"le": _format_value(bound)}, cumulative))
+        result.append(("_sum", {}, self.sum))
+        result.append(("_count", {}, self.count))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Return the upper bound of the bucket of the *q* quantile, ``0.0 <= q <= 1.0``.
+
+        :returns: The bound, ``inf`` when the quantile is greater than every
+            bound, or ``None`` when no value was observed.
+        """
+        if not self.count:
+            return None
+        rank = max(1, round(q * self.count))
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<Histogram count={self.count} sum={self.sum:.6g}>"
+
+
+class SessionLatency:
+    """
+    Latency of bytes within one telnet session.
+
+    Given as :attr:`TelnetWriter.latency <telnetlib3.stream_writer.TelnetWriter.latency>`
+    and :attr:`TelnetReader.latency <telnetlib3.stream_reader.TelnetReader.latency>`
+    by :meth:`TelnetWriter.track_latency
+    <telnetlib3.stream_writer.TelnetWriter.track_latency>`, which may be called at any
+    time to start or stop tracking.  Connections not tracked only test that the
+    attribute is ``None``.
+    """
+
+    __slots__ = ("read_residency", "write_seconds", "_fed", "_fed_total")
+
+    def __init__(self) -> None:
+        """Class initializer."""
+        #: Seconds that bytes given to the reader remain buffered, until the
+        #: read consuming the last byte of each chunk received.
+        self.read_residency = Histogram(LATENCY_BUCKETS)
+        #: Seconds taken by each write to the transport, including the escape
+        #: of IAC and MCCP compression.
+        self.write_seconds = Histogram(LATENCY_BUCKETS)
+        # Offset of the end of each chunk not yet consumed, and when it was fed.
+        self._fed: Deque[Tuple[int, float]] = collections.deque()
+        self._fed_total = 0
+
+    def fed(self, size: int) -> None:
+        """Record *size* bytes given to the reader buffer."""
+        self._fed_total += size
+        self._fed.append((self._fed_total, time.perf_counter()))
+
+    def consumed(self, buffered: int) -> None:
+        """Observe the residency of chunks consumed, *buffered* bytes remaining."""
+        offset = self._fed_total - buffered
+        fed = self._fed
+        if fed and fed[0][0] <= offset:
+            now = time.perf_counter()
+            while fed and fed[0][0] <= offset:
+                self.read_residency.observe(now - fed.popleft()[1])
+
+    def summary(self) -> str:
+        """
+        Return the count and estimated 50th and 99th percentiles of each histogram.
+
+        Such as ``"read n=12 p50<=50us p99<=1ms, write n=40 p50<=10us p99<=25us"``.
+        """
+        return ", ".join(
+            " ".join(
+                [f"{name} n={hist.count}"]
+                + [f"p{pct}{_format_quantile(hist, pct / 100)}" for pct in (50, 99)]
+            )
+            for name, hist in (("read", self.read_residency), ("write", self.write_seconds))
+        )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<SessionLatency {self.summary()}>"
+
+
+class Metrics:
+    """
+    Counters and histograms of the telnet connections of servers or clients.
+
+    One instance may be shared by any number of servers and clients, whose
+    connections add to the same counters.  Additional samples, such as
+    those of :attr:`Server.admission <telnetlib3.server.Server.admission>`,
+    are given by collectors registered with :meth:`add_collector`.
+    """
+
+    #: Prefix of the names of metric families.
+    prefix = "telnetlib3_"
+
+    def __init__(self) -> None:
+        """Class initializer."""
+        #: Number of connections made.
+        self.connections_opened = 0
+        #: Number of connections closed or lost.
+        self.connections_closed = 0
+        #: Number of bytes received, before MCCP decompression.
+        self.bytes_received = 0
+        #: Number of bytes sent, before MCCP compression.
+        self.bytes_sent = 0
+        #: Number of bytes given to MCCP compression, MCCP2 of servers and
+        #: MCCP3 of clients.
+        self.mccp_bytes_in = 0
+        #: Number of bytes sent by MCCP compression.
+        self.mccp_bytes_out = 0
+        #: Number of telnet commands received, indexed by command byte.
+        self.commands_received = [0] * 256
+        #: Number of telnet commands sent, indexed by command byte.
+        self.commands_sent = [0] * 256
+        #: Largest number of bytes buffered by a transport for sending.
+        self.write_buffer_high = 0
+        #: Number of times a transport paused writing of a protocol.
+        self.write_paused = 0
+        #: Number of bytes of output dropped by :class:`~telnetlib3.stream_writer.WriteLimit`
+        #: policy ``"drop"``.
+        self.write_dropped_bytes = 0
+        #: Number of connections aborted by :class:`~telnetlib3.stream_writer.WriteLimit`
+        #: policy ``"disconnect"``.
+        self.slow_consumers = 0
+        #: Number of times reading was paused, the reader buffer full.
+        self.read_paused = 0
+        #: Number of times reading was resumed.
+        self.read_resumed = 0
+        #: Seconds from connection until negotiation is complete or times out.
+        self.negotiation_seconds = Histogram()
+        #: Seconds from connection until the shell is started.
+        self.shell_start_seconds = Histogram()
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    @property
+    def connections_active(self) -> int:
+        """Number of connections open."""
+        return self.connections_opened - self.connections_closed
+
+    @property
+    def mccp_ratio(self) -> float:
+        """Ratio of bytes sent to bytes given by MCCP compression, ``1.0`` before any."""
+        return self.mccp_bytes_out / self.mccp_bytes_in if self.mccp_bytes_in else 1.0
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """
+        Register *collector*, called by :meth:`collect` for additional metric families.
+
+        :param collector: Callable returning ``(name, type, help, samples)``
+            tuples, where *name* does not include :attr:`prefix`, *type* is
+            ``"counter"`` or ``"gauge"``, and *samples* is a list of
+            ``(suffix, labels, value)`` tuples, as :meth:`collect`.
+        """
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """Unregister *collector* registered by :meth:`add_collector`."""
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def collect(self) -> List[Family]:
+        """
+        Return every metric family, as ``(name, type, help, samples)`` tuples.
+
+        Each sample is a ``(suffix, labels, value)`` tuple, where *suffix* is
+        appended to the name of the family, such as ``"_bucket"`` of
+        histograms, and is otherwise empty.
+        """
+        families = [
+            _scalar(
+                "connections_opened_total", "counter", "Connections made.", self.connections_opened
+            ),
+            _scalar(
+                "connections_closed_total",
+                "counter",
+                "Connections closed.",
+                self.connections_closed,
+            ),
+            _scalar("connections_active", "gauge", "Connections open.", self.connections_active),
+            _scalar("received_bytes_total", "counter", "Bytes received.", self.bytes_received),
+            _scalar("sent_bytes_total", "counter", "Bytes sent.", self.bytes_sent),
+            _scalar(
+                "mccp_uncompressed_bytes_total",
+                "counter",
+                "Bytes given to MCCP compression.",
+                self.mccp_bytes_in,
+            ),
+            _scalar(
+                "mccp_compressed_bytes_total",
+                "counter",
+                "Bytes sent by MCCP compression.",
+                self.mccp_bytes_out,
+            ),
+            _scalar(
+                "mccp_compression_ratio",
+                "gauge",
+                "Ratio of bytes sent to bytes given by MCCP compression.",
+                self.mccp_ratio,
+            ),
+            _scalar(
+                "write_buffer_high_bytes",
+                "gauge",
+                "Largest number of bytes buffered by a transport for sending.",
+                self.write_buffer_high,
+            ),
+            _scalar(
+                "write_paused_total",
+                "counter",
+                "Times writing was paused by a transport.",
+                self.write_paused,
+            ),
+            _scalar(
+                "write_dropped_bytes_total",
+                "counter",
+                "Bytes of output dropped for slow consumers.",
+                self.write_dropped_bytes,
+            ),
+            _scalar(
+                "slow_consumers_total",
+                "counter",
+                "Connections aborted for slow consumers.",
+                self.slow_consumers,
+            ),
+            _scalar("read_paused_total", "counter", "Times reading was paused.", self.read_paused),
+            _scalar(
+                "read_resumed_total", "counter", "Times reading was resumed.", self.read_resumed
+            ),
+            (
+                "commands_received_total",
+                "counter",
+                "Telnet commands received, by command.",
+                _command_samples(self.commands_received),
+            ),
+            (
+                "commands_sent_total",
+                "counter",
+                "Telnet commands sent, by command.",
+                _command_samples(self.commands_sent),
+            ),
+            (
+                "negotiation_seconds",
+                "histogram",
+                "Seconds from connection until negotiation is complete.",
+                self.negotiation_seconds.samples(),
+            ),
+            (
+                "shell_start_seconds",
+                "histogram",
+                "Seconds from connection until the shell is started.",
+                self.shell_start_seconds.samples(),
+            ),
+        ]
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        """Return every metric family in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name, kind, text, samples in self.collect():
+            name = self.prefix + name
+            lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(
+                f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}"
+                for suffix, labels, value in samples
+            )
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<Metrics connections={self.connections_active}/{self.connections_opened}"
+            f" rx={self.bytes_received} tx={self.bytes_sent}>"
+        )
+
+
+def _scalar(name: str, kind: str, text: str, value: float) -> Family:
+    """Return a metric family of a single unlabeled sample."""
+    return (name, kind, text, [("", {}, value)])
+
+
+def _command_samples(counts: List[int]) -> List[Sample]:
+    """Return samples labeled by command name of non-zero *counts*."""
+    return [
+        ("", {"command": name_command(bytes([byte]))}, count)
+        for byte, count in enumerate(counts)
+        if count
+    ]
+
+
+def _format_quantile(hist: Histogram, q: float) -> str:
+    """Return the *q* quantile of *hist* in seconds as ``"<=250us"``, ``">1s"``, or ``"=?"``."""
+    bound = hist.quantile(q)
+    if bound is None:
+        return "=?"
+    if bound == float("inf"):
+        return f">{_format_seconds(hist.buckets[-1])}"
+    return f"<={_format_seconds(bound)}"
+
+
+def _format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e3)):
+        if value * scale >= 1:
+            return f"{value * scale:g}{unit}"
+    return f"{value * 1e6:g}us"
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _format_value(value: Union[int, float]) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+async def start_metrics_server(
+    metrics: Metrics, host: Optional[str] = "localhost", port: int = 9464
+) -> asyncio.AbstractServer:
+    """
+    Serve *metrics* to HTTP ``GET /metrics`` requests, in the Prometheus text format.
+
+    :param metrics: Metrics to serve.
+    :param host: Address to listen on, local by default.
+    :param port: Port to listen on.
+    :returns: The :class:`asyncio.Server` listening, closed to stop.
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 10.0)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            writer.close()
+            return
+        method, _, rest = request.partition(b" ")
+        path = rest.split(b" ", 1)[0].split(b"?", 1)[0]
+        if method not in (b"GET", b"HEAD"):
+            status, body = "405 Method Not Allowed", b"method not allowed\n"
+        elif path != b"/metrics":
+            status, body = "404 Not Found", b"not found\n"
+        else:
+            status, body = "200 OK", metrics.render().encode("utf-8")
+        header = (
+            f"HTTP/1.0 {status}\r\n"
+            "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(header.encode("ascii") + (b"" if method == b"HEAD" else body))
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info("Metrics at http://%s:%d/metrics", host, port)
+    return server
@@ -17,11 +17,21 @@ framing with subnegotiation markers.
 from __future__ import annotations
 
 # std imports
+import re
 import json
-from typing import Any
+import asyncio
+from typing import TYPE_CHECKING, Any, Union, Callable, Iterable, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .stream_writer import TelnetWriter, TelnetWriterUnicode
 
 # local
 from .telopt import (
+    SB,
+    SE,
+    IAC,
+    GMCP,
+    MSDP,
     MSDP_VAL,
     MSDP_VAR,
     MSSP_VAL,
@@ -35,11 +45,16 @@ from .telopt import (
 __all__ = (
     "gmcp_encode",
     "gmcp_decode",
+    "GmcpMessage",
+    "set_json_backend",
     "msdp_encode",
     "msdp_decode",
+    "MsdpEncoder",
     "mssp_encode",
     "mssp_decode",
     "MsdpParser",
+    "MudState",
+    "JsonEncodeCache",
     "zmp_decode",
     "atcp_decode",
     "aardwolf_decode",
@@ -70,7 +85,84 @@ def gmcp_encode(package: str, data: Any = None) -> bytes:
     """
     if data is None:
         return package.encode("utf-8")
-    return package.encode("utf-8") + b" " + json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return package.encode("utf-8") + b" " + _json_dumps(data)
+
+
+def _stdlib_json_dumps(data: Any) -> bytes:
+    """Serialize *data* as compact JSON bytes using :mod:`json`."""
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+#: JSON serializer and parser of GMCP data, see :func:`set_json_backend`.
+_json_dumps: Callable[[Any], bytes] = _stdlib_json_dumps
+_json_loads: Callable[[Union[str, bytes]], Any] = json.loads
+
+
+def set_json_backend(name: str = "json") -> str:
+    """
+    Select the JSON library used to encode and decode GMCP data.
+
+    :param name: ``"json"`` for the standard library, ``"orjson"`` for the
+        optional, faster :mod:`orjson` library, or ``"auto"`` for
+        :mod:`orjson` when it is installed, otherwise :mod:`json`.
+    :returns: Name of the library selected.
+    :raises ImportError: If ``"orjson"`` is selected and not installed.
+    :raises ValueError: If *name* is not a known library.
+
+    Both produce compact JSON, but :mod:`orjson` writes non-ASCII characters
+    as UTF-8 rather than ``\\uXXXX`` escapes.
+    """
+    global _json_dumps, _json_loads  # pylint: disable=global-statement
+    if name not in ("json", "orjson", "auto"):
+        raise ValueError(f"Unknown JSON backend: {name!r}")
+    if name != "json":
+        try:
+            import orjson  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            if name == "orjson":
+                raise
+        else:
+
+            def _orjson_dumps(data: Any) -> bytes:
+                result: bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+                return result
+
+            _json_dumps, _json_loads = _orjson_dumps, orjson.loads
+            return "orjson"
+    _json_dumps, _json_loads = _stdlib_json_dumps, json.loads
+    return "json"
+
+
+class GmcpMessage:
+    """
+    A GMCP message serialized once, for transmission to many sessions.
+
+    The subnegotiation, ``IAC SB GMCP <payload> IAC SE``, is built on
+    initialization, and may be given in place of a package name to
+    :meth:`~telnetlib3.stream_writer.TelnetWriter.send_gmcp` or
+    :meth:`~telnetlib3.server.Server.multicast_gmcp`::
+
+        message = GmcpMessage("Comm.Channel.Text", {"channel": "ooc", "text": text})
+        for writer in writers:
+            writer.send_gmcp(message)
+    """
+
+    def __init__(self, package: str, data: Any = None) -> None:
+        """
+        Initialize and serialize a GMCP message.
+
+        :param package: GMCP package name (e.g., ``"Char.Vitals"``)
+        :param data: Optional data to encode as JSON
+        """
+        self.package = package
+        self.data = data
+        #: Encoded GMCP payload, as returned by :func:`gmcp_encode`.
+        self.payload = gmcp_encode(package, data)
+        #: Framed and IAC-escaped subnegotiation bytes.
+        self.frame = IAC + SB + GMCP + self.payload.replace(IAC, IAC + IAC) + IAC + SE
+
+    def __repr__(self) -> str:
+        return f"<GmcpMessage {self.package} ({len(self.frame)} bytes)>"
 
 
 def gmcp_decode(buf: bytes, encoding: str = "utf-8") -> tuple[str, Any]:
@@ -91,12 +183,41 @@ def gmcp_decode(buf: bytes, encoding: str = "utf-8") -> tuple[str, Any]:
     if not text:
         return (package, None)
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError as exc:
+        data = _json_loads(text)
+    except ValueError as exc:
         raise ValueError(f"Invalid JSON in GMCP payload: {exc}") from exc
     return (package, data)
 
 
+def _msdp_encode_value(value: Any, out: bytearray) -> None:
+    """Append the MSDP encoding of a single *value* to *out*."""
+    if isinstance(value, dict):
+        out += MSDP_TABLE_OPEN
+        for key, val in value.items():
+            out += MSDP_VAR
+            out += key.encode("utf-8")
+            out += MSDP_VAL
+            _msdp_encode_value(val, out)
+        out += MSDP_TABLE_CLOSE
+    elif isinstance(value, list):
+        out += MSDP_ARRAY_OPEN
+        for item in value:
+            out += MSDP_VAL
+            _msdp_encode_value(item, out)
+        out += MSDP_ARRAY_CLOSE
+    else:
+        out += str(value).encode("utf-8")
+
+
+def _msdp_encode_variable(key: str, value: Any) -> bytes:
+    """Encode a single MSDP variable, ``MSDP_VAR key MSDP_VAL value``."""
+    out = bytearray(MSDP_VAR)
+    out += key.encode("utf-8")
+    out += MSDP_VAL
+    _msdp_encode_value(value, out)
+    return bytes(out)
+
+
 def msdp_encode(variables: dict[str, Any]) -> bytes:
     """
     Encode variables to MSDP wire format.
@@ -104,77 +225,137 @@ def msdp_encode(variables: dict[str, Any]) -> bytes:
     :param variables: Dictionary of variable names to values
     :returns: Encoded MSDP payload bytes
     """
-
-    def encode_value(value: Any) -> bytes:
-        """Encode a single MSDP value."""
-        if isinstance(value, dict):
-            result = MSDP_TABLE_OPEN
-            for key, val in value.items():
-                result += MSDP_VAR + key.encode("utf-8") + MSDP_VAL + encode_value(val)
-            result += MSDP_TABLE_CLOSE
-            return result
-        if isinstance(value, list):
-            result = MSDP_ARRAY_OPEN
-            for item in value:
-                result += MSDP_VAL + encode_value(item)
-            result += MSDP_ARRAY_CLOSE
-            return result
-        return str(value).encode("utf-8")
-
-    result = b""
+    out = bytearray()
     for key, value in variables.items():
-        result += MSDP_VAR + key.encode("utf-8") + MSDP_VAL + encode_value(value)
-    return result
+        out += MSDP_VAR
+        out += key.encode("utf-8")
+        out += MSDP_VAL
+        _msdp_encode_value(value, out)
+    return bytes(out)
+
+
+class MsdpEncoder:
+    """
+    MSDP encoder that caches the encoding of each variable.
+
+    A server that reports the same variables every tick encodes only those
+    variables whose value has changed since the previous call to
+    :meth:`encode`.  Values are compared by :func:`repr`, so that, unlike
+    ``==``, a change of type (``1`` to ``True``) or of table key order is
+    detected.
+    """
+
+    def __init__(self) -> None:
+        """Initialize encoder with an empty cache."""
+        self._cache: dict[str, tuple[str, bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def encode(self, variables: dict[str, Any]) -> bytes:
+        """
+        Encode variables to MSDP wire format, as :func:`msdp_encode`.
+
+        :param variables: Dictionary of variable names to values
+        :returns: Encoded MSDP payload bytes
+        """
+        return b"".join([self.encode_variable(key, value) for key, value in variables.items()])
+
+    def encode_variable(self, key: str, value: Any) -> bytes:
+        """
+        Encode a single variable, reusing its previous encoding when unchanged.
+
+        :param key: Variable name
+        :param value: Variable value
+        :returns: Encoded ``MSDP_VAR key MSDP_VAL value`` bytes
+        """
+        snapshot = repr(value)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+        encoded = _msdp_encode_variable(key, value)
+        self._cache[key] = (snapshot, encoded)
+        return encoded
+
+    def clear(self) -> None:
+        """Discard all cached encodings."""
+        self._cache.clear()
+
+
+#: Matches the end of an MSDP variable name: ``MSDP_VAR`` or ``MSDP_VAL``.
+_MSDP_KEY_END = re.compile(b"[" + re.escape(MSDP_VAR + MSDP_VAL) + b"]")
+
+#: Matches the end of an MSDP string value.
+_MSDP_STRING_END = re.compile(
+    b"[" + re.escape(MSDP_VAR + MSDP_VAL + MSDP_TABLE_CLOSE + MSDP_ARRAY_CLOSE) + b"]"
+)
+
+_MSDP_VAR = MSDP_VAR[0]
+_MSDP_VAL = MSDP_VAL[0]
+_MSDP_TABLE_OPEN = MSDP_TABLE_OPEN[0]
+_MSDP_TABLE_CLOSE = MSDP_TABLE_CLOSE[0]
+_MSDP_ARRAY_OPEN = MSDP_ARRAY_OPEN[0]
+_MSDP_ARRAY_CLOSE = MSDP_ARRAY_CLOSE[0]
 
 
 class MsdpParser:
-    """State machine for parsing MSDP wire bytes."""
+    """
+    Parser of MSDP wire bytes.
+
+    Names and string values are located by :meth:`re.Pattern.search` for the
+    next delimiter, rather than by examining each byte.
+    """
 
     _DELIMITERS = (MSDP_VAR, MSDP_VAL, MSDP_TABLE_CLOSE, MSDP_ARRAY_CLOSE)
 
     def __init__(self, buf: bytes, encoding: str = "utf-8") -> None:
         """Initialize parser with raw MSDP buffer."""
-        self.buf = buf
+        self.buf = bytes(buf)
         self.idx = 0
         self.encoding = encoding
 
-    def _read_string(self) -> str:
+    def _read_until(self, pattern: re.Pattern[bytes]) -> str:
         start = self.idx
-        while (
-            self.idx < len(self.buf) and self.buf[self.idx : self.idx + 1] not in self._DELIMITERS
-        ):
-            self.idx += 1
+        match = pattern.search(self.buf, start)
+        self.idx = match.start() if match is not None else len(self.buf)
         return _decode_best_effort(self.buf[start : self.idx], self.encoding)
 
+    def _read_string(self) -> str:
+        return self._read_until(_MSDP_STRING_END)
+
     def _read_key(self) -> str:
-        start = self.idx
-        while self.idx < len(self.buf) and self.buf[self.idx : self.idx + 1] not in (
-            MSDP_VAL,
-            MSDP_VAR,
-        ):
-            self.idx += 1
-        return _decode_best_effort(self.buf[start : self.idx], self.encoding)
+        return self._read_until(_MSDP_KEY_END)
 
     def _parse_table(self) -> dict[str, Any]:
+        buf, end = self.buf, len(self.buf)
         table: dict[str, Any] = {}
-        while self.idx < len(self.buf) and self.buf[self.idx : self.idx + 1] != MSDP_TABLE_CLOSE:
-            if self.buf[self.idx : self.idx + 1] == MSDP_VAR:
+        while self.idx < end and buf[self.idx] != _MSDP_TABLE_CLOSE:
+            if buf[self.idx] == _MSDP_VAR:
                 self.idx += 1
                 key = self._read_key()
-                if self.idx < len(self.buf) and self.buf[self.idx : self.idx + 1] == MSDP_VAL:
+                if self.idx < end and buf[self.idx] == _MSDP_VAL:
                     self.idx += 1
                 table[key] = self.parse_value()
-        if self.idx < len(self.buf):
+            else:
+                # skip stray values and markers
+                self.idx += 1
+        if self.idx < end:
             self.idx += 1
         return table
 
     def _parse_array(self) -> list[Any]:
+        buf, end = self.buf, len(self.buf)
         array: list[Any] = []
-        while self.idx < len(self.buf) and self.buf[self.idx : self.idx + 1] != MSDP_ARRAY_CLOSE:
-            if self.buf[self.idx : self.idx + 1] == MSDP_VAL:
+        while self.idx < end and buf[self.idx] != _MSDP_ARRAY_CLOSE:
+            marker = buf[self.idx]
+            if marker == _MSDP_VAL:
+                self.idx += 1
+            elif marker in (_MSDP_VAR, _MSDP_TABLE_CLOSE):
+                # skip stray markers
                 self.idx += 1
+                continue
             array.append(self.parse_value())
-        if self.idx < len(self.buf):
+        if self.idx < end:
             self.idx += 1
         return array
 
@@ -182,27 +363,30 @@ class MsdpParser:
         """Parse a single MSDP value at current position."""
         if self.idx >= len(self.buf):
             return ""
-        marker = self.buf[self.idx : self.idx + 1]
-        self.idx += 1
-        if marker == MSDP_TABLE_OPEN:
+        marker = self.buf[self.idx]
+        if marker == _MSDP_TABLE_OPEN:
+            self.idx += 1
             return self._parse_table()
-        if marker == MSDP_ARRAY_OPEN:
+        if marker == _MSDP_ARRAY_OPEN:
+            self.idx += 1
             return self._parse_array()
-        self.idx -= 1
         return self._read_string()
 
     def parse(self) -> dict[str, Any]:
         """Parse the full MSDP buffer into a dict."""
+        buf, end = self.buf, len(self.buf)
         result: dict[str, Any] = {}
-        while self.idx < len(self.buf):
-            if self.buf[self.idx : self.idx + 1] == MSDP_VAR:
+        while self.idx < end:
+            if buf[self.idx] == _MSDP_VAR:
                 self.idx += 1
                 key = self._read_key()
-                if self.idx < len(self.buf) and self.buf[self.idx : self.idx + 1] == MSDP_VAL:
+                if self.idx < end and buf[self.idx] == _MSDP_VAL:
                     self.idx += 1
                     result[key] = self.parse_value()
             else:
-                self.idx += 1
+                # skip to next variable
+                following = buf.find(MSDP_VAR, self.idx)
+                self.idx = following if following != -1 else end
         return result
 
 
@@ -224,15 +408,14 @@ def mssp_encode(variables: dict[str, str | list[str]]) -> bytes:
     :param variables: Dictionary of variable names to string values or lists
     :returns: Encoded MSSP payload bytes
     """
-    result = b""
+    out = bytearray()
     for key, value in variables.items():
-        result += MSSP_VAR + key.encode("utf-8")
-        if isinstance(value, list):
-            for item in value:
-                result += MSSP_VAL + item.encode("utf-8")
-        else:
-            result += MSSP_VAL + value.encode("utf-8")
-    return result
+        out += MSSP_VAR
+        out += key.encode("utf-8")
+        for item in value if isinstance(value, list) else (value,):
+            out += MSSP_VAL
+            out += item.encode("utf-8")
+    return bytes(out)
 
 
 def mssp_decode(buf: bytes, encoding: str = "utf-8") -> dict[str, str | list[str]]:
@@ -244,38 +427,235 @@ def mssp_decode(buf: bytes, encoding: str = "utf-8") -> dict[str, str | list[str
     :returns: Dictionary with str values for single entries, list[str] for multiple
     """
     result: dict[str, str | list[str]] = {}
-    idx = 0
-    current_var: str | None = None
-
-    while idx < len(buf):
-        if buf[idx : idx + 1] == MSSP_VAR:
-            idx += 1
-            var_start = idx
-            while idx < len(buf) and buf[idx : idx + 1] not in (MSSP_VAL, MSSP_VAR):
-                idx += 1
-            current_var = _decode_best_effort(buf[var_start:idx], encoding)
-        elif buf[idx : idx + 1] == MSSP_VAL:
-            idx += 1
-            val_start = idx
-            while idx < len(buf) and buf[idx : idx + 1] not in (MSSP_VAL, MSSP_VAR):
-                idx += 1
-            value = _decode_best_effort(buf[val_start:idx], encoding)
-
-            if current_var is not None:
-                if current_var in result:
-                    existing = result[current_var]
-                    if isinstance(existing, list):
-                        existing.append(value)
-                    else:
-                        result[current_var] = [existing, value]
+    # bytes preceding the first MSSP_VAR, if any, are not part of a variable.
+    for segment in bytes(buf).split(MSSP_VAR)[1:]:
+        name, *values = segment.split(MSSP_VAL)
+        if not values:
+            continue
+        current_var = _decode_best_effort(name, encoding)
+        for raw_value in values:
+            value = _decode_best_effort(raw_value, encoding)
+            if current_var in result:
+                existing = result[current_var]
+                if isinstance(existing, list):
+                    existing.append(value)
                 else:
-                    result[current_var] = value
-        else:
-            idx += 1
+                    result[current_var] = [existing, value]
+            else:
+                result[current_var] = value
 
     return result
 
 
+class JsonEncodeCache:
+    """
+    Serialized JSON of values shared by many sessions.
+
+    When the same ``dict`` or ``list`` object is given to :meth:`MudState.set`
+    of many sessions, as for a room's list of players, it is serialized only
+    once.  Values are identified by :func:`id`, and entries are discarded at
+    the end of the current iteration of the event loop, so a shared value
+    must not be modified until the sessions it is given to have been set.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._cache: dict[int, tuple[Any, bytes]] = {}
+        self._clear_later: Optional[asyncio.Handle] = None
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serialize *data* as compact JSON bytes, as used by :func:`gmcp_encode`.
+
+        :param data: Value to serialize.
+        :returns: JSON bytes.
+        """
+        if not isinstance(data, (dict, list)):
+            return _json_dumps(data)
+        entry = self._cache.get(id(data))
+        if entry is not None and entry[0] is data:
+            return entry[1]
+        encoded = _json_dumps(data)
+        self._cache[id(data)] = (data, encoded)
+        if self._clear_later is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                self._clear_later = loop.call_soon(self.clear)
+        return encoded
+
+    def clear(self) -> None:
+        """Discard all cached values."""
+        self._cache.clear()
+        if self._clear_later is not None:
+            self._clear_later.cancel()
+            self._clear_later = None
+
+
+class MudState:
+    """
+    Per-session GMCP packages and MSDP variables, transmitting only changes.
+
+    Values given to :meth:`set` and :meth:`set_msdp` are compared to those
+    last transmitted to the client, and only those that differ are sent.
+    Changes made during the same iteration of the event loop are
+    transmitted together, MSDP variables in a single subnegotiation and
+    GMCP messages in a single write, or by an explicit call to :meth:`flush`.
+
+    Available as :attr:`TelnetWriter.mud_state
+    <telnetlib3.stream_writer.TelnetWriter.mud_state>`::
+
+        writer.mud_state.set("Char.Vitals", {"hp": 100, "maxhp": 120})
+        writer.mud_state.set_msdp({"HEALTH": "100", "HEALTH_MAX": "120"})
+    """
+
+    def __init__(
+        self,
+        writer: Union[TelnetWriter, TelnetWriterUnicode],
+        json_cache: Optional[JsonEncodeCache] = None,
+        auto_flush: bool = True,
+    ) -> None:
+        """
+        Initialize state of a session.
+
+        :param writer: Writer of the session.
+        :param json_cache: Cache shared by many sessions, so that values given
+            to many of them are serialized only once.
+        :param auto_flush: Whether changes are transmitted by the event loop,
+            otherwise only by :meth:`flush`.
+        """
+        self.writer = writer
+        self.json_cache = json_cache
+        self.auto_flush = auto_flush
+        self._gmcp_sent: dict[str, bytes] = {}
+        self._gmcp_changed: dict[str, bytes] = {}
+        self._msdp_sent: dict[str, bytes] = {}
+        self._msdp_changed: dict[str, bytes] = {}
+        self._flush_later: Optional[asyncio.Handle] = None
+
+    @property
+    def pending(self) -> bool:
+        """Whether any changes have not yet been transmitted."""
+        return bool(self._gmcp_changed or self._msdp_changed)
+
+    def set(self, package: str, data: Any = None) -> None:
+        """
+        Set the value of a GMCP package.
+
+        :param package: GMCP package name (e.g., ``"Char.Vitals"``)
+        :param data: Optional data to encode as JSON
+        """
+        payload = package.encode("utf-8")
+        if data is not None:
+            payload += b" "
+            if self.json_cache is not None:
+                payload += self.json_cache.dumps(data)
+            else:
+                payload += _json_dumps(data)
+        if self._gmcp_sent.get(package) == payload:
+            self._gmcp_changed.pop(package, None)
+        else:
+            self._gmcp_changed[package] = payload
+            self._schedule_flush()
+
+    def set_msdp(self, variables: dict[str, Any]) -> None:
+        """
+        Set the values of MSDP variables.
+
+        :param variables: Dictionary of variable names to values
+        """
+        for key, value in variables.items():
+            encoded = _msdp_encode_variable(key, value)
+            if self._msdp_sent.get(key) == encoded:
+                self._msdp_changed.pop(key, None)
+            else:
+                self._msdp_changed[key] = encoded
+                self._schedule_flush()
+
+    def bypass(self, package: Optional[str] = None, variables: Iterable[str] = ()) -> None:
+        """
+        Prepare for a GMCP or MSDP message sent directly, without this state.
+
+        Called by :meth:`~telnetlib3.stream_writer.TelnetWriter.send_gmcp` and
+        :meth:`~telnetlib3.stream_writer.TelnetWriter.send_msdp`.  Changes not
+        yet transmitted are transmitted first, unless :attr:`auto_flush` is
+        disabled, and the values last transmitted
+        of ``package`` and ``variables`` are forgotten, so that their next
+        :meth:`set` or :meth:`set_msdp` is transmitted.
+
+        :param package: GMCP package name sent directly.
+        :param variables: MSDP variable names sent directly.
+        """
+        if self.auto_flush and self.pending:
+            self.flush()
+        if package is not None:
+            self._gmcp_sent.pop(package, None)
+        for key in variables:
+            self._msdp_sent.pop(key, None)
+
+    def forget(self) -> None:
+        """
+        Forget the values last transmitted.
+
+        All values are transmitted on their next :meth:`set` or
+        :meth:`set_msdp`, as when a client requests them again.
+        """
+        self._gmcp_sent.clear()
+        self._msdp_sent.clear()
+
+    def flush(self) -> int:
+        """
+        Transmit all changed values.
+
+        Changes are discarded when GMCP or MSDP has not been negotiated.
+
+        :returns: Number of bytes written.
+        """
+        if self._flush_later is not None:
+            self._flush_later.cancel()
+            self._flush_later = None
+        writer = self.writer
+        out = bytearray()
+        if self._gmcp_changed:
+            if writer.local_option.enabled(GMCP) or writer.remote_option.enabled(GMCP):
+                for package, payload in self._gmcp_changed.items():
+                    out += IAC + SB + GMCP
+                    out += payload.replace(IAC, IAC + IAC)
+                    out += IAC + SE
+                    self._gmcp_sent[package] = payload
+                writer.log.debug("send IAC SB GMCP %s IAC SE", ", ".join(self._gmcp_changed))
+            else:
+                writer.log.debug("cannot send GMCP without negotiation")
+            self._gmcp_changed.clear()
+        if self._msdp_changed:
+            if writer.local_option.enabled(MSDP) or writer.remote_option.enabled(MSDP):
+                out += IAC + SB + MSDP
+                out += b"".join(self._msdp_changed.values()).replace(IAC, IAC + IAC)
+                out += IAC + SE
+                self._msdp_sent.update(self._msdp_changed)
+                writer.log.debug("send IAC SB MSDP IAC SE")
+            else:
+                writer.log.debug("cannot send MSDP without negotiation")
+            self._msdp_changed.clear()
+        if out:
+            writer.send_iac(bytes(out))
+        return len(out)
+
+    def _schedule_flush(self) -> None:
+        if not self.auto_flush or self._flush_later is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_later = loop.call_soon(self.flush)
+
+
 def zmp_decode(buf: bytes, encoding: str = "utf-8") -> list[str]:
     """
     Decode ZMP payload to list of NUL-delimited strings.
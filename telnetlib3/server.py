@@ -16,6 +16,7 @@ from __future__ import annotations
 # std imports
 import ssl as ssl_module
 import sys
+import time
 import zlib
 import codecs
 import signal
@@ -23,14 +24,37 @@ import socket
 import asyncio
 import logging
 import argparse
-from typing import Any, Dict, List, Type, Tuple, Union, Callable, Optional, Sequence, NamedTuple
+import functools
+import contextlib
+import collections
+import concurrent.futures
+from typing import (
+    Any,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Union,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    FrozenSet,
+    NamedTuple,
+    cast,
+)
 
 # local
 from . import accessories, server_base
+from .mud import GmcpMessage
+from ._base import BufferedTelnetProtocol
 from ._types import ShellCallback
-from .telopt import SB, SE, IAC, MCCP2_COMPRESS, name_commands
+from .telopt import DO, SB, SE, IAC, GMCP, SEND, WILL, TTYPE, BINARY, MCCP2_COMPRESS, name_commands
+from .metrics import Family, Metrics, start_metrics_server
 from .stream_reader import TelnetReader, TelnetReaderUnicode
-from .stream_writer import TelnetWriter, TelnetWriterUnicode
+from .stream_writer import WRITE_POLICIES, WriteLimit, TelnetWriter, TelnetWriterUnicode
 
 # Check if PTY support is available (Unix-only modules: pty, termios, fcntl)
 try:
@@ -45,6 +69,11 @@ except ImportError:
 __all__ = (
     "TelnetServer",
     "LinemodeServer",
+    "BufferedTelnetServer",
+    "NegotiationProfile",
+    "NegotiationProfileCache",
+    "AdmissionControl",
+    "TLSHandshakeStats",
     "Server",
     "create_server",
     "run_server",
@@ -73,6 +102,15 @@ class CONFIG(NamedTuple):
     status_interval: int = 20
     never_send_ga: bool = False
     line_mode: bool = False
+    max_sessions: int = 0
+    max_sessions_per_ip: int = 0
+    accept_rate: float = 0
+    accept_burst: Optional[int] = None
+    reject_early: bool = True
+    metrics_port: int = 0
+    write_limit: int = 0
+    write_policy: str = "block"
+    write_timeout: float = 30.0
 
 
 # Default config instance - use this to access default values
@@ -81,6 +119,174 @@ _config = CONFIG()
 logger = logging.getLogger("telnetlib3.server")
 
 
+class NegotiationProfile(NamedTuple):
+    """
+    Negotiation outcome remembered for one type of client.
+
+    Keys of :attr:`accepted` and :attr:`refused` are the same two-byte
+    ``command + option`` keys used by
+    :attr:`~telnetlib3.stream_writer.TelnetWriter.pending_option`, such as
+    ``DO + NAWS`` or ``SB + NEW_ENVIRON``.
+    """
+
+    #: Terminal types reported by the client, in cycle order.
+    ttypes: Tuple[str, ...]
+    #: Requests the client answered affirmatively.
+    accepted: FrozenSet[bytes]
+    #: Requests the client refused, or never answered before negotiation ended.
+    refused: FrozenSet[bytes]
+
+
+class NegotiationProfileCache:
+    """
+    Bounded cache of :class:`NegotiationProfile` records for known clients.
+
+    Shared by all connections of a server, see ``negotiation_profiles``
+    argument of :func:`create_server`.  A profile is recorded for each
+    client when negotiation completes, keyed by its first TTYPE reply and
+    its answers to the requests made before it.
+
+    A profile is only used once ``confirmations`` connections in a row
+    recorded the same outcome, so that a single client cannot change what
+    later clients of the same key are offered.  An outcome that disagrees
+    with the stored profile first discounts it, and only replaces it when
+    the stored profile is no longer confirmed by any connection.
+
+    When a later client matches a confirmed profile, :class:`TelnetServer`
+    sends all expected TTYPE requests in a single burst, sends ``SB
+    NEW_ENVIRON SEND`` together with ``DO NEW_ENVIRON`` without awaiting
+    ``WILL NEW_ENVIRON``, skips requests the same type of client refused,
+    and does not delay the shell waiting on options it refused or ignored.
+
+    :param maxsize: Maximum number of profiles kept, least recently used
+        profiles are discarded first.
+    :param key_fn: Optional callable receiving a
+        :class:`~telnetlib3.stream_writer.TelnetWriter`, returning the cache
+        key for its client, or ``None`` when it should not be cached.  It is
+        called once the first TTYPE reply is received.  The default key is
+        the value of ``ttype1`` followed by the requests answered so far,
+        see :meth:`key`.  A key derived from more client attributes, such as
+        a fingerprint hash, may be used to further distinguish clients.
+    :param confirmations: Number of connections in a row that must record
+        the same outcome before a profile is used.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        key_fn: Optional[Callable[[Any], Optional[str]]] = None,
+        confirmations: int = 2,
+    ) -> None:
+        """Class initializer."""
+        if confirmations < 1:
+            raise ValueError(f"confirmations must be at least 1, got {confirmations}")
+        self.maxsize = maxsize
+        self.confirmations = confirmations
+        self._key_fn = key_fn
+        #: Profile by key, with the number of connections confirming it.
+        self._profiles: collections.OrderedDict[str, Tuple[NegotiationProfile, int]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def key(self, writer: Union[TelnetWriter, TelnetWriterUnicode]) -> Optional[str]:
+        """
+        Return cache key for client of ``writer``, or ``None``.
+
+        The default key is ``ttype1``, followed by each ``DO`` or ``WILL``
+        request already answered, prefixed by ``+`` when accepted or ``-``
+        when refused, such as ``"xterm:+DO NAWS,+DO TTYPE,-WILL BINARY"``.
+        """
+        if self._key_fn is not None:
+            return self._key_fn(writer)
+        ttype1 = writer.get_extra_info("ttype1")
+        if not ttype1:
+            return None
+        answers = sorted(
+            f"{'+' if _option_accepted(writer, opt) else '-'}{name_commands(opt)}"
+            for opt, pending in writer.pending_option.items()
+            if not pending and opt[:1] in (DO, WILL)
+        )
+        return f"{ttype1}:{','.join(answers)}"
+
+    def get(
+        self, writer: Union[TelnetWriter, TelnetWriterUnicode], key: Optional[str] = None
+    ) -> Optional[NegotiationProfile]:
+        """
+        Return confirmed profile recorded for the client of ``writer``, if any.
+
+        :param key: Cache key, by default :meth:`key` of ``writer``.
+        """
+        key = self.key(writer) if key is None else key
+        if key is None or key not in self._profiles:
+            return None
+        self._profiles.move_to_end(key)
+        profile, seen = self._profiles[key]
+        return profile if seen >= self.confirmations else None
+
+    def record(
+        self, writer: Union[TelnetWriter, TelnetWriterUnicode], key: Optional[str] = None
+    ) -> Optional[NegotiationProfile]:
+        """
+        Record negotiation outcome of the client of ``writer``.
+
+        :param key: Cache key, by default :meth:`key` of ``writer``.  It
+            should be the key of the client when its first TTYPE reply was
+            received, as later answers change the default key.
+        :returns: Profile stored for the key, which is the previous profile
+            when the outcome disagreed with a profile confirmed more than
+            once, or ``None`` when no key is available, such as for clients
+            that refuse TTYPE.
+        """
+        key = self.key(writer) if key is None else key
+        if key is None:
+            return None
+        ttypes: List[str] = []
+        while (ttype := writer.get_extra_info(f"ttype{len(ttypes) + 1}")) is not None:
+            ttypes.append(ttype)
+        accepted: set[bytes] = set()
+        refused: set[bytes] = set()
+        for opt, pending in writer.pending_option.items():
+            cmd = opt[:1]
+            if pending:
+                # never answered before negotiation completed
+                refused.add(opt)
+            elif cmd in (DO, WILL):
+                (accepted if _option_accepted(writer, opt) else refused).add(opt)
+            elif cmd == SB:
+                accepted.add(opt)
+        profile = NegotiationProfile(tuple(ttypes), frozenset(accepted), frozenset(refused))
+        stored, seen = self._profiles.get(key, (None, 0))
+        if profile == stored:
+            seen = min(seen + 1, self.confirmations)
+        elif stored is not None and seen > 1:
+            # disagrees with stored profile: discount it, rather than replace.
+            profile, seen = stored, seen - 1
+        else:
+            seen = 1
+        self._profiles[key] = (profile, seen)
+        self._profiles.move_to_end(key)
+        while len(self._profiles) > self.maxsize:
+            self._profiles.popitem(last=False)
+        logger.debug(
+            "negotiation profile recorded for %r (%d/%d): %s",
+            key,
+            seen,
+            self.confirmations,
+            profile,
+        )
+        return profile
+
+
+def _option_accepted(writer: Union[TelnetWriter, TelnetWriterUnicode], opt: bytes) -> bool:
+    """Whether ``DO`` or ``WILL`` request ``opt`` was accepted by client of ``writer``."""
+    if opt[:1] == DO:
+        return writer.remote_option.enabled(opt[1:])
+    return writer.local_option.enabled(opt[1:])
+
+
 class TelnetServer(server_base.BaseServer):
     """Telnet Server protocol performing common negotiation."""
 
@@ -111,6 +317,8 @@ class TelnetServer(server_base.BaseServer):
         reader_factory_encoding: type = TelnetReaderUnicode,
         writer_factory: type = TelnetWriter,
         writer_factory_encoding: type = TelnetWriterUnicode,
+        negotiation_profiles: Optional[NegotiationProfileCache] = None,
+        early_shell: Union[bool, Sequence[str]] = False,
     ) -> None:
         """Initialize TelnetServer with terminal parameters."""
         super().__init__(
@@ -127,6 +335,7 @@ class TelnetServer(server_base.BaseServer):
             reader_factory_encoding=reader_factory_encoding,
             writer_factory=writer_factory,
             writer_factory_encoding=writer_factory_encoding,
+            early_shell=early_shell,
         )
         self._environ_requested = False
         self._echo_negotiated = False
@@ -138,6 +347,14 @@ class TelnetServer(server_base.BaseServer):
         self.waiter_encoding: asyncio.Future[bool] = asyncio.Future()
         self._tasks.append(self.waiter_encoding)
         self._ttype_count = 1
+        #: TTYPE SEND requests sent in a burst and not yet answered.
+        self._ttype_inflight = 0
+        #: TTYPE replies to discard, answering a burst beyond the cycle stop.
+        self._ttype_discard = 0
+        self._negotiation_profiles = negotiation_profiles
+        #: Profile of a previous client of the same type, found on first TTYPE reply.
+        self.negotiation_profile: Optional[NegotiationProfile] = None
+        self._negotiation_profile_key: Optional[str] = None
         self._timer: Optional[asyncio.TimerHandle] = None
         self._extra.update(
             {
@@ -158,6 +375,9 @@ class TelnetServer(server_base.BaseServer):
         # Set compression policy on writer
         self.writer.compression = self._compression
 
+        if self._negotiation_profiles is not None:
+            self._waiter_connected.add_done_callback(self._record_negotiation_profile)
+
         # begin timeout timer
         self.set_timeout()
 
@@ -225,6 +445,9 @@ class TelnetServer(server_base.BaseServer):
             if self._mccp2_compressor is not None:
                 compressed = self._mccp2_compressor.compress(data)
                 compressed += self._mccp2_compressor.flush(zlib.Z_SYNC_FLUSH)
+                if self.metrics is not None:
+                    self.metrics.mccp_bytes_in += len(data)
+                    self.metrics.mccp_bytes_out += len(compressed)
                 orig_write(compressed)
             else:
                 orig_write(data)
@@ -319,13 +542,22 @@ class TelnetServer(server_base.BaseServer):
         if pending:
             logger.debug("Pending options: %r", pending)
 
+        # Options a previous client of the same type refused or never
+        # answered are not waited for.
+        profile_refused = (
+            self.negotiation_profile.refused if self.negotiation_profile else frozenset()
+        )
+
         # Check if we're waiting for important subnegotiations
         waiting_for_environ = (
             SB + NEW_ENVIRON in self.writer.pending_option
             and self.writer.pending_option[SB + NEW_ENVIRON]
+            and SB + NEW_ENVIRON not in profile_refused
         )
         waiting_for_charset = (
-            SB + CHARSET in self.writer.pending_option and self.writer.pending_option[SB + CHARSET]
+            SB + CHARSET in self.writer.pending_option
+            and self.writer.pending_option[SB + CHARSET]
+            and SB + CHARSET not in profile_refused
         )
 
         if waiting_for_environ or waiting_for_charset:
@@ -337,6 +569,10 @@ class TelnetServer(server_base.BaseServer):
                 )
 
         parent = super().check_negotiation()
+        if not parent and profile_refused:
+            parent = not any(
+                val for opt, val in self.writer.pending_option.items() if opt not in profile_refused
+            )
 
         # In addition to the base class negotiation check, periodically check
         # for completion of bidirectional encoding negotiation.
@@ -347,6 +583,14 @@ class TelnetServer(server_base.BaseServer):
             logger.debug("encoding complete: %r", encoding)
             self.waiter_encoding.set_result(result)
 
+        elif not result and profile_refused & {DO + BINARY, WILL + BINARY}:
+            # BINARY was refused by a previous client of the same type,
+            # do not wait for the remainder of connect_maxwait.
+            if not self.waiter_encoding.done():
+                logger.debug("encoding failed: BINARY refused by negotiation profile")
+                self.waiter_encoding.set_result(result)  # False
+            return parent and not (waiting_for_environ or waiting_for_charset)
+
         elif not self.waiter_encoding.done() and self.writer.remote_option.get(TTYPE) is False:
             # if the remote end doesn't support TTYPE, which is agreed upon
             # to continue towards advanced negotiation of CHARSET, we assume
@@ -373,6 +617,22 @@ class TelnetServer(server_base.BaseServer):
 
         return parent and result
 
+    def option_settled(self, opt: bytes) -> bool:
+        """
+        Whether negotiation of option *opt* is settled.
+
+        ``ECHO`` is settled once it has been negotiated or deliberately
+        skipped for MUD clients, see ``_negotiate_echo()``, and ``SGA`` is
+        always settled in :attr:`line_mode`, where it is never requested.
+        """
+        from .telopt import SGA, ECHO
+
+        if opt == ECHO and self._echo_negotiated:
+            return not self.writer.pending_option.enabled(WILL + ECHO)
+        if opt == SGA and self.line_mode:
+            return True
+        return super().option_settled(opt)
+
     # new methods
 
     def encoding(
@@ -608,6 +868,14 @@ class TelnetServer(server_base.BaseServer):
         #
         # The most recently received terminal type by the server is
         # assumed TERM by this implementation, even when unsolicited.
+        if self._ttype_discard:
+            # answer to a burst request sent beyond the stop of this cycle.
+            self._ttype_discard -= 1
+            logger.debug("ttype discarded: %s, cycle already stopped.", ttype)
+            return
+        if self._ttype_inflight:
+            self._ttype_inflight -= 1
+
         key = f"ttype{self._ttype_count}"
         self._extra[key] = ttype
         if ttype:
@@ -615,14 +883,26 @@ class TelnetServer(server_base.BaseServer):
 
         _lastval = self.get_extra_info(f"ttype{self._ttype_count - 1}")
 
+        if key == "ttype1" and self._negotiation_profiles is not None:
+            assert self.writer is not None
+            self._negotiation_profile_key = self._negotiation_profiles.key(self.writer)
+            self.negotiation_profile = self._negotiation_profiles.get(
+                self.writer, key=self._negotiation_profile_key
+            )
+            if self.negotiation_profile is not None:
+                logger.debug(
+                    "negotiation profile found for %s: %s", ttype, self.negotiation_profile
+                )
+
         # After first TTYPE, negotiate ECHO -- MUD clients are detected
         # by ttype1 and never receive WILL ECHO (avoids password mode).
         self._negotiate_echo()
 
         # After ttype1: send DO NEW_ENVIRON now unless ttype1 is "ANSI",
         # in which case we defer until ttype2 to detect Microsoft telnet
-        # (ANSI + VT100) which crashes on NEW_ENVIRON (issue #24).
-        if key == "ttype1" and ttype != "ANSI":
+        # (ANSI + VT100) which crashes on NEW_ENVIRON (issue #24), unless
+        # a previous client of the same type was shown not to be.
+        if key == "ttype1" and (ttype != "ANSI" or not self._profile_is_maybe_ms_telnet()):
             self._negotiate_environ()
         elif key == "ttype2" and not self._environ_requested:
             self._negotiate_environ()
@@ -630,27 +910,33 @@ class TelnetServer(server_base.BaseServer):
         if key != "ttype1" and ttype == self.get_extra_info("ttype1", None):
             # cycle has looped, stop
             logger.debug("ttype cycle stop at %s: %s, looped.", key, ttype)
-            self._negotiate_environ()
+            self._ttype_cycle_stop()
 
         elif not ttype or self._ttype_count > self.TTYPE_LOOPMAX:
             # empty reply string or too many responses!
             logger.warning("ttype cycle stop at %s: %s.", key, ttype)
-            self._negotiate_environ()
+            self._ttype_cycle_stop()
 
         elif self._ttype_count == 3 and ttype.upper().startswith("MTTS "):
             val = self.get_extra_info("ttype2")
             logger.debug("ttype cycle stop at %s: %s, using %s from ttype2.", key, ttype, val)
             self._extra["TERM"] = val
-            self._negotiate_environ()
+            self._ttype_cycle_stop()
 
         elif ttype == _lastval:
             logger.debug("ttype cycle stop at %s: %s, repeated.", key, ttype)
-            self._negotiate_environ()
+            self._ttype_cycle_stop()
 
         else:
             logger.debug("ttype cycle cont at %s: %s.", key, ttype)
             self._ttype_count += 1
-            self.writer.request_ttype()
+            if self._ttype_inflight:
+                # the next reply was already requested by burst.
+                self.writer.pending_option[SB + TTYPE] = True
+            elif key == "ttype1" and self.negotiation_profile is not None:
+                self._request_ttype_burst(len(self.negotiation_profile.ttypes) - 1)
+            else:
+                self.writer.request_ttype()
 
     def on_xdisploc(self, xdisploc: str) -> None:
         """Callback for XDISPLOC response, :rfc:`1096`."""
@@ -658,6 +944,45 @@ class TelnetServer(server_base.BaseServer):
 
     # private methods
 
+    def _ttype_cycle_stop(self) -> None:
+        """Complete TTYPE cycle, discarding replies to any remaining burst requests."""
+        self._ttype_discard, self._ttype_inflight = self._ttype_inflight, 0
+        self._negotiate_environ()
+
+    def _request_ttype_burst(self, count: int) -> None:
+        """
+        Send ``count`` TTYPE SEND requests at once.
+
+        Used when :attr:`negotiation_profile` tells the length of the TTYPE
+        cycle of this client, saving a round trip for each cycle step.
+        """
+        count = max(1, min(count, self.TTYPE_LOOPMAX))
+        # Microsoft telnet (ANSI + VT100) is known to crash on bursts of requests.
+        maybe_ms_telnet = self.get_extra_info("ttype1") == "ANSI"
+        if count == 1 or maybe_ms_telnet or not self.writer.remote_option.enabled(TTYPE):
+            self.writer.request_ttype()
+            return
+        logger.debug("send IAC SB TTYPE SEND IAC SE (burst of %d)", count)
+        self.writer.pending_option[SB + TTYPE] = True
+        self.writer.send_iac((IAC + SB + TTYPE + SEND + IAC + SE) * count)
+        self._ttype_inflight = count
+
+    def _profile_is_maybe_ms_telnet(self) -> bool:
+        """Whether :attr:`negotiation_profile` is absent or may be Microsoft telnet."""
+        ttypes = self.negotiation_profile.ttypes if self.negotiation_profile else ()
+        return len(ttypes) < 2 or ttypes[1] == "VT100"
+
+    def _record_negotiation_profile(self, future: asyncio.Future[None]) -> None:
+        """Record negotiation outcome to the shared :class:`NegotiationProfileCache`."""
+        if (
+            future.cancelled()
+            or self.writer is None
+            or self._negotiation_profiles is None
+            or self._negotiation_profile_key is None
+        ):
+            return
+        self._negotiation_profiles.record(self.writer, key=self._negotiation_profile_key)
+
     def _negotiate_environ(self) -> None:
         """
         Send ``DO NEW_ENVIRON``.
@@ -674,9 +999,15 @@ class TelnetServer(server_base.BaseServer):
             return
         self._environ_requested = True
 
-        from .telopt import DO, NEW_ENVIRON
+        from .telopt import DO, SB, NEW_ENVIRON
 
+        if self.negotiation_profile and DO + NEW_ENVIRON in self.negotiation_profile.refused:
+            logger.debug("skip DO NEW_ENVIRON, refused by negotiation profile")
+            return
         self.writer.iac(DO, NEW_ENVIRON)
+        if self.negotiation_profile and SB + NEW_ENVIRON in self.negotiation_profile.accepted:
+            # a previous client of the same type answered, don't await WILL NEW_ENVIRON.
+            self.writer.request_environ(anticipate=True)
 
     def _negotiate_echo(self) -> None:
         """
@@ -706,6 +1037,9 @@ class TelnetServer(server_base.BaseServer):
         if _is_maybe_mud(self.writer):
             logger.info("skipping WILL ECHO for MUD client")
             return
+        if self.negotiation_profile and WILL + ECHO in self.negotiation_profile.refused:
+            logger.debug("skip WILL ECHO, refused by negotiation profile")
+            return
         self.writer.iac(WILL, ECHO)
 
     def _check_encoding(self) -> bool:
@@ -740,19 +1074,25 @@ class _TLSAutoDetectProtocol(asyncio.Protocol):
     """
     Protocol wrapper that auto-detects TLS vs plain telnet connections.
 
-    Reading is paused on connect, then a non-blocking ``MSG_PEEK`` on a
-    duplicated socket checks the first byte without consuming it.  A TLS
+    Reading is paused on connect, and the event loop watches a duplicate of
+    the socket for readability.  When data arrives, a single non-blocking
+    ``MSG_PEEK`` checks the first byte without consuming it.  A TLS
     ClientHello always begins with ``0x16`` (22); anything else (telnet IAC
     ``0xFF``, printable ASCII, etc.) is plain telnet.
 
     Plain telnet clients typically wait for the server to speak first, so a
     timeout (*detect_timeout* seconds) assumes plain telnet when no data
     arrives promptly.  TLS clients always send ClientHello immediately.
+    When *speculate* is non-zero, ``IAC DO TTYPE`` is sent after that many
+    seconds of silence, so that a waiting telnet client answers and is
+    detected without waiting for the full timeout.
 
     When TLS is detected, :meth:`loop.start_tls` upgrades the transport.
     Plain connections resume reading and hand off directly.
     """
 
+    #: Interval of peeking when the event loop cannot watch the socket, as
+    #: on Windows with :class:`asyncio.ProactorEventLoop`.
     _PEEK_RETRY_SECS = 0.01
 
     def __init__(
@@ -760,70 +1100,124 @@ class _TLSAutoDetectProtocol(asyncio.Protocol):
         ssl_context: ssl_module.SSLContext,
         real_factory: Callable[[], asyncio.Protocol],
         detect_timeout: float = 0.5,
+        speculate: float = 0,
+        stats: Optional[TLSHandshakeStats] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
     ) -> None:
         self._ssl_context = ssl_context
+        self._stats = stats
+        self._executor = executor
         self._detect_timeout_secs = detect_timeout
+        self._speculate_secs = speculate
         self._real_factory = real_factory
         self._transport: Optional[asyncio.Transport] = None
         self._detect_timer: Optional[asyncio.TimerHandle] = None
+        self._speculate_timer: Optional[asyncio.TimerHandle] = None
+        self._peek_sock: Optional[socket.socket] = None
         self._decided = False
+        self._speculated = False
         self._buffered: bytes = b""
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
-        """Pause reading and begin non-blocking peek loop."""
+        """Pause reading and wait for the socket to become readable."""
         self._transport = transport  # type: ignore[assignment]
         transport.pause_reading()  # type: ignore[attr-defined]
         loop = asyncio.get_event_loop()
         self._detect_timer = loop.call_later(self._detect_timeout_secs, self._on_detect_timeout)
-        loop.call_soon(self._try_peek)
+        if self._speculate_secs:
+            self._speculate_timer = loop.call_later(self._speculate_secs, self._send_speculative)
+        tsock = transport.get_extra_info("socket")
+        if tsock is None:
+            logger.debug("tls-auto: no socket in connection_made (client disconnected?)")
+            return
+        # The transport owns its file descriptor, and loop.add_reader() refuses
+        # it, so the duplicate made for peeking is watched instead.
+        self._peek_sock = socket.fromfd(tsock.fileno(), tsock.family, socket.SOCK_STREAM)
+        self._peek_sock.setblocking(False)
+        try:
+            loop.add_reader(self._peek_sock.fileno(), self._on_readable)
+        except NotImplementedError:
+            loop.call_soon(self._try_peek)
 
     def _cancel_timer(self) -> None:
-        """Cancel the pending detect timeout."""
+        """Cancel pending timers and stop watching the socket."""
         if self._detect_timer is not None:
             self._detect_timer.cancel()
             self._detect_timer = None
+        if self._speculate_timer is not None:
+            self._speculate_timer.cancel()
+            self._speculate_timer = None
+        if self._peek_sock is not None:
+            with contextlib.suppress(NotImplementedError, ValueError):
+                asyncio.get_event_loop().remove_reader(self._peek_sock.fileno())
+            self._peek_sock.close()
+            self._peek_sock = None
+
+    def _peek(self) -> Optional[bytes]:
+        """Return the first byte received without consuming it, ``None`` if not yet received."""
+        if self._peek_sock is None:
+            return b""
+        try:
+            return self._peek_sock.recv(1, socket.MSG_PEEK)
+        except BlockingIOError:
+            return None
+        except OSError:
+            return b""
 
-    def _try_peek(self) -> None:
-        """Non-blocking peek at the first byte via a duplicated socket."""
+    def _on_readable(self) -> None:
+        """Peek at the first byte when the socket becomes readable."""
         if self._decided:
             return
-        if self._transport is None:
-            logger.debug("tls-auto: no transport in _try_peek (client disconnected?)")
-            return
-        tsock = self._transport.get_extra_info("socket")
-        if tsock is None:
-            logger.debug("tls-auto: no socket in _try_peek (client disconnected?)")
+        data = self._peek()
+        if data is not None:
+            self._decide(data)
+
+    def _try_peek(self) -> None:
+        """Peek at the first byte, retrying until received or decided by timeout."""
+        if self._decided:
             return
-        peek_sock = socket.fromfd(tsock.fileno(), tsock.family, socket.SOCK_STREAM)
-        peek_sock.setblocking(False)
-        try:
-            data = peek_sock.recv(1, socket.MSG_PEEK)
-        except BlockingIOError:
+        data = self._peek()
+        if data is None:
             asyncio.get_event_loop().call_later(self._PEEK_RETRY_SECS, self._try_peek)
-            return
-        except OSError:
-            data = b""
-        finally:
-            peek_sock.close()
+        else:
+            self._decide(data)
 
+    def _decide(self, data: bytes) -> None:
+        """Hand off as TLS or plain telnet by the first byte received, *data*."""
+        assert self._transport is not None
         self._decided = True
         self._cancel_timer()
         if not data:
             self._transport.close()
             return
         if data[0] == 0x16:
+            if self._speculated:
+                logger.debug("tls-auto: TLS ClientHello after speculative IAC DO TTYPE")
             logger.debug("tls-auto: TLS ClientHello detected")
-            asyncio.ensure_future(self._upgrade_to_tls())
+            if self._executor is not None:
+                self._handoff_tls()
+            else:
+                asyncio.ensure_future(self._upgrade_to_tls())
         else:
             logger.debug("tls-auto: non-TLS byte 0x%02x, plain telnet", data[0])
             self._handoff_plain()
 
+    def _send_speculative(self) -> None:
+        """Send ``IAC DO TTYPE`` to prompt a reply from a waiting telnet client."""
+        self._speculate_timer = None
+        if self._decided or self._transport is None or self._transport.is_closing():
+            return
+        logger.debug("tls-auto: no data in %.2fs, sending IAC DO TTYPE", self._speculate_secs)
+        self._transport.write(IAC + DO + TTYPE)
+        self._speculated = True
+
     def _on_detect_timeout(self) -> None:
         """No data arrived -- assume plain telnet."""
         self._detect_timer = None
         if self._decided:
             return
         self._decided = True
+        self._cancel_timer()
         logger.debug("tls-auto: no data in %.1fs, assuming plain telnet", self._detect_timeout_secs)
         self._handoff_plain()
 
@@ -841,6 +1235,7 @@ class _TLSAutoDetectProtocol(asyncio.Protocol):
         loop = asyncio.get_running_loop()
         assert self._transport is not None
         protocol = self._real_factory()
+        stime = time.monotonic()
         try:
             # start_tls uses call_connection_made=False, so we must call
             # connection_made ourselves with the returned SSL transport.
@@ -849,6 +1244,8 @@ class _TLSAutoDetectProtocol(asyncio.Protocol):
             )
         except (ssl_module.SSLError, OSError) as exc:
             logger.debug("TLS handshake failed: %s", exc)
+            if self._stats is not None:
+                self._stats.record_failure()
             if not self._transport.is_closing():
                 self._transport.close()
             return
@@ -856,8 +1253,25 @@ class _TLSAutoDetectProtocol(asyncio.Protocol):
         logger.debug(
             "tls-auto: TLS handshake succeeded for %s", self._transport.get_extra_info("peername")
         )
+        if self._stats is not None:
+            sslobj = ssl_transport.get_extra_info("ssl_object")
+            self._stats.record(time.monotonic() - stime, bool(sslobj and sslobj.session_reused))
         protocol.connection_made(ssl_transport)
 
+    def _handoff_tls(self) -> None:
+        """Hand off to a protocol performing the TLS handshake in a thread of the executor."""
+        from ._tls import TLSHandshakeProtocol
+
+        assert self._transport is not None and self._executor is not None
+        protocol = TLSHandshakeProtocol(
+            self._ssl_context, self._executor, self._real_factory, self._stats
+        )
+        self._transport.set_protocol(protocol)
+        protocol.connection_made(self._transport)
+        if self._buffered:
+            protocol.data_received(self._buffered)
+        self._transport.resume_reading()
+
     def _handoff_plain(self) -> None:
         """
         Hand off to the real protocol as a plain telnet connection.
@@ -869,6 +1283,11 @@ class _TLSAutoDetectProtocol(asyncio.Protocol):
         protocol = self._real_factory()
         self._transport.set_protocol(protocol)
         protocol.connection_made(self._transport)
+        if self._speculated:
+            # negotiation begins with DO TTYPE, mark it as already sent.
+            writer = getattr(self._transport.get_protocol(), "writer", None)
+            if writer is not None:
+                writer.pending_option[DO + TTYPE] = True
         if self._buffered:
             protocol.data_received(self._buffered)
         self._transport.resume_reading()
@@ -919,6 +1338,277 @@ class LinemodeServer(TelnetServer):
         self._echo_negotiated = True
 
 
+class BufferedTelnetServer(BufferedTelnetProtocol, TelnetServer):
+    """
+    :class:`TelnetServer` receiving into a buffer reused for the connection.
+
+    An :class:`asyncio.BufferedProtocol`, given a :class:`memoryview` of
+    received data by ``data_received()``, valid only until it returns.  Other
+    protocols may be combined with its mixin, ``telnetlib3.BufferedTelnetProtocol``.
+    """
+
+
+class AdmissionControl:
+    """
+    Connection admission policy of :func:`create_server`.
+
+    Connections are admitted or refused before any telnet protocol, reader,
+    writer, or negotiation timer is constructed for them, so that a storm of
+    connections is shed at the cost of accepting and closing a socket.
+
+    :param max_sessions: Maximum number of concurrent sessions, ``0`` for no
+        limit.
+    :param max_sessions_per_ip: Maximum number of concurrent sessions from any
+        one remote address, ``0`` for no limit.
+    :param accept_rate: Sustained rate of connections admitted per second,
+        enforced by a token bucket, ``0`` for no limit.
+    :param accept_burst: Capacity of the token bucket, the number of
+        connections that may be admitted at once after a period of quiet.
+        Default is *accept_rate*, and at least 1.
+    """
+
+    #: Reasons a connection is refused, keys of :attr:`rejected`.
+    REASONS = ("sessions", "per_ip", "rate")
+
+    def __init__(
+        self,
+        max_sessions: int = 0,
+        max_sessions_per_ip: int = 0,
+        accept_rate: float = 0,
+        accept_burst: Optional[int] = None,
+    ) -> None:
+        """Class initializer."""
+        if max_sessions < 0 or max_sessions_per_ip < 0 or accept_rate < 0:
+            raise ValueError("admission limits must not be negative")
+        self.max_sessions = max_sessions
+        self.max_sessions_per_ip = max_sessions_per_ip
+        self.accept_rate = accept_rate
+        self.accept_burst = accept_burst or max(1, int(accept_rate))
+        #: Number of sessions currently admitted.
+        self.sessions = 0
+        #: Number of sessions currently admitted, by remote address.
+        self.sessions_by_ip: Dict[str, int] = {}
+        #: Total number of connections admitted.
+        self.accepted = 0
+        #: Total number of connections refused, by reason.
+        self.rejected: Dict[str, int] = dict.fromkeys(self.REASONS, 0)
+        self._tokens = float(self.accept_burst)
+        self._stamp = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is set."""
+        return bool(self.max_sessions or self.max_sessions_per_ip or self.accept_rate)
+
+    def admit(self, ip: str) -> Optional[str]:
+        """
+        Admit a connection from *ip*, taking a session slot.
+
+        :param ip: Remote address of the connection.
+        :returns: ``None`` when admitted, otherwise the reason refused, one of
+            :attr:`REASONS`.  Each admitted connection must be paired with a
+            call to :meth:`release`.
+        """
+        reason: Optional[str] = None
+        if self.max_sessions and self.sessions >= self.max_sessions:
+            reason = "sessions"
+        elif self.max_sessions_per_ip and (
+            self.sessions_by_ip.get(ip, 0) >= self.max_sessions_per_ip
+        ):
+            reason = "per_ip"
+        elif self.accept_rate and not self._take_token():
+            reason = "rate"
+        if reason is not None:
+            self.rejected[reason] += 1
+            return reason
+        self.accepted += 1
+        self.sessions += 1
+        self.sessions_by_ip[ip] = self.sessions_by_ip.get(ip, 0) + 1
+        return None
+
+    def release(self, ip: str) -> None:
+        """
+        Release the session slot of a connection admitted from *ip*.
+
+        :param ip: Remote address given to :meth:`admit`.
+        """
+        count = self.sessions_by_ip.get(ip, 0)
+        if count <= 0:
+            return
+        self.sessions -= 1
+        if count == 1:
+            del self.sessions_by_ip[ip]
+        else:
+            self.sessions_by_ip[ip] = count - 1
+
+    def _take_token(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.accept_burst), self._tokens + (now - self._stamp) * self.accept_rate
+        )
+        self._stamp = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def __repr__(self) -> str:
+        """Return string representation of limits and counters."""
+        return (
+            f"<AdmissionControl sessions={self.sessions}/{self.max_sessions or '-'}"
+            f" per_ip={self.max_sessions_per_ip or '-'} rate={self.accept_rate or '-'}"
+            f" accepted={self.accepted} rejected={sum(self.rejected.values())}>"
+        )
+
+
+class _AdmissionProtocol(asyncio.Protocol):
+    """
+    Protocol that admits or refuses a connection by :class:`AdmissionControl`.
+
+    Admitted connections are handed off to a protocol of *real_factory*, and
+    their session slot is released by its close callback, see
+    :class:`~.server_base.BaseServer`.  A protocol without one is not handed
+    off, but given the events of the transport by this protocol, releasing
+    the slot when its connection is lost.
+    Refused connections are aborted, or, when *busy_factory* is given, handed
+    off to a protocol of *busy_factory* that does not hold a session slot.
+    """
+
+    def __init__(
+        self,
+        admission: AdmissionControl,
+        real_factory: Callable[[], asyncio.Protocol],
+        busy_factory: Optional[Callable[[], asyncio.Protocol]] = None,
+    ) -> None:
+        self._admission = admission
+        self._real_factory = real_factory
+        self._busy_factory = busy_factory
+        self._protocol: Optional[asyncio.Protocol] = None
+        self._ip: Optional[str] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Admit the connection and hand off, or refuse it."""
+        peername = transport.get_extra_info("peername")
+        ip = str(peername[0]) if peername else ""
+        reason = self._admission.admit(ip)
+        if reason is None:
+            protocol = self._real_factory()
+            add_close_callback = getattr(protocol, "_add_close_callback", None)
+            if add_close_callback is None:
+                self._ip = ip
+                self._protocol = protocol
+                protocol.connection_made(transport)
+                return
+            add_close_callback(functools.partial(self._admission.release, ip))
+        elif self._busy_factory is not None:
+            logger.info("Connection from %s over %s limit, busy", ip, reason)
+            protocol = self._busy_factory()
+        else:
+            logger.debug("Connection from %s over %s limit, closed", ip, reason)
+            transport.abort()  # type: ignore[attr-defined]
+            return
+        self._protocol = protocol
+        transport.set_protocol(protocol)
+        protocol.connection_made(transport)
+
+    def data_received(self, data: bytes) -> None:
+        """Forward data replayed by :class:`_TLSAutoDetectProtocol` after hand-off."""
+        if self._protocol is not None:
+            self._protocol.data_received(data)
+
+    def eof_received(self) -> Optional[bool]:
+        """Forward end of file to a protocol not handed off."""
+        if self._protocol is not None:
+            return self._protocol.eof_received()
+        return None
+
+    def pause_writing(self) -> None:
+        """Forward flow control to a protocol not handed off."""
+        if self._protocol is not None:
+            self._protocol.pause_writing()
+
+    def resume_writing(self) -> None:
+        """Forward flow control to a protocol not handed off."""
+        if self._protocol is not None:
+            self._protocol.resume_writing()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Release the session slot of a protocol not handed off."""
+        if self._ip is not None:
+            self._admission.release(self._ip)
+            self._ip = None
+            if self._protocol is not None:
+                self._protocol.connection_lost(exc)
+
+
+class TLSHandshakeStats:
+    """
+    Counts and durations of the TLS handshakes of a :class:`Server`.
+
+    Durations are measured from the connection, or from detection of a TLS
+    ClientHello by *tls_auto* of :func:`create_server`, until the handshake
+    completes, and so include network round trips.  Failed handshakes are
+    counted when performed by *tls_auto* or *tls_handshake_workers*; those
+    of :mod:`asyncio` for a server given only *ssl* are not reported.
+    """
+
+    def __init__(self) -> None:
+        """Class initializer."""
+        #: Number of handshakes completed.
+        self.completed = 0
+        #: Number of completed handshakes that resumed an earlier session, by
+        #: session ticket or from the session cache of the server.
+        self.resumed = 0
+        #: Number of handshakes failed or timed out.
+        self.failed = 0
+        #: Total seconds of completed handshakes.
+        self.total_secs = 0.0
+        #: Longest seconds of a completed handshake.
+        self.max_secs = 0.0
+
+    @property
+    def mean_secs(self) -> float:
+        """Mean seconds of completed handshakes."""
+        return self.total_secs / self.completed if self.completed else 0.0
+
+    def record(self, elapsed: float, resumed: bool = False) -> None:
+        """
+        Record a completed handshake.
+
+        :param elapsed: Seconds taken by the handshake.
+        :param resumed: Whether an earlier session was resumed.
+        """
+        self.completed += 1
+        self.resumed += resumed
+        self.total_secs += elapsed
+        self.max_secs = max(self.max_secs, elapsed)
+
+    def record_failure(self) -> None:
+        """Record a failed handshake."""
+        self.failed += 1
+
+    def __repr__(self) -> str:
+        """Return string representation of counters."""
+        return (
+            f"<TLSHandshakeStats completed={self.completed} resumed={self.resumed}"
+            f" failed={self.failed} mean={self.mean_secs * 1000:.1f}ms>"
+        )
+
+
+def _on_tls_handshake(protocol: asyncio.Protocol, stats: TLSHandshakeStats) -> asyncio.Protocol:
+    """Record the TLS handshake completed when :mod:`asyncio` connects *protocol* in *stats*."""
+    stime = time.monotonic()
+    connection_made = protocol.connection_made
+
+    def _connection_made(transport: asyncio.BaseTransport) -> None:
+        sslobj = transport.get_extra_info("ssl_object")
+        stats.record(time.monotonic() - stime, bool(sslobj and sslobj.session_reused))
+        connection_made(transport)
+
+    setattr(protocol, "connection_made", _connection_made)
+    return protocol
+
+
 def _enqueue_client(server: "Server", protocol: server_base.BaseServer) -> None:
     """
     Push a completed protocol onto the server's client queue.
@@ -948,15 +1638,41 @@ class Server:
     def __init__(self, server: Optional[asyncio.Server]) -> None:
         """Initialize wrapper around asyncio.Server."""
         self._server: Optional[asyncio.Server] = server
-        self._protocols: List[server_base.BaseServer] = []
+        # Connected protocols in order of connection, each mapped to the
+        # (index, key) pairs by which it is found in self._index.
+        self._protocols: Dict[server_base.BaseServer, List[Tuple[str, Hashable]]] = {}
+        self._index: Dict[str, Dict[Hashable, Dict[server_base.BaseServer, None]]] = {
+            "ip": {},
+            "ttype": {},
+            "tag": {},
+        }
+        # Protocols not yet indexed by peer address, which is not known
+        # until the connection is made.
+        self._unindexed_ip: Dict[server_base.BaseServer, None] = {}
         # Bounded queue prevents unbounded memory growth on long-running
         # servers where wait_for_client() is never called.  The capacity
         # (1000) is far beyond any realistic wait_for_client() drain rate.
         self._new_client: asyncio.Queue[server_base.BaseServer] = asyncio.Queue(maxsize=1000)
+        #: The :class:`AdmissionControl` of connections, ``None`` when
+        #: :func:`create_server` is given no admission limits.
+        self.admission: Optional[AdmissionControl] = None
+        #: The :class:`TLSHandshakeStats` of connections, ``None`` when
+        #: :func:`create_server` is not given *ssl*.
+        self.tls_stats: Optional[TLSHandshakeStats] = None
+        # Executor of TLS handshakes, when given tls_handshake_workers.
+        self._tls_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        #: The :class:`~telnetlib3.metrics.Metrics` of connections, ``None``
+        #: when :func:`create_server` is not given *metrics*.  Counts of
+        #: :attr:`admission` and :attr:`tls_stats` are collected with it.
+        self.metrics: Optional[Metrics] = None
 
     def close(self) -> None:
         """Close the server, stop accepting new connections, and close all clients."""
         self._server.close()
+        if self._tls_executor is not None:
+            self._tls_executor.shutdown(wait=False)
+        if self.metrics is not None:
+            self.metrics.remove_collector(self._collect_metrics)
         # Close all connected client transports
         for protocol in list(self._protocols):
             if hasattr(protocol, "_transport") and protocol._transport is not None:
@@ -967,8 +1683,11 @@ class Server:
         await self._server.wait_closed()
         # Yield to event loop for pending close callbacks
         await asyncio.sleep(0)
-        # Clear protocol list now that server is closed
+        # Clear registry now that server is closed
         self._protocols.clear()
+        self._unindexed_ip.clear()
+        for index in self._index.values():
+            index.clear()
 
     @property
     def sockets(self) -> Optional[Tuple["socket.socket", ...]]:
@@ -986,10 +1705,81 @@ class Server:
 
         :returns: List of protocol instances for all connected clients.
         """
-        # Filter out closed protocols (lazy cleanup)
-        self._protocols = [p for p in self._protocols if not getattr(p, "_closing", False)]
         return list(self._protocols)
 
+    @property
+    def client_count(self) -> int:
+        """Number of connected clients."""
+        return len(self._protocols)
+
+    def iter_clients(self) -> Iterator[server_base.BaseServer]:
+        """
+        Iterate over connected client protocol instances without copying.
+
+        Clients may not connect or disconnect while iterating, the iterator
+        must be consumed without awaiting, otherwise use :attr:`clients`.
+        """
+        return iter(self._protocols)
+
+    def clients_by_ip(self, ip: str) -> List[server_base.BaseServer]:
+        """
+        Connected clients by remote address.
+
+        :param ip: Remote address, as the first item of ``peername``.
+        :returns: List of protocol instances connected from *ip*.
+        """
+        for protocol in list(self._unindexed_ip):
+            peername = protocol.get_extra_info("peername")
+            if peername:
+                del self._unindexed_ip[protocol]
+                self._add_index(protocol, "ip", str(peername[0]))
+        return self._lookup("ip", ip)
+
+    def clients_by_ttype(self, ttype: str) -> List[server_base.BaseServer]:
+        """
+        Connected clients by negotiated terminal type.
+
+        :param ttype: Terminal type, such as ``"xterm-256color"``, compared
+            without regard to case with the final ``TERM`` value negotiated
+            by TTYPE :rfc:`1091`.  Only clients that have completed
+            negotiation are found.
+        :returns: List of protocol instances of terminal type *ttype*.
+        """
+        return self._lookup("ttype", ttype.lower())
+
+    def clients_by_tag(self, tag: Hashable) -> List[server_base.BaseServer]:
+        """
+        Connected clients by tag given to :meth:`tag_client`.
+
+        :param tag: Any hashable value, such as a channel or room name.
+        :returns: List of protocol instances tagged by *tag*.
+        """
+        return self._lookup("tag", tag)
+
+    def tag_client(self, protocol: server_base.BaseServer, tag: Hashable) -> None:
+        """
+        Tag a connected client, to be found by :meth:`clients_by_tag`.
+
+        Tags are removed when the client disconnects.  Tagging a client that
+        is not connected has no effect.
+
+        :param protocol: Client protocol instance.
+        :param tag: Any hashable value, a client may have any number of tags.
+        """
+        self._add_index(protocol, "tag", tag)
+
+    def untag_client(self, protocol: server_base.BaseServer, tag: Hashable) -> None:
+        """
+        Remove a tag given by :meth:`tag_client`, if any.
+
+        :param protocol: Client protocol instance.
+        :param tag: Tag to remove.
+        """
+        entries = self._protocols.get(protocol)
+        if entries is not None and ("tag", tag) in entries:
+            entries.remove(("tag", tag))
+            self._remove_index(protocol, "tag", tag)
+
     async def wait_for_client(self) -> server_base.BaseServer:
         r"""
         Wait for a client to connect and complete negotiation.
@@ -1004,17 +1794,126 @@ class Server:
         """
         return await self._new_client.get()
 
+    def multicast_gmcp(
+        self,
+        package: Union[str, GmcpMessage],
+        data: Any = None,
+        clients: Optional[Iterable[server_base.BaseServer]] = None,
+    ) -> int:
+        """
+        Transmit a GMCP message to many clients, serializing it only once.
+
+        :param package: GMCP package name (e.g., ``"Comm.Channel.Text"``), or
+            a :class:`~.mud.GmcpMessage`.
+        :param data: Optional data to encode as JSON
+        :param clients: Client protocols to send to, default is all connected
+            :attr:`clients`.
+        :returns: Number of clients the message was sent to.  Clients that
+            have not negotiated GMCP are skipped.
+        """
+        message = package if isinstance(package, GmcpMessage) else GmcpMessage(package, data)
+        count = 0
+        for protocol in self.iter_clients() if clients is None else clients:
+            writer = protocol.writer
+            if writer is None or writer.is_closing():
+                continue
+            if writer.local_option.enabled(GMCP) or writer.remote_option.enabled(GMCP):
+                writer.send_gmcp(message)
+                count += 1
+        return count
+
+    def _collect_metrics(self) -> Iterator[Family]:
+        # Collector of :attr:`metrics`, the counts of admission and TLS.
+        if self.admission is not None:
+            admission = self.admission
+            yield ("sessions", "gauge", "Sessions admitted.", [("", {}, admission.sessions)])
+            yield (
+                "admission_accepted_total",
+                "counter",
+                "Connections admitted.",
+                [("", {}, admission.accepted)],
+            )
+            yield (
+                "admission_rejected_total",
+                "counter",
+                "Connections refused, by reason.",
+                [("", {"reason": reason}, count) for reason, count in admission.rejected.items()],
+            )
+        if self.tls_stats is not None:
+            stats = self.tls_stats
+            yield (
+                "tls_handshakes_total",
+                "counter",
+                "TLS handshakes, by result.",
+                [
+                    ("", {"result": "full"}, stats.completed - stats.resumed),
+                    ("", {"result": "resumed"}, stats.resumed),
+                    ("", {"result": "failed"}, stats.failed),
+                ],
+            )
+            yield (
+                "tls_handshake_seconds_total",
+                "counter",
+                "Seconds spent in completed TLS handshakes.",
+                [("", {}, stats.total_secs)],
+            )
+            yield (
+                "tls_handshake_seconds_max",
+                "gauge",
+                "Longest completed TLS handshake, in seconds.",
+                [("", {}, stats.max_secs)],
+            )
+
     def _register_protocol(self, protocol: asyncio.Protocol) -> None:
-        """Register a new protocol instance (called by factory)."""
-        # Prune dead protocols to prevent unbounded memory growth on
-        # long-running servers handling many short-lived connections.
-        self._protocols = [p for p in self._protocols if not getattr(p, "_closing", False)]
-        self._protocols.append(protocol)  # type: ignore[arg-type]
+        """
+        Register a new protocol instance (called by factory).
+
+        Only protocols calling back on close, as :class:`~.server_base.BaseServer`, are
+        registered, to be unregistered when their connection is lost.
+        """
+        client = cast(server_base.BaseServer, protocol)
+        add_close_callback = getattr(protocol, "_add_close_callback", None)
+        if add_close_callback is None:
+            return
+        self._protocols[client] = []
+        self._unindexed_ip[client] = None
+        add_close_callback(functools.partial(self._unregister_protocol, client))
         if hasattr(protocol, "_waiter_connected"):
             protocol._waiter_connected.add_done_callback(
-                lambda f, p=protocol: _enqueue_client(self, p) if not f.cancelled() else None
+                lambda f, p=client: self._on_negotiated(p) if not f.cancelled() else None
             )
 
+    def _unregister_protocol(self, protocol: server_base.BaseServer) -> None:
+        """Remove a protocol instance and its index entries (on connection lost)."""
+        self._unindexed_ip.pop(protocol, None)
+        for name, key in self._protocols.pop(protocol, ()):
+            self._remove_index(protocol, name, key)
+
+    def _on_negotiated(self, protocol: server_base.BaseServer) -> None:
+        """Index a protocol by terminal type and queue it for :meth:`wait_for_client`."""
+        ttype = protocol.get_extra_info("TERM")
+        if ttype:
+            self._add_index(protocol, "ttype", ttype.lower())
+        _enqueue_client(self, protocol)
+
+    def _add_index(self, protocol: server_base.BaseServer, name: str, key: Hashable) -> None:
+        entries = self._protocols.get(protocol)
+        if entries is None or (name, key) in entries:
+            return
+        entries.append((name, key))
+        self._index[name].setdefault(key, {})[protocol] = None
+
+    def _remove_index(self, protocol: server_base.BaseServer, name: str, key: Hashable) -> None:
+        index = self._index[name]
+        members = index.get(key)
+        if members is not None:
+            members.pop(protocol, None)
+            if not members:
+                del index[key]
+
+    def _lookup(self, name: str, key: Hashable) -> List[server_base.BaseServer]:
+        return list(self._index[name].get(key, ()))
+
 
 class StatusLogger:
     """Periodic status logger for connected clients."""
@@ -1030,6 +1929,8 @@ class StatusLogger:
         self._interval = interval
         self._task: Optional["asyncio.Task[None]"] = None
         self._last_status: Optional[Dict[str, Any]] = None
+        # (time, completed, total_secs) of TLS handshakes when last sampled.
+        self._tls_sample = (time.monotonic(), 0, 0.0)
 
     def _get_status(self) -> Dict[str, Any]:
         """Get current status snapshot using IP:port pairs for change detection."""
@@ -1048,25 +1949,66 @@ class StatusLogger:
                 }
             )
         client_data.sort(key=lambda x: (x["ip"], x["port"]))
-        return {"count": len(clients), "clients": client_data}
+        status: Dict[str, Any] = {"count": len(clients), "clients": client_data}
+        admission = getattr(self._server, "admission", None)
+        if admission is not None:
+            status["rejected"] = dict(admission.rejected)
+        tls_stats = getattr(self._server, "tls_stats", None)
+        if tls_stats is not None:
+            status["tls"] = self._get_tls_status(tls_stats)
+        return status
+
+    def _get_tls_status(self, tls_stats: TLSHandshakeStats) -> Dict[str, Any]:
+        """Get TLS handshake counts, and rate and mean duration since the last sample."""
+        now = time.monotonic()
+        stamp, completed, total_secs = self._tls_sample
+        self._tls_sample = (now, tls_stats.completed, tls_stats.total_secs)
+        count = tls_stats.completed - completed
+        return {
+            "completed": tls_stats.completed,
+            "resumed": tls_stats.resumed,
+            "failed": tls_stats.failed,
+            "rate": round(count / (now - stamp), 1) if now > stamp else 0.0,
+            "mean_ms": round((tls_stats.total_secs - total_secs) * 1000 / count, 1) if count else 0,
+            "max_ms": round(tls_stats.max_secs * 1000, 1),
+        }
 
     def _status_changed(self, current: Dict[str, Any]) -> bool:
         """Check if status differs from last logged."""
         if self._last_status is None:
-            return bool(current["count"] > 0)
+            tls = current.get("tls", {})
+            return bool(
+                current["count"] > 0
+                or any(current.get("rejected", {}).values())
+                or tls.get("completed")
+                or tls.get("failed")
+            )
         return current != self._last_status
 
     def _format_status(self, status: Dict[str, Any]) -> str:
         """Format status for logging."""
+        suffix = ""
+        rejected = ", ".join(
+            f"{reason}={count}" for reason, count in status.get("rejected", {}).items() if count
+        )
+        if rejected:
+            suffix += f"; rejected {rejected}"
+        handshakes = status.get("tls")
+        if handshakes and (handshakes["completed"] or handshakes["failed"]):
+            suffix += (
+                f"; tls handshakes={handshakes['completed']} (resumed={handshakes['resumed']},"
+                f" failed={handshakes['failed']}), {handshakes['rate']}/s,"
+                f" mean={handshakes['mean_ms']}ms, max={handshakes['max_ms']}ms"
+            )
         if status["count"] == 0:
-            return "0 clients connected"
+            return f"0 clients connected{suffix}"
 
         def _fmt_client(c: Dict[str, Any]) -> str:
             tls = " tls" if c["tls"] else ""
             return f"{c['ip']}:{c['port']} (rx={c['rx']}, tx={c['tx']}, idle={c['idle']}{tls})"
 
         client_info = ", ".join(_fmt_client(c) for c in status["clients"])
-        return f"{status['count']} client(s): {client_info}"
+        return f"{status['count']} client(s): {client_info}{suffix}"
 
     async def _run(self) -> None:
         """Run periodic status logging."""
@@ -1107,6 +2049,18 @@ async def create_server(
     timeout: int = 300,
     ssl: Optional[ssl_module.SSLContext] = None,
     tls_auto: Union[bool, float] = False,
+    tls_auto_speculate: float = 0,
+    tls_handshake_workers: int = 0,
+    negotiation_profiles: Optional[NegotiationProfileCache] = None,
+    early_shell: Union[bool, Sequence[str]] = False,
+    max_sessions: int = 0,
+    max_sessions_per_ip: int = 0,
+    accept_rate: float = 0,
+    accept_burst: Optional[int] = None,
+    reject_early: bool = True,
+    protocol_trace: int = 0,
+    metrics: Optional[Metrics] = None,
+    write_limit: Optional[WriteLimit] = None,
 ) -> Server:
     """
     Create a TCP Telnet server.
@@ -1185,6 +2139,64 @@ async def create_server(
         so the timeout distinguishes the two.  ``False`` or ``0`` (default)
         disables auto-detection.  Requires *ssl* to be an
         :class:`ssl.SSLContext`.
+    :param tls_auto_speculate: When non-zero with *tls_auto*, the number of
+        seconds without data after which ``IAC DO TTYPE`` is sent, so that a
+        plain telnet client waiting for the server to speak replies and is
+        detected without waiting for the *tls_auto* timeout.  A TLS client
+        that has not sent ClientHello by then fails its handshake, so this
+        should be longer than the round trip time of TLS clients.  ``0``
+        (default) sends nothing before detection.
+    :param tls_handshake_workers: When non-zero with *ssl*, the number of
+        threads performing TLS handshakes, so that a storm of connections
+        does not occupy the event loop with cryptography.  ``0`` (default)
+        performs handshakes on the event loop.  Counts and durations of
+        handshakes are available as :attr:`Server.tls_stats`, a
+        :class:`TLSHandshakeStats`.
+    :param negotiation_profiles: A :class:`NegotiationProfileCache` shared by
+        connections of :class:`TelnetServer` protocols.  Negotiation results
+        are remembered by terminal type, so that later connections of the
+        same type of client complete negotiation with fewer round trips and
+        without waiting on options known to be refused.  ``None`` (default)
+        disables profiling.
+    :param early_shell: When truthy, the shell is started as soon as a
+        minimal set of options is settled, rather than waiting for all
+        negotiation to complete or *connect_maxwait* to elapse.  A sequence
+        of option names, such as ``("BINARY", "SGA")``, sets the options
+        that must be settled; ``True`` uses
+        :data:`~.server_base.EARLY_SHELL_OPTIONS`, ``BINARY``, ``ECHO``, and
+        ``SGA``.  Remaining options, such as TTYPE, NEW_ENVIRON, and CHARSET,
+        continue to negotiate in the background: the shell may await them
+        with :meth:`~.TelnetWriter.wait_for` or
+        :meth:`~.TelnetWriter.wait_for_condition`, and the encoding of the
+        shell's streams changes when CHARSET negotiation later completes.
+        ``False`` (default) starts the shell after negotiation completes.
+    :param max_sessions: Maximum number of concurrent sessions.  Further
+        connections are refused until a session ends.  ``0`` (default) is
+        no limit.
+    :param max_sessions_per_ip: Maximum number of concurrent sessions from any
+        one remote address.  ``0`` (default) is no limit.
+    :param accept_rate: Sustained number of connections admitted per second,
+        further connections are refused.  ``0`` (default) is no limit.
+    :param accept_burst: Number of connections that may be admitted at once
+        by *accept_rate* after a period of quiet.  Default is *accept_rate*.
+    :param reject_early: When ``True`` (default), connections refused by
+        *max_sessions*, *max_sessions_per_ip*, or *accept_rate* are closed
+        before any telnet protocol is constructed for them.  When ``False``,
+        they negotiate and are given :func:`~.guard_shells.busy_shell`
+        instead of *shell*, and do not count as sessions.  Limits and counts
+        of refused connections are available as :attr:`Server.admission`,
+        an :class:`AdmissionControl`.
+    :param protocol_trace: Number of telnet commands received and sent
+        that are kept by the :attr:`~.TelnetWriter.trace` of each connection,
+        a :class:`~.ProtocolTrace`.  ``0`` (default) does not record them.
+    :param metrics: A :class:`~telnetlib3.metrics.Metrics` updated by each
+        connection, and given the counts of :attr:`Server.admission` and
+        :attr:`Server.tls_stats`, see :func:`~.start_metrics_server`.
+        ``None`` (default) counts nothing.
+    :param write_limit: A :class:`~.WriteLimit` of output buffered for each
+        client, and the policy applied beyond it: to block :meth:`~.TelnetWriter.drain`,
+        drop the oldest output, or disconnect a client that does not read.
+        ``None`` (default) uses the limits of the transport.
 
     :return: A :class:`Server` instance that wraps the asyncio.Server
         and provides access to connected client protocols via
@@ -1192,6 +2204,8 @@ async def create_server(
     """
     if tls_auto and ssl is None:
         raise ValueError("tls_auto requires an ssl SSLContext")
+    if tls_handshake_workers and ssl is None:
+        raise ValueError("tls_handshake_workers requires an ssl SSLContext")
     # normalize True → 0.5
     if tls_auto is True:
         tls_auto = 0.5
@@ -1199,8 +2213,9 @@ async def create_server(
     protocol_factory = protocol_factory or TelnetServer
 
     telnet_server = Server(None)
+    admission = AdmissionControl(max_sessions, max_sessions_per_ip, accept_rate, accept_burst)
 
-    def _make_telnet_protocol() -> asyncio.Protocol:
+    def _make_telnet_protocol(shell: Optional[ShellCallback] = shell) -> asyncio.Protocol:
         protocol: asyncio.Protocol
         if issubclass(protocol_factory, TelnetServer):
             protocol = protocol_factory(
@@ -1217,6 +2232,8 @@ async def create_server(
                 cols=cols,
                 rows=rows,
                 timeout=timeout,
+                negotiation_profiles=negotiation_profiles,
+                early_shell=early_shell,
             )
         elif issubclass(protocol_factory, server_base.BaseServer):
             protocol = protocol_factory(
@@ -1228,28 +2245,78 @@ async def create_server(
                 line_mode=line_mode,
                 connect_maxwait=connect_maxwait,
                 limit=limit,
+                early_shell=early_shell,
             )
         else:
             protocol = protocol_factory()
+        if isinstance(protocol, server_base.BaseServer):
+            if protocol_trace:
+                protocol.protocol_trace = protocol_trace
+            if metrics is not None:
+                protocol.metrics = metrics
+            if write_limit is not None:
+                protocol.write_limit = write_limit
         telnet_server._register_protocol(protocol)
         return protocol
 
+    busy_factory: Optional[Callable[[], asyncio.Protocol]] = None
+    if admission.enabled:
+        telnet_server.admission = admission
+        if not reject_early:
+            from .guard_shells import busy_shell
+
+            busy_factory = functools.partial(_make_telnet_protocol, busy_shell)
+
+    def make_protocol() -> asyncio.Protocol:
+        if not admission.enabled:
+            return _make_telnet_protocol()
+        return _AdmissionProtocol(admission, _make_telnet_protocol, busy_factory)
+
+    tls_stats = TLSHandshakeStats()
+    executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    if ssl is not None:
+        telnet_server.tls_stats = tls_stats
+        if tls_handshake_workers:
+            executor = telnet_server._tls_executor = concurrent.futures.ThreadPoolExecutor(
+                tls_handshake_workers, thread_name_prefix="telnetlib3-tls"
+            )
+
     if tls_auto:
         assert ssl is not None
 
         def factory() -> asyncio.Protocol:
-            return _TLSAutoDetectProtocol(ssl, _make_telnet_protocol, tls_auto)
+            return _TLSAutoDetectProtocol(
+                ssl, make_protocol, tls_auto, tls_auto_speculate, tls_stats, executor
+            )
+
+        telnet_server._server = await asyncio.get_running_loop().create_server(factory, host, port)
+    elif executor is not None:
+        from ._tls import TLSHandshakeProtocol
+
+        assert ssl is not None
+
+        def factory() -> asyncio.Protocol:
+            return TLSHandshakeProtocol(ssl, executor, make_protocol, tls_stats)
 
         telnet_server._server = await asyncio.get_running_loop().create_server(factory, host, port)
-    else:
+    elif ssl is not None:
 
         def factory() -> asyncio.Protocol:
-            return _make_telnet_protocol()
+            return _on_tls_handshake(make_protocol(), tls_stats)
 
         telnet_server._server = await asyncio.get_running_loop().create_server(
             factory, host, port, ssl=ssl
         )
+    else:
 
+        def factory() -> asyncio.Protocol:
+            return make_protocol()
+
+        telnet_server._server = await asyncio.get_running_loop().create_server(factory, host, port)
+
+    if metrics is not None:
+        telnet_server.metrics = metrics
+        metrics.add_collector(telnet_server._collect_metrics)
     return telnet_server
 
 
@@ -1319,6 +2386,70 @@ def parse_server_args(
         "when combined with --pty-exec.",
     )
     parser.add_argument("--logfile", default=_config.logfile, help="filepath")
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        metavar="N",
+        default=_config.max_sessions,
+        help="limit concurrent sessions, further connections are refused (0 disables)",
+    )
+    parser.add_argument(
+        "--max-sessions-per-ip",
+        type=int,
+        metavar="N",
+        default=_config.max_sessions_per_ip,
+        help="limit concurrent sessions from any one address (0 disables)",
+    )
+    parser.add_argument(
+        "--accept-rate",
+        type=float,
+        metavar="PER_SECOND",
+        default=_config.accept_rate,
+        help="limit rate of connections admitted per second (0 disables)",
+    )
+    parser.add_argument(
+        "--accept-burst",
+        type=int,
+        metavar="N",
+        default=_config.accept_burst,
+        help="connections admitted at once by --accept-rate (default: accept rate)",
+    )
+    parser.add_argument(
+        "--reject-early",
+        action=argparse.BooleanOptionalAction,
+        default=_config.reject_early,
+        help="close connections refused by --max-sessions, --max-sessions-per-ip, or "
+        "--accept-rate before telnet negotiation; --no-reject-early displays a busy message",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        default=_config.metrics_port,
+        help="serve metrics in the Prometheus text format at http://localhost:PORT/metrics"
+        " (0 disables)",
+    )
+    parser.add_argument(
+        "--write-limit",
+        type=int,
+        metavar="BYTES",
+        default=_config.write_limit,
+        help="pause writing to a client with more output buffered (0 uses the transport default)",
+    )
+    parser.add_argument(
+        "--write-policy",
+        choices=WRITE_POLICIES,
+        default=_config.write_policy,
+        help="while writing to a client is paused by --write-limit, block drain, drop the"
+        " oldest output, or disconnect after --write-timeout",
+    )
+    parser.add_argument(
+        "--write-timeout",
+        type=float,
+        metavar="SECONDS",
+        default=_config.write_timeout,
+        help="seconds writing may remain paused by --write-policy=disconnect",
+    )
     parser.add_argument("--logfmt", default=_config.logfmt, help="log format")
     parser.add_argument("--loglevel", default=_config.loglevel, help="level name")
     parser.add_argument(
@@ -1367,6 +2498,20 @@ def parse_server_args(
     parser.add_argument(
         "--ssl-keyfile", default=None, metavar="PATH", help="path to PEM private key file for TLS"
     )
+    parser.add_argument(
+        "--ssl-session-tickets",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="resume TLS sessions of reconnecting clients by session tickets;"
+        " --no-ssl-session-tickets resumes them from the session cache of the server",
+    )
+    parser.add_argument(
+        "--tls-handshake-workers",
+        type=int,
+        default=0,
+        metavar="N",
+        help="perform TLS handshakes in N threads rather than the event loop (0 disables)",
+    )
     parser.add_argument(
         "--status-interval",
         type=int,
@@ -1389,6 +2534,15 @@ def parse_server_args(
         " value is seconds to wait for TLS ClientHello before"
         " assuming plain telnet (default: 0.5, requires --ssl-certfile)",
     )
+    parser.add_argument(
+        "--tls-auto-speculate",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="with --tls-auto, send IAC DO TTYPE after SECONDS without data,"
+        " detecting plain telnet clients that wait for the server to speak"
+        " without waiting for the full --tls-auto timeout (0 disables)",
+    )
     if extra_args_fn is not None:
         extra_args_fn(parser)
     result = vars(parser.parse_args(argv))
@@ -1413,11 +2567,10 @@ def parse_server_args(
     # Build SSLContext from --ssl-certfile / --ssl-keyfile
     ssl_certfile = result.pop("ssl_certfile", None)
     ssl_keyfile = result.pop("ssl_keyfile", None)
+    ssl_session_tickets = result.pop("ssl_session_tickets", True)
     tls_auto = result.pop("tls_auto", False)
     if ssl_certfile:
-        ctx = ssl_module.SSLContext(ssl_module.PROTOCOL_TLS_SERVER)
-        ctx.load_cert_chain(ssl_certfile, keyfile=ssl_keyfile)
-        result["ssl"] = ctx
+        result["ssl"] = _make_ssl_context(ssl_certfile, ssl_keyfile, ssl_session_tickets)
     else:
         result["ssl"] = None
     result["tls_auto"] = tls_auto
@@ -1425,6 +2578,26 @@ def parse_server_args(
     return result
 
 
+def _make_ssl_context(
+    certfile: str, keyfile: Optional[str] = None, session_tickets: bool = True
+) -> ssl_module.SSLContext:
+    """
+    Return a server :class:`ssl.SSLContext` for the certificate chain of *certfile* and *keyfile*.
+
+    Sessions are resumed by stateless session tickets when *session_tickets* is ``True``,
+    otherwise from the session cache of the context, which OpenSSL keeps for server contexts.
+    Either way resumption skips the key exchange and certificate of a full handshake, but only
+    while the same context serves every connection, as it does for :func:`create_server`.
+    """
+    ctx = ssl_module.SSLContext(ssl_module.PROTOCOL_TLS_SERVER)
+    ctx.load_cert_chain(certfile, keyfile=keyfile)
+    if session_tickets:
+        ctx.options &= ~ssl_module.OP_NO_TICKET
+    else:
+        ctx.options |= ssl_module.OP_NO_TICKET
+    return ctx
+
+
 async def run_server(
     host: str = _config.host,
     port: int = _config.port,
@@ -1448,6 +2621,17 @@ async def run_server(
     protocol_factory: Optional[Type[asyncio.Protocol]] = None,
     ssl: Optional[ssl_module.SSLContext] = None,
     tls_auto: Union[bool, float] = False,
+    tls_auto_speculate: float = 0,
+    tls_handshake_workers: int = 0,
+    max_sessions: int = _config.max_sessions,
+    max_sessions_per_ip: int = _config.max_sessions_per_ip,
+    accept_rate: float = _config.accept_rate,
+    accept_burst: Optional[int] = _config.accept_burst,
+    reject_early: bool = _config.reject_early,
+    metrics_port: int = _config.metrics_port,
+    write_limit: int = _config.write_limit,
+    write_policy: str = _config.write_policy,
+    write_timeout: float = _config.write_timeout,
 ) -> None:
     """
     Program entry point for server daemon.
@@ -1519,6 +2703,8 @@ async def run_server(
 
     loop = asyncio.get_running_loop()
 
+    metrics = Metrics() if metrics_port else None
+
     # bind
     server = await create_server(
         host,
@@ -1534,8 +2720,21 @@ async def run_server(
         timeout=timeout,
         ssl=ssl,
         tls_auto=tls_auto,
+        tls_auto_speculate=tls_auto_speculate,
+        tls_handshake_workers=tls_handshake_workers,
+        max_sessions=max_sessions,
+        max_sessions_per_ip=max_sessions_per_ip,
+        accept_rate=accept_rate,
+        accept_burst=accept_burst,
+        reject_early=reject_early,
+        metrics=metrics,
+        write_limit=(WriteLimit(write_limit, write_policy, write_timeout) if write_limit else None),
     )
 
+    metrics_server = None
+    if metrics is not None:
+        metrics_server = await start_metrics_server(metrics, "localhost", metrics_port)
+
     # SIGTERM cases server to gracefully stop
     loop.add_signal_handler(signal.SIGTERM, asyncio.ensure_future, _sigterm_handler(server, log))
 
@@ -1554,6 +2753,8 @@ async def run_server(
         # stop status logger
         if status_logger:
             status_logger.stop()
+        if metrics_server is not None:
+            metrics_server.close()
         # remove signal handler on stop
         loop.remove_signal_handler(signal.SIGTERM)
 
@@ -7,30 +7,54 @@ import zlib
 import asyncio
 import logging
 import datetime
-from typing import Any, Union, Optional
+from typing import TYPE_CHECKING, Any, List, Tuple, Union, Callable, Optional, Sequence
 
 # local
 from ._base import TelnetProtocolBase, _log_exception, _process_data_chunk
 from ._types import ShellCallback
-from .telopt import theNULL
+from .telopt import DO, WILL, theNULL, option_from_name
 from .accessories import TRACE, hexdump
 from .stream_reader import TelnetReader, TelnetReaderUnicode
-from .stream_writer import TelnetWriter, TelnetWriterUnicode
+from .stream_writer import WriteLimit, TelnetWriter, ProtocolTrace, TelnetWriterUnicode
 
-__all__ = ("BaseServer",)
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import Metrics
+
+__all__ = ("BaseServer", "EARLY_SHELL_OPTIONS")
 
 logger = logging.getLogger("telnetlib3.server_base")
 
+#: Telnet options that must be settled before the shell is started when
+#: ``early_shell=True``.  These are the options that change how the shell's
+#: first output is displayed; others, such as TTYPE, NEW_ENVIRON, and CHARSET,
+#: continue negotiating in the background.
+EARLY_SHELL_OPTIONS = ("BINARY", "ECHO", "SGA")
+
 
 class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.Protocol):
     """Base Telnet Server Protocol."""
 
     _advanced = False
     _closing = False
+    _shell_started = False
     _check_later = None
     _rx_bytes = 0
     _tx_bytes = 0
     _mccp3_decompressor: Optional[zlib._Decompress] = None
+    _close_callbacks: Optional[List[Callable[[], None]]] = None
+
+    #: Number of telnet commands kept by :attr:`TelnetWriter.trace
+    #: <telnetlib3.stream_writer.TelnetWriter.trace>` of each connection, ``0``
+    #: (default) does not record them.
+    protocol_trace = 0
+
+    #: A :class:`~telnetlib3.metrics.Metrics` updated by each connection, or
+    #: ``None`` (default) when not counted.
+    metrics: Optional[Metrics] = None
+
+    #: A :class:`~telnetlib3.stream_writer.WriteLimit` applied to the writer of
+    #: each connection, or ``None`` (default) for the limits of the transport.
+    write_limit: Optional[WriteLimit] = None
 
     def __init__(
         self,
@@ -47,6 +71,7 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         reader_factory_encoding: type = TelnetReaderUnicode,
         writer_factory: type = TelnetWriter,
         writer_factory_encoding: type = TelnetWriterUnicode,
+        early_shell: Union[bool, Sequence[str]] = False,
     ) -> None:
         """Class initializer."""
         super().__init__()
@@ -71,6 +96,13 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         #: maximum duration for :meth:`check_negotiation`.
         self.connect_maxwait = connect_maxwait
         self._limit = limit
+        if early_shell is True:
+            early_shell = EARLY_SHELL_OPTIONS
+        #: Options that must be settled before the shell is started early,
+        #: empty when the shell waits for negotiation to complete.
+        self.early_shell_options: Tuple[bytes, ...] = tuple(
+            option_from_name(name) for name in (early_shell or ())
+        )
 
     def timeout_connection(self) -> None:
         """Close the connection due to timeout."""
@@ -94,9 +126,17 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
 
         :param exc: Exception instance, or ``None`` to indicate close by EOF.
         """
+        callbacks, self._close_callbacks = self._close_callbacks, None
+        for callback in callbacks or ():
+            callback()
         if self._closing:
             return
         self._closing = True
+        if self.metrics is not None:
+            self.metrics.connections_closed += 1
+
+        # discard pending rx data, so that none is fed to the reader after feed_eof().
+        self._discard_rx()
 
         # inform yielding readers about closed connection
         if exc is None:
@@ -135,6 +175,16 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         # for inspection by tests after close.
         self._transport = None
 
+    def _add_close_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Call *callback* once, when :meth:`connection_lost` is first called.
+
+        Subclasses overriding :meth:`connection_lost` must call it of this class.
+        """
+        if self._close_callbacks is None:
+            self._close_callbacks = []
+        self._close_callbacks.append(callback)
+
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         """
         Called when a connection is made.
@@ -169,6 +219,13 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         self.writer = writer_factory(
             transport=transport, protocol=self, reader=self.reader, server=True, **writer_kwds
         )
+        if self.protocol_trace:
+            self.writer.trace = ProtocolTrace(self.protocol_trace)
+        if self.metrics is not None:
+            self.metrics.connections_opened += 1
+            self.writer.metrics = self.reader.metrics = self.metrics
+        if self.write_limit is not None:
+            self.writer.set_write_limit(self.write_limit)
 
         logger.info("Connection from %s", self)
         self._log_tls_info(logger)
@@ -181,6 +238,16 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         # Don't start shell if the connection was cancelled or errored
         if future.cancelled() or future.exception() is not None:
             return
+        self._start_shell()
+
+    def _start_shell(self) -> None:
+        # The shell is started only once, either early, by
+        # :meth:`_check_early_shell`, or when negotiation completes.
+        if self._shell_started:
+            return
+        self._shell_started = True
+        if self.metrics is not None:
+            self.metrics.shell_start_seconds.observe(self.duration)
         if self.shell is not None:
             assert self.reader is not None and self.writer is not None
             coro = self.shell(self.reader, self.writer)
@@ -192,13 +259,19 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         """
         Process bytes received by transport.
 
-        Feeds raw bytes through the writer's IAC interpreter, forwarding in-band data to the reader.
+        Feeds raw bytes through the writer's IAC interpreter, forwarding in-band data to the reader,
+        at once, or queued for async processing while earlier data is pending.
         """
         if logger.isEnabledFor(TRACE):
             logger.log(TRACE, "recv %d bytes\n%s", len(data), hexdump(data, prefix="<<  "))
         self._last_received = datetime.datetime.now()
         self._rx_bytes += len(data)
+        if self.metrics is not None:
+            self.metrics.bytes_received += len(data)
+        self._receive(data)
 
+    def _process_chunk(self, data: Union[bytes, memoryview]) -> bool:
+        """Process a chunk of received bytes; return True if any IAC/SB cmd observed."""
         # MCCP3: decompress client→server data when active
         if self._mccp3_decompressor is not None:
             try:
@@ -206,13 +279,14 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
             except zlib.error:
                 logger.warning("MCCP3 decompression error, disabling")
                 self._mccp3_end()
-                return
+                return False
             if self._mccp3_decompressor.eof:
                 unused = self._mccp3_decompressor.unused_data
                 self._mccp3_end()
+                cmd_received = self._process_chunk(data)
                 if unused:
-                    self.data_received(unused)
-                    return
+                    cmd_received = self._process_chunk(unused) or cmd_received
+                return cmd_received
 
         if self.writer.slc_simulated:
             slc_vals = {defn.val[0] for defn in self.writer.slctab.values() if defn.val != theNULL}
@@ -221,15 +295,28 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
             slc_special = None
 
         cmd_received = _process_data_chunk(
-            data, self.writer, self.reader, slc_special, logger.warning
+            data, self.writer, self.reader, slc_special, logger.warning, self._rx_buffer_of(data)
         )
 
         # Check if MCCP3 SB was just received (client→server compression start)
         if self.writer.mccp3_active and self._mccp3_decompressor is None:
             self._mccp3_start()
 
-        if not self._waiter_connected.done() and cmd_received:
-            self._check_negotiation_timer()
+        return cmd_received
+
+    def pause_writing(self) -> None:
+        """Pause writing when the transport buffer exceeds its high-water mark."""
+        super().pause_writing()
+        if self.metrics is not None:
+            self.metrics.write_paused += 1
+        if self.writer is not None:
+            self.writer._pause_writing()
+
+    def resume_writing(self) -> None:
+        """Resume writing when the transport buffer drains to its low-water mark."""
+        super().resume_writing()
+        if self.writer is not None:
+            self.writer._resume_writing()
 
     # public properties
 
@@ -318,8 +405,39 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
         # that have been requested have been acknowledged.
         return not any(self.writer.pending_option.values())
 
+    def option_settled(self, opt: bytes) -> bool:
+        """
+        Whether negotiation of option *opt* is settled.
+
+        :param opt: Telnet option byte, such as :data:`~.telopt.BINARY`.
+        :returns: ``True`` when the option has been answered, in either
+            direction, and no ``DO`` or ``WILL`` request for it is pending.
+
+        Used to determine when the shell may be started early, see
+        ``early_shell`` of :func:`~.create_server`.
+        """
+        assert self.writer is not None
+        pending = self.writer.pending_option
+        if pending.enabled(DO + opt) or pending.enabled(WILL + opt):
+            return False
+        return opt in self.writer.local_option or opt in self.writer.remote_option
+
     # private methods
 
+    def _check_early_shell(self) -> None:
+        # Start the shell before negotiation completes, once advanced
+        # negotiation has begun and all of ``early_shell_options`` are settled.
+        # Negotiation of remaining options continues in the background,
+        # ``_waiter_connected`` is still resolved when it completes.
+        if (
+            self.early_shell_options
+            and not self._shell_started
+            and self._advanced
+            and all(self.option_settled(opt) for opt in self.early_shell_options)
+        ):
+            logger.debug("shell started early after %1.2fs.", self.duration)
+            self._start_shell()
+
     def _check_negotiation_timer(self) -> None:
         if self._check_later is not None:
             self._check_later.cancel()
@@ -331,17 +449,23 @@ class BaseServer(TelnetProtocolBase, asyncio.streams.FlowControlMixin, asyncio.P
 
         if self.check_negotiation(final=final):
             logger.debug("negotiation complete after %1.2fs.", self.duration)
-            self._waiter_connected.set_result(None)
+            self._negotiation_done()
         elif final:
             logger.debug("negotiation failed after %1.2fs.", self.duration)
-            self._waiter_connected.set_result(None)
+            self._negotiation_done()
         else:
+            self._check_early_shell()
             # keep re-queuing until complete
             self._check_later = asyncio.get_event_loop().call_later(
                 later, self._check_negotiation_timer
             )
             self._tasks.append(self._check_later)
 
+    def _negotiation_done(self) -> None:
+        if self.metrics is not None:
+            self.metrics.negotiation_seconds.observe(self.duration)
+        self._waiter_connected.set_result(None)
+
     def _mccp3_start(self) -> None:
         """Start MCCP3 decompression of client→server data."""
         self._mccp3_decompressor = zlib.decompressobj()
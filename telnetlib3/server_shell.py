@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 # std imports
+import re
 import types
 import asyncio
-from typing import Any, Union, Optional, Coroutine, Generator
+from typing import Any, Dict, Union, Optional, Coroutine, Generator
 
 # 3rd party
 from wcwidth import wcswidth as _wcswidth
+from wcwidth import iter_graphemes as _iter_graphemes
 from wcwidth import iter_graphemes_reverse as _iter_graphemes_reverse
 from wcwidth.escape_sequences import ZERO_WIDTH_PATTERN as _ZERO_WIDTH_PATTERN
 
@@ -33,6 +35,15 @@ _SEQ_STARTERS = frozenset("[])P_^(")
 # SS3 explicitly since it is an input sequence, not an output sequence.
 _SS3 = "O"
 
+# Longest multi-byte sequence consumed before giving up on its terminator.
+_MAX_SEQ_LEN = 256
+
+# Characters handled individually by _LineEditor, any others are appended in runs.
+_EDIT_CHARS = re.compile("[\r\n\x00\b\x7f]")
+
+# Cache of encoding name to byte values decoding as CR or LF, see _line_end_bytes().
+_LINE_END_BYTES: Dict[str, bytes] = {}
+
 
 def _write(writer: Union[TelnetWriter, TelnetWriterUnicode], data: str) -> None:
     """Write string data to writer in the appropriate type (str or bytes)."""
@@ -143,6 +154,9 @@ class _LineEditor:
         self.command: str = ""
         self.last_char: str = ""
         self.max_visible_width: int = max_visible_width
+        #: Visible width of command, summed by grapheme, tracked only when
+        #: max_visible_width is set.
+        self.width: int = 0
 
     def feed(self, char: str) -> tuple[str, Optional[str]]:
         """Feed one character, return (echo_str, command_or_none)."""
@@ -156,31 +170,256 @@ class _LineEditor:
             self.last_char = char
             cmd = self.command
             self.command = ""
+            self.width = 0
             return "", cmd
 
         # Backspace
         if char in ("\b", "\x7f"):
             self.last_char = char
             if self.command:
-                self.command, echo = _backspace_grapheme(self.command)
+                command, echo = _backspace_grapheme(self.command)
+                if self.max_visible_width:
+                    self.width -= _visible_width(self.command[len(command) :])
+                self.command = command
                 return echo, None
             return "", None
 
         # Regular character -- check max_visible_width
         self.last_char = char
-        if self.max_visible_width and _visible_width(self.command + char) > self.max_visible_width:
-            return "", None
-        self.command += char
-        return char, None
+        return self._append(char), None
+
+    def feed_text(self, text: str) -> tuple[str, Optional[str]]:
+        """
+        Feed a run of characters, return (echo_str, command_or_none).
+
+        LF and NUL received while the command is empty are skipped, accounting for CR+LF pairs split
+        across successive lines.  Characters following a completed command are discarded.
+        """
+        echo: list[str] = []
+        pos, end = 0, len(text)
+        while pos < end:
+            match = _EDIT_CHARS.search(text, pos)
+            stop = match.start() if match is not None else end
+            if stop > pos:
+                # Run of regular characters
+                echo.append(self._append(text[pos:stop]))
+                self.last_char = text[stop - 1]
+                pos = stop
+                continue
+            char = text[pos]
+            pos += 1
+            if char in (LF, NUL) and not self.command:
+                continue
+            out, cmd = self.feed(char)
+            echo.append(out)
+            if cmd is not None:
+                return "".join(echo), cmd
+        return "".join(echo), None
+
+    def _append(self, text: str) -> str:
+        """Append regular characters within max_visible_width, return those accepted."""
+        if not self.max_visible_width:
+            self.command += text
+            return text
+
+        # Only the last grapheme of command may be extended by text, such as by a combining
+        # character or ZWJ, so the width of all others is carried forward unchanged.
+        last = next(_iter_graphemes_reverse(self.command), "") if self.command else ""
+        kept = [self.command[: len(self.command) - len(last)]]
+        width = self.width - _visible_width(last)
+        echo: list[str] = []
+        for num, grapheme in enumerate(_iter_graphemes(last + text)):
+            grapheme_width = _visible_width(grapheme)
+            if width + grapheme_width <= self.max_visible_width:
+                kept.append(grapheme)
+                echo.append(grapheme[len(last) :] if num == 0 else grapheme)
+                width += grapheme_width
+            elif num == 0:
+                # extending the last grapheme would exceed width, keep it as it was
+                kept.append(last)
+                width += _visible_width(last)
+        self.command = "".join(kept)
+        self.width = width
+        return "".join(echo)
+
+
+def _sequence_end(text: str, pos: int) -> int:
+    """
+    Return index following the input sequence beginning with ESC at ``text[pos]``.
+
+    An ESC that does not begin a sequence is skipped alone, ``-1`` is returned when the sequence is
+    incomplete and more input is required, matching the behavior of :func:`filter_ansi`.
+    """
+    if pos + 1 >= len(text):
+        return -1
+    next_char = text[pos + 1]
+    if next_char == _SS3:
+        # SS3: ESC O + one final byte, see filter_ansi()
+        return pos + 3 if pos + 2 < len(text) else -1
+    if next_char in _SEQ_STARTERS:
+        match = _ZERO_WIDTH_PATTERN.match(text, pos)
+        if match is not None and match.end() > pos + 2:
+            return match.end()
+        tail = text[pos : pos + _MAX_SEQ_LEN]
+        if len(tail) < _MAX_SEQ_LEN and CR not in tail and LF not in tail:
+            return -1
+        # unterminated, discard only the sequence introducer
+        return pos + 2
+    if _ZERO_WIDTH_PATTERN.match(text[pos : pos + 2]):
+        return pos + 2
+    return pos + 1
+
+
+def _strip_sequences(text: str) -> tuple[str, str]:
+    """
+    Remove terminal input sequences from text.
+
+    :returns: text without sequences, and any incomplete sequence at its end, to be prepended to
+        further input.
+    """
+    if ESC not in text:
+        return text, ""
+    result: list[str] = []
+    pos = 0
+    while True:
+        esc = text.find(ESC, pos)
+        if esc == -1:
+            result.append(text[pos:])
+            return "".join(result), ""
+        result.append(text[pos:esc])
+        pos = _sequence_end(text, esc)
+        if pos == -1:
+            return "".join(result), text[esc:]
+
+
+class AnsiFilteringReader:
+    """
+    Reader wrapper removing terminal input sequences, such as arrow and function keys.
+
+    The same sequences as :func:`filter_ansi` are removed, but all data received is filtered at
+    once, rather than one character per read.  A sequence divided between successive receipts of
+    data is held until it is complete.
+
+    :param reader: Reader to wrap, its methods :meth:`read` and :meth:`readline` return the same
+        type, ``bytes`` or ``str``, and the same lines.
+    """
+
+    def __init__(self, reader: Union[TelnetReader, TelnetReaderUnicode]) -> None:
+        """Initialize wrapper of ``reader``."""
+        #: The wrapped reader.
+        self.reader = reader
+        self.is_binary_reader: bool = reader.is_binary_reader
+        # filtered text not yet returned, beginning at _offset
+        self._buffer = ""
+        self._offset = 0
+        # incomplete sequence at the end of data received
+        self._pending = ""
+
+    def __repr__(self) -> str:
+        """Description of filtered reader."""
+        return f"<AnsiFilteringReader buffered={len(self._buffer) - self._offset} {self.reader!r}>"
+
+    def at_eof(self) -> bool:
+        """Return True if the wrapped reader is at EOF and no filtered data remains."""
+        return self._offset == len(self._buffer) and self.reader.at_eof()
+
+    async def read(self, n: int = -1) -> Union[str, bytes]:
+        """
+        Read up to *n* filtered characters, waiting only when none are buffered.
+
+        :param n: If *n* is not provided, or set to -1, read until EOF.
+        :returns: Filtered data, empty at EOF.
+        """
+        if n == 0:
+            return self._take(0)
+        if n < 0:
+            while await self._fill():
+                pass
+            return self._take(len(self._buffer))
+        if self._offset == len(self._buffer):
+            await self._fill()
+        return self._take(min(self._offset + n, len(self._buffer)))
+
+    async def readline(self) -> Union[str, bytes]:
+        """
+        Read one filtered line.
+
+        Lines end with CR LF, LF, CR NUL (where NUL is removed), or CR, see
+        :meth:`TelnetReader.readline() <telnetlib3.stream_reader.TelnetReader.readline>`.  The
+        partial line is returned at EOF.
+        """
+        start = self._offset
+        while True:
+            idx_cr = self._buffer.find(CR, start)
+            idx_lf = self._buffer.find(LF, start)
+            if idx_cr != -1 and (idx_lf == -1 or idx_cr < idx_lf):
+                following = self._buffer[idx_cr + 1 : idx_cr + 2]
+                if following == LF:
+                    return self._take(idx_cr + 2)
+                line = self._take(idx_cr + 1)
+                if following == NUL:
+                    self._offset += 1
+                return line
+            if idx_lf != -1:
+                return self._take(idx_lf + 1)
+            searched = len(self._buffer) - self._offset
+            if not await self._fill():
+                return self._take(len(self._buffer))
+            start = self._offset + searched
+
+    async def _fill(self) -> bool:
+        """Filter further data received into buffer, return False at EOF."""
+        while True:
+            data = await self.reader.read_available()
+            if not data:
+                if self.reader.at_eof():
+                    # an incomplete sequence at EOF is discarded, as by filter_ansi()
+                    self._pending = ""
+                    return False
+                continue
+            text = data.decode("latin-1") if isinstance(data, bytes) else data
+            text, self._pending = _strip_sequences(self._pending + text)
+            if text:
+                self._buffer = self._buffer[self._offset :] + text
+                self._offset = 0
+                return True
+
+    def _take(self, end: int) -> Union[str, bytes]:
+        """Return buffered text up to index ``end``, encoded for a binary reader."""
+        text = self._buffer[self._offset : end]
+        self._offset = end
+        if self._offset == len(self._buffer):
+            self._buffer, self._offset = "", 0
+        return text.encode("latin-1") if self.is_binary_reader else text
+
+
+def _line_end_bytes(reader: TelnetReader) -> bytes:
+    """Return byte values that decode as CR or LF by the current encoding of reader."""
+    if not isinstance(reader, TelnetReaderUnicode):
+        return b"\r\n"
+    encoding = reader.fn_encoding(incoming=True)
+    result = _LINE_END_BYTES.get(encoding)
+    if result is None:
+        values = bytearray()
+        for byte in range(256):
+            try:
+                if bytes((byte,)).decode(encoding) in (CR, LF):
+                    values.append(byte)
+            except (UnicodeDecodeError, LookupError):
+                pass
+        result = _LINE_END_BYTES[encoding] = bytes(values)
+    return result
 
 
 __all__ = (
     "telnet_server_shell",
+    "AnsiFilteringReader",
     "readline_async",
     "readline",
     "get_linemode",
     "get_slcdata",
     "do_toggle",
+    "do_latency",
 )
 
 
@@ -220,7 +459,11 @@ async def telnet_server_shell(
             _write(writer, "Goodbye." + CR + LF)
             break
         if command == "help":
-            _write(writer, "quit, writer, slc, linemode, toggle [option|all], reader, proto, dump")
+            _write(
+                writer,
+                "quit, writer, slc, linemode, toggle [option|all], reader, proto, "
+                "latency [on|off], dump",
+            )
         elif command == "writer":
             # show 'writer' status
             _write(writer, repr(writer))
@@ -228,8 +471,10 @@ async def telnet_server_shell(
             # show 'reader' status
             _write(writer, repr(reader))
         elif command == "proto":
-            # show 'proto' details of writer
+            # show 'proto' details of writer, and its latency when tracked
             _write(writer, repr(writer.protocol))
+            if writer.latency is not None:
+                _write(writer, CR + LF + repr(writer.latency))
         elif command == "version":
             _write(writer, accessories.get_version())
         elif command == "slc":
@@ -241,6 +486,9 @@ async def telnet_server_shell(
             # toggle specified options
             option = command[len("toggle ") :] or None
             _write(writer, do_toggle(writer, option))
+        elif command.startswith("latency"):
+            # display, start, or stop latency tracking
+            _write(writer, do_latency(writer, command[len("latency ") :]))
         elif command.startswith("dump"):
             # dump [kb] [ms_delay] [drain|nodrain] [close|noclose]
             #
@@ -329,10 +577,38 @@ async def readline_async(
     """
     Async readline that filters ANSI escape sequences.
 
-    Uses ``filter_ansi()`` to strip escape sequences and
-    ``_LineEditor`` for grapheme-aware backspace and max_visible_width support.
+    All text received is edited and echoed at once, up to the end of line, so that pasted input
+    does not cost one coroutine step per character.  ``_LineEditor`` provides grapheme-aware
+    backspace and max_visible_width support.  Readers other than
+    :class:`~telnetlib3.stream_reader.TelnetReader` are read one character at a time using
+    ``filter_ansi()``.
     """
     editor = _LineEditor(max_visible_width=max_visible_width)
+    if not isinstance(reader, TelnetReader):
+        return await _readline_chars(reader, writer, editor)
+    pending = ""
+    while True:
+        data = await reader.read_available(stop=_line_end_bytes(reader))
+        if not data:
+            if reader.at_eof():
+                return None
+            # only part of a multibyte character was received
+            continue
+        text = data.decode("latin-1") if isinstance(data, bytes) else data
+        text, pending = _strip_sequences(pending + text)
+        echo, cmd = editor.feed_text(text)
+        if echo:
+            _echo(writer, echo)
+        if cmd is not None:
+            return cmd
+
+
+async def _readline_chars(
+    reader: Union[TelnetReader, TelnetReaderUnicode],
+    writer: Union[TelnetWriter, TelnetWriterUnicode],
+    editor: _LineEditor,
+) -> Optional[str]:
+    """Implement readline_async() by ``filter_ansi()``, one character at a time."""
     while True:
         next_char = await filter_ansi(reader, writer)
         if not next_char:
@@ -343,10 +619,7 @@ async def readline_async(
             continue
         echo, cmd = editor.feed(next_char)
         if echo:
-            if writer.is_binary_writer:
-                writer.echo(echo.encode("latin-1"))
-            else:
-                writer.echo(echo)  # type: ignore[arg-type]
+            _echo(writer, echo)
         if cmd is not None:
             return cmd
 
@@ -404,6 +677,21 @@ def get_linemode(writer: Union[TelnetWriter, TelnetWriterUnicode]) -> str:
     return f"LINEMODE active. Mode: {writer.mode}\r\n{bits}"
 
 
+def do_latency(writer: Union[TelnetWriter, TelnetWriterUnicode], option: str) -> str:
+    """Display, start (``"on"``), or stop (``"off"``) latency tracking of the session."""
+    if option == "on":
+        writer.track_latency()
+        return "latency tracking enabled."
+    if option == "off":
+        writer.track_latency(enable=False)
+        return "latency tracking disabled."
+    if option:
+        return "latency: not an option."
+    if writer.latency is None:
+        return "latency off"
+    return writer.latency.summary()
+
+
 def do_toggle(writer: Union[TelnetWriter, TelnetWriterUnicode], option: Optional[str]) -> str:
     """Display or toggle telnet session parameters."""
     linemode_active = writer.remote_option.enabled(telopt.LINEMODE)
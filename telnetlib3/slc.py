@@ -3,7 +3,18 @@
 from __future__ import annotations
 
 # std imports
-from typing import Any, Dict, List, Tuple, Union, Callable, Optional
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Mapping,
+    Callable,
+    Iterator,
+    Optional,
+    MutableMapping,
+)
 
 # local
 from .telopt import theNULL
@@ -37,6 +48,7 @@ __all__ = (
     "SLC_LNEXT",
     "SLC_nosupport",
     "SLC_NOSUPPORT",
+    "SLCTable",
     "SLC_RP",
     "SLC_SUSP",
     "SLC_SYNCH",
@@ -225,24 +237,152 @@ BSD_SLC_TAB = {
 }
 
 
-def generate_slctab(tabset: Optional[Dict[bytes, SLC]] = None) -> Dict[bytes, SLC]:
+#: Single-byte ``bytes`` objects, indexed by ordinal, to avoid allocations
+_BYTES = tuple(bytes([ordinal]) for ordinal in range(256))
+
+#: Compiled (masks, values) pairs shared by every :class:`SLCTable` of equal
+#  contents, copied only when a table is first modified.
+_SHARED_TABS: Dict[bytes, Tuple[bytes, bytes]] = {}
+
+
+class _SLCView(SLC):
+    """SLC definition reading and writing through to one slot of a :class:`SLCTable`."""
+
+    def __init__(self, table: "SLCTable", func: int) -> None:
+        """Initialize view of ``table`` at SLC function ordinal ``func``."""
+        # pylint: disable=super-init-not-called
+        self._table = table
+        self._func = func
+
+    @property
+    def mask(self) -> bytes:
+        """SLC option mask."""
+        return _BYTES[self._table._masks[self._func]]
+
+    @mask.setter
+    def mask(self, mask: bytes) -> None:
+        self._table._store(self._func, mask[0], None)
+
+    @property
+    def val(self) -> bytes:
+        """SLC keyboard ascii value."""
+        return _BYTES[self._table._values[self._func]]
+
+    @val.setter
+    def val(self, value: bytes) -> None:
+        self._table._store(self._func, None, value[0])
+
+
+class SLCTable(MutableMapping[bytes, SLC]):
+    """
+    Compact 'SLC Tab' of all SLC functions, ``SLC_SYNCH`` through ``SLC_EEOL``.
+
+    Behaves as a dictionary of SLC function byte to :class:`SLC` definition, but stores only two
+    arrays of ``NSLC + 1`` bytes, the mask and value of each function.  Tables of equal contents
+    share the same immutable arrays until modified, so that an idle connection costs no more than
+    this instance.  Definitions returned by item access are views: modifying them by
+    :meth:`SLC.set_mask` or :meth:`SLC.set_value` modifies this table.
+    """
+
+    def __init__(self, tabset: Optional[Mapping[bytes, SLC]] = None) -> None:
+        """
+        Initialize SLCTable from ``tabset``.
+
+        :param tabset: Dictionary of SLC function byte to :class:`SLC` definition, such as
+            :data:`BSD_SLC_TAB`, the default.  Functions not listed are set as ``SLC_NOSUPPORT``.
+        """
+        self._masks: Union[bytes, bytearray]
+        self._values: Union[bytes, bytearray]
+        if tabset is None:
+            tabset = BSD_SLC_TAB
+        if isinstance(tabset, SLCTable):
+            self._masks, self._values = tabset._masks, tabset._values
+            if isinstance(self._masks, bytearray):
+                self._masks, self._values = bytes(self._masks), bytes(self._values)
+            return
+        masks = bytearray(NSLC + 1)
+        values = bytearray(_POSIX_VDISABLE * (NSLC + 1))
+        for func in range(1, NSLC + 1):
+            slc_def = tabset.get(_BYTES[func])
+            if slc_def is not None:
+                masks[func], values[func] = slc_def.mask[0], slc_def.val[0]
+        key = bytes(masks + values)
+        self._masks, self._values = _SHARED_TABS.setdefault(key, (bytes(masks), bytes(values)))
+
+    def _store(self, func: int, mask: Optional[int], value: Optional[int]) -> None:
+        """Store ``mask`` and/or ``value`` of function ``func``, copying shared arrays."""
+        masks, values = self._masks, self._values
+        if not isinstance(masks, bytearray) or not isinstance(values, bytearray):
+            self._masks = masks = bytearray(masks)
+            self._values = values = bytearray(values)
+        if mask is not None:
+            masks[func] = mask
+        if value is not None:
+            values[func] = value
+
+    @staticmethod
+    def _index(func: bytes) -> int:
+        """Return ordinal of SLC function byte ``func``, raising KeyError when out of range."""
+        if isinstance(func, (bytes, bytearray)) and len(func) == 1 and 0 < func[0] <= NSLC:
+            return func[0]
+        raise KeyError(func)
+
+    def __getitem__(self, func: bytes) -> SLC:
+        """Return :class:`SLC` view of function ``func``."""
+        return _SLCView(self, self._index(func))
+
+    def __setitem__(self, func: bytes, slc_def: SLC) -> None:
+        """Store mask and value of ``slc_def`` for function ``func``."""
+        self._store(self._index(func), slc_def.mask[0], slc_def.val[0])
+
+    def __delitem__(self, func: bytes) -> None:
+        """Functions cannot be removed, set as ``SLC_NOSUPPORT`` instead."""
+        self[func] = SLC_nosupport()
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate SLC function bytes in ascending order."""
+        return iter(_BYTES[1 : NSLC + 1])
+
+    def __len__(self) -> int:
+        """Number of SLC functions, :data:`NSLC`."""
+        return NSLC
+
+    def __contains__(self, func: object) -> bool:
+        """Whether ``func`` is an SLC function byte."""
+        return isinstance(func, bytes) and len(func) == 1 and 0 < func[0] <= NSLC
+
+    def copy(self) -> "SLCTable":
+        """Return a copy of this table, sharing arrays until either is modified."""
+        return SLCTable(self)
+
+    def find(self, byte: bytes) -> Optional[bytes]:
+        """
+        Return the first SLC function byte with value ``byte``, or None.
+
+        The value ``theNULL`` never matches, it indicates that no value is assigned.
+        """
+        if byte == theNULL or len(byte) != 1:
+            return None
+        func = self._values.find(byte[0], 1)
+        return None if func == -1 else _BYTES[func]
+
+    def __repr__(self) -> str:
+        """Returns string of all functions and definitions, for debugging."""
+        items = ", ".join(f"{name_slc_command(func)}: {slc_def}" for func, slc_def in self.items())
+        return f"<SLCTable {{{items}}}>"
+
+
+def generate_slctab(tabset: Optional[Mapping[bytes, SLC]] = None) -> SLCTable:
     """
     Returns full 'SLC Tab' for definitions found using ``tabset``.
 
     Functions not listed in ``tabset`` are set as SLC_NOSUPPORT.
     """
-    if tabset is None:
-        tabset = BSD_SLC_TAB
-    #   ``slctab`` is a dictionary of SLC functions, such as SLC_IP,
-    #   to a tuple of the handling character and support level.
-    _slctab = {}
-    for slc in [bytes([const]) for const in range(1, NSLC + 1)]:
-        _slctab[slc] = tabset.get(slc, SLC_nosupport())
-    return _slctab
+    return SLCTable(tabset)
 
 
 def generate_forwardmask(
-    binary_mode: bool, tabset: Dict[bytes, SLC], ack: bool = False
+    binary_mode: bool, tabset: Mapping[bytes, SLC], ack: bool = False
 ) -> "Forwardmask":
     """
     Generate a Forwardmask instance.
@@ -273,7 +413,7 @@ def generate_forwardmask(
 
 
 def snoop(
-    byte: bytes, slctab: Dict[bytes, SLC], slc_callbacks: Dict[bytes, Callable[..., Any]]
+    byte: bytes, slctab: Mapping[bytes, SLC], slc_callbacks: Mapping[bytes, Callable[..., Any]]
 ) -> Tuple[Optional[Callable[..., Any]], Optional[bytes], Optional[SLC]]:
     """
     Scan ``slctab`` for matching ``byte`` values.
@@ -281,6 +421,11 @@ def snoop(
     Returns (callback, func_byte, slc_definition) on match. Otherwise, (None, None, None). If no
     callback is assigned, the value of callback is always None.
     """
+    if isinstance(slctab, SLCTable):
+        func = slctab.find(byte)
+        if func is None:
+            return (None, None, None)
+        return (slc_callbacks.get(func, None), func, slctab[func])
     for slc_func, slc_def in slctab.items():
         if byte == slc_def.val and slc_def.val != theNULL:
             return (slc_callbacks.get(slc_func, None), slc_func, slc_def)
@@ -9,13 +9,18 @@ import codecs
 import asyncio
 import logging
 import warnings
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 from asyncio import format_helpers
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import Metrics, SessionLatency
+
 __all__ = ("TelnetReader", "TelnetReaderUnicode")
 
 _DEFAULT_LIMIT = 2**16  # 64 KiB
 
+logger = logging.getLogger(__name__)
+
 
 class TelnetReader:
     """
@@ -24,6 +29,23 @@ class TelnetReader:
     A copy of :class:`asyncio.StreamReader` with telnet-aware readline().
     """
 
+    __slots__ = (
+        "log",
+        "_limit",
+        "_buffer",
+        "_eof",
+        "_waiter",
+        "_exception",
+        "_transport",
+        "_paused",
+        "metrics",
+        "latency",
+        # attributes not listed, such as _source_traceback of debug mode,
+        # are stored in a dictionary created on demand.
+        "__dict__",
+        "__weakref__",
+    )
+
     #: Whether this reader returns raw bytes (True) or unicode strings (False).
     is_binary_reader: bool = True
 
@@ -31,7 +53,7 @@ class TelnetReader:
 
     def __init__(self, limit: int = _DEFAULT_LIMIT) -> None:
         """Initialize TelnetReader with optional buffer size limit."""
-        self.log = logging.getLogger(__name__)
+        self.log = logger
         # The line length limit is  a security feature;
         # it also doubles as half the buffer limit.
 
@@ -45,6 +67,14 @@ class TelnetReader:
         self._exception: Optional[Exception] = None
         self._transport: Optional[asyncio.BaseTransport] = None
         self._paused = False
+        #: A :class:`~telnetlib3.metrics.Metrics` counting when reading is
+        #: paused and resumed, or ``None`` (default) when not counted.
+        self.metrics: Optional[Metrics] = None
+        #: A :class:`~telnetlib3.metrics.SessionLatency` observing how long
+        #: received bytes remain buffered, or ``None`` (default) when not
+        #: observed, set by :meth:`TelnetWriter.track_latency
+        #: <telnetlib3.stream_writer.TelnetWriter.track_latency>`.
+        self.latency: Optional[SessionLatency] = None
         try:
             loop = asyncio.get_running_loop()
             if loop.get_debug():
@@ -99,9 +129,14 @@ class TelnetReader:
         self._transport = transport
 
     def _maybe_resume_transport(self) -> None:
+        # called by every read after consuming from the buffer.
+        if self.latency is not None:
+            self.latency.consumed(len(self._buffer))
         if self._paused and len(self._buffer) <= self._limit:
             self._paused = False
             self._transport.resume_reading()
+            if self.metrics is not None:
+                self.metrics.read_resumed += 1
 
     def feed_eof(self) -> None:
         """
@@ -131,6 +166,8 @@ class TelnetReader:
             return
 
         self._buffer.extend(data)
+        if self.latency is not None:
+            self.latency.fed(len(data))
         self._wakeup_waiter()
 
         if self._transport is not None and not self._paused and len(self._buffer) > 2 * self._limit:
@@ -143,6 +180,8 @@ class TelnetReader:
                 self._transport = None
             else:
                 self._paused = True
+                if self.metrics is not None:
+                    self.metrics.read_paused += 1
 
     async def _wait_for_data(self, func_name: str) -> None:
         """
@@ -165,6 +204,8 @@ class TelnetReader:
         if self._paused:
             self._paused = False
             self._transport.resume_reading()
+            if self.metrics is not None:
+                self.metrics.read_resumed += 1
 
         self._waiter = asyncio.get_running_loop().create_future()
         try:
@@ -385,6 +426,40 @@ class TelnetReader:
         self._maybe_resume_transport()
         return data
 
+    async def read_available(self, n: int = -1, stop: bytes = b"") -> bytes:
+        """
+        Read bytes already received, waiting only when none are buffered.
+
+        Where :meth:`read` of the unicode reader may return as little as one character, this
+        returns everything received, allowing a caller such as a line editor to process pasted
+        text in one pass.
+
+        :param n: Maximum number of bytes to return, or -1 for all buffered bytes.
+        :param stop: Byte values, any one of which ends the returned data (inclusive).  Bytes
+            following it remain buffered for the next read.
+        :returns: Buffered bytes, or empty bytes at EOF.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        if n == 0:
+            return b""
+
+        if not self._buffer and not self._eof:
+            await self._wait_for_data("read_available")
+
+        end = len(self._buffer) if n < 0 else min(n, len(self._buffer))
+        for byte in stop:
+            idx = self._buffer.find(byte, 0, end)
+            if idx != -1:
+                end = idx + 1
+
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+
+        self._maybe_resume_transport()
+        return data
+
     async def readexactly(self, n: int) -> bytes:
         """
         Read exactly `n` bytes.
@@ -555,15 +630,11 @@ class TelnetReaderUnicode(TelnetReader):
     configurable encoding determined by callback function.
     """
 
+    __slots__ = ("fn_encoding", "encoding_errors", "_decoder")
+
     #: Unicode readers return strings, not raw bytes.
     is_binary_reader: bool = False
 
-    #: Late-binding instance of :class:`codecs.IncrementalDecoder`, some
-    #: bytes may be lost if the protocol's encoding is changed after
-    #: previously receiving a partial multibyte.  This isn't common in
-    #: practice, however.
-    _decoder = None
-
     def __init__(
         self,
         fn_encoding: Callable[..., str],
@@ -583,6 +654,12 @@ class TelnetReaderUnicode(TelnetReader):
         self.fn_encoding = fn_encoding
         self.encoding_errors = encoding_errors
 
+        #: Late-binding instance of :class:`codecs.IncrementalDecoder`.  When the
+        #: protocol's encoding is changed, such as by CHARSET negotiation, after
+        #: previously receiving a partial multibyte, the buffered bytes are carried
+        #: into the decoder of the new encoding.
+        self._decoder: Optional[codecs.IncrementalDecoder] = None
+
     def decode(self, buf: bytes, final: bool = False) -> str:
         """Decode bytes ``buf`` using preferred encoding."""
         if buf == b"":
@@ -592,8 +669,10 @@ class TelnetReaderUnicode(TelnetReader):
 
         # late-binding,
         if self._decoder is None or encoding != getattr(self._decoder, "_encoding", ""):
+            pending = self._decoder.getstate()[0] if self._decoder is not None else b""
             self._decoder = codecs.getincrementaldecoder(encoding)(errors=self.encoding_errors)
             setattr(self._decoder, "_encoding", encoding)
+            buf = pending + buf
 
         return self._decoder.decode(buf, final)
 
@@ -650,6 +729,33 @@ class TelnetReaderUnicode(TelnetReader):
         self._maybe_resume_transport()
         return u_data
 
+    async def read_raw(self, n: int = -1) -> bytes:
+        """
+        Read up to *n* bytes without decoding.
+
+        Bytes of a partial character held by the decoder from a previous read are returned first.
+        This allows a caller to pass through data already in the encoding it requires, such as
+        UTF-8 for display, without decoding and encoding it again.
+
+        See ancestor method, :meth:`~TelnetReader.read` for details.
+        """
+        if self._decoder is not None:
+            pending = self._decoder.getstate()[0]
+            if pending:
+                self._decoder.reset()
+                self._buffer[:0] = pending
+        return await super().read(n)
+
+    async def read_available(self, n: int = -1, stop: bytes = b"") -> str:  # type: ignore[override]
+        """
+        Read and decode bytes already received, waiting only when none are buffered.
+
+        See ancestor method, :meth:`~TelnetReader.read_available` for details.  Both *n* and
+        *stop* are given in bytes.  An empty string is returned when only part of a multibyte
+        character was received; use :meth:`~TelnetReader.at_eof` to detect EOF.
+        """
+        return self.decode(await super().read_available(n, stop))
+
     async def readexactly(self, n: int) -> str:  # type: ignore[override]
         """
         Read exactly *n* unicode characters.
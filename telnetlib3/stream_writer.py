@@ -3,18 +3,39 @@
 from __future__ import annotations
 
 # std imports
+import time
 import struct
 import asyncio
 import logging
 import collections
-from typing import TYPE_CHECKING, Any, Dict, Union, Callable, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Deque,
+    Tuple,
+    Union,
+    Generic,
+    Mapping,
+    TypeVar,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+    NamedTuple,
+    MutableMapping,
+    overload,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import Metrics
     from .stream_reader import TelnetReader
 
 # local
 from . import slc
 from .mud import (
+    MudState,
+    GmcpMessage,
     zmp_decode,
     atcp_decode,
     gmcp_decode,
@@ -97,10 +118,11 @@ from .telopt import (
     name_commands,
     option_from_name,
 )
+from .metrics import SessionLatency
 from .accessories import TRACE, hexdump
 from ._session_context import TelnetSessionContext
 
-__all__ = ("TelnetWriter", "TelnetWriterUnicode")
+__all__ = ("TelnetWriter", "TelnetWriterUnicode", "ProtocolTrace", "WriteLimit", "WriteBuffer")
 
 #: MUD options that allow empty SB payloads (e.g. ``IAC SB MXP IAC SE``).
 _EMPTY_SB_OK = frozenset({MXP, MSP, ZMP, AARDWOLF, ATCP, MCCP2_COMPRESS, MCCP3_COMPRESS})
@@ -108,6 +130,286 @@ _EMPTY_SB_OK = frozenset({MXP, MSP, ZMP, AARDWOLF, ATCP, MCCP2_COMPRESS, MCCP3_C
 #: MUD protocol options that a plain telnet client should decline by default.
 _MUD_PROTOCOL_OPTIONS = frozenset({GMCP, MSDP, MSSP, MSP, MXP, ZMP, AARDWOLF, ATCP})
 
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+#: An event of :class:`ProtocolTrace`, ``(timestamp, direction, cmd, opt)``.
+TraceEvent = Tuple[float, str, bytes, Optional[bytes]]
+
+#: Policies of :class:`WriteLimit`.
+WRITE_POLICIES = ("block", "drop", "disconnect")
+
+
+def _iter_commands(buf: bytes) -> Iterator[Tuple[bytes, Optional[bytes]]]:
+    """Yield ``(cmd, opt)`` of each telnet command of *buf*, escaped ``IAC IAC`` skipped."""
+    idx, end = 0, len(buf)
+    while idx < end - 1:
+        if buf[idx] != IAC[0]:
+            idx += 1
+            continue
+        cmd = buf[idx + 1 : idx + 2]
+        if cmd == IAC:
+            # escaped 255 data byte
+            idx += 2
+        elif cmd == SB:
+            yield cmd, buf[idx + 2 : idx + 3] or None
+            idx = buf.find(IAC + SE, idx + 2)
+            if idx == -1:
+                break
+            idx += 2
+        elif cmd in (DO, DONT, WILL, WONT):
+            yield cmd, buf[idx + 2 : idx + 3] or None
+            idx += 3
+        else:
+            yield cmd, None
+            idx += 2
+
+
+class ProtocolTrace:
+    """
+    Ring buffer of the telnet commands of one connection.
+
+    Given as :attr:`TelnetWriter.trace`, each telnet command received and
+    sent is recorded as a tuple ``(timestamp, direction, cmd, opt)``: the
+    :func:`time.monotonic` time, ``"recv"`` or ``"send"``, the command byte,
+    such as :data:`~.telopt.DO` or :data:`~.telopt.SB`, and the option byte,
+    or ``None`` for 2-byte commands such as ``IAC GA``.  Recording an event
+    costs much less than a log record, so that a trace may be kept for every
+    connection and displayed by :meth:`dump` only for those of interest.
+
+    :param maxlen: Number of most recent events kept.
+    """
+
+    __slots__ = ("events", "started")
+
+    def __init__(self, maxlen: int = 256) -> None:
+        """Class initializer."""
+        #: Recorded events, oldest first.
+        self.events: Deque[TraceEvent] = collections.deque(maxlen=maxlen)
+        #: :func:`time.monotonic` time the trace was created.
+        self.started = time.monotonic()
+
+    def record(self, direction: str, cmd: bytes, opt: Optional[bytes] = None) -> None:
+        """Record a command, *direction* is ``"recv"`` or ``"send"``."""
+        self.events.append((time.monotonic(), direction, cmd, opt))
+
+    def record_send(self, buf: bytes) -> None:
+        """Record each command of *buf*, as sent by :meth:`TelnetWriter.send_iac`."""
+        for cmd, opt in _iter_commands(buf):
+            self.record("send", cmd, opt)
+
+    def clear(self) -> None:
+        """Discard all recorded events."""
+        self.events.clear()
+
+    def dump(self) -> str:
+        """
+        Return recorded events as text, one per line.
+
+        Each line is the time since the trace was created, direction, and
+        the names of the command and option, such as
+        ``"  0.001250 recv WILL TTYPE"``.
+        """
+        return "\n".join(
+            f"{stamp - self.started:10.6f} {direction} {name_command(cmd)}"
+            + ("" if opt is None else f" {name_option(opt)}")
+            for stamp, direction, cmd, opt in self.events
+        )
+
+    def __len__(self) -> int:
+        """Return number of recorded events."""
+        return len(self.events)
+
+    def __iter__(self) -> Iterator[TraceEvent]:
+        """Iterate over recorded events, oldest first."""
+        return iter(self.events)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<ProtocolTrace {len(self.events)}/{self.events.maxlen} events>"
+
+
+class WriteLimit(NamedTuple):
+    """
+    Limit of output buffered for a slow peer, and the policy applied beyond it.
+
+    Given as argument ``write_limit`` of :func:`~telnetlib3.server.create_server`
+    or :func:`~telnetlib3.client.open_connection`, or to
+    :meth:`TelnetWriter.set_write_limit`.  Writing is paused once the transport
+    buffers more than :attr:`high` bytes, and resumed when it has sent all but a
+    quarter of them.  While paused, *policy* is one of:
+
+    - ``"block"``: :meth:`TelnetWriter.drain` waits until writing is resumed.
+      Output of writers that never drain is buffered without limit.
+    - ``"drop"``: output is held by the writer, and the oldest output is
+      dropped while more than :attr:`high` bytes are held.  Held output is
+      written when resumed.
+    - ``"disconnect"``: the connection is aborted once writing remains paused
+      for :attr:`timeout` seconds.
+
+    Telnet commands, such as those of negotiation, are never held or dropped,
+    and are written ahead of any output held by policy ``"drop"``.
+    """
+
+    #: Number of bytes buffered by the transport beyond which writing is paused.
+    high: int = 64 * 1024
+    #: Policy while writing is paused, ``"block"``, ``"drop"``, or ``"disconnect"``.
+    policy: str = "block"
+    #: Seconds writing may remain paused by policy ``"disconnect"``.
+    timeout: float = 30.0
+
+
+class WriteBuffer:
+    """
+    Output held from a slow peer by a :class:`WriteLimit`, and counts of its flow control.
+
+    Given as :attr:`TelnetWriter.write_buffer` by :meth:`TelnetWriter.set_write_limit`.
+    """
+
+    __slots__ = (
+        "limit",
+        "held",
+        "held_bytes",
+        "dropped_bytes",
+        "pauses",
+        "paused_since",
+        "paused_secs",
+        "_timer",
+    )
+
+    def __init__(self, limit: WriteLimit) -> None:
+        """Class initializer."""
+        #: The limit applied.
+        self.limit = limit
+        #: Output held while paused by policy ``"drop"``, oldest first.
+        self.held: Deque[bytes] = collections.deque()
+        #: Number of bytes of :attr:`held`.
+        self.held_bytes = 0
+        #: Number of bytes of output dropped by policy ``"drop"``.
+        self.dropped_bytes = 0
+        #: Number of times writing was paused.
+        self.pauses = 0
+        #: :func:`time.monotonic` time writing was paused, ``None`` while not paused.
+        self.paused_since: Optional[float] = None
+        #: Total seconds writing was paused, not including the current pause.
+        self.paused_secs = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def paused(self) -> bool:
+        """Whether writing is paused."""
+        return self.paused_since is not None
+
+    def hold(self, data: bytes) -> None:
+        """Hold *data*, dropping the oldest held output beyond :attr:`WriteLimit.high` bytes."""
+        self.held.append(data)
+        self.held_bytes += len(data)
+        while self.held_bytes > self.limit.high:
+            dropped = len(self.held.popleft())
+            self.held_bytes -= dropped
+            self.dropped_bytes += dropped
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<WriteBuffer {self.limit.policy} high={self.limit.high}"
+            f"{' paused' if self.paused else ''} held={self.held_bytes}"
+            f" dropped={self.dropped_bytes} pauses={self.pauses}>"
+        )
+
+
+class _Lazy(Generic[_T]):
+    """
+    Descriptor of a container attribute created by ``factory`` on first access.
+
+    The container is stored in the slot of the same name prefixed by an underscore, which the
+    owning class initializes as ``None``, so that connections never using it do not allocate it.
+    """
+
+    def __init__(self, factory: Callable[[], _T]) -> None:
+        """Initialize descriptor creating containers by ``factory``."""
+        self.factory = factory
+        self.slot: Any = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = owner.__dict__[f"_{name}"]
+
+    @overload
+    def __get__(self, obj: None, objtype: Optional[type] = None) -> _Lazy[_T]: ...
+
+    @overload
+    def __get__(self, obj: object, objtype: Optional[type] = None) -> _T: ...
+
+    def __get__(self, obj: Optional[object], objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, objtype)
+        if value is None:
+            value = self.factory()
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: object, value: _T) -> None:
+        self.slot.__set__(obj, value)
+
+
+class _Callbacks(MutableMapping[bytes, Callable[..., Any]]):
+    """
+    Callbacks of a :class:`TelnetWriter` keyed by command or option byte.
+
+    Commands not registered by ``set_*_callback()`` methods fall back to the writer method named
+    in ``defaults``, looked up on use, rather than binding every default handler of every
+    connection in advance.
+    """
+
+    __slots__ = ("_writer", "_defaults", "_funcs")
+
+    def __init__(self, writer: TelnetWriter, defaults: Mapping[bytes, str]) -> None:
+        """Initialize callbacks of ``writer`` with ``defaults`` of method names."""
+        self._writer = writer
+        self._defaults = defaults
+        self._funcs: Optional[Dict[bytes, Callable[..., Any]]] = None
+
+    def __getitem__(self, cmd: bytes) -> Callable[..., Any]:
+        if self._funcs is not None and cmd in self._funcs:
+            return self._funcs[cmd]
+        func: Callable[..., Any] = getattr(self._writer, self._defaults[cmd])
+        return func
+
+    def __setitem__(self, cmd: bytes, func: Callable[..., Any]) -> None:
+        if self._funcs is None:
+            self._funcs = {}
+        self._funcs[cmd] = func
+
+    def __delitem__(self, cmd: bytes) -> None:
+        if cmd not in self:
+            raise KeyError(cmd)
+        if self._funcs is not None:
+            self._funcs.pop(cmd, None)
+        if cmd in self._defaults:
+            self._defaults = {key: name for key, name in self._defaults.items() if key != cmd}
+
+    def __contains__(self, cmd: object) -> bool:
+        return cmd in self._defaults or (self._funcs is not None and cmd in self._funcs)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._defaults
+        if self._funcs is not None:
+            yield from (cmd for cmd in self._funcs if cmd not in self._defaults)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get(self, cmd: bytes, default: Any = None) -> Any:
+        """Return callback of ``cmd``, or ``default``."""
+        return self[cmd] if cmd in self else default
+
+    def clear(self) -> None:
+        """Remove all callbacks, including defaults."""
+        self._defaults = {}
+        self._funcs = None
+
 
 class TelnetWriter:
     """
@@ -116,12 +418,71 @@ class TelnetWriter:
     A copy of :class:`asyncio.StreamWriter` with IAC interpretation.
     """
 
+    __slots__ = (
+        "_transport",
+        "_protocol",
+        "_reader",
+        "_closed_fut",
+        "_server",
+        "log",
+        "byte_count",
+        "iac_received",
+        "cmd_received",
+        "slc_received",
+        "_waiters",
+        "pending_option",
+        "local_option",
+        "remote_option",
+        "environ_encoding",
+        "_always_will",
+        "_always_do",
+        "_always_wont",
+        "_always_dont",
+        "_passive_do",
+        "_encoding_explicit",
+        "_ctx",
+        "_rejected_will",
+        "_rejected_do",
+        "_directional_refusals",
+        "environ_send_raw",
+        "_environ_batches",
+        "mssp_data",
+        "_zmp_data",
+        "_atcp_data",
+        "_aardwolf_data",
+        "_mxp_data",
+        "comport_data",
+        "compression",
+        "_mccp2_activated",
+        "_compressed_remainder",
+        "mccp2_active",
+        "mccp3_active",
+        "_in_loop_detection",
+        "_sb_buffer",
+        "_slc_buffer",
+        "slctab",
+        "_linemode",
+        "_forwardmask",
+        "_slc_sent",
+        "_connection_closed",
+        "_iac_callback",
+        "_slc_callback",
+        "_ext_callback",
+        "_ext_send_callback",
+        "_ext_offer_callback",
+        "trace",
+        "metrics",
+        "latency",
+        "write_buffer",
+        # attributes not listed, such as those of class defaults below, or
+        # set by applications, are stored in a dictionary created on demand.
+        "__dict__",
+        "__weakref__",
+    )
+
     #: Whether this writer expects raw bytes (True) or unicode strings (False).
     is_binary_writer: bool = True
 
-    #: Total bytes sent to :meth:`~.feed_byte`
-    byte_count = 0
-
     #: Whether flow control is enabled.
     lflow = True
 
@@ -130,18 +491,6 @@ class TelnetWriter:
     #: False, any keypress from client re-enables transmission.
     xon_any = False
 
-    #: Whether the last byte received by :meth:`~.feed_byte` is the beginning
-    #: of an IAC command.
-    iac_received = None
-
-    #: Whether the last byte received by :meth:`~.feed_byte` begins an IAC
-    #: command sequence.
-    cmd_received: bytes | tuple[bytes, bytes] | bool | None = None
-
-    #: Whether the last byte received by :meth:`~.feed_byte` is a matching
-    #: special line character value, if negotiated.
-    slc_received = None
-
     #: SLC function values and callbacks are fired for clients in Kludge
     #: mode not otherwise capable of negotiating LINEMODE, providing
     #: transport remote editing function callbacks for dumb clients.
@@ -149,12 +498,155 @@ class TelnetWriter:
 
     default_slc_tab = slc.BSD_SLC_TAB
 
+    _mud_state: Optional[MudState] = None
+
     #: Initial line mode requested by server if client supports LINEMODE
     #: negotiation (remote line editing and literal echo of control chars)
     default_linemode = slc.Linemode(
         bytes([ord(slc.LMODE_MODE_REMOTE) | ord(slc.LMODE_MODE_LIT_ECHO)])
     )
 
+    #: Set of option byte(s) for which the client always sends WILL
+    #: (even when not natively supported).  Overrides the default
+    #: WONT rejection in :meth:`handle_do`.
+    always_will: _Lazy[set[bytes]] = _Lazy(set)
+
+    #: Set of option byte(s) for which the client always sends DO
+    #: (even when not natively supported).  Overrides the default
+    #: DONT rejection in :meth:`handle_will`.
+    always_do: _Lazy[set[bytes]] = _Lazy(set)
+
+    #: Set of option byte(s) for which the client always sends WONT
+    #: in response to DO, refusing the option even when natively
+    #: supported.  Overrides the default WILL in :meth:`handle_do`.
+    always_wont: _Lazy[set[bytes]] = _Lazy(set)
+
+    #: Set of option byte(s) for which the client always sends DONT
+    #: in response to WILL, refusing the option even when natively
+    #: supported.  Overrides the default DO in :meth:`handle_will`.
+    always_dont: _Lazy[set[bytes]] = _Lazy(set)
+
+    #: Set of option byte(s) for which the client sends DO only
+    #: in response to a server WILL (passive negotiation).
+    passive_do: _Lazy[set[bytes]] = _Lazy(set)
+
+    #: Per-connection session context.  Applications may replace this
+    #: with a subclass of :class:`~telnetlib3._session_context.TelnetSessionContext` to carry
+    #: additional state (e.g. MUD client macros, room graphs).
+    ctx: _Lazy[TelnetSessionContext] = _Lazy(TelnetSessionContext)
+
+    #: Set of option byte(s) for WILL received from remote end
+    #: that were rejected with DONT (unhandled options).
+    rejected_will: _Lazy[set[bytes]] = _Lazy(set)
+
+    #: Set of option byte(s) for DO received from remote end
+    #: that were rejected with WONT (unsupported options).
+    rejected_do: _Lazy[set[bytes]] = _Lazy(set)
+
+    #: Set of option byte(s) refused due to directional mismatch
+    #: (e.g. WILL NAWS on client end, DO TTYPE on server end).
+    directional_refusals: _Lazy[set[bytes]] = _Lazy(set)
+
+    #: Accumulated ZMP messages (list of [command, arg, ...] lists).
+    #: Empty until ``SB ZMP`` payloads are received and decoded.
+    zmp_data: _Lazy[list[list[str]]] = _Lazy(list)
+
+    #: Accumulated ATCP messages (list of (package, value) tuples).
+    #: Empty until ``SB ATCP`` payloads are received and decoded.
+    atcp_data: _Lazy[list[tuple[str, str]]] = _Lazy(list)
+
+    #: Accumulated Aardwolf messages (list of decoded dicts).
+    #: Empty until ``SB AARDWOLF`` payloads are received and decoded.
+    aardwolf_data: _Lazy[list[dict[str, Any]]] = _Lazy(list)
+
+    #: Accumulated MXP subnegotiation payloads (list of raw bytes).
+    #: Empty until ``SB MXP`` payloads are received.  An empty payload
+    #: (``b""``) signals MXP mode activation.
+    mxp_data: _Lazy[list[bytes]] = _Lazy(list)
+
+    #: Names of methods handling IAC commands, unless replaced by
+    #: :meth:`set_iac_callback`.
+    _default_iac_callbacks: Mapping[bytes, str] = {
+        BRK: "handle_brk",
+        IP: "handle_ip",
+        AO: "handle_ao",
+        AYT: "handle_ayt",
+        EC: "handle_ec",
+        EL: "handle_el",
+        EOF: "handle_eof",
+        SUSP: "handle_susp",
+        ABORT: "handle_abort",
+        NOP: "handle_nop",
+        DM: "handle_dm",
+        GA: "handle_ga",
+        CMD_EOR: "handle_eor",
+        TM: "handle_tm",
+    }
+
+    #: Names of methods handling SLC functions, unless replaced by
+    #: :meth:`set_slc_callback`.
+    _default_slc_callbacks: Mapping[bytes, str] = {
+        slc.SLC_SYNCH: "handle_dm",
+        slc.SLC_BRK: "handle_brk",
+        slc.SLC_IP: "handle_ip",
+        slc.SLC_AO: "handle_ao",
+        slc.SLC_AYT: "handle_ayt",
+        slc.SLC_EOR: "handle_eor",
+        slc.SLC_ABORT: "handle_abort",
+        slc.SLC_EOF: "handle_eof",
+        slc.SLC_SUSP: "handle_susp",
+        slc.SLC_EC: "handle_ec",
+        slc.SLC_EL: "handle_el",
+        slc.SLC_EW: "handle_ew",
+        slc.SLC_RP: "handle_rp",
+        slc.SLC_LNEXT: "handle_lnext",
+        slc.SLC_XON: "handle_xon",
+        slc.SLC_XOFF: "handle_xoff",
+    }
+
+    #: Names of methods receiving sub-negotiation values, unless replaced by
+    #: :meth:`set_ext_callback`.
+    _default_ext_callbacks: Mapping[bytes, str] = {
+        LOGOUT: "handle_logout",
+        SNDLOC: "handle_sndloc",
+        NAWS: "handle_naws",
+        TSPEED: "handle_tspeed",
+        TTYPE: "handle_ttype",
+        XDISPLOC: "handle_xdisploc",
+        NEW_ENVIRON: "handle_environ",
+        CHARSET: "handle_charset",
+        GMCP: "handle_gmcp",
+        MSDP: "handle_msdp",
+        MSSP: "handle_mssp",
+        MSP: "handle_msp",
+        MXP: "handle_mxp",
+        ZMP: "handle_zmp",
+        AARDWOLF: "handle_aardwolf",
+        ATCP: "handle_atcp",
+        MCCP2_COMPRESS: "handle_mccp2",
+    }
+
+    #: Names of methods answering sub-negotiation requests, unless replaced by
+    #: :meth:`set_ext_send_callback`.  The "client" handlers of CHARSET and
+    #: NEW_ENVIRON take arguments, responding to received offers.
+    _default_ext_send_callbacks: Mapping[bytes, str] = {
+        TTYPE: "handle_send_ttype",
+        TSPEED: "handle_send_tspeed",
+        XDISPLOC: "handle_send_xdisploc",
+        NAWS: "handle_send_naws",
+        SNDLOC: "handle_send_sndloc",
+        CHARSET: "handle_send_client_charset",
+        NEW_ENVIRON: "handle_send_client_environ",
+    }
+
+    #: Names of methods building outgoing sub-negotiation requests, unless
+    #: replaced by :meth:`set_ext_offer_callback`.  The "server" handlers
+    #: take no arguments and return lists of what to offer or request.
+    _default_ext_offer_callbacks: Mapping[bytes, str] = {
+        CHARSET: "handle_send_server_charset",
+        NEW_ENVIRON: "handle_send_server_environ",
+    }
+
     def __init__(
         self,
         transport: asyncio.Transport,
@@ -202,7 +694,40 @@ class TelnetWriter:
         if not any((client, server)) or all((client, server)):
             raise TypeError("keyword arguments `client', and `server' are mutually exclusive.")
         self._server = server
-        self.log = logging.getLogger(__name__)
+        self.log = logger
+
+        #: A :class:`ProtocolTrace` recording each telnet command received
+        #: and sent, or ``None`` (default) when not recorded.
+        self.trace: Optional[ProtocolTrace] = None
+
+        #: A :class:`~telnetlib3.metrics.Metrics` counting commands and bytes
+        #: sent and commands received, or ``None`` (default) when not counted.
+        self.metrics: Optional[Metrics] = None
+
+        #: A :class:`~telnetlib3.metrics.SessionLatency` observing the time
+        #: taken by each write, shared with the reader, or ``None`` (default)
+        #: when not observed.  Set by :meth:`track_latency`.
+        self.latency: Optional[SessionLatency] = None
+
+        #: A :class:`WriteBuffer` of output held from a slow peer, and counts of
+        #: its flow control, or ``None`` (default) without a :class:`WriteLimit`.
+        #: Set by :meth:`set_write_limit`.
+        self.write_buffer: Optional[WriteBuffer] = None
+
+        #: Total bytes sent to :meth:`~.feed_byte`
+        self.byte_count = 0
+
+        #: Whether the last byte received by :meth:`~.feed_byte` is the beginning
+        #: of an IAC command.
+        self.iac_received: Optional[bool] = None
+
+        #: Whether the last byte received by :meth:`~.feed_byte` begins an IAC
+        #: command sequence.
+        self.cmd_received: bytes | tuple[bytes, bytes] | bool | None = None
+
+        #: Whether the last byte received by :meth:`~.feed_byte` is a matching
+        #: special line character value, if negotiated.
+        self.slc_received: Optional[bytes] = None
 
         #: List of (predicate, future) tuples for wait_for functionality
         self._waiters: list[tuple[Callable[[], bool], asyncio.Future[bool]]] = []
@@ -227,52 +752,27 @@ class TelnetWriter:
         #: EBCDIC hosts such as IBM OS/400.
         self.environ_encoding: str = "ascii"
 
-        #: Set of option byte(s) for which the client always sends WILL
-        #: (even when not natively supported).  Overrides the default
-        #: WONT rejection in :meth:`handle_do`.
-        self.always_will: set[bytes] = set()
-
-        #: Set of option byte(s) for which the client always sends DO
-        #: (even when not natively supported).  Overrides the default
-        #: DONT rejection in :meth:`handle_will`.
-        self.always_do: set[bytes] = set()
-
-        #: Set of option byte(s) for which the client always sends WONT
-        #: in response to DO, refusing the option even when natively
-        #: supported.  Overrides the default WILL in :meth:`handle_do`.
-        self.always_wont: set[bytes] = set()
-
-        #: Set of option byte(s) for which the client always sends DONT
-        #: in response to WILL, refusing the option even when natively
-        #: supported.  Overrides the default DO in :meth:`handle_will`.
-        self.always_dont: set[bytes] = set()
-
-        #: Set of option byte(s) for which the client sends DO only
-        #: in response to a server WILL (passive negotiation).
-        self.passive_do: set[bytes] = set()
+        # containers of lazy attributes, such as always_will, are created on
+        # first access: most connections never use most of them.
+        self._always_will: Optional[set[bytes]] = None
+        self._always_do: Optional[set[bytes]] = None
+        self._always_wont: Optional[set[bytes]] = None
+        self._always_dont: Optional[set[bytes]] = None
+        self._passive_do: Optional[set[bytes]] = None
+        self._ctx: Optional[TelnetSessionContext] = None
+        self._rejected_will: Optional[set[bytes]] = None
+        self._rejected_do: Optional[set[bytes]] = None
+        self._directional_refusals: Optional[set[bytes]] = None
+        self._zmp_data: Optional[list[list[str]]] = None
+        self._atcp_data: Optional[list[tuple[str, str]]] = None
+        self._aardwolf_data: Optional[list[dict[str, Any]]] = None
+        self._mxp_data: Optional[list[bytes]] = None
 
         #: Whether the encoding was explicitly set (not just the default
         #: ``"ascii"``).  Used by fingerprinting and client connection logic
         #: to decide whether to negotiate CHARSET.
         self._encoding_explicit: bool = False
 
-        #: Per-connection session context.  Applications may replace this
-        #: with a subclass of :class:`~telnetlib3._session_context.TelnetSessionContext` to carry
-        #: additional state (e.g. MUD client macros, room graphs).
-        self.ctx: TelnetSessionContext = TelnetSessionContext()
-
-        #: Set of option byte(s) for WILL received from remote end
-        #: that were rejected with DONT (unhandled options).
-        self.rejected_will: set[bytes] = set()
-
-        #: Set of option byte(s) for DO received from remote end
-        #: that were rejected with WONT (unsupported options).
-        self.rejected_do: set[bytes] = set()
-
-        #: Set of option byte(s) refused due to directional mismatch
-        #: (e.g. WILL NAWS on client end, DO TTYPE on server end).
-        self.directional_refusals: set[bytes] = set()
-
         #: Raw bytes of the last NEW_ENVIRON SEND payload, captured
         #: for fingerprinting.  ``None`` if no SEND was received.
         self.environ_send_raw: Optional[bytes] = None
@@ -286,23 +786,6 @@ class TelnetWriter:
         #: ``None`` until a ``SB MSSP`` payload is received and decoded.
         self.mssp_data: Optional[dict[str, str | list[str]]] = None
 
-        #: Accumulated ZMP messages (list of [command, arg, ...] lists).
-        #: Empty until ``SB ZMP`` payloads are received and decoded.
-        self.zmp_data: list[list[str]] = []
-
-        #: Accumulated ATCP messages (list of (package, value) tuples).
-        #: Empty until ``SB ATCP`` payloads are received and decoded.
-        self.atcp_data: list[tuple[str, str]] = []
-
-        #: Accumulated Aardwolf messages (list of decoded dicts).
-        #: Empty until ``SB AARDWOLF`` payloads are received and decoded.
-        self.aardwolf_data: list[dict[str, Any]] = []
-
-        #: Accumulated MXP subnegotiation payloads (list of raw bytes).
-        #: Empty until ``SB MXP`` payloads are received.  An empty payload
-        #: (``b""``) signals MXP mode activation.
-        self.mxp_data: list[bytes] = []
-
         #: COM-PORT-OPTION (RFC 2217) data received via subnegotiation.
         #: ``None`` until an ``SB COM-PORT-OPTION`` payload is received.
         self.comport_data: Optional[dict[str, Any]] = None
@@ -332,11 +815,11 @@ class TelnetWriter:
         #: produce false-positive re-negotiation signals.
         self._in_loop_detection: bool = False
 
-        #: Sub-negotiation buffer
-        self._sb_buffer: collections.deque[bytes] = collections.deque()
+        #: Sub-negotiation buffer, an empty tuple outside of sub-negotiation.
+        self._sb_buffer: Union[collections.deque[bytes], tuple[bytes, ...]] = ()
 
         #: SLC buffer
-        self._slc_buffer: collections.deque[bytes] = collections.deque()
+        self._slc_buffer: list[bytes] = []
 
         #: SLC Tab (SLC Functions and their support level, and ascii value)
         self.slctab = slc.generate_slctab(self.default_slc_tab)
@@ -353,94 +836,15 @@ class TelnetWriter:
 
         self._connection_closed = False
 
-        # Set default callback handlers to local methods.  A base protocol
-        # wishing not to wire any callbacks at all may simply allow our stream
-        # to gracefully log and do nothing about in most cases.
-        self._iac_callback: dict[bytes, Callable[..., Any]] = {}
-        for iac_cmd, key in (
-            (BRK, "brk"),
-            (IP, "ip"),
-            (AO, "ao"),
-            (AYT, "ayt"),
-            (EC, "ec"),
-            (EL, "el"),
-            (EOF, "eof"),
-            (SUSP, "susp"),
-            (ABORT, "abort"),
-            (NOP, "nop"),
-            (DM, "dm"),
-            (GA, "ga"),
-            (CMD_EOR, "eor"),
-            (TM, "tm"),
-        ):
-            self.set_iac_callback(cmd=iac_cmd, func=getattr(self, f"handle_{key}"))
-
-        self._slc_callback: dict[bytes, Callable[..., Any]] = {}
-        for slc_cmd, key in (
-            (slc.SLC_SYNCH, "dm"),
-            (slc.SLC_BRK, "brk"),
-            (slc.SLC_IP, "ip"),
-            (slc.SLC_AO, "ao"),
-            (slc.SLC_AYT, "ayt"),
-            (slc.SLC_EOR, "eor"),
-            (slc.SLC_ABORT, "abort"),
-            (slc.SLC_EOF, "eof"),
-            (slc.SLC_SUSP, "susp"),
-            (slc.SLC_EC, "ec"),
-            (slc.SLC_EL, "el"),
-            (slc.SLC_EW, "ew"),
-            (slc.SLC_RP, "rp"),
-            (slc.SLC_LNEXT, "lnext"),
-            (slc.SLC_XON, "xon"),
-            (slc.SLC_XOFF, "xoff"),
-        ):
-            self.set_slc_callback(slc_byte=slc_cmd, func=getattr(self, f"handle_{key}"))
-
-        self._ext_callback: dict[bytes, Callable[..., Any]] = {}
-        for ext_cmd, key in (
-            (LOGOUT, "logout"),
-            (SNDLOC, "sndloc"),
-            (NAWS, "naws"),
-            (TSPEED, "tspeed"),
-            (TTYPE, "ttype"),
-            (XDISPLOC, "xdisploc"),
-            (NEW_ENVIRON, "environ"),
-            (CHARSET, "charset"),
-            (GMCP, "gmcp"),
-            (MSDP, "msdp"),
-            (MSSP, "mssp"),
-            (MSP, "msp"),
-            (MXP, "mxp"),
-            (ZMP, "zmp"),
-            (AARDWOLF, "aardwolf"),
-            (ATCP, "atcp"),
-            (MCCP2_COMPRESS, "mccp2"),
-        ):
-            self.set_ext_callback(cmd=ext_cmd, func=getattr(self, f"handle_{key}"))
-
-        self._ext_send_callback: dict[bytes, Callable[..., Any]] = {}
-        for ext_cmd, key in (
-            (TTYPE, "ttype"),
-            (TSPEED, "tspeed"),
-            (XDISPLOC, "xdisploc"),
-            (NAWS, "naws"),
-            (SNDLOC, "sndloc"),
-        ):
-            self.set_ext_send_callback(cmd=ext_cmd, func=getattr(self, f"handle_send_{key}"))
-
-        # Offer callbacks: used by request_charset() and request_environ()
-        # to get the list of items to offer/request.  Separate from
-        # _ext_send_callback which is used to *respond* to received requests.
-        self._ext_offer_callback: dict[bytes, Callable[..., Any]] = {}
-
-        for ext_cmd, key in ((CHARSET, "charset"), (NEW_ENVIRON, "environ")):
-            # The "server" default handlers take no args and return lists
-            # (what to offer/request).  The "client" handlers take args
-            # (respond to received offers).
-            self.set_ext_offer_callback(
-                cmd=ext_cmd, func=getattr(self, f"handle_send_server_{key}")
-            )
-            self.set_ext_send_callback(cmd=ext_cmd, func=getattr(self, f"handle_send_client_{key}"))
+        # Callbacks default to local methods, see _default_iac_callbacks and
+        # others.  A base protocol wishing not to wire any callbacks at all may
+        # simply allow our stream to gracefully log and do nothing about in
+        # most cases.
+        self._iac_callback = _Callbacks(self, self._default_iac_callbacks)
+        self._slc_callback = _Callbacks(self, self._default_slc_callbacks)
+        self._ext_callback = _Callbacks(self, self._default_ext_callbacks)
+        self._ext_send_callback = _Callbacks(self, self._default_ext_send_callbacks)
+        self._ext_offer_callback = _Callbacks(self, self._default_ext_offer_callbacks)
 
     @property
     def connection_closed(self) -> bool:
@@ -468,6 +872,8 @@ class TelnetWriter:
                 self._protocol.connection_lost(None)
             except Exception:
                 pass
+        if self.write_buffer is not None and self.write_buffer._timer is not None:
+            self.write_buffer._timer.cancel()
         if self._transport is not None:
             self._transport.close()
         # break circular refs
@@ -649,6 +1055,17 @@ class TelnetWriter:
         if _remote:
             info.append(f"{endpoint}-will:{','.join(_remote)}")
 
+        if self.latency is not None:
+            info.append(f"latency[{self.latency.summary()}]")
+
+        if self.write_buffer is not None:
+            buf = self.write_buffer
+            info.append(f"write:{buf.limit.policy}{'(paused)' if buf.paused else ''}")
+            if buf.held_bytes:
+                info.append(f"held:{buf.held_bytes}")
+            if buf.dropped_bytes:
+                info.append(f"dropped:{buf.dropped_bytes}")
+
         return f"<{' '.join(info)}>"
 
     def write(self, data: bytes) -> None:
@@ -701,6 +1118,90 @@ class TelnetWriter:
         if self._protocol is not None:
             await self._protocol._drain_helper()
 
+    def track_latency(self, enable: bool = True) -> Optional[SessionLatency]:
+        """
+        Start or stop observing the latency of bytes within this session.
+
+        When enabled, a new :class:`~telnetlib3.metrics.SessionLatency` is given as
+        :attr:`latency` of this writer and its reader, observing the time each
+        :meth:`write` takes until given to the transport, and the time received
+        bytes remain buffered by the reader until read.  Tracking may be started
+        and stopped at any time; a session not tracked has no added cost.
+
+        :param enable: Whether to track latency, discarding any previous observations.
+        :returns: The new :attr:`latency`, or ``None`` when disabled.
+        """
+        self.latency = SessionLatency() if enable else None
+        if self._reader is not None:
+            self._reader.latency = self.latency
+        return self.latency
+
+    def set_write_limit(self, limit: Optional[WriteLimit]) -> None:
+        """
+        Apply a :class:`WriteLimit` to output buffered for the peer.
+
+        The high-water mark of the transport is set to :attr:`WriteLimit.high`,
+        and :attr:`write_buffer` is given a new :class:`WriteBuffer`.
+
+        :param limit: The limit and policy, or ``None`` to remove a limit,
+            writing any held output.
+        :raises ValueError: When the policy is not one of ``"block"``,
+            ``"drop"``, or ``"disconnect"``.
+        """
+        if limit is not None and limit.policy not in WRITE_POLICIES:
+            raise ValueError(f"write policy must be one of {WRITE_POLICIES}, got {limit.policy!r}")
+        previous = self.write_buffer
+        self.write_buffer = None if limit is None else WriteBuffer(limit)
+        if previous is not None:
+            if previous._timer is not None:
+                previous._timer.cancel()
+            for data in previous.held:
+                self._send(data)
+        if limit is not None:
+            self._transport.set_write_buffer_limits(high=limit.high)
+
+    def _pause_writing(self) -> None:
+        """Begin the policy of :attr:`write_buffer`, called by the protocol as writing is paused."""
+        buf = self.write_buffer
+        if buf is None or buf.paused:
+            return
+        buf.pauses += 1
+        buf.paused_since = time.monotonic()
+        if buf.limit.policy == "disconnect":
+            buf._timer = asyncio.get_running_loop().call_later(
+                buf.limit.timeout, self._slow_consumer
+            )
+
+    def _resume_writing(self) -> None:
+        """End the policy of :attr:`write_buffer`, called by the protocol as writing is resumed."""
+        buf = self.write_buffer
+        if buf is None or buf.paused_since is None:
+            return
+        buf.paused_secs += time.monotonic() - buf.paused_since
+        buf.paused_since = None
+        if buf._timer is not None:
+            buf._timer.cancel()
+            buf._timer = None
+        # writing held output may pause writing again.
+        while buf.held and not buf.paused and not self.is_closing():
+            data = buf.held.popleft()
+            buf.held_bytes -= len(data)
+            self._send(data)
+
+    def _slow_consumer(self) -> None:
+        """Abort the connection, paused longer than the timeout of policy ``"disconnect"``."""
+        assert self.write_buffer is not None
+        self.write_buffer._timer = None
+        self.log.warning(
+            "Closing connection of slow consumer, writing paused for %ss with %d bytes buffered",
+            self.write_buffer.limit.timeout,
+            self._transport.get_write_buffer_size(),
+        )
+        if self.metrics is not None:
+            self.metrics.slow_consumers += 1
+        self._transport.abort()
+        self.close()
+
     # proprietary write helper
 
     def feed_byte(self, byte: bytes) -> bool:
@@ -729,7 +1230,7 @@ class TelnetWriter:
             self.iac_received = not self.iac_received
             if not self.iac_received and self.cmd_received == SB:
                 # SB buffer receives escaped IAC values
-                self._sb_buffer.append(IAC)
+                self._sb_append(IAC)
 
         elif self.iac_received and not self.cmd_received:
             # parse 2nd byte of IAC
@@ -745,6 +1246,10 @@ class TelnetWriter:
                         "IAC %s: not a legal 2-byte cmd, treating as data", name_command(cmd)
                     )
                     return True
+                if self.trace is not None:
+                    self.trace.record("recv", cmd)
+                if self.metrics is not None:
+                    self.metrics.commands_received[cmd[0]] += 1
                 self._iac_callback[cmd](cmd)
             self.iac_received = False
 
@@ -760,29 +1265,47 @@ class TelnetWriter:
                     len(self._sb_buffer),
                     name_command(cmd),
                 )
-                self._sb_buffer.clear()
+                self._sb_buffer = ()
             else:
                 # sub-negotiation end (SE), fire handle_subnegotiation
-                self.log.debug(
-                    "sub-negotiation cmd %s SE completion byte", name_command(self._sb_buffer[0])
-                )
+                buf = self._sb_buffer
+                if self.trace is not None:
+                    self.trace.record("recv", SB, buf[0] if buf else None)
+                if self.metrics is not None:
+                    self.metrics.commands_received[SB[0]] += 1
+                if self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug(
+                        "sub-negotiation cmd %s SE completion byte",
+                        name_command(buf[0]) if buf else "?",
+                    )
                 try:
-                    self.handle_subnegotiation(self._sb_buffer)
+                    self.handle_subnegotiation(
+                        buf if isinstance(buf, collections.deque) else collections.deque()
+                    )
                 finally:
-                    self._sb_buffer.clear()
+                    self._sb_buffer = ()
                     self.iac_received = False
+                # values stored by the subnegotiation's callback, such as
+                # 'charset' or 'TERM', may now satisfy wait_for_condition().
+                self._check_waiters()
             self.iac_received = False
 
         elif self.cmd_received == SB:
             # continue buffering of sub-negotiation command.
-            if not self._sb_buffer:
+            if not self._sb_buffer and self.log.isEnabledFor(logging.DEBUG):
                 self.log.debug("begin sub-negotiation SB %s", name_command(byte))
-            self._sb_buffer.append(byte)
+            self._sb_append(byte)
 
         elif self.cmd_received:
             # parse 3rd and final byte of IAC DO, DONT, WILL, WONT.
             cmd, opt = self.cmd_received, byte
-            self.log.debug("recv IAC %s %s", name_command(cmd), name_option(opt))
+            if self.trace is not None:
+                self.trace.record("recv", cmd, opt)
+            if self.metrics is not None:
+                self.metrics.commands_received[cmd[0]] += 1
+            debug = self.log.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.log.debug("recv IAC %s %s", name_command(cmd), name_option(opt))
             try:
                 if cmd == DO:
                     try:
@@ -797,12 +1320,13 @@ class TelnetWriter:
                         self.pending_option[WILL + opt] = False
                         self.local_option[opt] = False
                 elif cmd == WILL:
-                    if not self.pending_option.enabled(DO + opt) and opt not in (TM, CHARSET):
-                        self.log.debug("WILL %s unsolicited", name_command(opt))
-                    elif opt == CHARSET and not self.pending_option.enabled(DO + opt):
-                        self.log.debug(
-                            "WILL %s (bi-directional capability exchange)", name_command(opt)
-                        )
+                    if debug and not self.pending_option.enabled(DO + opt):
+                        if opt not in (TM, CHARSET):
+                            self.log.debug("WILL %s unsolicited", name_command(opt))
+                        elif opt == CHARSET:
+                            self.log.debug(
+                                "WILL %s (bi-directional capability exchange)", name_command(opt)
+                            )
                     try:
                         self.handle_will(opt)
                     finally:
@@ -842,6 +1366,13 @@ class TelnetWriter:
 
     # Our protocol methods
 
+    def _sb_append(self, byte: bytes) -> None:
+        """Append ``byte`` to the sub-negotiation buffer, created on demand."""
+        buf = self._sb_buffer
+        if not isinstance(buf, collections.deque):
+            buf = self._sb_buffer = collections.deque()
+        buf.append(byte)
+
     def get_extra_info(self, name: str, default: Any = None) -> Any:
         """Get optional server protocol information."""
         # StreamWriter uses self._transport.get_extra_info, so we mix it in
@@ -980,9 +1511,15 @@ class TelnetWriter:
         if not self.is_closing():
             if self.log.isEnabledFor(TRACE):
                 self.log.log(TRACE, "send IAC %d bytes\n%s", len(buf), hexdump(buf, prefix=">>  "))
+            if self.trace is not None:
+                self.trace.record_send(buf)
             self._transport.write(buf)
             if hasattr(self._protocol, "_tx_bytes"):
                 self._protocol._tx_bytes += len(buf)
+            if self.metrics is not None:
+                for cmd, _ in _iter_commands(buf):
+                    self.metrics.commands_sent[cmd[0]] += 1
+                self._count_sent(len(buf))
 
     def iac(self, cmd: bytes, opt: bytes = b"") -> bool:
         """
@@ -1033,7 +1570,8 @@ class TelnetWriter:
         if cmd == WONT:
             self.local_option[opt] = False
 
-        self.log.debug("send IAC %s %s", name_command(cmd), name_command(opt))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("send IAC %s %s", name_command(cmd), name_command(opt))
         self.send_iac(IAC + cmd + opt)
         return True
 
@@ -1070,16 +1608,26 @@ class TelnetWriter:
         self.send_iac(IAC + CMD_EOR)
         return True
 
-    def send_gmcp(self, package: str, data: Any = None) -> None:
+    def send_gmcp(self, package: Union[str, GmcpMessage], data: Any = None) -> None:
         """
         Transmit a GMCP message via subnegotiation.
 
-        :param package: GMCP package name (e.g., ``"Char.Vitals"``)
+        :param package: GMCP package name (e.g., ``"Char.Vitals"``), or a
+            :class:`~.mud.GmcpMessage`, already serialized, such as when the
+            same message is sent to many clients.
         :param data: Optional data to encode as JSON
         """
         if not (self.local_option.enabled(GMCP) or self.remote_option.enabled(GMCP)):
             self.log.debug("cannot send GMCP without negotiation")
             return
+        if self._mud_state is not None:
+            self._mud_state.bypass(
+                package=package.package if isinstance(package, GmcpMessage) else package
+            )
+        if isinstance(package, GmcpMessage):
+            self.log.debug("send IAC SB GMCP %s IAC SE", package.package)
+            self.send_iac(package.frame)
+            return
         payload = self._escape_iac(gmcp_encode(package, data))
         self.log.debug("send IAC SB GMCP %s IAC SE", package)
         self.send_iac(IAC + SB + GMCP + payload + IAC + SE)
@@ -1093,6 +1641,8 @@ class TelnetWriter:
         if not (self.local_option.enabled(MSDP) or self.remote_option.enabled(MSDP)):
             self.log.debug("cannot send MSDP without negotiation")
             return
+        if self._mud_state is not None:
+            self._mud_state.bypass(variables=variables)
         payload = self._escape_iac(msdp_encode(variables))
         self.log.debug("send IAC SB MSDP IAC SE")
         self.send_iac(IAC + SB + MSDP + payload + IAC + SE)
@@ -1110,6 +1660,20 @@ class TelnetWriter:
         self.log.debug("send IAC SB MSSP IAC SE")
         self.send_iac(IAC + SB + MSSP + payload + IAC + SE)
 
+    @property
+    def mud_state(self) -> MudState:
+        """
+        GMCP packages and MSDP variables of this session, see :class:`~.mud.MudState`.
+
+        Unlike :meth:`send_gmcp` and :meth:`send_msdp`, only values that have
+        changed since last transmitted are sent, and changes made during the
+        same iteration of the event loop are sent together, ahead of any
+        later write.
+        """
+        if self._mud_state is None:
+            self._mud_state = MudState(self)
+        return self._mud_state
+
     # Public methods for notifying about, or soliciting state options.
     #
 
@@ -1212,15 +1776,20 @@ class TelnetWriter:
     #: so we batch variable requests to stay within this limit.
     _ENVIRON_SB_MAX = 240
 
-    def request_environ(self) -> bool:
+    def request_environ(self, anticipate: bool = False) -> bool:
         """
         Request sub-negotiation NEW_ENVIRON, :rfc:`1572`.
 
         Returns True if request is valid for telnet state, and was sent. When the request list
         exceeds the subnegotiation buffer limit of many telnet clients (256 bytes for GNU
         inetutils), the request is automatically split into multiple SB frames.
+
+        :param anticipate: Send request while ``DO NEW_ENVIRON`` is pending, ahead of receipt of
+            ``WILL NEW_ENVIRON``, for a client known to accept it.  The request is abandoned if
+            the client answers ``WONT NEW_ENVIRON``.
         """
-        if not self.remote_option.enabled(NEW_ENVIRON):
+        anticipated = anticipate and self.pending_option.enabled(DO + NEW_ENVIRON)
+        if not anticipated and not self.remote_option.enabled(NEW_ENVIRON):
             self.log.debug("cannot send SB NEW_ENVIRON SEND IS without receipt of WILL NEW_ENVIRON")
             return False
 
@@ -1896,8 +2465,9 @@ class TelnetWriter:
         # remote end to accept a telnet capability, such as NAWS. It returns
         # False for unsupported option, or an option invalid in that context,
         # such as LOGOUT.
-        self.log.debug("handle_do(%s)", name_command(opt))
-        if opt in self.always_wont:
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("handle_do(%s)", name_command(opt))
+        if opt in (self._always_wont or ()):
             self.log.debug("DO %s: always-wont, declining.", name_command(opt))
             if not self.local_option.enabled(opt):
                 self.iac(WONT, opt)
@@ -1963,7 +2533,7 @@ class TelnetWriter:
         ):
             # Client declines MUD protocols unless explicitly opted in.
             if self.client and opt in _MUD_PROTOCOL_OPTIONS:
-                if opt in self.always_will:
+                if opt in (self._always_will or ()):
                     if not self.local_option.enabled(opt):
                         self.iac(WILL, opt)
                     return True
@@ -2001,7 +2571,7 @@ class TelnetWriter:
                     self._slc_add(theNULL, slc.SLC(slc.SLC_DEFAULT, theNULL))
                     self._slc_end()
 
-        elif opt in self.always_will:
+        elif opt in (self._always_will or ()):
             if not self.local_option.enabled(opt):
                 self.iac(WILL, opt)
         else:
@@ -2020,7 +2590,8 @@ class TelnetWriter:
         the exception of (IAC, DONT, LOGOUT), which only signals a callback
         to ``handle_logout(DONT)``.
         """
-        self.log.debug("handle_dont(%s)", name_command(opt))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("handle_dont(%s)", name_command(opt))
         if opt == LOGOUT:
             self._ext_callback[LOGOUT](DONT)
         # many implementations (wrongly!) sent a WONT in reply to DONT. It
@@ -2055,9 +2626,10 @@ class TelnetWriter:
         :raises ValueError: When WILL ECHO is received on server end, or
             when WILL TM is received without prior DO TM.
         """
-        self.log.debug("handle_will(%s)", name_command(opt))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("handle_will(%s)", name_command(opt))
 
-        if opt in self.always_dont:
+        if opt in (self._always_dont or ()):
             self.log.debug("WILL %s: always-dont, refusing.", name_command(opt))
             self.iac(DONT, opt)
             self.remote_option[opt] = False
@@ -2092,7 +2664,7 @@ class TelnetWriter:
                 return
             # Client declines MUD protocols unless explicitly opted in.
             if self.client and opt in _MUD_PROTOCOL_OPTIONS:
-                if opt in self.always_do or opt in self.passive_do:
+                if opt in (self._always_do or ()) or opt in (self._passive_do or ()):
                     if not self.remote_option.enabled(opt):
                         self.iac(DO, opt)
                         self.remote_option[opt] = True
@@ -2187,7 +2759,7 @@ class TelnetWriter:
                     LFLOW: self.send_lineflow_mode,
                 }[opt]()
 
-        elif opt in self.always_do:
+        elif opt in (self._always_do or ()):
             if not self.remote_option.enabled(opt):
                 self.iac(DO, opt)
                 self.remote_option[opt] = True
@@ -2211,7 +2783,8 @@ class TelnetWriter:
 
         :raises ValueError: When WONT TM is received without prior DO TM.
         """
-        self.log.debug("handle_wont(%s)", name_command(opt))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("handle_wont(%s)", name_command(opt))
         if opt == TM and not self.pending_option.enabled(DO + TM):
             raise ValueError("WONT TM received but DO TM was not sent")
         if opt == TM:
@@ -2223,6 +2796,9 @@ class TelnetWriter:
             self._ext_callback[LOGOUT](WONT)
         else:
             self.remote_option[opt] = False
+            if self.pending_option.enabled(SB + opt):
+                # a subnegotiation request sent in anticipation is never answered.
+                self.pending_option[SB + opt] = False
 
     # public derivable Sub-Negotation parsing
     #
@@ -2249,7 +2825,7 @@ class TelnetWriter:
         cmd = buf[0]
         if self.pending_option.enabled(SB + cmd):
             self.pending_option[SB + cmd] = False
-        else:
+        elif self.log.isEnabledFor(logging.DEBUG):
             self.log.debug("[SB + %s] unsolicited", name_command(cmd))
 
         fn_call = {
@@ -2299,6 +2875,13 @@ class TelnetWriter:
         if not isinstance(buf, (bytes, bytearray)):
             raise TypeError(f"buf expected bytes, got {type(buf)}")
         if not self.is_closing():
+            mud_state = self._mud_state
+            if mud_state is not None and mud_state.auto_flush and mud_state.pending:
+                # changes made before this write are transmitted ahead of it.
+                mud_state.flush()
+            latency = self.latency
+            if latency is not None:
+                started = time.perf_counter()
             if escape_iac:
                 # when escape_iac is True, we may safely assume downstream
                 # application has provided an encoded string. Prior to 2.0.1, `buf`
@@ -2308,9 +2891,37 @@ class TelnetWriter:
 
             if self.log.isEnabledFor(TRACE):
                 self.log.log(TRACE, "send %d bytes\n%s", len(buf), hexdump(buf, prefix=">>  "))
-            self._transport.write(buf)
-            if hasattr(self._protocol, "_tx_bytes"):
-                self._protocol._tx_bytes += len(buf)
+            write_buffer = self.write_buffer
+            if (
+                write_buffer is not None
+                and escape_iac
+                and write_buffer.paused
+                and write_buffer.limit.policy == "drop"
+            ):
+                dropped = write_buffer.dropped_bytes
+                write_buffer.hold(buf)
+                if self.metrics is not None:
+                    self.metrics.write_dropped_bytes += write_buffer.dropped_bytes - dropped
+            else:
+                self._send(buf)
+            if latency is not None:
+                latency.write_seconds.observe(time.perf_counter() - started)
+
+    def _send(self, buf: bytes) -> None:
+        """Write *buf* to the transport, counting bytes sent."""
+        self._transport.write(buf)
+        if hasattr(self._protocol, "_tx_bytes"):
+            self._protocol._tx_bytes += len(buf)
+        if self.metrics is not None:
+            self._count_sent(len(buf))
+
+    def _count_sent(self, size: int) -> None:
+        """Count *size* bytes sent, and the bytes buffered by the transport, in :attr:`metrics`."""
+        assert self.metrics is not None
+        self.metrics.bytes_sent += size
+        buffered = self._transport.get_write_buffer_size()
+        if buffered > self.metrics.write_buffer_high:
+            self.metrics.write_buffer_high = buffered
 
     # Private sub-negotiation (SB) routines
 
@@ -2838,7 +3449,7 @@ class TelnetWriter:
         self.log.debug("slc_start: IAC SB LINEMODE SLC [..]")
         self.send_iac(IAC + SB + LINEMODE + slc.LMODE_SLC)
 
-    def _slc_send(self, slctab: Optional[dict[bytes, slc.SLC]] = None) -> None:
+    def _slc_send(self, slctab: Optional[Mapping[bytes, slc.SLC]] = None) -> None:
         """
         Send supported SLC characters of current tabset, or specified tabset.
 
@@ -2900,7 +3511,7 @@ class TelnetWriter:
                 # client requests we send our default tab; reset current to defaults
                 # (analogous to NetBSD default_slc() before send_slc())
                 self.log.debug("_slc_process: client request SLC_DEFAULT")
-                self.slctab = dict(self.default_slc_tab)
+                self.slctab = slc.generate_slctab(self.default_slc_tab)
                 self._slc_send(self.default_slc_tab)
                 if self.server:
                     self._slc_sent = True
@@ -3286,6 +3897,8 @@ class TelnetWriterUnicode(TelnetWriter):
     discovered by ``LANG`` environment variables by NEW_ENVIRON, :rfc:`1572`.
     """
 
+    __slots__ = ("fn_encoding", "encoding_errors")
+
     #: Unicode writers receive strings, not raw bytes.
     is_binary_writer: bool = False
 
@@ -3378,6 +3991,8 @@ class Option(dict[bytes, bool]):
     telnet option negotiation.
     """
 
+    __slots__ = ("name", "log", "_on_change")
+
     def __init__(
         self, name: str, log: logging.Logger, on_change: Optional[Callable[[], None]] = None
     ) -> None:
@@ -3403,15 +4018,27 @@ class Option(dict[bytes, bool]):
     def __setitem__(self, key: bytes, value: bool) -> None:
         # the real purpose of this class, tracking state negotiation.
         if value != dict.get(self, key, None):
-            descr = " + ".join(
-                [name_command(bytes([byte])) for byte in key[:2]] + [repr(byte) for byte in key[2:]]
-            )
-            self.log.debug("%s[%s] = %s", self.name, descr, value)
+            self.log.debug("%s[%s] = %s", self.name, _OptionKeyName(key), value)
         dict.__setitem__(self, key, value)
         if self._on_change is not None:
             self._on_change()
 
 
+class _OptionKeyName:
+    """Description of an :class:`Option` key, formatted only when logged."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: bytes) -> None:
+        self.key = key
+
+    def __str__(self) -> str:
+        key = self.key
+        return " + ".join(
+            [name_command(bytes([byte])) for byte in key[:2]] + [repr(byte) for byte in key[2:]]
+        )
+
+
 def _escape_environ(buf: bytes) -> bytes:
     """
     Return new buffer with VAR and USERVAR escaped, if present in ``buf``.
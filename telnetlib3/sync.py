@@ -35,16 +35,17 @@ import queue
 import asyncio
 import threading
 import concurrent.futures
-from typing import Any, Union, Callable, Optional
+from typing import TYPE_CHECKING, Any, Union, Callable, Optional
 
 # local
 # Import from submodules to avoid cyclic import
 from .client import open_connection as _open_connection
-from .server import Server
-from .server import create_server as _create_server
 from .stream_reader import TelnetReader
 from .stream_writer import TelnetWriter
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .server import Server
+
 __all__ = ("TelnetConnection", "BlockingTelnetServer", "ServerConnection")
 
 
@@ -501,7 +502,10 @@ class BlockingTelnetServer:
             # Wait until the sync handler closes the connection
             await conn._wait_closed()
 
-        self._server = await _create_server(self._host, self._port, shell=shell, **self._kwargs)
+        # imported on use, clients of this module need not import the server
+        from .server import create_server
+
+        self._server = await create_server(self._host, self._port, shell=shell, **self._kwargs)
 
     def accept(self, timeout: Optional[float] = None) -> "ServerConnection":
         """
@@ -334,7 +334,7 @@ def option_from_name(name: str) -> bytes:
 
 def name_command(byte: bytes) -> str:
     """Return string description for (maybe) telnet command byte."""
-    return _DEBUG_OPTS.get(byte, repr(byte))
+    return _DEBUG_OPTS.get(byte) or repr(byte)
 
 
 #: IAC command bytes that should display as hex when used as option codes.
@@ -356,7 +356,7 @@ def name_option(byte: bytes) -> str:
     """
     if byte in _IAC_CMD_BYTES:
         return repr(byte)
-    return _DEBUG_OPTS.get(byte, repr(byte))
+    return _DEBUG_OPTS.get(byte) or repr(byte)
 
 
 def name_commands(cmds: bytes, sep: str = " ") -> str:
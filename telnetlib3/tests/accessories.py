@@ -4,8 +4,10 @@ from __future__ import annotations
 
 # std imports
 import os
+import sys
 import asyncio
 import contextlib
+import subprocess
 
 # 3rd party
 import pytest
@@ -47,6 +49,24 @@ def make_preexec_coverage():
     return preexec
 
 
+def import_time(statement):
+    """Return microseconds to import telnetlib3 by *statement*, by ``python -X importtime``."""
+    # asyncio, needed by any use of telnetlib3, is imported first and not counted.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import asyncio; {statement}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines of 'import time: self [us] | cumulative | imported package', where
+    # nested imports are indented.
+    return sum(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].startswith(" telnetlib3")
+    )
+
+
 @pytest.fixture(scope="module", params=["127.0.0.1"])
 def bind_host(request):
     """Localhost bind address."""
@@ -195,6 +215,14 @@ class MockTransport:
         """Mark transport as closing."""
         self._closing = True
 
+    def abort(self) -> None:
+        """Mark transport as closing, discarding buffered data."""
+        self._closing = True
+
+    def set_write_buffer_limits(self, high: int | None = None, low: int | None = None) -> None:
+        """Record write buffer limits *high* and *low*."""
+        self.extra["write_buffer_limits"] = (high, low)
+
 
 class MockProtocol:
     """Mock protocol for unit tests with drain helper and extra info."""
@@ -225,6 +253,7 @@ __all__ = (
     "bind_host",
     "connection_context",
     "create_server",
+    "import_time",
     "init_subproc_coverage",
     "make_preexec_coverage",
     "open_connection",
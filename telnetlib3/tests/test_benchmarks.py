@@ -1,17 +1,41 @@
 """Benchmarks for telnetlib3 hot paths."""
 
 # std imports
+import gc
+import io
+import ssl
+import types
+import codecs
+import socket
 import asyncio
+import logging
+import collections
+import tracemalloc
+import concurrent.futures
 
 # 3rd party
 import pytest
 
 # local
 import telnetlib3
-from telnetlib3.slc import snoop, generate_slctab
-from telnetlib3.telopt import IAC, NAWS, WILL, TTYPE, theNULL
-from telnetlib3.stream_reader import TelnetReader
-from telnetlib3.stream_writer import TelnetWriter
+from telnetlib3.mud import MsdpEncoder, gmcp_decode, gmcp_encode, msdp_decode, msdp_encode
+from telnetlib3.slc import SLC_EC, snoop, generate_slctab
+from telnetlib3.server import BufferedTelnetServer
+from telnetlib3.telopt import IAC, NOP, NAWS, WILL, TTYPE, theNULL
+from telnetlib3.metrics import Metrics
+from telnetlib3.server_base import BaseServer
+from telnetlib3.client_shell import (
+    _INPUT_XLAT,
+    _INPUT_SEQ_XLAT,
+    InputFilter,
+    TypescriptWriter,
+    _RawLoopState,
+    _raw_event_loop,
+)
+from telnetlib3.server_shell import AnsiFilteringReader, readline_async
+from telnetlib3.stream_reader import TelnetReader, TelnetReaderUnicode
+from telnetlib3.stream_writer import WriteLimit, TelnetWriter, ProtocolTrace
+from telnetlib3.tests.accessories import import_time
 
 
 class MockTransport:
@@ -23,9 +47,18 @@ class MockTransport:
     def get_write_buffer_size(self):
         return 0
 
+    def set_write_buffer_limits(self, high=None, low=None):
+        pass
+
     def is_closing(self):
         return False
 
+    def get_extra_info(self, name, default=None):
+        return default
+
+    def close(self):
+        pass
+
 
 class MockProtocol:
     """Minimal protocol mock for benchmarking."""
@@ -80,6 +113,55 @@ def test_feed_byte_iac_will(benchmark, writer):
     benchmark(feed_iac_will)
 
 
+def test_feed_byte_iac_will_traced(benchmark, writer):
+    """Benchmark feed_byte() for IAC WILL TTYPE with a protocol trace attached."""
+    writer.trace = ProtocolTrace()
+
+    def feed_iac_will():
+        writer.feed_byte(IAC)
+        writer.feed_byte(WILL)
+        writer.feed_byte(TTYPE)
+
+    benchmark(feed_iac_will)
+    assert ("recv", WILL, TTYPE) in [event[1:] for event in writer.trace]
+
+
+def test_feed_byte_iac_will_metrics(benchmark, writer):
+    """Benchmark feed_byte() for IAC WILL TTYPE with metrics attached."""
+    writer.metrics = Metrics()
+
+    def feed_iac_will():
+        writer.feed_byte(IAC)
+        writer.feed_byte(WILL)
+        writer.feed_byte(TTYPE)
+
+    benchmark(feed_iac_will)
+    assert writer.metrics.commands_received[WILL[0]] > 0
+
+
+def test_metrics_render(benchmark):
+    """Benchmark rendering metrics for a scrape of the metrics endpoint."""
+    metrics = Metrics()
+    for byte in (IAC, WILL, TTYPE, NAWS):
+        metrics.commands_received[byte[0]] = 1000
+    for value in (0.002, 0.02, 0.2, 2.0):
+        metrics.negotiation_seconds.observe(value)
+    benchmark(metrics.render)
+
+
+@pytest.mark.parametrize(
+    "latency,write_limit",
+    [(False, None), (True, None), (False, WriteLimit(policy="drop"))],
+    ids=["plain", "latency", "write_limit"],
+)
+def test_write(benchmark, writer, latency, write_limit):
+    """Benchmark TelnetWriter.write() of a line, with latency tracking or a write limit."""
+    writer.track_latency(latency)
+    writer.set_write_limit(write_limit)
+    benchmark(writer.write, b"You are standing in an open field west of a white house.\r\n")
+    assert (writer.latency is not None) == latency
+
+
 # -- is_oob: checked after every feed_byte() call --
 
 
@@ -123,6 +205,100 @@ def test_reader_feed_data(benchmark, reader, size):
     benchmark(reader.feed_data, data)
 
 
+# -- BaseServer receive pipeline: 1-byte packets processed at once or coalesced --
+
+
+@pytest.mark.parametrize("backlog", [False, True], ids=["inline", "coalesced"])
+def test_receive_small_chunks(benchmark, backlog):
+    """Benchmark 4096 1-byte chunks received by a server, idle or behind a backlog."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    chunks = [b"x"] * 4096
+    try:
+        server = BaseServer(encoding=False)
+        server.connection_made(MockTransport())
+        server.writer.slc_simulated = False
+
+        def receive():
+            if backlog:
+                server._rx_queue = collections.deque(chunks)
+                server._rx_queued = len(chunks)
+                loop.run_until_complete(server._process_rx())
+            else:
+                for chunk in chunks:
+                    server.data_received(chunk)
+            server.reader._buffer.clear()
+
+        benchmark(receive)
+        server.connection_lost(None)
+    finally:
+        loop.close()
+
+
+# -- Receive path: bytes allocated by recv(), or recv_into() a reused buffer --
+
+#: 16 KiB read, of IAC NOP in each KiB
+RECV_16K = bytearray((b"x" * 1022 + IAC + NOP) * 16)
+
+
+def _receive_1mb(server, buffered):
+    """Receive 1 MiB by 64 reads, allocated as by recv(), or copied as by recv_into()."""
+    for _ in range(64):
+        if buffered:
+            server.get_buffer(-1)[: len(RECV_16K)] = RECV_16K
+            server.buffer_updated(len(RECV_16K))
+        else:
+            server.data_received(bytes(RECV_16K))
+        server.reader._buffer.clear()
+
+
+def _new_receiver(buffered):
+    server = (BufferedTelnetServer if buffered else telnetlib3.TelnetServer)(encoding=False)
+    server.connection_made(MockTransport())
+    server.writer.slc_simulated = False
+    return server
+
+
+@pytest.mark.parametrize("buffered", [False, True], ids=["recv", "recv_into"])
+def test_receive_1mb(benchmark, buffered):
+    """Benchmark receiving 1 MiB by TelnetServer and BufferedTelnetServer."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        server = _new_receiver(buffered)
+        benchmark(_receive_1mb, server, buffered)
+        server.connection_lost(None)
+    finally:
+        loop.close()
+
+
+def _receive_peak(buffered):
+    """Return peak bytes allocated while receiving 1 MiB after the first read."""
+    server = _new_receiver(buffered)
+    _receive_1mb(server, buffered)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    _receive_1mb(server, buffered)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    server.connection_lost(None)
+    return peak
+
+
+def test_receive_memory_per_mb(benchmark):
+    """Measure peak bytes allocated per MiB received, by recv() and by recv_into()."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    logging.disable(logging.CRITICAL)
+    try:
+        peaks = benchmark(lambda: {buffered: _receive_peak(buffered) for buffered in (False, True)})
+    finally:
+        logging.disable(logging.NOTSET)
+        loop.close()
+    # each read of recv() allocates bytes, besides the copy made by the reader
+    assert peaks[False] - peaks[True] >= len(RECV_16K) * 3 // 4
+
+
 # -- SLC snoop: used in client fast path for SLC character detection --
 
 
@@ -146,14 +322,353 @@ def test_slc_value_set_membership(benchmark, slctab):
     benchmark(lambda: 3 in slc_vals)
 
 
+def test_generate_slctab(benchmark):
+    """Benchmark generate_slctab(), called for every new connection."""
+    benchmark(generate_slctab)
+
+
+@pytest.mark.parametrize("modified", [False, True], ids=["default", "modified"])
+def test_slctab_memory_per_connection(benchmark, modified):
+    """Measure memory held by the SLC table of each of 1,000 connections."""
+
+    def allocate():
+        tabs = [generate_slctab() for _ in range(1000)]
+        if modified:
+            for tab in tabs:
+                tab[SLC_EC].set_value(b"\x08")
+        return tabs
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tabs = benchmark(allocate)
+        per_connection = (tracemalloc.get_traced_memory()[0] - before) / len(tabs)
+    finally:
+        tracemalloc.stop()
+    # a dictionary of 30 SLC instances costs over 2 KiB per connection
+    assert per_connection < (512 if modified else 128)
+
+
+# -- mud: MSDP/GMCP codecs for large nested tables --
+
+MSDP_ROOM = {
+    "ROOM": {
+        "VNUM": "6008",
+        "NAME": "The Forest clearing",
+        "AREA": "Haon Dor",
+        "EXITS": {"n": "6011", "e": "6007", "s": "6009"},
+        "MOBS": [
+            {"NAME": f"mob{num}", "LEVEL": str(num), "FLAGS": ["aggr", "sentinel"]}
+            for num in range(200)
+        ],
+    }
+}
+
+
+def test_msdp_encode(benchmark):
+    """Benchmark msdp_encode() of a large nested table."""
+    benchmark(msdp_encode, MSDP_ROOM)
+
+
+def test_msdp_encode_cached(benchmark):
+    """Benchmark MsdpEncoder.encode() of an unchanged large nested table."""
+    encoder = MsdpEncoder()
+    encoder.encode(MSDP_ROOM)
+    benchmark(encoder.encode, MSDP_ROOM)
+
+
+def test_msdp_decode(benchmark):
+    """Benchmark msdp_decode() of a large nested table."""
+    payload = msdp_encode(MSDP_ROOM)
+    assert benchmark(msdp_decode, payload) == MSDP_ROOM
+
+
+def test_gmcp_roundtrip(benchmark):
+    """Benchmark gmcp_encode() and gmcp_decode() of a large nested table."""
+
+    def roundtrip():
+        return gmcp_decode(gmcp_encode("Room.Info", MSDP_ROOM["ROOM"]))
+
+    assert benchmark(roundtrip) == ("Room.Info", MSDP_ROOM["ROOM"])
+
+
+# -- encodings: Big5-BBS full-screen redraw --
+
+BIG5BBS_FRAME = (
+    ("\x1b[1;37;44m" + "夢想台灣批踢踢實業坊" * 8 + "\x1b[m").encode("big5")
+    + bytes([0xB0, 0x1B])
+    + b"[0m \xa1\xb7 ascii text  "
+) * 20
+
+
+def test_big5bbs_decode(benchmark):
+    """Benchmark big5bbs decoding of a BBS screen redraw with half-width art bytes."""
+    decoder = codecs.getincrementaldecoder("big5bbs")()
+    benchmark(decoder.decode, BIG5BBS_FRAME)
+
+
+def test_big5bbs_encode(benchmark):
+    """Benchmark big5bbs encoding of a BBS screen redraw."""
+    text = BIG5BBS_FRAME.decode("big5bbs")
+    encoder = codecs.getincrementalencoder("big5bbs")()
+    benchmark(encoder.encode, text)
+
+
+# -- Client shell: InputFilter paste --
+
+PASTE_64K = (b"The quick brown fox jumps over the lazy dog.\r" * 1490)[: 64 * 1024]
+PASTE_64K_ESC = (b"north\r\x1b[Alook\r\x1b[3~\x7f" * 2500)[: 64 * 1024]
+
+
+@pytest.mark.parametrize("data", [PASTE_64K, PASTE_64K_ESC], ids=["plain", "escapes"])
+def test_input_filter_paste(benchmark, data):
+    """Benchmark an atascii InputFilter translating a 64 KiB paste."""
+    inf = InputFilter(_INPUT_SEQ_XLAT["atascii"], _INPUT_XLAT["atascii"])
+    benchmark(inf.feed, data)
+
+
+# -- Server shell: readline_async paste --
+
+PASTE_LINE = ("look at the quick brown fox " * 600).encode("ascii") + b"\r"
+
+
+@pytest.mark.parametrize("max_visible_width", [0, 20000], ids=["unlimited", "width"])
+def test_readline_async_paste(benchmark, writer, max_visible_width):
+    """Benchmark readline_async() editing a 16 KiB pasted line."""
+    loop = asyncio.new_event_loop()
+
+    def readline():
+        reader = TelnetReaderUnicode(fn_encoding=lambda incoming: "ascii")
+        reader.feed_data(PASTE_LINE)
+        return loop.run_until_complete(readline_async(reader, writer, max_visible_width))
+
+    try:
+        assert benchmark(readline) == PASTE_LINE[:-1].decode("ascii")
+    finally:
+        loop.close()
+
+
+# -- Server shell: AnsiFilteringReader --
+
+ANSI_INPUT = b"north\x1b[A\x1bOPsouth\x1b[1;5Cwest\x1b]0;title\x07\r\n" * 1500
+
+
+def test_ansi_filtering_reader(benchmark):
+    """Benchmark AnsiFilteringReader.read() removing input sequences from 64 KiB."""
+    loop = asyncio.new_event_loop()
+
+    def read_all():
+        reader = TelnetReader()
+        reader.feed_data(ANSI_INPUT)
+        reader.feed_eof()
+        return loop.run_until_complete(AnsiFilteringReader(reader).read())
+
+    try:
+        assert benchmark(read_all) == b"northsouthwest\r\n" * 1500
+    finally:
+        loop.close()
+
+
+# -- Client shell: raw mode output throughput --
+
+SERVER_DUMP = [("\x1b[1;33mscreen\x1b[m " * 8 + "\r\n") * 475] * 32
+
+
+class _ChunkReader:
+    """Reader returning each of given chunks, then EOF."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    async def read(self, n):
+        return self._chunks.pop(0) if self._chunks else ""
+
+    def at_eof(self):
+        return not self._chunks
+
+
+class _NullTerminal:
+    """Terminal shell that never changes mode."""
+
+    def check_auto_mode(self, switched_to_raw, last_will_echo):
+        return None
+
+
+@pytest.mark.parametrize("typescript", [False, True], ids=["display", "typescript"])
+def test_raw_event_loop_output(benchmark, typescript):
+    """Benchmark client shell raw mode display of 32 server output chunks of 64 KiB."""
+    loop = asyncio.new_event_loop()
+    ctx = telnetlib3.TelnetSessionContext(raw_mode=True)
+    writer = types.SimpleNamespace(ctx=ctx, log=logging.getLogger("benchmark"))
+    sink = types.SimpleNamespace(write=lambda data: None)
+
+    async def display():
+        ctx.typescript_file = TypescriptWriter(io.StringIO()) if typescript else None
+        state = _RawLoopState(
+            switched_to_raw=True, last_will_echo=False, local_echo=False, linesep="\r\n"
+        )
+        await _raw_event_loop(
+            _ChunkReader(SERVER_DUMP),
+            writer,
+            _NullTerminal(),
+            asyncio.StreamReader(),
+            sink,
+            "\x1d",
+            state,
+            lambda msg: None,
+            lambda: False,
+        )
+
+    try:
+        benchmark(lambda: loop.run_until_complete(display()))
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("passthrough", [True, False], ids=["bytes", "decoded"])
+def test_raw_event_loop_utf8_output(benchmark, passthrough):
+    """Benchmark client shell raw mode display of 2 MiB of UTF-8 server output."""
+    loop = asyncio.new_event_loop()
+    ctx = telnetlib3.TelnetSessionContext(raw_mode=True)
+    # an output filter requires text, disabling display of undecoded bytes
+    ctx.output_filters = [] if passthrough else [str]
+    writer = types.SimpleNamespace(ctx=ctx, log=logging.getLogger("benchmark"))
+    sink = types.SimpleNamespace(write=lambda data: None)
+    data = "".join(SERVER_DUMP).replace("screen", "\u00e9cran").encode("utf-8")
+
+    async def display():
+        reader = TelnetReaderUnicode(fn_encoding=lambda incoming: "utf-8")
+        reader.feed_data(data)
+        reader.feed_eof()
+        state = _RawLoopState(
+            switched_to_raw=True, last_will_echo=False, local_echo=False, linesep="\r\n"
+        )
+        await _raw_event_loop(
+            reader,
+            writer,
+            _NullTerminal(),
+            asyncio.StreamReader(),
+            sink,
+            "\x1d",
+            state,
+            lambda msg: None,
+            lambda: False,
+        )
+
+    try:
+        benchmark(lambda: loop.run_until_complete(display()))
+    finally:
+        loop.close()
+
+
+# -- Idle sessions: memory held by each negotiated server connection --
+
+
+async def _idle_sessions(count):
+    """Connect ``count`` clients, returning bytes held by server connection objects of each."""
+    shells = []
+    done = asyncio.Event()
+
+    async def shell(reader, writer):
+        shells.append(writer)
+        await done.wait()
+
+    server = await telnetlib3.create_server(
+        host="127.0.0.1", port=0, shell=shell, connect_maxwait=0.5
+    )
+    port = server.sockets[0].getsockname()[1]
+    clients = []
+    try:
+        # the first connection warms module-level caches
+        clients.append(await telnetlib3.open_connection("127.0.0.1", port, connect_maxwait=0.5))
+        while not shells:
+            await asyncio.sleep(0.01)
+        gc.collect()
+        tracemalloc.start(32)
+        before = tracemalloc.take_snapshot()
+        clients.extend(
+            await asyncio.gather(
+                *(
+                    telnetlib3.open_connection("127.0.0.1", port, connect_maxwait=0.5)
+                    for _ in range(count)
+                )
+            )
+        )
+        while len(shells) <= count:
+            await asyncio.sleep(0.01)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    finally:
+        done.set()
+        for _, client_writer in clients:
+            client_writer.close()
+        server.close()
+        await server.wait_closed()
+    # only count memory allocated by the server side of each connection
+    server_side = [tracemalloc.Filter(True, "*server_base.py", all_frames=True)]
+    stats = after.filter_traces(server_side).compare_to(
+        before.filter_traces(server_side), "filename"
+    )
+    return sum(stat.size_diff for stat in stats) / count
+
+
+def test_idle_session_memory(benchmark):
+    """Measure bytes held by each idle, negotiated server session."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    # log records retained by pytest's capture handler would be counted
+    logging.disable(logging.CRITICAL)
+    try:
+        per_session = benchmark(lambda: loop.run_until_complete(_idle_sessions(50)))
+    finally:
+        logging.disable(logging.NOTSET)
+        loop.close()
+    # about 15 KiB before __slots__ and lazily created containers
+    assert per_session < 8 * 1024
+
+
+class _IdleProtocol(asyncio.Protocol):
+    """Protocol of a connected client, for benchmarking the server registry."""
+
+    _close_callback = None
+
+    def get_extra_info(self, name, default=None):
+        return ("127.0.0.1", 0) if name == "peername" else default
+
+    def _add_close_callback(self, callback):
+        self._close_callback = callback
+
+    def connection_lost(self, exc):
+        self._close_callback()
+
+
+def test_server_registry_churn(benchmark):
+    """Benchmark connect and disconnect of 1,000 clients among 10,000 connected."""
+    server = telnetlib3.Server(None)
+    connected = [_IdleProtocol() for _ in range(10000)]
+    for protocol in connected:
+        server._register_protocol(protocol)
+
+    def churn():
+        for _ in range(1000):
+            connected.pop(0).connection_lost(None)
+            protocol = _IdleProtocol()
+            server._register_protocol(protocol)
+            connected.append(protocol)
+        return server.client_count
+
+    assert benchmark(churn) == 10000
+
+
 # -- End-to-end: full connection with bulk data transfer --
 
 
 DATA_1MB = b"x" * (1024 * 1024)
 
 
-async def _setup_server_client_pair():
-    """Create connected server and client pair."""
+async def _setup_server_client_pair(**kwargs):
+    """Create connected server and client pair, *kwargs* given to both."""
     received_data = bytearray()
     server_ready = asyncio.Event()
     srv_writer = None
@@ -169,7 +684,7 @@ async def _setup_server_client_pair():
             received_data.extend(data.encode() if isinstance(data, str) else data)
 
     server = await telnetlib3.create_server(
-        host="127.0.0.1", port=0, shell=shell, encoding=False, connect_maxwait=0.1
+        host="127.0.0.1", port=0, shell=shell, encoding=False, connect_maxwait=0.1, **kwargs
     )
     port = server.sockets[0].getsockname()[1]
 
@@ -179,6 +694,7 @@ async def _setup_server_client_pair():
         encoding=False,
         connect_maxwait=0.1,
         client_factory=telnetlib3.TelnetClient,
+        **kwargs,
     )
 
     await server_ready.wait()
@@ -224,13 +740,18 @@ def test_bulk_transfer_client_to_server(benchmark):
         loop.close()
 
 
-def test_bulk_transfer_server_to_client(benchmark):
-    """Benchmark 1MB bulk transfer from server to client."""
+@pytest.mark.parametrize(
+    "kwargs", [pytest.param({}, id="plain"), pytest.param({"metrics": True}, id="metrics")]
+)
+def test_bulk_transfer_server_to_client(benchmark, kwargs):
+    """Benchmark 1MB bulk transfer from server to client, with or without metrics."""
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
+    if kwargs.get("metrics"):
+        kwargs = {"metrics": Metrics()}
 
     try:
-        pair = loop.run_until_complete(_setup_server_client_pair())
+        pair = loop.run_until_complete(_setup_server_client_pair(**kwargs))
         srv_writer = pair["srv_writer"]
         client_reader = pair["client_reader"]
 
@@ -249,3 +770,121 @@ def test_bulk_transfer_server_to_client(benchmark):
         loop.run_until_complete(_teardown_server_client_pair(pair))
     finally:
         loop.close()
+
+
+async def _tls_auto_first_byte(greeting, **kwargs):
+    """Return seconds from connecting to a ``tls_auto`` server to its first byte."""
+
+    async def shell(reader, writer):
+        pass
+
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server = await telnetlib3.create_server(
+        host="127.0.0.1", port=0, shell=shell, ssl=ssl_context, connect_maxwait=0.1, **kwargs
+    )
+    port = server.sockets[0].getsockname()[1]
+    loop = asyncio.get_running_loop()
+    try:
+        stime = loop.time()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(greeting)
+        await asyncio.wait_for(reader.read(1), 2.0)
+        elapsed = loop.time() - stime
+        writer.close()
+        await writer.wait_closed()
+    finally:
+        server.close()
+        await server.wait_closed()
+    return elapsed
+
+
+@pytest.mark.parametrize(
+    "greeting, kwargs",
+    [
+        pytest.param(IAC + WILL + TTYPE, {"tls_auto": 0.5}, id="client-first"),
+        pytest.param(b"", {"tls_auto": 0.5, "tls_auto_speculate": 0.01}, id="silent-speculate"),
+    ],
+)
+def test_tls_auto_connect_latency(benchmark, greeting, kwargs):
+    """Benchmark connection setup of plain telnet clients to a ``tls_auto`` server."""
+    elapsed = benchmark(lambda: asyncio.run(_tls_auto_first_byte(greeting, **kwargs)))
+    # about 12 ms for client-first when the socket was peeked every 10 ms, and
+    # the full 0.5 s timeout for silent clients without speculative negotiation.
+    assert elapsed < 0.25
+
+
+def _tls_client(port, ssl_context):
+    """Complete a blocking TLS handshake with the server at *port* and send a byte."""
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as sock:
+        with ssl_context.wrap_socket(sock, server_hostname="localhost") as tls_sock:
+            tls_sock.sendall(b"x")
+
+
+async def _tls_handshake_storm(count, server_ssl_ctx, client_ssl_ctx, **kwargs):
+    """Connect *count* TLS clients at once, return the longest stall of the event loop."""
+
+    async def shell(reader, writer):
+        pass
+
+    server = await telnetlib3.create_server(
+        host="127.0.0.1", port=0, shell=shell, ssl=server_ssl_ctx, connect_maxwait=0.01, **kwargs
+    )
+    port = server.sockets[0].getsockname()[1]
+    loop = asyncio.get_running_loop()
+    stalls = [0.0]
+    done = False
+
+    async def ticker():
+        while not done:
+            stime = loop.time()
+            await asyncio.sleep(0.001)
+            stalls.append(loop.time() - stime)
+
+    tick = asyncio.ensure_future(ticker())
+    with concurrent.futures.ThreadPoolExecutor(16) as executor:
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _tls_client, port, client_ssl_ctx)
+                for _ in range(count)
+            )
+        )
+    # let shells of the last clients start before the server is closed
+    await asyncio.sleep(0.05)
+    done = True
+    await tick
+    server.close()
+    await server.wait_closed()
+    assert server.tls_stats.completed == count
+    return max(stalls)
+
+
+@pytest.mark.parametrize("workers", [0, 4])
+def test_tls_handshake_storm(benchmark, workers):
+    """Benchmark 100 TLS clients connecting at once, with handshakes on the loop or in threads."""
+    trustme = pytest.importorskip("trustme")
+    ca = trustme.CA()
+    server_ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ca.issue_cert("localhost").configure_cert(server_ssl_ctx)
+    client_ssl_ctx = ssl.create_default_context()
+    ca.configure_trust(client_ssl_ctx)
+    logging.disable(logging.CRITICAL)
+    try:
+        benchmark(
+            lambda: asyncio.run(
+                _tls_handshake_storm(
+                    100, server_ssl_ctx, client_ssl_ctx, tls_handshake_workers=workers
+                )
+            )
+        )
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+@pytest.mark.parametrize(
+    "statement", ["import telnetlib3", "from telnetlib3.sync import TelnetConnection"]
+)
+def test_import_time(benchmark, statement):
+    """Measure time to import the package, or only its blocking client."""
+    elapsed = min(benchmark(lambda: [import_time(statement) for _ in range(3)]))
+    # about 80 ms for either, importing every submodule, before imports were made lazy
+    assert elapsed < 60_000
@@ -179,3 +179,34 @@ def test_incremental_encoder_big5():
 def test_incremental_encoder_getstate():
     encoder = codecs.getincrementalencoder("big5bbs")()
     assert encoder.getstate() == 0
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (bytes([0xF9, 0xF9, 0xF9]), "∙∙∙"),  # undefined pairs, CP437 ∙∙∙
+        (bytes([0x85, 0xA0, 0xFF]), "\x85\xa0\xff"),  # not lead bytes, latin-1
+        (bytes([0x80]) + "夢".encode("big5"), "\x80夢"),
+    ],
+)
+def test_undefined_pairs_and_non_lead_bytes(data, expected):
+    assert data.decode("big5bbs") == expected
+
+
+def test_split_non_lead_byte_across_chunks():
+    decoder = codecs.getincrementaldecoder("big5bbs")()
+    out = decoder.decode(b"ab\x85", final=False)
+    out += decoder.decode("夢".encode("big5"), final=False)
+    out += decoder.decode(b"", final=True)
+    assert out == "ab\x85夢"
+
+
+def test_encode_cp437_fallback():
+    # '░' has no Big5 encoding, CP437 0xB0
+    assert "夢░x".encode("big5bbs") == "夢".encode("big5") + b"\xb0x"
+
+
+def test_encode_unencodable_errors():
+    with pytest.raises(UnicodeEncodeError):
+        "夢€".encode("big5bbs")
+    assert "夢€".encode("big5bbs", errors="replace") == "夢".encode("big5") + b"?"
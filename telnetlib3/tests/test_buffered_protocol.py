@@ -0,0 +1,117 @@
+"""Tests for the receive path of BufferedTelnetProtocol into a reused buffer."""
+
+# std imports
+import zlib
+import asyncio
+
+# 3rd party
+import pytest
+
+# local
+from telnetlib3.client import BufferedTelnetClient
+from telnetlib3.server import BufferedTelnetServer
+from telnetlib3.telopt import DO, SB, SE, IAC, NOP, ECHO, MCCP2_COMPRESS
+from telnetlib3.tests.accessories import MockTransport, create_server, open_connection
+
+
+def new_server():
+    server = BufferedTelnetServer(encoding=False, connect_maxwait=0.05)
+    server.connection_made(MockTransport())
+    return server
+
+
+def receive(protocol, data):
+    buf = protocol.get_buffer(-1)
+    buf[: len(data)] = data
+    protocol.buffer_updated(len(data))
+
+
+@pytest.mark.asyncio
+async def test_receive_into_buffer():
+    """In-band data is received into one buffer, reused by each read."""
+    server = new_server()
+    buf = server.get_buffer(-1)
+    assert len(buf) == BufferedTelnetServer.read_size
+    receive(server, b"stale data" + IAC + NOP)
+    receive(server, b"hi" + IAC + DO + ECHO + b"there")
+    assert server.get_buffer(-1) is buf
+    assert bytes(server.reader._buffer) == b"stale datahithere"
+    assert server.writer.local_option[ECHO] is True
+    assert server.rx_bytes == 22
+
+    server.connection_lost(None)
+    assert server._rx_buffer is None
+
+
+@pytest.mark.asyncio
+async def test_receive_view_at_offset():
+    """A memoryview not at the start of its buffer is searched for IAC in itself only."""
+    server = new_server()
+    server.data_received(memoryview(bytearray(IAC + b"XXabc" + IAC + NOP + b"d"))[1:])
+    assert bytes(server.reader._buffer) == b"XXabcd"
+
+    server = new_server()
+    receive(server, IAC + NOP + b"XX")
+    server.data_received(server.get_buffer(-1)[3:4])
+    assert bytes(server.reader._buffer) == b"XXX"
+
+
+@pytest.mark.asyncio
+async def test_receive_into_buffer_queued():
+    """Data queued behind a backlog is copied from the buffer, before it is reused."""
+    server = new_server()
+    server.writer.slc_simulated = False
+    server.read_size = 256 * 1024
+    receive(server, b"a" * (200 * 1024))
+    receive(server, b"b" * 10)
+    receive(server, b"c" * 10)
+    assert server._rx_queued > 0
+    await asyncio.sleep(0.01)
+    assert server._rx_queued == 0
+    assert server.reader._buffer.endswith(b"b" * 10 + b"c" * 10)
+
+
+@pytest.mark.asyncio
+async def test_receive_into_buffer_mccp2():
+    """Compressed data following MCCP2 start in the same read is copied from the buffer."""
+    client = BufferedTelnetClient(encoding=False, connect_maxwait=0.05)
+    client.connection_made(MockTransport())
+    client.writer.remote_option[MCCP2_COMPRESS] = True
+    client.writer.pending_option[DO + MCCP2_COMPRESS] = False
+    compressed = zlib.compress(b"compressed")
+    receive(client, IAC + SB + MCCP2_COMPRESS + IAC + SE + compressed[:4])
+    receive(client, compressed[4:])
+    assert bytes(client.reader._buffer) == b"compressed"
+
+
+@pytest.mark.asyncio
+async def test_buffered_server_client(bind_host, unused_tcp_port):
+    """Server and client, both buffered, exchange data and close by EOF."""
+    received = asyncio.Future()
+
+    async def shell(reader, writer):
+        writer.write(b"hello")
+        received.set_result(await reader.readexactly(5))
+        writer.close()
+
+    async with create_server(
+        protocol_factory=BufferedTelnetServer,
+        host=bind_host,
+        port=unused_tcp_port,
+        shell=shell,
+        encoding=False,
+        connect_maxwait=0.05,
+    ):
+        async with open_connection(
+            client_factory=BufferedTelnetClient,
+            host=bind_host,
+            port=unused_tcp_port,
+            encoding=False,
+            connect_maxwait=0.05,
+        ) as (reader, writer):
+            assert writer.protocol._rx_buffer is not None
+            assert await asyncio.wait_for(reader.readexactly(5), 2.0) == b"hello"
+            writer.write(b"world")
+            assert await asyncio.wait_for(received, 2.0) == b"world"
+            assert await asyncio.wait_for(reader.read(), 2.0) == b""
+            assert writer.protocol._rx_buffer is None
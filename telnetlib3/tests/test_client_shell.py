@@ -1,6 +1,7 @@
 """Tests for telnetlib3.client_shell -- Terminal mode handling."""
 
 # std imports
+import io
 import sys
 import types
 import asyncio
@@ -24,8 +25,11 @@ from telnetlib3.client_shell import (  # noqa: E402
     _INPUT_SEQ_XLAT,
     Terminal,
     InputFilter,
+    TypescriptWriter,
     _send_stdin,
     _transform_output,
+    _output_passthrough,
+    _transform_output_bytes,
 )
 
 
@@ -353,6 +357,33 @@ def test_filter_without_eol_xlat(data: bytes, expected: bytes) -> None:
     assert f.feed(data) == expected
 
 
+def test_filter_paste_mixed_runs() -> None:
+    f = _make_atascii_filter()
+    data = (b"abc\x7f" * 1000) + b"\x1b[A" + (b"xyz\r" * 1000)
+    expected = (b"abc\x7e" * 1000) + b"\x1c" + (b"xyz\x9b" * 1000)
+    assert f.feed(data) == expected
+    assert not f.has_pending
+
+
+def test_filter_sequence_split_at_every_offset() -> None:
+    data = b"ab\x1b[3~cd\x1b[Aef"
+    expected = _make_atascii_filter().feed(data)
+    for split in range(len(data) + 1):
+        f = _make_atascii_filter()
+        assert f.feed(data[:split]) + f.feed(data[split:]) == expected
+
+
+def test_filter_longest_sequence_wins() -> None:
+    f = InputFilter({b"\x1b[": b"1", b"\x1b[3": b"2", b"\x1b[3~": b"3"}, {})
+    assert f.feed(b"\x1b[3~\x1b[3x\x1b[x") == b"32x1x"
+
+
+def test_filter_unmatched_lead_byte_emitted() -> None:
+    f = InputFilter({b"\x1b[A": b"\x1c"}, {0x1B: 0xFF})
+    assert f.feed(b"\x1bxy\x1b[B") == b"\xffxy\xff[B"
+    assert not f.has_pending
+
+
 # std imports
 import os  # noqa: E402
 import time as _time  # noqa: E402
@@ -929,6 +960,7 @@ def _make_transform_writer(**kwargs: object) -> object:
 def test_transform_output_line_endings(inp: str, in_raw: bool, expected: str) -> None:
     writer = _make_transform_writer()
     assert _transform_output(inp, writer, in_raw) == expected
+    assert _transform_output_bytes(inp.encode(), in_raw) == expected.encode()
 
 
 def test_transform_output_bare_cr_preserved_raw() -> None:
@@ -944,6 +976,130 @@ def test_transform_output_empty_string() -> None:
     assert not _transform_output("", writer, True)
 
 
+def test_transform_output_raw_crlf_not_copied() -> None:
+    writer = _make_transform_writer()
+    text = "line one\r\nline two\r\n"
+    assert _transform_output(text, writer, True) is text
+    assert _transform_output("a\r\nb\nc", writer, True) == "a\r\nb\r\nc"
+
+
+def test_transform_output_filters_applied_in_order() -> None:
+    writer = _make_transform_writer()
+    writer.ctx.output_filters = [str.upper, lambda text: text.replace("\r\n", "|")]
+    assert _transform_output("ab\ncd", writer, True) == "AB|CD"
+
+
+def test_transform_output_ascii_eol() -> None:
+    writer = _make_transform_writer()
+    writer.ctx.ascii_eol = True
+    assert _transform_output("x\U0001fb82\u25e3y\u25e3", writer, True) == "x\r\ny\r\n"
+
+
+@pytest.mark.parametrize(
+    "encoding,ctx_attrs,expected",
+    [
+        ("utf-8", {}, True),
+        ("UTF8", {}, True),
+        ("latin-1", {}, False),
+        ("no-such-encoding", {}, False),
+        ("utf-8", {"ascii_eol": True}, False),
+        ("utf-8", {"output_filters": [str.upper]}, False),
+    ],
+)
+def test_output_passthrough(encoding: str, ctx_attrs: dict, expected: bool) -> None:
+    from telnetlib3.stream_reader import TelnetReaderUnicode
+
+    writer = _make_transform_writer()
+    for key, value in ctx_attrs.items():
+        setattr(writer.ctx, key, value)
+    reader = TelnetReaderUnicode(fn_encoding=lambda incoming: encoding)
+    assert _output_passthrough(reader, writer) is expected
+
+
+def test_output_passthrough_binary_reader() -> None:
+    from telnetlib3.stream_reader import TelnetReader
+
+    assert _output_passthrough(TelnetReader(), _make_transform_writer()) is False
+
+
+@pytest.mark.asyncio
+async def test_raw_event_loop_utf8_passthrough() -> None:
+    """UTF-8 server output is displayed undecoded, decoded only for typescript and autoreply."""
+    from telnetlib3.client_shell import _RawLoopState, _raw_event_loop
+    from telnetlib3.stream_reader import TelnetReaderUnicode
+
+    reader = TelnetReaderUnicode(fn_encoding=lambda incoming: "utf-8")
+    data = "caf\u00e9\nok\r\n".encode("utf-8")
+    reader.feed_data(data[:4])
+
+    writer = _make_writer()
+    writer.log = types.SimpleNamespace(debug=lambda *a, **kw: None, log=lambda *a, **kw: None)
+    writer.ctx.raw_mode = True
+    writer.ctx.autoreply_engine = mock.Mock()
+    writer.ctx.typescript_file = io.StringIO()
+
+    term = _make_term(writer)
+    term.check_auto_mode = lambda switched_to_raw, last_will_echo: None
+    written: list[bytes] = []
+    stdout = types.SimpleNamespace(write=written.append)
+
+    async def feed_rest() -> None:
+        await asyncio.sleep(0.01)
+        reader.feed_data(data[4:])
+        reader.feed_eof()
+
+    feeder = asyncio.ensure_future(feed_rest())
+    await _raw_event_loop(
+        telnet_reader=reader,
+        telnet_writer=writer,
+        tty_shell=term,
+        stdin=asyncio.StreamReader(),
+        stdout=stdout,
+        keyboard_escape="\x1d",
+        state=_RawLoopState(
+            switched_to_raw=True, last_will_echo=False, local_echo=False, linesep="\r\n"
+        ),
+        handle_close=lambda msg: None,
+        want_repl=lambda: False,
+    )
+    await feeder
+    assert all(isinstance(chunk, bytes) for chunk in written)
+    assert b"".join(written) == "caf\u00e9\r\nok\r\n".encode("utf-8")
+    assert writer.ctx.typescript_file.getvalue() == "caf\u00e9\r\nok\r\n"
+    fed = "".join(call.args[0] for call in writer.ctx.autoreply_engine.feed.call_args_list)
+    assert fed == "caf\u00e9\r\nok\r\n"
+
+
+async def test_typescript_writer_flushes_on_size() -> None:
+    ts_buf = io.StringIO()
+    typescript = TypescriptWriter(ts_buf, flush_interval=60, flush_size=10)
+    typescript.write("hello")
+    assert not ts_buf.getvalue()
+    typescript.write("")
+    typescript.write(" world")
+    assert ts_buf.getvalue() == "hello world"
+    assert typescript._timer is None
+
+
+async def test_typescript_writer_flushes_on_timer() -> None:
+    ts_buf = io.StringIO()
+    typescript = TypescriptWriter(ts_buf, flush_interval=0.01)
+    typescript.write("a")
+    typescript.write("b")
+    assert not ts_buf.getvalue()
+    await asyncio.sleep(0.05)
+    assert ts_buf.getvalue() == "ab"
+
+
+def test_typescript_writer_without_loop_and_close() -> None:
+    ts_buf = mock.Mock()
+    typescript = TypescriptWriter(ts_buf)
+    typescript.write("text")
+    ts_buf.write.assert_called_once_with("text")
+    typescript.close()
+    ts_buf.close.assert_called_once_with()
+
+
 @pytest.mark.parametrize("raw_mode,expected", [(False, False), (None, None), (True, True)])
 def test_get_raw_mode(raw_mode: "bool | None", expected: "bool | None") -> None:
     from telnetlib3.client_shell import _get_raw_mode
@@ -2,6 +2,7 @@
 import sys
 import types
 import asyncio
+import collections
 
 # 3rd party
 import pytest
@@ -233,6 +234,26 @@ async def test_open_connection_default_factory(bind_host, unused_tcp_port, monke
         writer.close()
 
 
+@pytest.mark.asyncio
+async def test_open_connection_read_watermarks(bind_host, unused_tcp_port, monkeypatch):
+    monkeypatch.setattr(sys.stdin, "isatty", lambda: False)
+
+    async with create_server(host=bind_host, port=unused_tcp_port, connect_maxwait=0.5):
+        reader, writer = await cl.open_connection(
+            host=bind_host,
+            port=unused_tcp_port,
+            connect_maxwait=0.1,
+            encoding=False,
+            read_high=4096,
+            read_low=1024,
+        )
+        assert (writer.protocol.read_high, writer.protocol.read_low) == (4096, 1024)
+        writer.close()
+
+    with pytest.raises(ValueError):
+        await cl.open_connection(host=bind_host, port=unused_tcp_port, read_high=1024)
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="TTY factory not used on win32")
 @pytest.mark.asyncio
 async def test_open_connection_tty_factory(bind_host, unused_tcp_port, monkeypatch):
@@ -429,7 +450,7 @@ async def test_data_received_pauses_at_high_watermark():
         resume_reading=lambda: paused.append(False),
     )
     client.connection_made(transport)
-    big_data = b"\x00" * (client._read_high + 100)
+    big_data = b"\x00" * (client.read_high + 100)
     client.data_received(big_data)
     assert client._reading_paused is True
     await asyncio.sleep(0.05)
@@ -450,7 +471,7 @@ async def test_data_received_pause_reading_exception():
         pause_reading=bad_pause,
     )
     client.connection_made(transport)
-    big_data = b"\x00" * (client._read_high + 100)
+    big_data = b"\x00" * (client.read_high + 100)
     client.data_received(big_data)
     assert client._reading_paused is False
     await asyncio.sleep(0.05)
@@ -470,12 +491,46 @@ async def test_process_rx_resumes_reading_on_drain():
     )
     client.connection_made(transport)
     client._reading_paused = True
-    client._rx_queue.append(b"\x00" * 10)
-    client._rx_bytes = 10
+    client._rx_queue = collections.deque([b"\x00" * 10])
+    client._rx_queued = 10
     await client._process_rx()
     assert len(resumed) >= 1
 
 
+@pytest.mark.asyncio
+async def test_data_received_coalesces_queued_chunks(monkeypatch):
+    client = _make_client(encoding=False)
+    transport = types.SimpleNamespace(
+        get_extra_info=lambda name, default=None: default,
+        write=lambda data: None,
+        is_closing=lambda: False,
+        close=lambda: None,
+        pause_reading=lambda: None,
+        resume_reading=lambda: None,
+    )
+    client.connection_made(transport)
+    chunks = []
+    process_chunk = client._process_chunk
+
+    def counting_process_chunk(data):
+        chunks.append(data)
+        return process_chunk(data)
+
+    monkeypatch.setattr(client, "_process_chunk", counting_process_chunk)
+    client.data_received(b"a")
+    assert chunks == [b"a"]
+
+    # while a backlog is processed, each byte received is queued and joined
+    client.data_received(b"\x00" * (256 * 1024))
+    for byte in b"bcd\xff\xf1ef":
+        client.data_received(bytes([byte]))
+    assert len(chunks) == 1
+    await asyncio.sleep(0.01)
+    assert chunks[-1] == b"bcd\xff\xf1ef"
+    assert client._rx_task is None and client._rx_queued == 0
+    assert client.reader._buffer.endswith(b"bcdef")
+
+
 class _MockTransport:
     def __init__(self):
         self.data = bytearray()
@@ -152,6 +152,19 @@ def test_slc_change_default_uses_default_table():
     assert w.slctab[slc.SLC_EC].val != b"\x03"
 
 
+def test_slc_change_does_not_modify_other_connections():
+    """Changes to one writer's slctab are not seen by another or by the default table."""
+    w1, _ = _make_server_writer()
+    w2, _ = _make_server_writer()
+    w1._slc_change(slc.SLC_EOF, slc.SLC(slc.SLC_NOSUPPORT, slc.theNULL))
+    w1._slc_change(slc.SLC_EC, slc.SLC(slc.SLC_VARIABLE, b"\x08"))
+    assert w1.slctab[slc.SLC_EOF].nosupport
+    assert w1.slctab[slc.SLC_EC].val == b"\x08"
+    assert not w2.slctab[slc.SLC_EOF].nosupport
+    assert w2.slctab[slc.SLC_EC].val == b"\x7f"
+    assert w1.default_slc_tab[slc.SLC_EC].val == b"\x7f"
+
+
 def test_forwardmask_stored():
     """_handle_do_forwardmask stores a Forwardmask for valid lengths."""
     w, _ = _make_client_writer()
@@ -372,6 +385,7 @@ def test_slc_process_default_resets_slctab():
     w._slc_process(theNULL, slc.SLC(slc.SLC_DEFAULT, theNULL))
 
     assert w.slctab[slc.SLC_EC].val == w.default_slc_tab[slc.SLC_EC].val
+    assert len(w.slctab) == slc.NSLC
 
 
 def test_server_sends_slc_table_exactly_once():
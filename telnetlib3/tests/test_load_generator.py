@@ -0,0 +1,101 @@
+"""Smoke tests for the load generator (bin/load_generator.py)."""
+
+# std imports
+import os
+import sys
+import json
+
+# 3rd party
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "bin"))
+# 3rd party
+import load_generator
+
+# local
+from telnetlib3.tests.accessories import create_server
+
+
+@pytest.mark.parametrize(
+    "mix,sessions,expected",
+    [
+        ("mud=1,idle=1", 10, {"mud": 5, "idle": 5}),
+        ("negotiate=1,mud=3,mccp=1,idle=5", 7, {"negotiate": 1, "mud": 2, "mccp": 1, "idle": 3}),
+        ("mud,idle=3", 1, {"mud": 0, "idle": 1}),
+        ("pty=2", 3, {"pty": 3}),
+    ],
+)
+def test_parse_mix(mix, sessions, expected):
+    """Sessions are divided among kinds in proportion to their weights."""
+    assert load_generator.parse_mix(mix, sessions) == expected
+
+
+@pytest.mark.parametrize("mix", ["mud=1,telnet=1", "idle=0"])
+def test_parse_mix_invalid(mix):
+    """Unknown kinds and mixes without weight are refused."""
+    with pytest.raises(ValueError):
+        load_generator.parse_mix(mix, 10)
+
+
+def test_percentile():
+    """Percentiles are of nearest rank."""
+    values = [float(n) for n in range(100, 0, -1)]
+    assert load_generator.percentile(values, 50) == 50.0
+    assert load_generator.percentile(values, 99) == 99.0
+    assert load_generator.percentile([3.0], 99) == 3.0
+    assert load_generator.percentile([], 50) is None
+
+
+def test_compare():
+    """Values worse than their baseline beyond the tolerance regress."""
+    baseline = {"connects_per_sec": 1000.0, "negotiation_p99_ms": 10.0, "server_cpu_per_mb": None}
+    text, regressed = load_generator.compare(
+        {"connects_per_sec": 950.0, "negotiation_p99_ms": 10.5, "server_cpu_per_mb": 0.1}, baseline
+    )
+    assert not regressed
+    assert "connects_per_sec" in text and "server_cpu_per_mb" not in text
+    text, regressed = load_generator.compare(
+        {"connects_per_sec": 1500.0, "negotiation_p99_ms": 12.0}, baseline
+    )
+    assert regressed
+    assert text.splitlines()[1].endswith("(+20.0%)  REGRESSION")
+
+
+async def test_run_connect(bind_host, unused_tcp_port):
+    """Sessions of each kind are run against a server given by address."""
+
+    async def shell(reader, writer):
+        await load_generator._server_shell(reader, writer, 0.05)
+
+    async with create_server(
+        host=bind_host, port=unused_tcp_port, shell=shell, connect_maxwait=0.5, compression=True
+    ):
+        report = await load_generator.run(
+            8,
+            "negotiate=1,mud=1,mccp=1,idle=1",
+            duration=0.3,
+            tick=0.05,
+            connect=f"{bind_host}:{unused_tcp_port}",
+        )
+    assert report["mix"] == {"negotiate": 2, "mud": 2, "mccp": 2, "idle": 2}
+    assert report["connect_errors"] == 0
+    assert report["connects"] > 8
+    assert report["negotiation_p50_ms"] <= report["negotiation_p99_ms"]
+    assert report["mb_transferred"] > 0
+    assert report["rss_per_session_kib"] is None
+    assert report["server_cpu_per_mb"] is None
+    assert "connects/sec" in load_generator.format_report(report)
+
+
+def test_main_server_process(tmp_path, capsys):
+    """The load of a server child process is reported, saved, and compared."""
+    baseline = tmp_path / "baseline.json"
+    argv = "--sessions 6 --mix mud=1,mccp=1,idle=1 --duration 0.3 --tick 0.05".split()
+    assert load_generator.main([*argv, "--json", "--save-baseline", str(baseline)]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report == json.loads(baseline.read_text())
+    assert report["connects"] >= 6
+    assert report["rss_per_session_kib"] is not None
+    assert report["mccp_ratio"] < 1.0
+    assert load_generator.main([*argv, "--compare", str(baseline), "--tolerance", "1000"]) == 0
+    assert "negotiation_p50_ms" in capsys.readouterr().out
@@ -381,6 +381,20 @@ class TestMCCPDecompressionError:
         assert server._mccp3_decompressor is None
         assert not received
 
+    async def test_server_mccp3_end_keeps_data(self):
+        """Data at the end of an MCCP3 stream, and plain data following it, is received."""
+        from telnetlib3.server_base import BaseServer
+
+        server = BaseServer(encoding=False, connect_maxwait=0.1)
+        server.connection_made(MockTransport())
+        server.writer.slc_simulated = False
+        server._mccp3_decompressor = zlib.decompressobj()
+
+        server.data_received(zlib.compress(b"compressed ") + b"plain")
+
+        assert server._mccp3_decompressor is None
+        assert bytes(server.reader._buffer) == b"compressed plain"
+
 
 @pytest.mark.asyncio
 class TestMCCP2ServerEnd:
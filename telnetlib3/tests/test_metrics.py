@@ -0,0 +1,237 @@
+# std imports
+import asyncio
+from unittest.mock import MagicMock
+
+# 3rd party
+import pytest
+
+# local
+from telnetlib3.telopt import DO, SB, WILL
+from telnetlib3.metrics import Metrics, Histogram, SessionLatency, start_metrics_server
+from telnetlib3.server_shell import do_latency
+from telnetlib3.stream_reader import TelnetReader
+from telnetlib3.stream_writer import TelnetWriter
+from telnetlib3.tests.accessories import MockProtocol, MockTransport, create_server, open_connection
+
+
+def test_histogram_samples():
+    """Histogram buckets are cumulative, with an implied +Inf bucket."""
+    hist = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        hist.observe(value)
+    assert hist.counts == [2, 1, 1]
+    assert hist.samples() == [
+        ("_bucket", {"le": "0.1"}, 2),
+        ("_bucket", {"le": "1"}, 3),
+        ("_bucket", {"le": "+Inf"}, 4),
+        ("_sum", {}, 2.65),
+        ("_count", {}, 4),
+    ]
+    assert repr(hist) == "<Histogram count=4 sum=2.65>"
+
+
+def test_histogram_quantile():
+    """Quantiles are estimated by the upper bound of their bucket."""
+    hist = Histogram((0.1, 1.0))
+    assert hist.quantile(0.5) is None
+    for value in (0.05, 0.5, 0.5, 2.0):
+        hist.observe(value)
+    assert hist.quantile(0.0) == 0.1
+    assert hist.quantile(0.5) == 1.0
+    assert hist.quantile(0.99) == float("inf")
+
+
+def test_session_latency(monkeypatch):
+    """Residency of each chunk fed is observed once its last byte is consumed."""
+    clock = iter((1.0, 1.00002, 1.001, 1.5))
+    monkeypatch.setattr("telnetlib3.metrics.time.perf_counter", lambda: next(clock))
+    latency = SessionLatency()
+    latency.fed(3)
+    latency.fed(4)
+    latency.consumed(buffered=5)
+    assert latency.read_residency.count == 0
+    latency.consumed(buffered=4)
+    assert latency.read_residency.count == 1
+    latency.consumed(buffered=0)
+    assert latency.read_residency.count == 2
+    assert latency.read_residency.counts == [0] * 6 + [1] + [0] * 7 + [1, 0, 0]
+    latency.write_seconds.observe(0.0003)
+    latency.write_seconds.observe(5.0)
+    assert latency.summary() == "read n=2 p50<=1ms p99<=500ms, write n=2 p50<=500us p99>1s"
+    assert repr(SessionLatency()) == "<SessionLatency read n=0 p50=? p99=?, write n=0 p50=? p99=?>"
+
+
+async def test_track_latency():
+    """TelnetWriter.track_latency() shares a SessionLatency with its reader until stopped."""
+    reader = TelnetReader()
+    writer = TelnetWriter(MockTransport(), MockProtocol(), server=True, reader=reader)
+    assert writer.latency is reader.latency is None
+    assert "latency" not in repr(writer)
+
+    latency = writer.track_latency()
+    assert writer.latency is reader.latency is latency
+    writer.write(b"abc")
+    reader.feed_data(b"line\r\n")
+    assert await reader.readline() == b"line\r\n"
+    assert (latency.write_seconds.count, latency.read_residency.count) == (1, 1)
+    assert "latency[read n=1 " in repr(writer)
+
+    assert writer.track_latency(enable=False) is None
+    assert writer.latency is reader.latency is None
+    writer.write(b"abc")
+    assert latency.write_seconds.count == 1
+
+
+def test_do_latency():
+    """Shell command ``latency`` displays, starts, and stops latency tracking."""
+    reader = TelnetReader()
+    writer = TelnetWriter(MockTransport(), MockProtocol(), server=True, reader=reader)
+    assert do_latency(writer, "") == "latency off"
+    assert do_latency(writer, "on") == "latency tracking enabled."
+    assert reader.latency is not None
+    assert do_latency(writer, "").startswith("read n=0 ")
+    assert do_latency(writer, "sideways") == "latency: not an option."
+    assert do_latency(writer, "off") == "latency tracking disabled."
+    assert writer.latency is None
+
+
+def test_metrics_render():
+    """Metrics are rendered in the Prometheus text format, with collected families."""
+    metrics = Metrics()
+    metrics.connections_opened = 3
+    metrics.connections_closed = 1
+    metrics.commands_received[WILL[0]] = 2
+    metrics.mccp_bytes_in, metrics.mccp_bytes_out = 400, 100
+    metrics.negotiation_seconds.observe(0.02)
+
+    def collector():
+        yield ("custom", "gauge", "A custom value.", [("", {"name": 'a "b"\n'}, 1.5)])
+
+    metrics.add_collector(collector)
+    text = metrics.render()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert "# HELP telnetlib3_connections_opened_total Connections made." in lines
+    assert "# TYPE telnetlib3_connections_opened_total counter" in lines
+    assert "telnetlib3_connections_opened_total 3" in lines
+    assert "telnetlib3_connections_active 2" in lines
+    assert "telnetlib3_mccp_compression_ratio 0.25" in lines
+    assert 'telnetlib3_commands_received_total{command="WILL"} 2' in lines
+    assert not any(line.startswith("telnetlib3_commands_sent_total ") for line in lines)
+    assert 'telnetlib3_negotiation_seconds_bucket{le="0.01"} 0' in lines
+    assert 'telnetlib3_negotiation_seconds_bucket{le="0.025"} 1' in lines
+    assert "telnetlib3_negotiation_seconds_count 1" in lines
+    assert 'telnetlib3_custom{name="a \\"b\\"\\n"} 1.5' in lines
+    assert repr(metrics) == "<Metrics connections=2/3 rx=0 tx=0>"
+
+    metrics.remove_collector(collector)
+    metrics.remove_collector(collector)
+    assert "telnetlib3_custom" not in metrics.render()
+
+
+async def test_metrics_of_reader_flow_control():
+    """TelnetReader counts when reading is paused and resumed."""
+    metrics = Metrics()
+    reader = TelnetReader(limit=4)
+    reader.metrics = metrics
+    transport = MagicMock()
+    reader.set_transport(transport)
+    reader.feed_data(b"123456789")
+    assert transport.pause_reading.called
+    assert (metrics.read_paused, metrics.read_resumed) == (1, 0)
+    assert await reader.read(9) == b"123456789"
+    assert transport.resume_reading.called
+    assert (metrics.read_paused, metrics.read_resumed) == (1, 1)
+
+
+async def test_metrics_of_connections(bind_host, unused_tcp_port):
+    """create_server() and open_connection() count connections, bytes, and commands."""
+    server_metrics, client_metrics = Metrics(), Metrics()
+    shell_done = asyncio.Event()
+
+    async def shell(reader, writer):
+        writer.write("hello")
+        await writer.drain()
+        shell_done.set()
+
+    async with create_server(
+        host=bind_host,
+        port=unused_tcp_port,
+        shell=shell,
+        connect_maxwait=0.5,
+        metrics=server_metrics,
+    ) as server:
+        assert server.metrics is server_metrics
+        async with open_connection(
+            host=bind_host, port=unused_tcp_port, connect_maxwait=0.5, metrics=client_metrics
+        ) as (reader, _):
+            assert await asyncio.wait_for(reader.readexactly(5), 2.0) == "hello"
+            await asyncio.wait_for(shell_done.wait(), 2.0)
+            assert server_metrics.connections_active == 1
+            assert client_metrics.connections_active == 1
+        await asyncio.sleep(0.05)
+
+    for metrics in (server_metrics, client_metrics):
+        assert metrics.connections_opened == metrics.connections_closed == 1
+        assert metrics.bytes_received > 0
+        assert metrics.bytes_sent > 0
+        assert metrics.negotiation_seconds.count == 1
+    assert server_metrics.shell_start_seconds.count == 1
+    assert server_metrics.commands_sent[DO[0]] > 0
+    assert server_metrics.commands_received[WILL[0]] > 0
+    assert server_metrics.commands_received[SB[0]] > 0
+    assert client_metrics.commands_received[DO[0]] == server_metrics.commands_sent[DO[0]]
+    assert client_metrics.bytes_received == server_metrics.bytes_sent
+
+
+async def test_metrics_of_admission(bind_host, unused_tcp_port):
+    """Counts of Server.admission are collected by its metrics until closed."""
+    metrics = Metrics()
+    async with create_server(
+        host=bind_host, port=unused_tcp_port, max_sessions=5, metrics=metrics
+    ) as server:
+        lines = metrics.render().splitlines()
+        assert "telnetlib3_sessions 0" in lines
+        assert "telnetlib3_admission_accepted_total 0" in lines
+        assert 'telnetlib3_admission_rejected_total{reason="per_ip"} 0' in lines
+        assert "telnetlib3_tls_handshakes_total" not in metrics.render()
+        server.close()
+    assert "telnetlib3_sessions" not in metrics.render()
+
+
+async def _http_request(port, request):
+    reader, writer = await asyncio.open_connection("localhost", port)
+    writer.write(request)
+    response = await asyncio.wait_for(reader.read(), 2.0)
+    writer.close()
+    return response
+
+
+@pytest.mark.parametrize(
+    "request_line,status",
+    [
+        (b"GET /metrics HTTP/1.1", b"200 OK"),
+        (b"GET /metrics?name=x HTTP/1.1", b"200 OK"),
+        (b"HEAD /metrics HTTP/1.1", b"200 OK"),
+        (b"GET / HTTP/1.1", b"404 Not Found"),
+        (b"POST /metrics HTTP/1.1", b"405 Method Not Allowed"),
+    ],
+)
+async def test_start_metrics_server(unused_tcp_port, request_line, status):
+    """start_metrics_server() answers GET /metrics with the rendered metrics."""
+    metrics = Metrics()
+    metrics.connections_opened = 7
+    server = await start_metrics_server(metrics, "localhost", unused_tcp_port)
+    try:
+        response = await _http_request(unused_tcp_port, request_line + b"\r\nHost: x\r\n\r\n")
+    finally:
+        server.close()
+        await server.wait_closed()
+    header, _, body = response.partition(b"\r\n\r\n")
+    assert header.startswith(b"HTTP/1.0 " + status)
+    assert b"Content-Type: text/plain; version=0.0.4; charset=utf-8" in header
+    if status == b"200 OK" and not request_line.startswith(b"HEAD"):
+        assert b"telnetlib3_connections_opened_total 7\n" in body
+        assert f"Content-Length: {len(body)}".encode() in header
+    elif request_line.startswith(b"HEAD"):
+        assert body == b""
@@ -5,6 +5,7 @@ import pytest
 
 # local
 from telnetlib3.mud import (
+    MsdpEncoder,
     zmp_decode,
     atcp_decode,
     gmcp_decode,
@@ -348,3 +349,80 @@ def test_mssp_decode_skips_garbage_bytes():
     buf = b"\x42" + MSSP_VAR + b"NAME" + MSSP_VAL + b"TestMUD"
     result = mssp_decode(buf)
     assert result == {"NAME": "TestMUD"}
+
+
+def test_msdp_nested_roundtrip() -> None:
+    variables = {
+        "ROOM": {
+            "VNUM": "6008",
+            "EXITS": {"n": "6011", "e": "6007"},
+            "MOBS": [{"NAME": "wolf", "FLAGS": ["aggr", "sentinel"]}, {"NAME": "owl"}],
+        },
+        "HEALTH": "100",
+        "EMPTY": [],
+    }
+    assert msdp_decode(msdp_encode(variables)) == variables
+
+
+@pytest.mark.parametrize(
+    "buf,expected",
+    [
+        pytest.param(MSDP_VAR + b"K" + MSDP_VAL + MSDP_TABLE_OPEN + b"x", {"K": {}}, id="table"),
+        pytest.param(
+            MSDP_VAR + b"K" + MSDP_VAL + MSDP_ARRAY_OPEN + MSDP_VAR + MSDP_TABLE_CLOSE,
+            {"K": []},
+            id="array",
+        ),
+    ],
+)
+def test_msdp_decode_stray_bytes_in_container(buf, expected) -> None:
+    assert msdp_decode(buf) == expected
+
+
+def test_msdp_encoder_caches_unchanged() -> None:
+    encoder = MsdpEncoder()
+    table = {"VNUM": "6008", "EXITS": ["n", "e"]}
+    first = encoder.encode({"ROOM": table, "HEALTH": 100})
+    assert first == msdp_encode({"ROOM": table, "HEALTH": 100})
+    assert len(encoder) == 2
+
+    # unchanged values reuse the previous encoding
+    assert encoder.encode_variable("ROOM", table) is encoder.encode_variable("ROOM", table)
+
+    # changes by mutation, or of type only, are detected
+    table["EXITS"].append("s")
+    assert encoder.encode({"ROOM": table}) == msdp_encode({"ROOM": table})
+    assert encoder.encode({"HEALTH": True}) == msdp_encode({"HEALTH": True})
+
+    encoder.clear()
+    assert len(encoder) == 0
+
+
+def test_mssp_decode_var_without_value() -> None:
+    buf = MSSP_VAR + b"EMPTY" + MSSP_VAR + b"NAME" + MSSP_VAL + b"TestMUD" + MSSP_VAL + b"Alt"
+    assert mssp_decode(buf) == {"NAME": ["TestMUD", "Alt"]}
+
+
+def test_set_json_backend() -> None:
+    from telnetlib3.mud import set_json_backend
+
+    try:
+        assert set_json_backend("auto") in ("json", "orjson")
+        assert gmcp_decode(gmcp_encode("Char.Vitals", {"hp": 1})) == ("Char.Vitals", {"hp": 1})
+        with pytest.raises(ValueError):
+            gmcp_decode(b"Char.Vitals {bad")
+        with pytest.raises(ValueError):
+            set_json_backend("yaml")
+    finally:
+        assert set_json_backend() == "json"
+
+
+def test_set_json_backend_orjson() -> None:
+    from telnetlib3.mud import set_json_backend
+
+    pytest.importorskip("orjson")
+    try:
+        assert set_json_backend("orjson") == "orjson"
+        assert gmcp_encode("Char.Vitals", {1: "caf\xe9"}) == 'Char.Vitals {"1":"caf\xe9"}'.encode()
+    finally:
+        set_json_backend()
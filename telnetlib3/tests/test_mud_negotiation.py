@@ -187,6 +187,19 @@ def test_send_gmcp():
     assert expected in t.writes
 
 
+def test_send_gmcp_message():
+    from telnetlib3.mud import GmcpMessage
+
+    message = GmcpMessage("Comm.Channel.Text", {"channel": "ooc", "text": "hi"})
+    assert message.frame == IAC + SB + GMCP + message.payload + IAC + SE
+    assert "Comm.Channel.Text" in repr(message)
+    for _ in range(2):
+        w, t, p = new_writer(server=True)
+        w.local_option[GMCP] = True
+        w.send_gmcp(message)
+        assert t.writes == [message.frame]
+
+
 def test_send_gmcp_not_negotiated():
     w, t, p = new_writer(server=True)
     w.send_gmcp("Char.Vitals", {"hp": 100})
@@ -215,6 +228,132 @@ def test_send_mssp():
     assert expected in t.writes
 
 
+def test_mud_state_sends_changes_only():
+    from telnetlib3.telopt import MSDP_VAL, MSDP_VAR
+
+    w, t, p = new_writer(server=True)
+    w.local_option[GMCP] = True
+    w.local_option[MSDP] = True
+    state = w.mud_state
+    assert w.mud_state is state
+
+    state.set("Char.Vitals", {"hp": 100})
+    state.set("Room.Info", {"num": 1})
+    state.set_msdp({"HEALTH": "100", "MANA": "50"})
+    assert state.pending
+    state.flush()
+    assert t.writes == [
+        b"".join(
+            [
+                IAC + SB + GMCP + b'Char.Vitals {"hp":100}' + IAC + SE,
+                IAC + SB + GMCP + b'Room.Info {"num":1}' + IAC + SE,
+                IAC + SB + MSDP,
+                MSDP_VAR + b"HEALTH" + MSDP_VAL + b"100",
+                MSDP_VAR + b"MANA" + MSDP_VAL + b"50",
+                IAC + SE,
+            ]
+        )
+    ]
+
+    # unchanged values are not sent again
+    t.writes.clear()
+    state.set("Char.Vitals", {"hp": 100})
+    state.set_msdp({"HEALTH": "100", "MANA": "45"})
+    assert state.flush() > 0
+    assert t.writes == [IAC + SB + MSDP + MSDP_VAR + b"MANA" + MSDP_VAL + b"45" + IAC + SE]
+
+    # a change reverted before flush is not sent
+    t.writes.clear()
+    state.set("Char.Vitals", {"hp": 90})
+    state.set("Char.Vitals", {"hp": 100})
+    assert not state.pending
+    assert state.flush() == 0
+
+    state.forget()
+    state.set("Char.Vitals", {"hp": 100})
+    state.flush()
+    assert t.writes == [IAC + SB + GMCP + b'Char.Vitals {"hp":100}' + IAC + SE]
+
+
+def test_mud_state_not_negotiated():
+    w, t, p = new_writer(server=True)
+    w.mud_state.set("Char.Vitals", {"hp": 100})
+    w.mud_state.set_msdp({"HEALTH": "100"})
+    assert w.mud_state.flush() == 0
+    assert not w.mud_state.pending
+    assert len(t.writes) == 0
+
+    # values not sent are sent once negotiated
+    w.local_option[GMCP] = True
+    w.mud_state.set("Char.Vitals", {"hp": 100})
+    w.mud_state.flush()
+    assert t.writes == [IAC + SB + GMCP + b'Char.Vitals {"hp":100}' + IAC + SE]
+
+
+async def test_mud_state_auto_flush_batches():
+    import asyncio
+
+    w, t, p = new_writer(server=True)
+    w.local_option[GMCP] = True
+    w.mud_state.set("Char.Vitals", {"hp": 100})
+    w.mud_state.set("Char.Status", {"message": "ready"})
+    assert not t.writes
+    await asyncio.sleep(0)
+    assert len(t.writes) == 1
+    assert t.writes[0].count(IAC + SB + GMCP) == 2
+
+
+def test_mud_state_flushed_before_write():
+    w, t, p = new_writer(server=True)
+    w.local_option[GMCP] = True
+    w.mud_state.set("Char.Vitals", {"hp": 100})
+    w.write(b"You are hurt.")
+    assert t.writes == [IAC + SB + GMCP + b'Char.Vitals {"hp":100}' + IAC + SE, b"You are hurt."]
+    assert not w.mud_state.pending
+
+
+def test_mud_state_bypassed_by_send_gmcp_and_msdp():
+    w, t, p = new_writer(server=True)
+    w.local_option[GMCP] = True
+    w.local_option[MSDP] = True
+    w.mud_state.set("Char.Vitals", {"hp": 100})
+    w.mud_state.set_msdp({"HEALTH": "100"})
+    w.send_gmcp("Char.Vitals", {"hp": 50})
+    # pending changes are sent first, in order
+    assert len(t.writes) == 2
+    assert t.writes[0].startswith(IAC + SB + GMCP + b'Char.Vitals {"hp":100}')
+    assert t.writes[1].startswith(IAC + SB + GMCP + b"Char.Vitals")
+
+    # the value sent directly is not mistaken for that last set
+    w.mud_state.set("Char.Vitals", {"hp": 100})
+    assert w.mud_state.flush() > 0
+    w.send_msdp({"HEALTH": "50"})
+    w.mud_state.set_msdp({"HEALTH": "100"})
+    assert w.mud_state.pending
+
+
+async def test_json_encode_cache_shared():
+    import asyncio
+
+    from telnetlib3.mud import MudState, JsonEncodeCache
+
+    cache = JsonEncodeCache()
+    players = [{"name": "Alice"}, {"name": "Bob"}]
+    writers = [new_writer(server=True) for _ in range(3)]
+    for w, t, _p in writers:
+        w.local_option[GMCP] = True
+        MudState(w, json_cache=cache).set("Room.Players", players)
+    assert len(cache) == 1
+    assert cache.dumps(players) is cache.dumps(players)
+    assert cache.dumps(5) == b"5"
+    await asyncio.sleep(0)
+    assert len(cache) == 0
+    for _w, t, _p in writers:
+        assert t.writes == [
+            IAC + SB + GMCP + b'Room.Players [{"name":"Alice"},{"name":"Bob"}]' + IAC + SE
+        ]
+
+
 _MUD_EXTENDED = [MSP, MXP, ZMP, AARDWOLF, ATCP]
 _MUD_EXT_IDS = ["MSP", "MXP", "ZMP", "AARDWOLF", "ATCP"]
 
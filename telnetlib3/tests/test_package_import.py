@@ -0,0 +1,68 @@
+"""Test the lazily imported namespace of the telnetlib3 package."""
+
+# std imports
+import sys
+import importlib
+import subprocess
+
+# 3rd party
+import pytest
+
+# local
+import telnetlib3
+
+
+def _imported_by(statement):
+    """Return telnetlib3 modules imported by *statement* in a new interpreter."""
+    code = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return {name for name in output.split() if name.startswith("telnetlib3")}
+
+
+@pytest.mark.parametrize("module", list(telnetlib3._EXPORTS))
+def test_exports_match_submodule_all(module):
+    """Each submodule exports the names listed for it by the package."""
+    submodule = importlib.import_module(f"telnetlib3.{module}")
+    assert tuple(telnetlib3._EXPORTS[module].split()) == tuple(submodule.__all__)
+    for name in submodule.__all__:
+        if telnetlib3._EXPORTED_BY[name] == module:
+            assert getattr(telnetlib3, name) is getattr(submodule, name)
+
+
+def test_package_namespace():
+    """Names, submodules, and constants resolve on first use."""
+    assert telnetlib3.TelnetSessionContext.__module__ == "telnetlib3._session_context"
+    assert telnetlib3.server_pty_shell.__name__ == "telnetlib3.server_pty_shell"
+    assert telnetlib3.accessories.get_version() == telnetlib3.__version__
+    assert telnetlib3.PTY_SUPPORT is True
+    assert "create_server" in dir(telnetlib3)
+    assert "fingerprinting_display" in dir(telnetlib3)
+    with pytest.raises(AttributeError, match="no_such_name"):
+        telnetlib3.no_such_name  # pylint: disable=pointless-statement
+    namespace = {}
+    exec("from telnetlib3 import *", namespace)  # pylint: disable=exec-used
+    assert set(telnetlib3.__all__) <= set(namespace)
+
+
+def test_all_without_pty_support(monkeypatch):
+    """Names of server_pty_shell are exported only when PTY is supported."""
+    assert "make_pty_shell" in telnetlib3.__all__
+    monkeypatch.delitem(vars(telnetlib3), "__all__")
+    monkeypatch.setattr(telnetlib3, "PTY_SUPPORT", False)
+    assert "make_pty_shell" not in telnetlib3.__all__
+    assert "create_server" in telnetlib3.__all__
+
+
+def test_import_is_lazy():
+    """Importing the package, or only its blocking client, imports few submodules."""
+    assert _imported_by("import telnetlib3") == {"telnetlib3", "telnetlib3.encodings"}
+    imported = _imported_by("from telnetlib3.sync import TelnetConnection")
+    assert "telnetlib3.client" in imported
+    assert not imported & {
+        "telnetlib3.server",
+        "telnetlib3.server_shell",
+        "telnetlib3.fingerprinting",
+        "telnetlib3.server_fingerprinting",
+        "telnetlib3.fingerprinting_display",
+        "telnetlib3.server_pty_shell",
+    }
@@ -136,6 +136,32 @@ async def test_data_received_fast_path_no_iac():
     assert len(server.reader._buffer) >= len(b"hello world")
 
 
+@pytest.mark.asyncio
+async def test_data_received_queued_behind_backlog():
+    """Data received while a backlog is processed is queued, and discarded when lost."""
+    server = _make_telnet_server()
+    server.writer.slc_simulated = False
+    server._transport.pause_reading = server._transport.resume_reading = lambda: None
+    server.data_received(b"a")
+    assert server.reader._buffer == b"a"
+
+    server.data_received(b"b" * (256 * 1024))
+    server.data_received(b"c")
+    assert server.reader._buffer == b"a"
+    assert server._rx_queued == 256 * 1024 + 1
+    await asyncio.sleep(0.01)
+    assert server._rx_task is None
+    assert len(server.reader._buffer) == 256 * 1024 + 2
+
+    server.reader._buffer.clear()
+    server.data_received(b"d" * (256 * 1024))
+    server.connection_lost(None)
+    await asyncio.sleep(0.01)
+    assert server._rx_queued == 0
+    assert server.reader._buffer == b""
+    assert server.reader.at_eof()
+
+
 def _make_telnet_server(**kwargs):
     """Create a TelnetServer with a FakeTransport for unit testing."""
     defaults = {"encoding": False, "connect_maxwait": 0.01}
@@ -228,15 +254,21 @@ async def test_tls_autodetect_empty_peek():
     transport.get_extra_info = MagicMock(
         side_effect=lambda name, **kw: mock_sock if name == "socket" else None
     )
-    proto._transport = transport
-    proto._detect_timer = MagicMock()
 
     dup_sock = MagicMock()
     dup_sock.recv.return_value = b""
-    with patch("socket.fromfd", return_value=dup_sock):
-        proto._try_peek()
+    loop = asyncio.get_running_loop()
+    with (
+        patch("socket.fromfd", return_value=dup_sock),
+        patch.object(loop, "add_reader") as add_reader,
+        patch.object(loop, "remove_reader"),
+    ):
+        proto.connection_made(transport)
+        add_reader.assert_called_once_with(dup_sock.fileno(), proto._on_readable)
+        proto._on_readable()
 
     transport.close.assert_called_once()
+    dup_sock.close.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -513,3 +545,675 @@ def test_log_tls_info(ssl_obj, expect_log, caplog):
     assert bool(tls_msgs) == expect_log
     if ssl_obj and ssl_obj.cipher():
         assert "AES" in tls_msgs[0].message
+
+
+def _make_profiled_server(cache, **kwargs):
+    """Create a TelnetServer with a transport that records writes."""
+    written = []
+    server = _make_telnet_server(negotiation_profiles=cache, **kwargs)
+    server.writer._transport.write = written.append
+    return server, written
+
+
+@pytest.mark.asyncio
+async def test_negotiation_profile_record_and_get():
+    """NegotiationProfileCache records accepted, refused and unanswered requests."""
+    from telnetlib3.server import NegotiationProfileCache
+    from telnetlib3.telopt import DO, SB, NAWS, WILL, TTYPE, BINARY, CHARSET, NEW_ENVIRON
+
+    cache = NegotiationProfileCache()
+    server, _ = _make_profiled_server(cache)
+    server._extra.update({"ttype1": "ALPHA", "ttype2": "BETA", "ttype3": "ALPHA"})
+    writer = server.writer
+    writer.pending_option[DO + TTYPE] = False
+    writer.remote_option[TTYPE] = True
+    writer.pending_option[SB + TTYPE] = False
+    writer.pending_option[DO + NAWS] = False
+    writer.remote_option[NAWS] = False
+    writer.pending_option[WILL + BINARY] = False
+    writer.local_option[BINARY] = True
+    writer.pending_option[DO + CHARSET] = True
+    writer.pending_option[DO + NEW_ENVIRON] = False
+    writer.remote_option[NEW_ENVIRON] = True
+    writer.pending_option[SB + NEW_ENVIRON] = True
+
+    assert cache.key(writer) == "ALPHA:+DO NEW_ENVIRON,+DO TTYPE,+WILL BINARY,-DO NAWS"
+    profile = cache.record(writer)
+    assert profile.ttypes == ("ALPHA", "BETA", "ALPHA")
+    assert profile.accepted == {DO + TTYPE, SB + TTYPE, WILL + BINARY, DO + NEW_ENVIRON}
+    assert profile.refused == {DO + NAWS, DO + CHARSET, SB + NEW_ENVIRON}
+    # not used until confirmed by a second connection
+    assert cache.get(writer) is None
+    assert cache.record(writer) == profile
+    assert cache.get(writer) == profile
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_negotiation_profile_confirmations():
+    """A profile is replaced only when no longer confirmed, alternating outcomes are unused."""
+    from telnetlib3.server import NegotiationProfileCache
+
+    cache = NegotiationProfileCache(key_fn=lambda w: "key")
+    server_a, _ = _make_profiled_server(cache)
+    server_a._extra["ttype1"] = "ALPHA"
+    server_b, _ = _make_profiled_server(cache)
+    server_b._extra["ttype1"] = "BETA"
+    profile_a = cache.record(server_a.writer)
+    profile_b = cache.record(server_b.writer)
+    assert cache.get(server_a.writer) is None
+    assert cache.record(server_a.writer) == profile_a
+    assert cache.get(server_a.writer) is None
+
+    # confirmed, a single disagreeing outcome discounts, but does not replace it.
+    cache.record(server_a.writer)
+    assert cache.get(server_a.writer) == profile_a
+    assert cache.record(server_b.writer) == profile_a
+    assert cache.get(server_a.writer) is None
+    assert cache.record(server_a.writer) == profile_a
+    assert cache.get(server_a.writer) == profile_a
+
+    # replaced by a profile of consistent outcomes.
+    for _ in range(3):
+        cache.record(server_b.writer)
+    assert cache.get(server_b.writer) == profile_b
+
+    with pytest.raises(ValueError):
+        NegotiationProfileCache(confirmations=0)
+
+
+@pytest.mark.asyncio
+async def test_negotiation_profile_cache_maxsize_and_key_fn():
+    """Least recently used profiles are discarded, key_fn selects the key."""
+    from telnetlib3.server import NegotiationProfileCache
+
+    cache = NegotiationProfileCache(
+        maxsize=2, key_fn=lambda w: w.get_extra_info("term"), confirmations=1
+    )
+    for term in ("a", "b", "c"):
+        server, _ = _make_profiled_server(cache, term=term)
+        cache.record(server.writer)
+    assert len(cache) == 2
+    assert cache.get(_make_profiled_server(cache, term="a")[0].writer) is None
+    assert cache.get(_make_profiled_server(cache, term="c")[0].writer) is not None
+
+    # without a key (TTYPE refused), nothing is recorded
+    default_cache = NegotiationProfileCache()
+    assert default_cache.record(_make_profiled_server(default_cache)[0].writer) is None
+    assert len(default_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_negotiation_profile_ttype_burst():
+    """A known client type receives the remaining TTYPE requests in one write."""
+    from telnetlib3.server import NegotiationProfile, NegotiationProfileCache
+    from telnetlib3.telopt import SB, SE, IAC, SEND, TTYPE
+
+    cache = NegotiationProfileCache(key_fn=lambda w: w.get_extra_info("ttype1"))
+    cache._profiles["ALPHA"] = (
+        NegotiationProfile(("ALPHA", "BETA", "GAMMA", "ALPHA"), frozenset(), frozenset()),
+        cache.confirmations,
+    )
+    server, written = _make_profiled_server(cache)
+    server.writer.remote_option[TTYPE] = True
+    server.writer.pending_option[SB + TTYPE] = False
+
+    server.on_ttype("ALPHA")
+    assert server.negotiation_profile is cache._profiles["ALPHA"][0]
+    assert (IAC + SB + TTYPE + SEND + IAC + SE) * 3 in written
+    assert server._ttype_inflight == 3
+
+    for ttype in ("BETA", "GAMMA"):
+        server.writer.pending_option[SB + TTYPE] = False
+        server.on_ttype(ttype)
+        assert server.writer.pending_option[SB + TTYPE] is True
+    server.writer.pending_option[SB + TTYPE] = False
+    server.on_ttype("ALPHA")
+    assert server._ttype_inflight == 0
+    assert server.get_extra_info("ttype3") == "GAMMA"
+    assert server.get_extra_info("ttype4") == "ALPHA"
+    assert server.writer.pending_option[SB + TTYPE] is False
+    assert written.count(IAC + SB + TTYPE + SEND + IAC + SE) == 0
+
+
+@pytest.mark.asyncio
+async def test_negotiation_profile_ttype_burst_early_stop():
+    """Replies to burst requests beyond an early cycle stop are discarded."""
+    from telnetlib3.server import NegotiationProfile, NegotiationProfileCache
+    from telnetlib3.telopt import SB, TTYPE
+
+    cache = NegotiationProfileCache(key_fn=lambda w: w.get_extra_info("ttype1"))
+    cache._profiles["ALPHA"] = (
+        NegotiationProfile(("ALPHA", "BETA", "GAMMA", "ALPHA"), frozenset(), frozenset()),
+        cache.confirmations,
+    )
+    server, _ = _make_profiled_server(cache)
+    server.writer.remote_option[TTYPE] = True
+    server.on_ttype("ALPHA")
+    server.on_ttype("ALPHA")
+    assert server._ttype_discard == 2
+    server.on_ttype("OMEGA")
+    server.on_ttype("OMEGA")
+    assert server._ttype_discard == 0
+    assert server.get_extra_info("TERM") == "ALPHA"
+    assert server.get_extra_info("ttype3") is None
+
+
+@pytest.mark.asyncio
+async def test_negotiation_profile_skips_refused():
+    """Options refused by a known client type are neither requested nor awaited."""
+    from telnetlib3.server import NegotiationProfile, NegotiationProfileCache
+    from telnetlib3.telopt import DO, SB, ECHO, NAWS, WILL, TTYPE, BINARY, NEW_ENVIRON
+
+    cache = NegotiationProfileCache(key_fn=lambda w: w.get_extra_info("ttype1"))
+    cache._profiles["ANSI"] = (
+        NegotiationProfile(
+            ("ANSI", "ANSI"),
+            frozenset({DO + TTYPE}),
+            frozenset({DO + NEW_ENVIRON, DO + NAWS, WILL + BINARY, WILL + ECHO}),
+        ),
+        cache.confirmations,
+    )
+    server, written = _make_profiled_server(cache, connect_maxwait=10)
+    server._advanced = True
+    server.writer.remote_option[TTYPE] = True
+    server.writer.pending_option[DO + NAWS] = True
+    server.writer.pending_option[WILL + BINARY] = True
+
+    server.on_ttype("ANSI")
+    assert server._environ_requested
+    assert not server.writer.pending_option.get(DO + NEW_ENVIRON)
+    assert WILL + ECHO not in server.writer.pending_option
+    server.writer.pending_option[SB + TTYPE] = False
+    server.on_ttype("ANSI")
+
+    # DO NAWS and WILL BINARY remain unanswered
+    assert server.check_negotiation() is True
+    assert server.waiter_encoding.done() and server.waiter_encoding.result() is False
+
+
+@pytest.mark.asyncio
+async def test_negotiation_profile_recorded_on_connect(bind_host, unused_tcp_port):
+    """Profiles are recorded when negotiation completes and used by the next client."""
+    from telnetlib3.server import NegotiationProfileCache
+    from telnetlib3.tests.accessories import create_server, open_connection
+
+    cache = NegotiationProfileCache()
+    async with create_server(
+        host=bind_host, port=unused_tcp_port, connect_maxwait=0.5, negotiation_profiles=cache
+    ) as server:
+        for _ in range(3):
+            async with open_connection(
+                host=bind_host, port=unused_tcp_port, term="alpha", connect_maxwait=0.5
+            ):
+                client = await asyncio.wait_for(server.wait_for_client(), 2.0)
+                assert client.get_extra_info("TERM") == "alpha"
+                assert client.get_extra_info("LANG") is not None
+    assert len(cache) == 1
+    assert client.negotiation_profile is not None
+    assert client.negotiation_profile.ttypes[0] == "alpha"
+
+
+@pytest.mark.asyncio
+async def test_negotiation_profile_anticipates_environ():
+    """SB NEW_ENVIRON SEND follows DO NEW_ENVIRON when a known client type accepted it."""
+    from telnetlib3.server import NegotiationProfile, NegotiationProfileCache
+    from telnetlib3.telopt import DO, SB, IAC, SEND, TTYPE, NEW_ENVIRON
+
+    cache = NegotiationProfileCache(key_fn=lambda w: w.get_extra_info("ttype1"))
+    cache._profiles["ALPHA"] = (
+        NegotiationProfile(
+            ("ALPHA", "ALPHA"), frozenset({DO + NEW_ENVIRON, SB + NEW_ENVIRON}), frozenset()
+        ),
+        cache.confirmations,
+    )
+    server, written = _make_profiled_server(cache)
+    server.writer.remote_option[TTYPE] = True
+    server.on_ttype("ALPHA")
+    assert IAC + DO + NEW_ENVIRON in written
+    assert any(buf.startswith(IAC + SB + NEW_ENVIRON + SEND) for buf in written)
+    assert server.writer.pending_option[SB + NEW_ENVIRON] is True
+
+    # the client changed its mind, the request is not awaited.
+    server.writer.handle_wont(NEW_ENVIRON)
+    assert server.writer.pending_option[SB + NEW_ENVIRON] is False
+
+
+@pytest.mark.asyncio
+async def test_early_shell_starts_before_negotiation_completes():
+    """With early_shell, the shell starts once BINARY, ECHO, and SGA are settled."""
+    from telnetlib3.telopt import DO, SB, SGA, ECHO, WILL, TTYPE, BINARY, CHARSET, NEW_ENVIRON
+
+    started = []
+
+    async def shell(reader, writer):
+        started.append(writer)
+
+    server = _make_telnet_server(shell=shell, connect_maxwait=10, early_shell=True)
+    writer = server.writer
+    server._advanced = True
+    server._echo_negotiated = True
+    writer.remote_option[TTYPE] = True
+    writer.pending_option[SB + CHARSET] = True
+    for opt in (SGA, ECHO, BINARY):
+        writer.pending_option[WILL + opt] = True
+
+    server._check_negotiation_timer()
+    await asyncio.sleep(0)
+    assert not started
+
+    for opt in (SGA, ECHO, BINARY):
+        writer.pending_option[WILL + opt] = False
+        writer.local_option[opt] = True
+    writer.remote_option[BINARY] = True
+    writer.pending_option[DO + BINARY] = False
+    server._check_negotiation_timer()
+    await asyncio.sleep(0)
+    assert started == [writer]
+    assert not server._waiter_connected.done()
+
+    # CHARSET and NEW_ENVIRON complete in the background; the shell is not started again.
+    writer.pending_option[SB + CHARSET] = False
+    writer.pending_option[DO + NEW_ENVIRON] = False
+    server._check_negotiation_timer()
+    await asyncio.sleep(0)
+    assert server._waiter_connected.done()
+    assert started == [writer]
+
+
+@pytest.mark.asyncio
+async def test_early_shell_option_settled():
+    """ECHO skipped for MUD clients and SGA in line mode are settled."""
+    from telnetlib3.telopt import SGA, ECHO, WILL, BINARY
+
+    server = _make_telnet_server(early_shell=("SGA", "ECHO"), line_mode=True)
+    assert server.early_shell_options == (SGA, ECHO)
+    assert server.option_settled(SGA)
+    assert not server.option_settled(ECHO)
+    assert not server.option_settled(BINARY)
+    server._negotiate_echo()
+    assert server.option_settled(ECHO)
+
+    server = _make_telnet_server()
+    assert server.early_shell_options == ()
+    server.writer.pending_option[WILL + BINARY] = True
+    assert not server.option_settled(BINARY)
+    server.writer.pending_option[WILL + BINARY] = False
+    server.writer.local_option[BINARY] = False
+    assert server.option_settled(BINARY)
+
+    with pytest.raises(KeyError):
+        _make_telnet_server(early_shell=("NOT-AN-OPTION",))
+
+
+@pytest.mark.asyncio
+async def test_early_shell_on_connect(bind_host, unused_tcp_port):
+    """The shell starts before a client answers CHARSET negotiation."""
+    from telnetlib3.client import TelnetClient
+    from telnetlib3.telopt import SB, CHARSET
+    from telnetlib3.tests.accessories import create_server, open_connection
+
+    class SilentCharsetClient(TelnetClient):
+        # a client that never answers a CHARSET REQUEST
+        def connection_made(self, transport):
+            super().connection_made(transport)
+            handle_subnegotiation = self.writer.handle_subnegotiation
+
+            def ignore_charset(buf):
+                if buf[0] != CHARSET:
+                    handle_subnegotiation(buf)
+
+            self.writer.handle_subnegotiation = ignore_charset
+
+    shell_started = asyncio.Event()
+
+    async def shell(reader, writer):
+        shell_started.set()
+
+    async with create_server(
+        host=bind_host, port=unused_tcp_port, shell=shell, connect_maxwait=4.0, early_shell=True
+    ) as server:
+        async with open_connection(
+            host=bind_host,
+            port=unused_tcp_port,
+            client_factory=SilentCharsetClient,
+            connect_maxwait=0.5,
+        ):
+            await asyncio.wait_for(shell_started.wait(), 2.0)
+            (protocol,) = server.clients
+            assert protocol.writer.pending_option.enabled(SB + CHARSET)
+            assert not protocol._waiter_connected.done()
+
+
+@pytest.mark.asyncio
+async def test_server_multicast_gmcp():
+    """multicast_gmcp() sends one serialization to clients that negotiated GMCP."""
+    from telnetlib3.mud import GmcpMessage
+    from telnetlib3.server import Server
+    from telnetlib3.telopt import GMCP
+    from telnetlib3.stream_writer import TelnetWriter
+    from telnetlib3.tests.accessories import MockProtocol, MockTransport
+
+    class FakeClient:
+        def __init__(self, gmcp):
+            self.transport = MockTransport()
+            self.writer = TelnetWriter(self.transport, MockProtocol(), server=True)
+            self.writer.local_option[GMCP] = gmcp
+
+        def _add_close_callback(self, callback):
+            pass
+
+    server = Server(None)
+    clients = [FakeClient(gmcp=True), FakeClient(gmcp=False), FakeClient(gmcp=True)]
+    closed = FakeClient(gmcp=True)
+    closed.writer = None
+    for client in clients + [closed]:
+        server._register_protocol(client)
+
+    assert server.multicast_gmcp("Room.Players", ["Alice", "Bob"]) == 2
+    frame = GmcpMessage("Room.Players", ["Alice", "Bob"]).frame
+    assert [client.transport.writes for client in clients] == [[frame], [], [frame]]
+
+    message = GmcpMessage("Core.Goodbye")
+    assert server.multicast_gmcp(message, clients=clients[:1]) == 1
+    assert clients[0].transport.writes[-1] == message.frame
+
+
+def test_admission_control_limits(monkeypatch):
+    """AdmissionControl refuses by sessions, per-address sessions, and rate."""
+    from telnetlib3 import server as server_module
+    from telnetlib3.server import AdmissionControl
+
+    now = [100.0]
+    monkeypatch.setattr(server_module.time, "monotonic", lambda: now[0])
+
+    assert not AdmissionControl().enabled
+    admission = AdmissionControl(max_sessions=3, max_sessions_per_ip=2)
+    assert admission.enabled
+    assert admission.admit("10.0.0.1") is None
+    assert admission.admit("10.0.0.1") is None
+    assert admission.admit("10.0.0.1") == "per_ip"
+    assert admission.admit("10.0.0.2") is None
+    assert admission.admit("10.0.0.3") == "sessions"
+    assert admission.sessions == 3
+    assert admission.sessions_by_ip == {"10.0.0.1": 2, "10.0.0.2": 1}
+    admission.release("10.0.0.2")
+    admission.release("10.0.0.2")
+    assert admission.sessions == 2
+    assert admission.sessions_by_ip == {"10.0.0.1": 2}
+    assert admission.accepted == 3
+    assert admission.rejected == {"sessions": 1, "per_ip": 1, "rate": 0}
+
+    admission = AdmissionControl(accept_rate=2, accept_burst=3)
+    assert [admission.admit("10.0.0.1") for _ in range(4)] == [None, None, None, "rate"]
+    now[0] += 0.5
+    assert admission.admit("10.0.0.1") is None
+    assert admission.admit("10.0.0.1") == "rate"
+    assert "rejected=2" in repr(admission)
+
+    with pytest.raises(ValueError):
+        AdmissionControl(max_sessions=-1)
+
+
+@pytest.mark.asyncio
+async def test_admission_reject_early(bind_host, unused_tcp_port):
+    """Connections over max_sessions are closed without constructing a protocol."""
+    from telnetlib3.telopt import WONT, TTYPE
+    from telnetlib3.tests.accessories import create_server, asyncio_connection
+
+    async with create_server(
+        host=bind_host, port=unused_tcp_port, connect_maxwait=0.5, max_sessions=1
+    ) as server:
+        async with asyncio_connection(bind_host, unused_tcp_port) as (_, writer):
+            writer.write(b"\xff" + WONT + TTYPE)
+            await asyncio.wait_for(server.wait_for_client(), 2.0)
+            async with asyncio_connection(bind_host, unused_tcp_port) as (reader2, _):
+                assert await asyncio.wait_for(reader2.read(), 2.0) == b""
+            assert len(server.clients) == 1
+            assert server.admission.sessions == 1
+            assert server.admission.rejected["sessions"] == 1
+        for _ in range(50):
+            if server.admission.sessions == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert server.admission.sessions == 0
+        assert server.admission.sessions_by_ip == {}
+
+        # the released slot admits another session
+        async with asyncio_connection(bind_host, unused_tcp_port) as (_, writer):
+            writer.write(b"\xff" + WONT + TTYPE)
+            await asyncio.wait_for(server.wait_for_client(), 2.0)
+        assert server.admission.accepted == 2
+
+
+@pytest.mark.asyncio
+async def test_admission_release_by_close_callback():
+    """A session slot is released by the close callback, or by forwarding to a plain protocol."""
+    from telnetlib3.server import TelnetServer, AdmissionControl, _AdmissionProtocol
+    from telnetlib3.tests.accessories import MockTransport
+
+    class _Proto(TelnetServer):
+        def connection_lost(self, exc):
+            super().connection_lost(exc)
+
+    class _PlainProto(asyncio.Protocol):
+        def __init__(self):
+            self.events = []
+
+        def connection_made(self, transport):
+            self.events.append("made")
+
+        def data_received(self, data):
+            self.events.append(data)
+
+        def eof_received(self):
+            self.events.append("eof")
+
+        def connection_lost(self, exc):
+            self.events.append("lost")
+
+    class _Transport(MockTransport):
+        protocol = None
+
+        def set_protocol(self, protocol):
+            self.protocol = protocol
+
+    admission = AdmissionControl(max_sessions=2)
+    transport = _Transport()
+    transport.extra["peername"] = ("10.0.0.1", 1234)
+    _AdmissionProtocol(admission, lambda: _Proto(connect_maxwait=0.05)).connection_made(transport)
+    protocol = transport.protocol
+    assert "connection_lost" not in vars(protocol)
+    assert admission.sessions == 1
+    protocol.connection_lost(None)
+    assert admission.sessions == 0
+
+    plain = _PlainProto()
+    admitting = _AdmissionProtocol(admission, lambda: plain)
+    admitting.connection_made(transport)
+    assert admission.sessions_by_ip == {"10.0.0.1": 1}
+    admitting.data_received(b"hi")
+    admitting.eof_received()
+    admitting.connection_lost(None)
+    admitting.connection_lost(None)
+    assert plain.events == ["made", b"hi", "eof", "lost"]
+    assert admission.sessions == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_busy_shell(bind_host, unused_tcp_port):
+    """With reject_early=False, connections over the limit receive a busy message."""
+    from telnetlib3.tests.accessories import create_server, asyncio_connection
+
+    async with create_server(
+        host=bind_host,
+        port=unused_tcp_port,
+        connect_maxwait=0.1,
+        max_sessions_per_ip=1,
+        reject_early=False,
+    ) as server:
+        async with asyncio_connection(bind_host, unused_tcp_port):
+            await asyncio.wait_for(server.wait_for_client(), 2.0)
+            async with asyncio_connection(bind_host, unused_tcp_port) as (reader2, _):
+                data = b""
+                while b"busy" not in data:
+                    data += await asyncio.wait_for(reader2.read(1024), 2.0)
+            assert server.admission.sessions == 1
+            assert server.admission.rejected["per_ip"] == 1
+
+
+def test_status_logger_format_rejected():
+    """StatusLogger reports connections refused by admission control."""
+    status_logger = StatusLogger(None, 60)
+    status = {"count": 0, "clients": [], "rejected": {"sessions": 0, "per_ip": 3, "rate": 1}}
+    assert status_logger._status_changed(status)
+    assert status_logger._format_status(status) == (
+        "0 clients connected; rejected per_ip=3, rate=1"
+    )
+    status["rejected"] = {"sessions": 0, "per_ip": 0, "rate": 0}
+    assert not status_logger._status_changed(status)
+    assert status_logger._format_status(status) == "0 clients connected"
+
+
+def test_status_logger_tls_handshakes():
+    """StatusLogger reports counts, rate, and duration of TLS handshakes."""
+    from telnetlib3.server import Server, TLSHandshakeStats
+
+    server = Server(None)
+    server.tls_stats = stats = TLSHandshakeStats()
+    status_logger = StatusLogger(server, 60)
+    status = status_logger._get_status()
+    assert status["tls"]["completed"] == 0
+    assert not status_logger._status_changed(status)
+
+    stats.record(0.004, resumed=False)
+    stats.record(0.002, resumed=True)
+    stats.record_failure()
+    assert repr(stats) == "<TLSHandshakeStats completed=2 resumed=1 failed=1 mean=3.0ms>"
+    status = status_logger._get_status()
+    assert status_logger._status_changed(status)
+    status["tls"]["rate"] = 0.5
+    assert status_logger._format_status(status) == (
+        "0 clients connected; tls handshakes=2 (resumed=1, failed=1), 0.5/s, mean=3.0ms, max=4.0ms"
+    )
+    # mean of handshakes since the last sample
+    stats.record(0.010)
+    assert status_logger._get_status()["tls"]["mean_ms"] == 10.0
+
+
+def test_parse_server_args_admission():
+    """Admission control arguments are parsed for create_server."""
+    with patch(
+        "sys.argv",
+        ["server", "--max-sessions", "100", "--max-sessions-per-ip=4", "--accept-rate", "2.5"],
+    ):
+        result = parse_server_args()
+    assert result["max_sessions"] == 100
+    assert result["max_sessions_per_ip"] == 4
+    assert result["accept_rate"] == 2.5
+    assert result["accept_burst"] is None
+    assert result["reject_early"] is True
+    with patch("sys.argv", ["server", "--no-reject-early", "--accept-burst", "8"]):
+        result = parse_server_args()
+    assert result["reject_early"] is False
+    assert result["accept_burst"] == 8
+
+
+def test_parse_server_args_metrics_port():
+    """--metrics-port is parsed for run_server."""
+    with patch("sys.argv", ["server"]):
+        assert parse_server_args()["metrics_port"] == 0
+    with patch("sys.argv", ["server", "--metrics-port", "9464"]):
+        assert parse_server_args()["metrics_port"] == 9464
+
+
+def test_parse_server_args_write_limit():
+    """--write-limit, --write-policy, and --write-timeout are parsed for run_server."""
+    with patch("sys.argv", ["server"]):
+        result = parse_server_args()
+    assert (result["write_limit"], result["write_policy"], result["write_timeout"]) == (
+        0,
+        "block",
+        30.0,
+    )
+    argv = "server --write-limit 8192 --write-policy drop --write-timeout 5".split()
+    with patch("sys.argv", argv):
+        result = parse_server_args()
+    assert (result["write_limit"], result["write_policy"], result["write_timeout"]) == (
+        8192,
+        "drop",
+        5.0,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_limit,expected", [(0, None), (8192, ("drop", 8192, 5.0))])
+async def test_run_server_write_limit(write_limit, expected):
+    """run_server gives create_server a WriteLimit when given write_limit."""
+    from telnetlib3.server import run_server
+
+    created_server = MagicMock()
+    loop = asyncio.get_running_loop()
+    wait_future = loop.create_future()
+    wait_future.set_result(None)
+    created_server.wait_closed = MagicMock(return_value=wait_future)
+
+    async def mock_create_server(*args, **kwargs):
+        created_server.write_limit = kwargs["write_limit"]
+        return created_server
+
+    with patch("telnetlib3.server.create_server", side_effect=mock_create_server):
+        with patch.object(loop, "add_signal_handler"):
+            with patch.object(loop, "remove_signal_handler"):
+                await run_server(
+                    host="127.0.0.1",
+                    port=0,
+                    shell=lambda r, w: None,
+                    status_interval=0,
+                    write_limit=write_limit,
+                    write_policy="drop",
+                    write_timeout=5.0,
+                )
+    limit = created_server.write_limit
+    assert (limit if limit is None else (limit.policy, limit.high, limit.timeout)) == expected
+
+
+@pytest.mark.asyncio
+async def test_run_server_metrics_port(unused_tcp_port):
+    """run_server serves the metrics of its server when given metrics_port."""
+    from telnetlib3.server import run_server
+    from telnetlib3.metrics import Metrics
+
+    created_server = MagicMock()
+    loop = asyncio.get_running_loop()
+    wait_future = loop.create_future()
+    created_server.wait_closed = MagicMock(return_value=wait_future)
+
+    async def mock_create_server(*args, **kwargs):
+        created_server.metrics = kwargs["metrics"]
+        return created_server
+
+    with patch("telnetlib3.server.create_server", side_effect=mock_create_server):
+        with patch.object(loop, "add_signal_handler"):
+            with patch.object(loop, "remove_signal_handler"):
+                task = asyncio.ensure_future(
+                    run_server(
+                        host="127.0.0.1",
+                        port=0,
+                        shell=lambda r, w: None,
+                        status_interval=0,
+                        metrics_port=unused_tcp_port,
+                    )
+                )
+                await asyncio.sleep(0.05)
+                assert isinstance(created_server.metrics, Metrics)
+                reader, writer = await asyncio.open_connection("localhost", unused_tcp_port)
+                writer.write(b"GET /metrics HTTP/1.0\r\n\r\n")
+                response = await asyncio.wait_for(reader.read(), 2.0)
+                writer.close()
+                wait_future.set_result(None)
+                await task
+    assert response.startswith(b"HTTP/1.0 200 OK")
+    assert b"telnetlib3_connections_opened_total 0" in response
+    with pytest.raises(OSError):
+        await asyncio.open_connection("localhost", unused_tcp_port)
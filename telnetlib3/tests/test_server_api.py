@@ -138,20 +138,110 @@ async def test_enqueue_client_queue_full():
     assert server._new_client.qsize() == 1
 
 
-async def test_register_protocol_prunes_dead():
-    """_register_protocol removes closed protocols before appending."""
+async def test_register_protocol_removed_on_connection_lost():
+    """Registered protocols, and their index entries, are removed on connection lost."""
     from telnetlib3.server import Server
 
-    class _FakeProto:
-        _closing = True
-        _waiter_connected = None
+    class _FakeProto(asyncio.Protocol):
+        def __init__(self, ip):
+            self._waiter_connected = asyncio.get_running_loop().create_future()
+            self._extra = {"peername": (ip, 1234), "TERM": "XTERM"}
+            self._close_callbacks = []
+            self.lost = []
 
-    class _LiveProto:
-        _closing = False
-        _waiter_connected = asyncio.Future()
+        def get_extra_info(self, name, default=None):
+            return self._extra.get(name, default)
+
+        def _add_close_callback(self, callback):
+            self._close_callbacks.append(callback)
+
+        def connection_lost(self, exc):
+            callbacks, self._close_callbacks = self._close_callbacks, []
+            for callback in callbacks:
+                callback()
+            self.lost.append(exc)
 
     server = Server(None)
-    server._protocols = [_FakeProto()]
-    server._register_protocol(_LiveProto())
-    assert len(server._protocols) == 1
-    assert isinstance(server._protocols[0], _LiveProto)
+    p1, p2 = _FakeProto("10.0.0.1"), _FakeProto("10.0.0.2")
+    server._register_protocol(p1)
+    server._register_protocol(p2)
+    p1._waiter_connected.set_result(None)
+    await asyncio.sleep(0)
+    assert server.clients == [p1, p2]
+    assert list(server.iter_clients()) == [p1, p2]
+    assert server.client_count == 2
+    assert server.clients_by_ttype("xterm") == [p1]
+    assert server.clients_by_ip("10.0.0.2") == [p2]
+    server.tag_client(p1, "lobby")
+    server.tag_client(p2, "lobby")
+    assert server.clients_by_tag("lobby") == [p1, p2]
+
+    p1.connection_lost(None)
+    p1.connection_lost(None)
+    assert p1.lost == [None, None]
+    assert server.clients == [p2]
+    assert server.clients_by_ttype("xterm") == []
+    assert server.clients_by_ip("10.0.0.1") == []
+    assert server.clients_by_tag("lobby") == [p2]
+    # a disconnected protocol is not tagged
+    server.tag_client(p1, "lobby")
+    assert server.clients_by_tag("lobby") == [p2]
+
+    server.untag_client(p2, "lobby")
+    server.untag_client(p2, "lobby")
+    assert server.clients_by_tag("lobby") == []
+    assert server._index["tag"] == {}
+    p2.connection_lost(None)
+    assert server.client_count == 0
+    assert server._index == {"ip": {}, "ttype": {}, "tag": {}}
+
+
+async def test_server_client_lookups(bind_host, unused_tcp_port):
+    """Connected clients are found by remote address, terminal type, and tag."""
+    from telnetlib3.tests.accessories import open_connection
+
+    async with create_server(host=bind_host, port=unused_tcp_port, connect_maxwait=0.5) as server:
+        async with open_connection(
+            host=bind_host, port=unused_tcp_port, term="xterm-256color", connect_maxwait=0.5
+        ):
+            client = await asyncio.wait_for(server.wait_for_client(), 2.0)
+            assert server.clients_by_ip(bind_host) == [client]
+            assert server.clients_by_ip("192.0.2.1") == []
+            assert server.clients_by_ttype("XTERM-256COLOR") == [client]
+            server.tag_client(client, ("room", 1))
+            assert server.clients_by_tag(("room", 1)) == [client]
+        for _ in range(50):
+            if not server.client_count:
+                break
+            await asyncio.sleep(0.01)
+        assert server.clients == []
+        assert server.clients_by_ip(bind_host) == []
+        assert server.clients_by_tag(("room", 1)) == []
+
+
+async def test_server_client_unregistered_by_base_connection_lost(bind_host, unused_tcp_port):
+    """A protocol is unregistered by BaseServer.connection_lost, also when it is overridden."""
+    from telnetlib3.server import TelnetServer
+
+    lost = []
+
+    class _Proto(TelnetServer):
+        def connection_lost(self, exc):
+            lost.append(exc)
+            super().connection_lost(exc)
+
+    async with create_server(
+        host=bind_host, port=unused_tcp_port, protocol_factory=_Proto, connect_maxwait=0.5
+    ) as server:
+        async with asyncio_connection(bind_host, unused_tcp_port) as (reader, writer):
+            writer.write(IAC + WONT + TTYPE)
+            client = await asyncio.wait_for(server.wait_for_client(), 0.5)
+            assert "connection_lost" not in vars(client)
+            server.tag_client(client, "lobby")
+        for _ in range(50):
+            if lost:
+                break
+            await asyncio.sleep(0.01)
+        assert lost == [None]
+        assert server.clients == []
+        assert server._index == {"ip": {}, "ttype": {}, "tag": {}}
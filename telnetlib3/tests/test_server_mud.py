@@ -15,6 +15,19 @@ import server_mud as mud
 from telnetlib3.telopt import GMCP, MSDP, MSSP, WILL
 
 
+class MudMockState:
+    """Mock of writer.mud_state, recording each change as sent."""
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def set(self, package, data=None):
+        self.writer._gmcp.append((package, data))
+
+    def set_msdp(self, variables):
+        self.writer._msdp.append(variables)
+
+
 class MudMockWriter:
     """Mock writer for MUD command tests."""
 
@@ -24,6 +37,7 @@ class MudMockWriter:
         self._gmcp = []
         self._msdp = []
         self._iac_calls = []
+        self.mud_state = MudMockState(self)
 
     def write(self, data):
         self.written.append(data)
@@ -11,6 +11,7 @@ from telnetlib3 import slc as slc_mod
 from telnetlib3 import client_shell as cs
 from telnetlib3 import guard_shells as gs
 from telnetlib3 import server_shell as ss
+from telnetlib3.stream_reader import TelnetReader, TelnetReaderUnicode
 from telnetlib3._session_context import TelnetSessionContext
 
 
@@ -223,6 +224,49 @@ def test_connection_counter_release():
 @pytest.mark.asyncio
 async def test_read_line_inner(input_data, max_len, expected):
     assert await gs._read_line_inner(MockReader(list(input_data)), max_len) == expected
+    reader = TelnetReader()
+    reader.feed_data(input_data.encode("latin-1"))
+    reader.feed_eof()
+    assert await gs._read_line_inner(reader, max_len) == expected
+
+
+@pytest.mark.asyncio
+async def test_read_line_inner_leaves_following_input():
+    reader = _unicode_reader(b"first\rsecond\r", encoding="latin-1")
+    assert await gs._read_line_inner(reader, 100) == "first"
+    assert bytes(reader._buffer) == b"second\r"
+
+
+@pytest.mark.asyncio
+async def test_read_line_inner_multibyte():
+    reader = _unicode_reader("abcd夢xyz\r".encode("utf-8"))
+    assert await gs._read_line_inner(reader, 5) == "abcd夢"
+
+    # a partial character is not mistaken for EOF
+    reader = _unicode_reader("夢".encode("utf-8")[:1], eof=False)
+    task = asyncio.ensure_future(gs._read_line_inner(reader, 100))
+    await asyncio.sleep(0.01)
+    assert not task.done()
+    reader.feed_data("夢".encode("utf-8")[1:] + b"\r")
+    assert await asyncio.wait_for(task, 1.0) == "夢"
+
+
+@pytest.mark.asyncio
+async def test_read_cpr_response_partial_character():
+    reader = _unicode_reader(b"\xc3", eof=False)
+    task = asyncio.ensure_future(gs._read_cpr_response(reader))
+    await asyncio.sleep(0.01)
+    assert not task.done()
+    reader.feed_data(b"\xa9\x1b[5;10R")
+    assert await asyncio.wait_for(task, 1.0) == (5, 10)
+
+
+@pytest.mark.asyncio
+async def test_read_cpr_response_leaves_following_input():
+    reader = TelnetReader()
+    reader.feed_data(b"x\x1b[5;10Rtyped")
+    assert await gs._read_cpr_response(reader) == (5, 10)
+    assert bytes(reader._buffer) == b"typed"
 
 
 @pytest.mark.asyncio
@@ -1077,3 +1121,136 @@ async def test_busy_shell_second_timeout(monkeypatch):
     assert "Machine is busy" in written
     assert "distant explosion" in written
     assert call_count[0] == 2
+
+
+def _unicode_reader(data, encoding="utf-8", eof=True):
+    reader = TelnetReaderUnicode(fn_encoding=lambda incoming: encoding)
+    reader.feed_data(data)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+@pytest.mark.asyncio
+async def test_readline_async_paste_leaves_following_lines_buffered():
+    reader = _unicode_reader(b"first\r\nsecond\nthird")
+    writer = MockWriter()
+    assert await ss.readline_async(reader, writer) == "first"
+    assert bytes(reader._buffer) == b"\nsecond\nthird"
+    assert writer.written == ["first"]
+    assert await ss.readline_async(reader, writer) == "second"
+    assert await ss.readline_async(reader, writer) is None
+
+
+@pytest.mark.asyncio
+async def test_readline_async_binary_reader_escape_sequence():
+    reader = TelnetReader()
+    reader.feed_data(b"ab\x7fc\x1b[Ad\r")
+    writer = MockBinaryWriter()
+    assert await ss.readline_async(reader, writer) == "acd"
+
+
+@pytest.mark.asyncio
+async def test_readline_async_sequence_and_multibyte_split():
+    reader = _unicode_reader(b"x\x1b[1;", eof=False)
+    data = "\u30b3y\r".encode("utf-8")
+    task = asyncio.create_task(ss.readline_async(reader, MockWriter()))
+    await asyncio.sleep(0)
+    reader.feed_data(b"2H" + data[:1])
+    await asyncio.sleep(0)
+    reader.feed_data(data[1:])
+    assert await asyncio.wait_for(task, 0.5) == "x\u30b3y"
+
+
+@pytest.mark.asyncio
+async def test_readline_async_unterminated_sequence_before_cr():
+    reader = _unicode_reader(b"a\x1b[12\r")
+    assert await ss.readline_async(reader, MockWriter()) == "a12"
+
+
+@pytest.mark.asyncio
+async def test_readline_async_atascii_eol():
+    reader = _unicode_reader(b"hi\x9bnext", encoding="atascii")
+    assert await ss.readline_async(reader, MockWriter()) == "hi"
+    assert bytes(reader._buffer) == b"next"
+
+
+@pytest.mark.asyncio
+async def test_readline_async_paste_maxvis_wide():
+    reader = _unicode_reader("a\u30b3\u30b3x".encode("utf-8") * 100 + b"\r")
+    writer = MockWriter()
+    assert await ss.readline_async(reader, writer, max_visible_width=5) == "a\u30b3\u30b3"
+    assert writer.written == ["a\u30b3\u30b3"]
+
+
+@pytest.mark.parametrize(
+    "text,expected_cmd,expected_width",
+    [
+        pytest.param("abc\u30b3\r", "abc", 3, id="wide_rejected"),
+        pytest.param("ab\u30b3\r", "ab\u30b3", 4, id="wide_fits"),
+        pytest.param("abce\u0301\r", "abce\u0301", 4, id="combining_extends"),
+        pytest.param("ab\u30b3\x7fc\r", "abc", 3, id="backspace_wide"),
+    ],
+)
+def test_line_editor_feed_text_width(text, expected_cmd, expected_width):
+    editor = ss._LineEditor(max_visible_width=4)
+    _, cmd = editor.feed_text(text[:-1])
+    assert cmd is None
+    assert editor.width == expected_width
+    assert editor.feed_text(text[-1]) == ("", expected_cmd)
+    assert editor.width == 0
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        pytest.param("plain", ("plain", ""), id="no_escape"),
+        pytest.param("a\x1b[Ab\x1bOPc", ("abc", ""), id="csi_ss3"),
+        pytest.param("a\x1b]0;title\x07b", ("ab", ""), id="osc"),
+        pytest.param("a\x1b!b", ("a!b", ""), id="esc_non_sequence"),
+        pytest.param("a\x1b", ("a", "\x1b"), id="trailing_esc"),
+        pytest.param("a\x1bO", ("a", "\x1bO"), id="trailing_ss3"),
+        pytest.param("a\x1b[1;2", ("a", "\x1b[1;2"), id="trailing_csi"),
+        pytest.param("\x1b[" + "0" * 300, ("0" * 300, ""), id="csi_too_long"),
+    ],
+)
+def test_strip_sequences(text, expected):
+    assert ss._strip_sequences(text) == expected
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.asyncio
+async def test_ansi_filtering_reader_read(binary):
+    reader = TelnetReader() if binary else _unicode_reader(b"", eof=False)
+    filtered = ss.AnsiFilteringReader(reader)
+    reader.feed_data(b"ab\x1b[A\x1bOPcd\x1b[1;")
+    assert await filtered.read(3) == (b"abc" if binary else "abc")
+    assert await filtered.read(10) == (b"d" if binary else "d")
+    reader.feed_data(b"2He\x1b")
+    reader.feed_eof()
+    assert await filtered.read() == (b"e" if binary else "e")
+    assert filtered.at_eof()
+    assert await filtered.read(1) == (b"" if binary else "")
+
+
+@pytest.mark.asyncio
+async def test_ansi_filtering_reader_readline():
+    filtered = ss.AnsiFilteringReader(
+        _unicode_reader(b"one\x1b[B\r\ntw\x1b]0;t\x07o\r\x00three\nfour\rfive")
+    )
+    lines = [await filtered.readline() for _ in range(6)]
+    assert lines == ["one\r\n", "two\r", "three\n", "four\r", "five", ""]
+
+
+@pytest.mark.asyncio
+async def test_ansi_filtering_reader_readline_waits_across_sequences():
+    reader = _unicode_reader(b"a\x1b[", eof=False)
+    filtered = ss.AnsiFilteringReader(reader)
+    task = asyncio.create_task(filtered.readline())
+    await asyncio.sleep(0)
+    reader.feed_data(b"Cb")
+    await asyncio.sleep(0)
+    assert not task.done()
+    reader.feed_data(b"\n")
+    assert await asyncio.wait_for(task, 0.5) == "ab\n"
+    assert repr(filtered).startswith("<AnsiFilteringReader buffered=0 ")
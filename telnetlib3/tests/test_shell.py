@@ -134,7 +134,8 @@ async def test_telnet_server_given_shell(bind_host, unused_tcp_port):
                 (
                     (b"\bhel\blp\r"),
                     (
-                        b"\r\nquit, writer, slc, linemode, toggle [option|all], reader, proto, dump"
+                        b"\r\nquit, writer, slc, linemode, toggle [option|all], reader, proto, "
+                        b"latency [on|off], dump"
                         b"\r\ntel:sh> "
                     ),
                 ),
@@ -4,7 +4,8 @@
 import pytest
 
 # local
-from telnetlib3.slc import Forwardmask
+from telnetlib3 import slc
+from telnetlib3.slc import SLCTable, Forwardmask
 
 
 def test_forwardmask_description_table_nonzero_byte():
@@ -28,3 +29,77 @@ def test_forwardmask_contains():
     fm = Forwardmask(bytes(value), ack=False)
     assert 0 in fm
     assert 1 not in fm
+
+
+def test_generate_slctab_matches_tabset():
+    tab = slc.generate_slctab()
+    assert isinstance(tab, SLCTable)
+    assert len(tab) == slc.NSLC
+    assert list(tab) == [bytes([func]) for func in range(1, slc.NSLC + 1)]
+    for func, slc_def in tab.items():
+        expected = slc.BSD_SLC_TAB.get(func, slc.SLC_nosupport())
+        assert (slc_def.mask, slc_def.val) == (expected.mask, expected.val)
+
+
+def test_slctab_bounds():
+    tab = slc.generate_slctab()
+    assert slc.SLC_EC in tab
+    assert slc.theNULL not in tab
+    assert bytes([slc.NSLC + 1]) not in tab
+    assert tab.get(slc.theNULL) is None
+    with pytest.raises(KeyError):
+        tab[bytes([slc.NSLC + 1])]
+    with pytest.raises(KeyError):
+        tab[slc.theNULL] = slc.SLC()
+
+
+def test_slctab_view_writes_through():
+    tab = slc.generate_slctab()
+    tab[slc.SLC_EC].set_value(b"\x08")
+    tab[slc.SLC_EC].set_flag(slc.SLC_ACK)
+    assert tab[slc.SLC_EC].val == b"\x08"
+    assert tab[slc.SLC_EC].ack
+    assert tab[slc.SLC_EC].variable
+
+    tab[slc.SLC_EOF] = slc.SLC(slc.SLC_CANTCHANGE, b"\x1a")
+    assert (tab[slc.SLC_EOF].mask, tab[slc.SLC_EOF].val) == (slc.SLC_CANTCHANGE, b"\x1a")
+
+    del tab[slc.SLC_EOF]
+    assert tab[slc.SLC_EOF].nosupport
+    assert len(tab) == slc.NSLC
+
+
+def test_slctab_copy_on_write():
+    first, second = slc.generate_slctab(), slc.generate_slctab()
+    assert first._masks is second._masks
+    assert first._values is second._values
+
+    first[slc.SLC_IP].set_value(b"\x04")
+    assert first[slc.SLC_IP].val == b"\x04"
+    assert second[slc.SLC_IP].val == b"\x03"
+    assert slc.BSD_SLC_TAB[slc.SLC_IP].val == b"\x03"
+    assert slc.generate_slctab()[slc.SLC_IP].val == b"\x03"
+
+    copied = first.copy()
+    assert copied[slc.SLC_IP].val == b"\x04"
+    first[slc.SLC_IP].set_value(b"\x05")
+    assert copied[slc.SLC_IP].val == b"\x04"
+
+
+def test_slctab_from_dict():
+    tab = slc.generate_slctab({slc.SLC_EC: slc.SLC(slc.SLC_VARIABLE, b"\x08")})
+    assert tab[slc.SLC_EC].val == b"\x08"
+    assert tab[slc.SLC_IP].nosupport
+    assert "SLC_EC" in repr(tab)
+
+
+@pytest.mark.parametrize("byte", [bytes([value]) for value in range(256)])
+def test_snoop_slctab_matches_dict(byte):
+    tab = slc.generate_slctab()
+    callbacks = {slc.SLC_IP: print}
+    callback, func, slc_def = slc.snoop(byte, tab, callbacks)
+    expected = slc.snoop(byte, dict(tab), callbacks)
+    assert (callback, func) == expected[:2]
+    assert (slc_def is None) == (expected[2] is None)
+    if slc_def is not None:
+        assert (slc_def.mask, slc_def.val) == (expected[2].mask, expected[2].val)
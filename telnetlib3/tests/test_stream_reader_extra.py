@@ -159,6 +159,20 @@ async def test_unicode_reader_read_zero_and_read_consumes():
     assert out1 == "c"
 
 
+def test_unicode_decode_encoding_change_keeps_partial_multibyte():
+    encoding = ["utf8"]
+
+    def enc(incoming):
+        return encoding[0]
+
+    ur = TelnetReaderUnicode(fn_encoding=enc)
+    data = "☭".encode("utf-8")
+    assert ur.decode(b"a" + data[:2]) == "a"
+    # CHARSET negotiated, bytes buffered by the previous decoder are carried over
+    encoding[0] = "UTF-8"
+    assert ur.decode(data[2:] + b"b") == "☭b"
+
+
 @pytest.mark.asyncio
 async def test_unicode_readexactly_reads_characters_not_bytes():
     def enc(incoming):
@@ -375,3 +389,54 @@ async def test_readuntil_pattern_invalid_types():
     r = TelnetReader()
     with pytest.raises(ValueError, match="pattern should be a re\\.Pattern"):
         await r.readuntil_pattern(None)
+
+
+@pytest.mark.parametrize(
+    "n,stop,expected,remaining",
+    [
+        pytest.param(-1, b"", b"ab\rcd\ne", b"", id="all"),
+        pytest.param(3, b"", b"ab\r", b"cd\ne", id="limit"),
+        pytest.param(-1, b"\n\r", b"ab\r", b"cd\ne", id="stop_first"),
+        pytest.param(-1, b"\n", b"ab\rcd\n", b"e", id="stop_later"),
+        pytest.param(2, b"\r", b"ab", b"\rcd\ne", id="limit_before_stop"),
+        pytest.param(0, b"", b"", b"ab\rcd\ne", id="zero"),
+    ],
+)
+async def test_read_available(n, stop, expected, remaining):
+    r = TelnetReader()
+    r.feed_data(b"ab\rcd\ne")
+    assert await r.read_available(n, stop) == expected
+    assert bytes(r._buffer) == remaining
+
+
+async def test_read_available_waits_then_eof():
+    r = TelnetReader()
+    task = asyncio.create_task(r.read_available())
+    await asyncio.sleep(0.01)
+    assert not task.done()
+    r.feed_data(b"xy")
+    assert await asyncio.wait_for(task, 0.5) == b"xy"
+    r.feed_eof()
+    assert await r.read_available() == b""
+
+
+async def test_read_available_unicode_partial_multibyte():
+    r = TelnetReaderUnicode(fn_encoding=lambda incoming: "utf-8")
+    data = "aコ".encode("utf-8")
+    r.feed_data(data[:-1])
+    assert await r.read_available() == "a"
+    assert not r.at_eof()
+    r.feed_data(data[-1:] + b"\rz")
+    assert await r.read_available(stop=b"\r") == "コ\r"
+    assert await r.read_available() == "z"
+
+
+async def test_read_raw_returns_decoder_pending_bytes():
+    r = TelnetReaderUnicode(fn_encoding=lambda incoming: "utf-8")
+    data = "aé".encode("utf-8")
+    r.feed_data(data[:-1])
+    assert await r.read(10) == "a"
+    r.feed_data(data[-1:] + b"z")
+    assert await r.read_raw(10) == "éz".encode("utf-8")
+    r.feed_data("é".encode("utf-8"))
+    assert await r.read(10) == "é"
@@ -20,6 +20,7 @@ from telnetlib3.telopt import (
     EOR,
     ESC,
     IAC,
+    MXP,
     NOP,
     SGA,
     VAR,
@@ -62,6 +63,7 @@ from telnetlib3.server_base import BaseServer
 from telnetlib3.stream_writer import (
     Option,
     TelnetWriter,
+    ProtocolTrace,
     TelnetWriterUnicode,
     _decode_env_buf,
     _encode_env_buf,
@@ -79,6 +81,82 @@ def new_writer(server=True, client=False, reader=None):
     return w, t, p
 
 
+def test_lazy_containers_created_on_first_access():
+    w, _, _ = new_writer(server=True)
+    assert w._rejected_will is None
+    assert w._zmp_data is None
+    assert w._ctx is None
+    rejected = w.rejected_will
+    assert rejected == set()
+    assert w.rejected_will is rejected
+    assert w.zmp_data == []
+    assert w.ctx is w.ctx
+
+    w.always_do = {MXP}
+    assert w._always_do == {MXP}
+    w2, _, _ = new_writer(server=True)
+    assert w2.always_do == set()
+    assert TelnetWriter.always_do.factory is set
+
+
+def test_lazy_containers_not_created_by_negotiation():
+    w, _, _ = new_writer(server=True)
+    w.handle_do(BINARY)
+    w.handle_will(BINARY)
+    assert w._always_will is None
+    assert w._always_do is None
+    assert w._always_wont is None
+    assert w._always_dont is None
+    assert w._passive_do is None
+
+
+def test_default_callbacks_resolved_by_name():
+    seen = []
+
+    class Writer(TelnetWriter):
+        def handle_nop(self, cmd):
+            seen.append(cmd)
+
+    w = Writer(MockTransport(), MockProtocol(), server=True)
+    assert NOP in w._iac_callback
+    assert w._iac_callback[NOP] == w.handle_nop
+    assert w._slc_callback.get(slc.SLC_IP) == w.handle_ip
+    assert w._slc_callback.get(b"\xfe") is None
+    assert len(w._ext_offer_callback) == 2
+    w.feed_byte(IAC)
+    w.feed_byte(NOP)
+    assert seen == [NOP]
+
+    callback = seen.clear
+    w.set_iac_callback(NOP, callback)
+    assert w._iac_callback[NOP] is callback
+    assert len(w._iac_callback) == 14
+    del w._iac_callback[NOP]
+    assert NOP not in w._iac_callback
+    with pytest.raises(KeyError):
+        del w._iac_callback[NOP]
+
+
+def test_writer_slots_allow_application_attributes():
+    w, _, _ = new_writer(server=True)
+    assert not hasattr(w, "custom_state")
+    w.custom_state = 42
+    assert w.custom_state == 42
+    w.lflow = False
+    assert w.lflow is False
+    assert TelnetWriter.lflow is True
+
+
+def test_sb_buffer_released_after_subnegotiation():
+    w, _, _ = new_writer(server=True)
+    assert w._sb_buffer == ()
+    w.set_ext_callback(NAWS, lambda rows, cols: None)
+    w.remote_option[NAWS] = True
+    for byte in IAC + SB + NAWS + b"\x00\x50\x00\x19" + IAC + SE:
+        w.feed_byte(bytes([byte]))
+    assert w._sb_buffer == ()
+
+
 def test_close_idempotent_and_cleanup():
     w, t, p = new_writer(server=True)
     assert not w.connection_closed
@@ -1723,3 +1801,92 @@ def test_handle_will_client_directional_refusal():
     w.handle_will(TTYPE)
     assert t.writes[-1] == IAC + DONT + TTYPE
     assert TTYPE in w.directional_refusals
+
+
+def test_negotiation_debug_logged(caplog):
+    """Negotiation is logged with command and option names when DEBUG is enabled."""
+    w, _, _ = new_writer(server=True)
+    with caplog.at_level(logging.DEBUG, logger="telnetlib3.stream_writer"):
+        for byte in (IAC, WILL, TTYPE):
+            w.feed_byte(byte)
+        w.iac(DO, ECHO)
+    assert "recv IAC WILL TTYPE" in caplog.messages
+    assert "handle_will(TTYPE)" in caplog.messages
+    assert "send IAC DO ECHO" in caplog.messages
+    assert "pending_option[DO + ECHO] = True" in caplog.messages
+
+
+def test_negotiation_not_formatted_without_debug(monkeypatch):
+    """Command and option names are not formatted when DEBUG is disabled."""
+    from telnetlib3 import stream_writer
+
+    def fail(byte):
+        raise AssertionError(f"formatted {byte!r}")
+
+    monkeypatch.setattr(stream_writer, "name_command", fail)
+    monkeypatch.setattr(stream_writer, "name_option", fail)
+    w, t, _ = new_writer(server=True)
+    monkeypatch.setattr(w.log, "isEnabledFor", lambda level: level > logging.DEBUG)
+    for byte in (IAC, WILL, TTYPE, IAC, SB, NAWS, b"\x00", b"\x50", b"\x00", b"\x19", IAC, SE):
+        w.feed_byte(byte)
+    w.iac(DO, ECHO)
+    assert t.writes[-1] == IAC + DO + ECHO
+
+
+def test_protocol_trace_records_commands():
+    """ProtocolTrace records telnet commands received and sent by the writer."""
+    w, _, _ = new_writer(server=True)
+    assert w.trace is None
+    w.trace = trace = ProtocolTrace(maxlen=16)
+    for byte in (IAC, WILL, TTYPE, IAC, NOP, IAC, SB, NAWS, b"\x00", b"\x50"):
+        w.feed_byte(byte)
+    for byte in (b"\x00", b"\x19", IAC, SE):
+        w.feed_byte(byte)
+    w.iac(DO, ECHO)
+    w.send_iac(IAC + GA + IAC + SB + TTYPE + SEND + IAC + SE + IAC + WONT + LINEMODE)
+    events = [event[1:] for event in trace]
+    assert events == [
+        ("recv", WILL, TTYPE),
+        ("send", SB, TTYPE),
+        ("recv", NOP, None),
+        ("recv", SB, NAWS),
+        ("send", DO, ECHO),
+        ("send", GA, None),
+        ("send", SB, TTYPE),
+        ("send", WONT, LINEMODE),
+    ]
+    stamps = [event[0] for event in trace]
+    assert stamps == sorted(stamps) and stamps[0] >= trace.started
+    lines = trace.dump().splitlines()
+    assert lines[0].endswith(" recv WILL TTYPE")
+    assert lines[2].endswith(" recv NOP")
+    assert len(trace) == 8
+    assert repr(trace) == "<ProtocolTrace 8/16 events>"
+    trace.clear()
+    assert not trace.dump()
+
+
+def test_protocol_trace_ring_buffer():
+    """Only the most recent events are kept."""
+    trace = ProtocolTrace(maxlen=2)
+    trace.record_send(IAC + DO + ECHO + IAC + DO + SGA + IAC + SB + NAWS)
+    assert [event[1:] for event in trace] == [("send", DO, SGA), ("send", SB, NAWS)]
+
+
+async def test_protocol_trace_on_connect(bind_host, unused_tcp_port):
+    """create_server() and open_connection() keep a trace of each connection."""
+    from telnetlib3.tests.accessories import create_server, open_connection
+
+    async with create_server(
+        host=bind_host, port=unused_tcp_port, connect_maxwait=0.5, protocol_trace=64
+    ) as server:
+        async with open_connection(
+            host=bind_host, port=unused_tcp_port, connect_maxwait=0.5, protocol_trace=64
+        ) as (_, client_writer):
+            client = await asyncio.wait_for(server.wait_for_client(), 2.0)
+            server_events = [event[1:] for event in client.writer.trace]
+            client_events = [event[1:] for event in client_writer.trace]
+    assert ("send", DO, TTYPE) in server_events
+    assert ("recv", WILL, TTYPE) in server_events
+    assert ("recv", DO, TTYPE) in client_events
+    assert ("send", WILL, TTYPE) in client_events
@@ -19,6 +19,8 @@ import pytest
 import trustme
 
 # local
+from telnetlib3.client import BufferedTelnetClient
+from telnetlib3.server import BufferedTelnetServer
 from telnetlib3.tests.accessories import create_server, open_connection, init_subproc_coverage
 
 
@@ -101,6 +103,51 @@ _start_tls_timeout = pytest.mark.timeout(5 if sys.version_info < (3, 11) else 15
             {},
             id="tls-auto-plain-client",
         ),
+        pytest.param(
+            {"ssl": "server_ssl_ctx", "tls_handshake_workers": 2},
+            {"ssl": "client_ssl_ctx", "server_hostname": "localhost"},
+            id="tls-handshake-workers",
+        ),
+        pytest.param(
+            {"ssl": "server_ssl_ctx", "tls_auto": 1.0, "tls_handshake_workers": 2},
+            {"ssl": "client_ssl_ctx", "server_hostname": "localhost"},
+            id="tls-auto-handshake-workers-tls-client",
+        ),
+        pytest.param(
+            {"ssl": "server_ssl_ctx", "tls_auto": 0.15, "tls_handshake_workers": 2},
+            {},
+            id="tls-auto-handshake-workers-plain-client",
+        ),
+        pytest.param(
+            {"ssl": "server_ssl_ctx", "tls_auto": 1.0, "tls_auto_speculate": 0.5},
+            {"ssl": "client_ssl_ctx", "server_hostname": "localhost"},
+            id="tls-auto-speculate-tls-client",
+            marks=[_start_tls_xfail, _start_tls_timeout],
+        ),
+        pytest.param(
+            {"ssl": "server_ssl_ctx", "tls_auto": 1.0, "tls_auto_speculate": 0.02},
+            {},
+            id="tls-auto-speculate-plain-client",
+        ),
+        pytest.param(
+            {"ssl": "server_ssl_ctx", "protocol_factory": BufferedTelnetServer},
+            {
+                "ssl": "client_ssl_ctx",
+                "server_hostname": "localhost",
+                "client_factory": BufferedTelnetClient,
+            },
+            id="tls-buffered",
+        ),
+        pytest.param(
+            {
+                "ssl": "server_ssl_ctx",
+                "tls_auto": 0.15,
+                "tls_handshake_workers": 2,
+                "protocol_factory": BufferedTelnetServer,
+            },
+            {"client_factory": BufferedTelnetClient},
+            id="tls-auto-handshake-workers-buffered-plain-client",
+        ),
     ],
 )
 async def test_ping_pong(
@@ -153,6 +200,39 @@ async def test_tls_auto_both_clients(bind_host, unused_tcp_port, server_ssl_ctx,
             await asyncio.wait_for(_plain_ok, 2.0)
 
 
+@_start_tls_xfail
+@_start_tls_timeout
+async def test_tls_auto_admission(bind_host, unused_tcp_port, server_ssl_ctx, client_ssl_ctx):
+    """Sessions of a tls_auto server are admitted and released after detection."""
+
+    async def shell(reader, writer):
+        writer.write(await reader.readexactly(3))
+        await writer.drain()
+
+    async with create_server(
+        host=bind_host,
+        port=unused_tcp_port,
+        shell=shell,
+        ssl=server_ssl_ctx,
+        tls_auto=1.0,
+        max_sessions=1,
+    ) as server:
+        for client_kw in ({"ssl": client_ssl_ctx, "server_hostname": "localhost"}, {}):
+            async with open_connection(bind_host, unused_tcp_port, **client_kw, **_FAST_CLIENT) as (
+                reader,
+                writer,
+            ):
+                writer.write("abc")
+                assert await asyncio.wait_for(reader.readexactly(3), 2.0) == "abc"
+                assert server.admission.sessions == 1
+            for _ in range(50):
+                if server.admission.sessions == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert server.admission.sessions == 0
+        assert server.admission.accepted == 2
+
+
 async def test_tls_auto_silent_plain_client(bind_host, unused_tcp_port, server_ssl_ctx):
     """A plain TCP client that sends nothing is handed off after the detect timeout."""
 
@@ -180,6 +260,168 @@ async def test_tls_auto_silent_plain_client(bind_host, unused_tcp_port, server_s
             await writer.wait_closed()
 
 
+def _tls_exchange(port, client_ssl_ctx, session=None):
+    """Send ``ping`` over a blocking TLS connection, return its session and whether resumed."""
+    import socket
+
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+        with client_ssl_ctx.wrap_socket(
+            sock, server_hostname="localhost", session=session
+        ) as tls_sock:
+            tls_sock.sendall(b"ping")
+            data = b""
+            # reading also receives the session tickets of TLS 1.3
+            while b"pong" not in data:
+                data += tls_sock.recv(1024)
+            return tls_sock.session, tls_sock.session_reused
+
+
+@pytest.mark.parametrize(
+    "server_kw",
+    [
+        pytest.param({}, id="event-loop"),
+        pytest.param({"tls_handshake_workers": 2}, id="handshake-workers"),
+        pytest.param({"tls_auto": 1.0, "tls_handshake_workers": 2}, id="tls-auto-workers"),
+        pytest.param(
+            {"tls_auto": 1.0}, id="tls-auto", marks=[_start_tls_xfail, _start_tls_timeout]
+        ),
+    ],
+)
+async def test_tls_session_resumption(
+    bind_host, unused_tcp_port, server_ssl_ctx, client_ssl_ctx, server_kw
+):
+    """A reconnecting client resumes its TLS session, counted by Server.tls_stats."""
+
+    async def shell(reader, writer):
+        await reader.readexactly(4)
+        writer.write("pong")
+        await writer.drain()
+
+    async with create_server(
+        host="127.0.0.1",
+        port=unused_tcp_port,
+        shell=shell,
+        ssl=server_ssl_ctx,
+        encoding="ascii",
+        connect_maxwait=0.05,
+        **server_kw,
+    ) as server:
+        session, reused = await asyncio.to_thread(_tls_exchange, unused_tcp_port, client_ssl_ctx)
+        assert not reused
+        _, reused = await asyncio.to_thread(_tls_exchange, unused_tcp_port, client_ssl_ctx, session)
+        assert reused
+        assert server.tls_stats.completed == 2
+        assert server.tls_stats.resumed == 1
+        assert 0 < server.tls_stats.mean_secs <= server.tls_stats.max_secs
+
+
+async def test_tls_handshake_workers_failure(bind_host, unused_tcp_port, server_ssl_ctx):
+    """A failed handshake performed by tls_handshake_workers is counted and closed."""
+    async with create_server(
+        host=bind_host, port=unused_tcp_port, ssl=server_ssl_ctx, tls_handshake_workers=1
+    ) as server:
+        reader, writer = await asyncio.open_connection(host=bind_host, port=unused_tcp_port)
+        try:
+            # a TLS record header of an unknown content type
+            writer.write(b"\x16\x03\x01\x00\x05hello")
+            with contextlib.suppress(OSError):
+                # closed, with or without a TLS alert
+                await asyncio.wait_for(reader.read(1024), 2.0)
+            for _ in range(100):
+                if server.tls_stats.failed:
+                    break
+                await asyncio.sleep(0.01)
+            assert server.tls_stats.failed == 1
+            assert server.tls_stats.completed == 0
+            assert not server.clients
+        finally:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+
+async def test_tls_handshake_workers_requires_ssl_context():
+    """tls_handshake_workers without ssl raises ValueError."""
+    with pytest.raises(ValueError, match="tls_handshake_workers requires"):
+        async with create_server(host="localhost", port=0, tls_handshake_workers=2):
+            pass
+
+
+async def test_tls_handshake_workers_connection_lost(server_ssl_ctx):
+    """A connection lost during the last handshake step is not handed off, nor admitted."""
+    import concurrent.futures
+
+    from telnetlib3._tls import TLSHandshakeProtocol
+    from telnetlib3.server import AdmissionControl, TLSHandshakeStats, _AdmissionProtocol
+    from telnetlib3.tests.accessories import MockTransport
+
+    loop = asyncio.get_running_loop()
+    admission = AdmissionControl(max_sessions=1)
+    made = []
+
+    def real_factory():
+        return _AdmissionProtocol(admission, lambda: made.append(1) or asyncio.Protocol())
+
+    class LostDuringHandshake:
+        session_reused = False
+
+        def do_handshake(self):
+            # the peer disconnects while this step runs in the executor.
+            asyncio.run_coroutine_threadsafe(lose(), loop).result()
+
+    async def lose():
+        transport.abort()
+        protocol.connection_lost(None)
+
+    stats = TLSHandshakeStats()
+    transport = MockTransport()
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        protocol = TLSHandshakeProtocol(server_ssl_ctx, executor, real_factory, stats)
+        protocol._sslobj = LostDuringHandshake()
+        protocol.connection_made(transport)
+        await asyncio.wait_for(protocol._task, 2.0)
+    assert protocol._tls_transport is None
+    assert not made
+    assert admission.sessions == 0
+    assert stats.completed == 1
+
+
+async def test_tls_auto_speculate_silent_plain_client(bind_host, unused_tcp_port, server_ssl_ctx):
+    """A silent plain client answering a speculative DO TTYPE is detected before the timeout."""
+    from telnetlib3.telopt import DO, IAC, WILL, TTYPE
+
+    shell_started: asyncio.Future[bool] = asyncio.Future()
+
+    async def shell(reader, writer):
+        shell_started.set_result(True)
+
+    async with create_server(
+        host=bind_host,
+        port=unused_tcp_port,
+        shell=shell,
+        ssl=server_ssl_ctx,
+        tls_auto=2.0,
+        tls_auto_speculate=0.02,
+        connect_maxwait=0.35,
+    ) as server:
+        reader, writer = await asyncio.open_connection(host=bind_host, port=unused_tcp_port)
+        try:
+            stime = _time.monotonic()
+            data = await asyncio.wait_for(reader.readexactly(3), 3.0)
+            assert data == IAC + DO + TTYPE
+            writer.write(IAC + WILL + TTYPE)
+            client = await asyncio.wait_for(server.wait_for_client(), 3.0)
+            assert _time.monotonic() - stime < 1.0
+            assert client.writer.remote_option.enabled(TTYPE)
+            await asyncio.wait_for(shell_started, 3.0)
+            # DO TTYPE is not sent twice.
+            data = await asyncio.wait_for(reader.read(1024), 3.0)
+            assert IAC + DO + TTYPE not in data
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
 @pytest.mark.parametrize(
     "client_ssl",
     [
@@ -348,6 +590,9 @@ async def test_tls_auto_cli_args(tmp_path, ca):
         result = parse_server_args()
     assert result["tls_auto"] == 0.5
     assert isinstance(result["ssl"], ssl.SSLContext)
+    assert result["tls_auto_speculate"] == 0
+    assert result["tls_handshake_workers"] == 0
+    assert not result["ssl"].options & ssl.OP_NO_TICKET
 
     with _override_argv(
         [
@@ -357,12 +602,16 @@ async def test_tls_auto_cli_args(tmp_path, ca):
             "--ssl-keyfile",
             key_pem,
             "--tls-auto=0.5",
+            "--tls-handshake-workers=4",
+            "--no-ssl-session-tickets",
             "localhost",
             "6023",
         ]
     ):
         result = parse_server_args()
     assert result["tls_auto"] == 0.5
+    assert result["tls_handshake_workers"] == 4
+    assert result["ssl"].options & ssl.OP_NO_TICKET
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,123 @@
+"""Tests for write-side flow control of TelnetWriter by WriteLimit."""
+
+# std imports
+import asyncio
+
+# 3rd party
+import pytest
+
+# local
+from telnetlib3.telopt import IAC, NOP
+from telnetlib3.metrics import Metrics
+from telnetlib3.stream_writer import WriteLimit, TelnetWriter
+from telnetlib3.tests.accessories import MockProtocol, MockTransport, create_server
+
+
+def new_writer(limit):
+    transport = MockTransport()
+    writer = TelnetWriter(transport, MockProtocol(), server=True)
+    writer.metrics = Metrics()
+    writer.set_write_limit(limit)
+    return writer, transport
+
+
+def test_write_limit_sets_transport_high_water():
+    """The high-water mark of the transport is that of the limit."""
+    _, transport = new_writer(WriteLimit(high=4096))
+    assert transport.extra["write_buffer_limits"] == (4096, None)
+
+
+def test_write_limit_invalid_policy():
+    """Policies not known are refused."""
+    with pytest.raises(ValueError, match="write policy"):
+        new_writer(WriteLimit(policy="shout"))
+
+
+def test_write_limit_drop():
+    """Oldest output is dropped while paused, telnet commands are written, held output resumes."""
+    writer, transport = new_writer(WriteLimit(high=10, policy="drop"))
+    writer.write(b"before")
+    writer._pause_writing()
+    writer.write(b"first!")
+    writer.write(b"second")
+    writer.send_iac(IAC + NOP)
+    assert transport.writes == [b"before", IAC + NOP]
+    buf = writer.write_buffer
+    assert (buf.held_bytes, buf.dropped_bytes, buf.pauses) == (6, 6, 1)
+    assert writer.metrics.write_dropped_bytes == 6
+    assert "write:drop(paused) held:6 dropped:6" in repr(writer)
+    assert repr(buf) == "<WriteBuffer drop high=10 paused held=6 dropped=6 pauses=1>"
+
+    writer._resume_writing()
+    assert transport.writes[-1] == b"second"
+    assert not buf.paused and buf.held_bytes == 0
+    assert buf.paused_secs >= 0
+    writer.write(b"after")
+    assert transport.writes[-1] == b"after"
+
+
+def test_write_limit_block():
+    """Output is written while paused by policy block, left to drain()."""
+    writer, transport = new_writer(WriteLimit(high=10))
+    writer._pause_writing()
+    writer.write(b"0123456789abc")
+    assert transport.writes == [b"0123456789abc"]
+    assert writer.write_buffer.dropped_bytes == 0
+
+
+def test_set_write_limit_none_writes_held_output():
+    """Removing a limit writes output held by it."""
+    writer, transport = new_writer(WriteLimit(high=10, policy="drop"))
+    writer._pause_writing()
+    writer.write(b"held")
+    writer.set_write_limit(None)
+    assert writer.write_buffer is None
+    assert transport.writes == [b"held"]
+
+
+async def test_write_limit_disconnect():
+    """A connection paused longer than the timeout of policy disconnect is aborted."""
+    writer, transport = new_writer(WriteLimit(policy="disconnect", timeout=0.01))
+    writer._pause_writing()
+    writer._resume_writing()
+    await asyncio.sleep(0.05)
+    assert not writer.is_closing()
+
+    writer._pause_writing()
+    await asyncio.sleep(0.05)
+    assert writer.is_closing()
+    assert transport._closing
+    assert writer.metrics.slow_consumers == 1
+
+
+async def test_write_limit_of_server(bind_host, unused_tcp_port):
+    """create_server() applies write_limit to each connection, aborting a client not reading."""
+    metrics = Metrics()
+    shell_writer = asyncio.get_running_loop().create_future()
+
+    async def shell(reader, writer):
+        shell_writer.set_result(writer)
+        while not writer.is_closing():
+            writer.write(b"x" * 65536)
+            await asyncio.sleep(0)
+
+    async with create_server(
+        host=bind_host,
+        port=unused_tcp_port,
+        shell=shell,
+        encoding=False,
+        connect_maxwait=0.05,
+        metrics=metrics,
+        write_limit=WriteLimit(high=4096, policy="disconnect", timeout=0.1),
+    ):
+        reader, writer = await asyncio.open_connection(bind_host, unused_tcp_port)
+        server_writer = await asyncio.wait_for(shell_writer, 2.0)
+        assert server_writer.write_buffer.limit.high == 4096
+        for _ in range(100):
+            if server_writer.is_closing():
+                break
+            await asyncio.sleep(0.05)
+        assert server_writer.is_closing()
+        assert server_writer.write_buffer.pauses >= 1
+        assert metrics.slow_consumers == 1
+        writer.close()
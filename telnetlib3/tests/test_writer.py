@@ -536,6 +536,23 @@ async def test_wait_for_condition_waits():
     await task
 
 
+async def test_wait_for_condition_after_subnegotiation():
+    """Test wait_for_condition observes values stored by subnegotiation callbacks."""
+    from telnetlib3.telopt import IS
+
+    writer = telnetlib3.TelnetWriter(transport=None, protocol=None, server=True)
+    received = {}
+    writer.set_ext_callback(TTYPE, lambda ttype: received.update(ttype=ttype))
+
+    waiter = asyncio.ensure_future(writer.wait_for_condition(lambda w: "ttype" in received))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    for byte in IAC + SB + TTYPE + IS + b"xterm" + IAC + SE:
+        writer.feed_byte(bytes([byte]))
+    assert await asyncio.wait_for(waiter, 0.5) is True
+    assert received["ttype"] == "xterm"
+
+
 async def test_wait_for_cleanup_on_success():
     """Test that waiters are cleaned up after successful completion."""
     writer = telnetlib3.TelnetWriter(transport=None, protocol=None, server=True)